@@ -17,7 +17,7 @@ def also_numba(f):
     return f
 
 
-from fluids.atmosphere import ATMOSPHERE_1976, ATMOSPHERE_NRLMSISE00, airmass, solar_position, earthsun_distance, sunrise_sunset, solar_irradiation
+from fluids.atmosphere import ATMOSPHERE_1976, ATMOSPHERE_NRLMSISE00, airmass, solar_position, earthsun_distance, sunrise_sunset, solar_irradiation, solar_irradiation_sites
 
 if not IS_PYPY:
     ATMOSPHERE_1976_numba = fluids.numba.ATMOSPHERE_1976
@@ -42,12 +42,18 @@ class TimeAtmosphereSuite(BaseTimeSuite):
         self.date_test_es = datetime(2020, 6, 6, 10, 0, 0, 0)
         self.tz_dt = pytz.timezone('Australia/Perth').localize(datetime(2020, 6, 6, 7, 10, 57))
         self.tz_dt2 = pytz.timezone('America/Edmonton').localize(datetime(2018, 4, 15, 13, 43, 5))
+        self.Zs_atmosphere = np.linspace(-610.0, 86000.0, 100000)
+        self.Zs_nrlmsise = np.linspace(0.0, 500E3, 1000)
+        self.moments_year = np.arange('2020-01-01T00', '2021-01-01T00', dtype='datetime64[h]')
 
 
 
     def time_ATMOSPHERE_1976(self):
         ATMOSPHERE_1976(5000.0)
 
+    def time_ATMOSPHERE_1976_from_array(self):
+        ATMOSPHERE_1976.from_array(self.Zs_atmosphere)
+
     def time_ATMOSPHERE_1976_numba(self):
         ATMOSPHERE_1976_numba(5000.0)
         
@@ -56,9 +62,15 @@ class TimeAtmosphereSuite(BaseTimeSuite):
         
     def time_ATMOSPHERE_NRLMSISE00(self):
         ATMOSPHERE_NRLMSISE00(1E3, 45, 45, 150)
+
+    def time_ATMOSPHERE_NRLMSISE00_from_array(self):
+        ATMOSPHERE_NRLMSISE00.from_array(self.Zs_nrlmsise, 45, 45, 150)
         
     def time_airmass(self):
         airmass(lambda Z : ATMOSPHERE_1976(Z).rho, 90.0)
+
+    def time_ATMOSPHERE_1976_airmass(self):
+        ATMOSPHERE_1976.airmass(90.0)
         
     def time_airmass_numba(self):
         airmass_numba(numba_int_airmass, 90.0)
@@ -70,6 +82,9 @@ class TimeAtmosphereSuite(BaseTimeSuite):
     
     def time_solar_position(self):
         solar_position(self.tz_dt, -31.95265, 115.85742)
+
+    def time_solar_position_array(self):
+        solar_position(self.moments_year, -31.95265, 115.85742)
         
     def time_sunrise_sunset(self):
         sunrise_sunset(self.tz_dt, 51.0486, -114.07)
@@ -77,6 +92,13 @@ class TimeAtmosphereSuite(BaseTimeSuite):
     def time_solar_irradiation(self):
         solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3, moment=self.tz_dt2, surface_tilt=41.0, surface_azimuth=180.0)
 
+    def time_solar_irradiation_array(self):
+        solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3, moment=self.moments_year, surface_tilt=41.0, surface_azimuth=180.0)
+
+    def time_solar_irradiation_sites(self):
+        for _ in solar_irradiation_sites(np.linspace(-60.0, 60.0, 100), np.linspace(-180.0, 180.0, 100), 100.0, self.moments_year, surface_tilt=30.0, surface_azimuth=180.0, T=288.15, P=101325.0, linke_turbidity=3):
+            pass
+
 
 from fluids import isothermal_gas, isentropic_work_compression, isentropic_efficiency, P_isothermal_critical_flow
 if not IS_PYPY:
@@ -133,17 +155,27 @@ class TimeCompressibleSuite(BaseTimeSuite):
         #P_isothermal_critical_flow_numba(P=1E6, fd=0.00185, L=1000., D=0.5)
         
         
-from fluids import control_valve_noise_g_2011, control_valve_noise_l_2015, size_control_valve_l, size_control_valve_g
+from fluids import control_valve_noise_g_2011, control_valve_noise_l_2015, size_control_valve_l, size_control_valve_g, size_control_valve_l_batch, size_control_valve_g_batch
 if not IS_PYPY:
     control_valve_noise_l_2015_numba = fluids.numba.control_valve_noise_l_2015
     control_valve_noise_g_2011_numba = fluids.numba.control_valve_noise_g_2011
 
 class TimeControlValveSuite(BaseTimeSuite):    
+    def setup(self):
+        BaseTimeSuite.setup(self)
+        self.Qs_valves = np.linspace(0.01, 1.5, 10000)
+
     def time_size_control_valve_g(self):
         size_control_valve_g(T=433., MW=44.01, mu=1.4665E-4, gamma=1.30,  Z=0.988, P1=680E3, P2=310E3, Q=38/36., D1=0.08, D2=0.1, d=0.05, FL=0.85, Fd=0.42, xT=0.60)
 
     def time_size_control_valve_l(self):
         size_control_valve_l(rho=965.4, Psat=70.1E3, Pc=22120E3, mu=3.1472E-4, P1=680E3, P2=220E3, Q=0.1, D1=0.15, D2=0.15, d=0.15, FL=0.9, Fd=0.46)
+
+    def time_size_control_valve_g_batch(self):
+        size_control_valve_g_batch(T=433., MW=44.01, mu=1.4665E-4, gamma=1.30,  Z=0.988, P1=680E3, P2=310E3, Q=self.Qs_valves, D1=0.08, D2=0.1, d=0.05, FL=0.85, Fd=0.42, xT=0.60)
+
+    def time_size_control_valve_l_batch(self):
+        size_control_valve_l_batch(rho=965.4, Psat=70.1E3, Pc=22120E3, mu=3.1472E-4, P1=680E3, P2=220E3, Q=0.1*self.Qs_valves, D1=0.1, D2=0.09, d=0.08, FL=0.9, Fd=0.46)
         
         
     def time_control_valve_noise_l_2015(self):
@@ -255,13 +287,18 @@ class TimeFittingsSuite(BaseTimeSuite):
         K_branch_converging_Crane_numba(0.1023, 0.1023, 0.018917, 0.00633)
 
 
-from fluids import C_Reader_Harris_Gallagher, differential_pressure_meter_solver, dP_venturi_tube
+from fluids import C_Reader_Harris_Gallagher, differential_pressure_meter_solver, differential_pressure_meter_solver_batch, dP_venturi_tube, FlowMeter
+from fluids.flow_meter_uncertainty import flow_meter_uncertainty_GUM, flow_meter_uncertainty_Monte_Carlo
 if not IS_PYPY:
     C_Reader_Harris_Gallagher_numba = fluids.numba.C_Reader_Harris_Gallagher
     differential_pressure_meter_solver_numba = fluids.numba.differential_pressure_meter_solver
     dP_venturi_tube_numba = fluids.numba.dP_venturi_tube
 
 class TimeFlowMeterSuite(BaseTimeSuite):
+    def setup(self):
+        BaseTimeSuite.setup(self)
+        self.D2s_meters = np.linspace(0.02, 0.055, 10000)
+        self.meter = FlowMeter(D=0.07366, D2=0.05, meter_type='ISO 5167 orifice', taps='D')
 
     def time_C_Reader_Harris_Gallagher(self):
         C_Reader_Harris_Gallagher(D=0.07391, Do=0.0222, rho=1.165, mu=1.85E-5, m=0.12, taps='flange')
@@ -281,6 +318,21 @@ class TimeFlowMeterSuite(BaseTimeSuite):
     def time_differential_pressure_meter_solver_numba_m(self):
         differential_pressure_meter_solver_numba(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
         
+    def time_differential_pressure_meter_solver_batch_m(self):
+        differential_pressure_meter_solver_batch(D=0.07366, D2=self.D2s_meters, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
+
+    def time_FlowMeter_m_from_dP(self):
+        self.meter.m_from_dP(dP=17000.0, P1=200000.0, rho=999.1, mu=0.0011, k=1.33)
+
+    def time_FlowMeter_dP_from_m(self):
+        self.meter.dP_from_m(m=7.702338035732167, P1=200000.0, rho=999.1, mu=0.0011, k=1.33)
+
+    def time_flow_meter_uncertainty_GUM(self):
+        flow_meter_uncertainty_GUM(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, u_D=1E-5, u_D2=5E-6, u_P1=100.0, u_P2=100.0, u_rho=0.5, taps='D')
+
+    def time_flow_meter_uncertainty_Monte_Carlo(self):
+        flow_meter_uncertainty_Monte_Carlo(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, u_D=1E-5, u_D2=5E-6, u_P1=100.0, u_P2=100.0, u_rho=0.5, taps='D', draws=1000000, seed=0)
+
     def time_differential_pressure_meter_solver_P2(self):
         differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0, m=7.702338035732167, rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
 
@@ -592,14 +644,23 @@ class TimeParticleSizeDistributionSuite(BaseTimeSuite):
         psd = ParticleSizeDistribution(ds=ds, fractions=numbers, order=0)
 
 
-from fluids import nearest_pipe, gauge_from_t, t_from_gauge
+from fluids import nearest_pipe, nearest_pipes, schedules_from_Di, gauge_from_t, t_from_gauge
 if not IS_PYPY:
     nearest_pipe_numba = fluids.numba.nearest_pipe
 
 
 class TimePipingSuite(BaseTimeSuite):
+    def setup(self):
+        self.Dis = np.linspace(0.01, 0.5, 10000)
+
     def time_nearest_pipe(self):
         nearest_pipe(Di=0.021)
+
+    def time_nearest_pipes(self):
+        nearest_pipes(Di=self.Dis)
+
+    def time_schedules_from_Di(self):
+        schedules_from_Di(0.05248)
         
     def time_gauge_from_t(self):
         gauge_from_t(.5, SI=False, schedule='BWG')
@@ -715,6 +776,24 @@ class TimeTwoPhaseSuite(BaseTimeSuite):
     def time_Mandhane_Gregory_Aziz_regime_numba(self):
         Mandhane_Gregory_Aziz_regime_numba(m=0.6, x=0.112, rhol=915.12, rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.065, D=0.05)
 
+class TimeImportSuite(object):
+    # Each is timed in a fresh interpreter; `import fluids` should only load
+    # fluids.numerics and fluids.constants, with submodules loaded on use
+    def timeraw_import_fluids(self):
+        return "import fluids"
+
+    def timeraw_import_fluids_Reynolds(self):
+        return "from fluids import Reynolds"
+
+    def timeraw_import_fluids_all(self):
+        return "from fluids import *"
+
+    def timeraw_import_design_climate(self):
+        return "import fluids.design_climate"
+
+    def timeraw_get_closest_station(self):
+        return "from fluids.design_climate import get_closest_station; get_closest_station(51.02532675, -114.049868485806, 20150000)"
+
 suites = [TimeAtmosphereSuite, TimeCompressibleSuite, TimeControlValveSuite, 
           TimeDragSuite, TimeFittingsSuite, TimeFlowMeterSuite,
           TimeFrictionSuite, TimeGeometrySuite, TimeOpenFlowSuite,
@@ -23,102 +23,102 @@ SOFTWARE.
 """
 
 import os
-global vectorized, numba, units, numba_vectorized
+import importlib
+global vectorized, numba, units, numba_vectorized, numba_parallel
 
 from . import numerics
 from . import constants
 
+def load_submodules():
+    r'''Import every submodule of fluids and every name they export into the
+    fluids namespace, and return the submodules. This is done on demand on
+    Python 3.7+, when `fluids.submodules` is first accessed.
+    '''
+    global submodules
+    submodules = [importlib.import_module('.' + name, __name__) for name in submodule_names]
+    namespace = globals()
+    for module in submodules:
+        for name in module.__all__:
+            namespace[name] = getattr(module, name)
+    return submodules
+
 if not numerics.is_micropython:
-    from . import atmosphere
-    from . import compressible
-    from . import core
-    from . import friction
-    from . import filters
-    from . import fittings
-    from . import flow_meter
-    from . import geometry
-    from . import mixing
-    from . import open_flow
-    from . import packed_bed
-    from . import piping
-    from . import pump
-    from . import safety_valve
-    from . import packed_tower
-    from . import two_phase_voidage
-    from . import two_phase
-    from . import drag
-    from . import saltation
-    from . import separator
-    from . import particle_size_distribution
-    from . import jet_pump
-    from . import control_valve
-    
-    
-    from .atmosphere import *
-    from .compressible import *
-    from .control_valve import *
-    from .core import *
-    from .filters import *
-    from .fittings import *
-    from .flow_meter import *
-    from .friction import *
-    from .geometry import *
-    from .mixing import *
-    from .open_flow import *
-    from .particle_size_distribution import *
-    from .packed_bed import *
-    from .piping import *
-    from .pump import *
-    from .safety_valve import *
-    from .packed_tower import *
-    from .two_phase import *
-    from .two_phase_voidage import *
-    from .drag import *
-    from .saltation import *
-    from .separator import *
-    from .jet_pump import *
-    
-    
-    __all__ = ['atmosphere', 'compressible', 'control_valve', 'core', 'filters', 'fittings',
-    'friction', 'geometry', 'mixing', 'open_flow', 'packed_bed', 'piping',
-    'pump', 'safety_valve', 'packed_tower', 'two_phase', 'two_phase_voidage',
-    'drag', 'saltation', 'separator', 'flow_meter', 'particle_size_distribution',
-    'jet_pump']
-    
-    __all__.extend(atmosphere.__all__)
-    __all__.extend(compressible.__all__)
-    __all__.extend(control_valve.__all__)
-    __all__.extend(core.__all__)
-    __all__.extend(filters.__all__)
-    
-    __all__.extend(fittings.__all__)
-    __all__.extend(friction.__all__)
-    __all__.extend(geometry.__all__)
-    __all__.extend(mixing.__all__)
-    __all__.extend(open_flow.__all__)
-    __all__.extend(flow_meter.__all__)
-    __all__.extend(packed_bed.__all__)
-    __all__.extend(piping.__all__)
-    __all__.extend(pump.__all__)
-    __all__.extend(safety_valve.__all__)
-    __all__.extend(packed_tower.__all__)
-    __all__.extend(two_phase.__all__)
-    __all__.extend(two_phase_voidage.__all__)
-    __all__.extend(drag.__all__)
-    __all__.extend(saltation.__all__)
-    __all__.extend(separator.__all__)
-    __all__.extend(particle_size_distribution.__all__)
-    __all__.extend(jet_pump.__all__)
-    
-    submodules = [atmosphere, compressible, core, friction, filters, fittings,
-                  flow_meter, geometry, mixing, open_flow, packed_bed, piping, pump,
-                  safety_valve, packed_tower, two_phase_voidage, two_phase, drag,
-                  saltation, separator, particle_size_distribution, jet_pump,
-                  control_valve]
+    submodule_names = ['atmosphere', 'compressible', 'core', 'friction', 'filters',
+                       'fittings', 'flow_meter', 'geometry', 'mixing', 'open_flow',
+                       'packed_bed', 'piping', 'pump', 'safety_valve', 'packed_tower',
+                       'two_phase_voidage', 'two_phase', 'drag', 'saltation', 'separator',
+                       'particle_size_distribution', 'jet_pump', 'control_valve']
+
+    def read_exports(name):
+        r'''Return the `__all__` of a submodule. It is read from the
+        `__all__ = [...]`, `__all__ += [...]` and `__all__.extend([...])`
+        statements of the source, so the submodule is not imported; if that is
+        not possible the submodule is imported instead.
+
+        Parameters
+        ----------
+        name : str
+            Name of the submodule, [-]
+
+        Returns
+        -------
+        names : list[str]
+            Names exported by the submodule, [-]
+        '''
+        import re
+        import ast
+        try:
+            with open(os.path.join(os.path.dirname(__file__), name + '.py'), 'rb') as f:
+                source = f.read().decode('utf-8')
+            names = []
+            for match in re.finditer(r'^__all__( = |\.extend\(| \+= )\[', source, re.M):
+                values = ast.literal_eval(source[match.end()-1:source.index(']', match.end())+1])
+                if match.group(1) == ' = ':
+                    names = list(values)
+                else:
+                    names.extend(values)
+            if names:
+                return names
+        except (IOError, ValueError, SyntaxError):
+            pass
+        return list(importlib.import_module('.' + name, __name__).__all__)
+
+    def load_exports():
+        r'''Build `submodule_exports`, the names star-exported by each
+        submodule; `exported_from`, the submodule of each name; and `__all__`
+        from the `__all__` of each submodule, and return `exported_from`. On
+        Python 3.7+ this is done when an attribute of fluids is first missing,
+        and a submodule is only imported when it, or one of its names, is first
+        accessed.
+        '''
+        global submodule_exports, exported_from, __all__
+        submodule_exports = {}
+        exported_from = {}
+        __all__ = list(submodule_names)
+        for module in submodule_names:
+            names = submodule_exports[module] = read_exports(module)
+            __all__.extend(names)
+            for name in names:
+                exported_from[name] = module
+        return exported_from
 
     if numerics.PY37:
         def __getattr__(name):
-            global vectorized, numba, units, numba_vectorized
+            global vectorized, numba, units, numba_vectorized, numba_parallel, network, sweep, flow_meter_uncertainty
+            try:
+                module = exported_from.get(name)
+            except NameError:
+                module = load_exports().get(name)
+            if module is not None:
+                value = getattr(importlib.import_module('.' + module, __name__), name)
+                globals()[name] = value
+                return value
+            if name in ('__all__', 'submodule_exports', 'exported_from'):
+                return globals()[name]
+            if name in submodule_names:
+                return importlib.import_module('.' + name, __name__)
+            if name == 'submodules':
+                return load_submodules()
             if name == 'vectorized':
                 import fluids.vectorized as vectorized
                 return vectorized
@@ -131,10 +131,27 @@ if not numerics.is_micropython:
             if name == 'numba_vectorized':
                 import fluids.numba_vectorized as numba_vectorized
                 return numba_vectorized
+            if name == 'numba_parallel':
+                import fluids.numba_parallel as numba_parallel
+                return numba_parallel
+            if name == 'network':
+                import fluids.network as network
+                return network
+            if name == 'sweep':
+                import fluids.sweep as sweep
+                return sweep
+            if name == 'flow_meter_uncertainty':
+                import fluids.flow_meter_uncertainty as flow_meter_uncertainty
+                return flow_meter_uncertainty
             raise AttributeError("module %s has no attribute %s" %(__name__, name))
+
+        def __dir__():
+            return sorted(set(globals()).union(__getattr__('__all__')))
     else:
+        load_exports()
+        load_submodules()
         from . import vectorized
-    
+
 def all_submodules():
     import fluids.optional
     import fluids.optional.irradiance
@@ -142,12 +159,12 @@ def all_submodules():
     import fluids.nrlmsise00.nrlmsise_00_data
     import fluids.nrlmsise00.nrlmsise_00
     import fluids.nrlmsise00.nrlmsise_00_header
-    return submodules + [fluids.optional, fluids.optional.irradiance, fluids.optional.spa,
-                         fluids.nrlmsise00.nrlmsise_00_data, fluids.nrlmsise00.nrlmsise_00, fluids.nrlmsise00.nrlmsise_00_header]
+    return load_submodules() + [fluids.optional, fluids.optional.irradiance, fluids.optional.spa,
+                                fluids.nrlmsise00.nrlmsise_00_data, fluids.nrlmsise00.nrlmsise_00, fluids.nrlmsise00.nrlmsise_00_header]
 
 def load_types():
     from fluids.typing_utils import type_module
-    for m in submodules:
+    for m in load_submodules():
         type_module(m)
 
 
@@ -53,7 +53,7 @@ Wind Models (requires Fortran compiler!)
 
 from __future__ import division
 
-from math import sqrt, exp, cos, radians, pi, sin
+from math import sqrt, exp, log, cos, radians, pi, sin
 import time
 import os
 from fluids.constants import N_A, R, au
@@ -65,7 +65,7 @@ except:
 
 __all__ = ['ATMOSPHERE_1976', 'ATMOSPHERE_NRLMSISE00', 'hwm93', 'hwm14',
            'earthsun_distance', 'solar_position', 'solar_irradiation',
-           'sunrise_sunset']
+           'solar_irradiation_sites', 'sunrise_sunset']
 
 no_gfortran_error = '''This function uses f2py to encapsulate a fortran \
 routine. However, f2py did not detect one on installation and could not compile \
@@ -94,6 +94,20 @@ gamma = 1.400
 def H_for_P_ATMOSPHERE_1976_err(H, P1):
     return ATMOSPHERE_1976(H).P - P1
 
+def H_for_P_ATMOSPHERE_1976(P):
+    # Inverse of the standard pressure profile, solved within the layer
+    # containing `P`; returns the elevation Z, not the geopotential height
+    i = 0
+    while i < 7 and P < P_std[i+1]:
+        i += 1
+    R = 8314.32
+    if T_grad[i] == 0.0:
+        H = H_std[i] - log(P/P_std[i])*R*T_std[i]/(g0*M0)
+    else:
+        T = T_std[i]*(P/P_std[i])**(-R*T_grad[i]/(g0*M0))
+        H = H_std[i] + (T - T_std[i])/T_grad[i]
+    return r0*H/(r0 - H)
+
 def to_int_dP_ATMOSPHERE_1976(Z, dT):
     atm = ATMOSPHERE_1976(Z, dT=dT)
     return atm.g*atm.rho
@@ -188,6 +202,70 @@ class ATMOSPHERE_1976(object):
         self.k = self.thermal_conductivity(self.T)
         self.g = self.gravity(self.Z)
 
+    @staticmethod
+    def from_array(Z, dT=0.0):
+        r'''Create an :obj:`ATMOSPHERE_1976` object holding the properties
+        of the atmosphere at many elevations at once. Every attribute of the
+        result is a NumPy array of the same shape as `Z`; the layer of each
+        elevation is found with `searchsorted` and all of the properties are
+        calculated with array operations, with no object created per
+        elevation.
+
+        Parameters
+        ----------
+        Z : array-like
+            Elevations, [m]
+        dT : float or array-like, optional
+            Temperature difference from standard conditions used in
+            determining the properties of the atmosphere, [K]
+
+        Returns
+        -------
+        atmosphere : ATMOSPHERE_1976
+            Object with array attributes `T`, `P`, `rho`, `v_sonic`, `mu`,
+            `k`, `g`, and `H`, [-]
+
+        Examples
+        --------
+        >>> atm = ATMOSPHERE_1976.from_array([0.0, 5000.0, 30000.0])
+        >>> atm.P.tolist()
+        [101325.0, 54048.28614576141, 1197.0316403859636]
+        '''
+        self = ATMOSPHERE_1976.__new__(ATMOSPHERE_1976)
+        Z = np.asarray(Z, dtype=float)
+        self.Z = Z
+        self.dT = dT
+        self.H = H = r0*Z/(r0+Z)
+
+        # Same layer as _get_ind_from_H; H at a boundary is in the lower layer
+        i = np.clip(np.searchsorted(H_std, H), 1, 8) - 1
+        self.T_layer = T_layer = np.array(T_std)[i]
+        self.T_increase = T_increase = np.array(T_grad)[i]
+        self.P_layer = P_layer = np.array(P_std, dtype=float)[i]
+        self.H_layer = np.array(H_std)[i]
+
+        self.H_above_layer = H_above_layer = H - self.H_layer
+        T = T_layer + T_increase*H_above_layer
+
+        R = 8314.32
+        isothermal = T_increase == 0.0
+        exponent = g0*M0/(R*np.where(isothermal, 1.0, T_increase))
+        self.P = P = np.where(isothermal,
+                              P_layer*np.exp(-g0*M0*H_above_layer/(R*T_layer)),
+                              P_layer*(T_layer/T)**exponent)
+
+        # Affects only the following properties
+        self.T = T = T + dT
+
+        self.rho = ATMOSPHERE_1976.density(T, P)
+        self.g = ATMOSPHERE_1976.gravity(Z)
+        # Same as the scalar methods, with NumPy functions
+        T_sqrt = np.sqrt(T)
+        self.v_sonic = np.sqrt(401.87430086589046*T)
+        self.mu = 1.458E-6*T*T_sqrt/(T + 110.4)
+        self.k = 2.64638E-3*T*T_sqrt/(T + 245.4*np.exp(-27.63102111592855/T))
+        return self
+
     @staticmethod
     def _get_ind_from_H(H):
         r'''Method defined in the US Standard Atmosphere 1976 for determining
@@ -337,13 +415,179 @@ class ATMOSPHERE_1976(object):
             Pressure difference between the elevations, [Pa]
         '''
         # Compute the elevation to obtain the pressure specified
-        H_ref = brenth(H_for_P_ATMOSPHERE_1976_err, -610.0, 86000.0, args=(P1,))
+        H_ref = H_for_P_ATMOSPHERE_1976(P1)
 
         # Compute the temperature delta
         dT = T1 - ATMOSPHERE_1976(H_ref).T
 
-        return quad(to_int_dP_ATMOSPHERE_1976, H_ref, H_ref+dH, args=(dT,))[0]
+        H_top = H_ref + dH
+        if (ATMOSPHERE_1976_integrals.Z_min <= min(H_ref, H_top)
+                and max(H_ref, H_top) <= ATMOSPHERE_1976_integrals.Z_max):
+            return ATMOSPHERE_1976_integrals.get(dT).pressure_difference(H_ref, H_top)
+        return quad(to_int_dP_ATMOSPHERE_1976, H_ref, H_top, args=(dT,))[0]
+
+    @staticmethod
+    def airmass(angle, dT=0.0, R_planet=6.371229E6, RI=1.000276):
+        r'''Calculates mass of air per square meter in this atmosphere, as
+        :obj:`airmass` does for any density function, from sea level to
+        86400 m. The densities are evaluated once for each `dT` on a fixed
+        quadrature grid and cached, so the integral for any number of angles
+        is a weighted sum.
+
+        Parameters
+        ----------
+        angle : float or array-like
+            Degrees above the horizon (90 = straight up), [degrees]
+        dT : float, optional
+            Temperature difference from standard conditions used in determining
+            the properties of the atmosphere, [K]
+        R_planet : float, optional
+            The radius of the planet for which the integration is being
+            performed, [m]
+        RI : float, optional
+            The refractive index of the atmosphere (air on earth at 0.7 um as
+            default) assumed a constant, [-]
+
+        Returns
+        -------
+        m : float or ndarray
+            Mass of air per square meter in the atmosphere, [kg/m^2]
+
+        Examples
+        --------
+        >>> ATMOSPHERE_1976.airmass(90.0)
+        10356.12764566912
+        '''
+        return ATMOSPHERE_1976_integrals.get(dT).airmass(angle, R_planet, RI)
+
+
+class ATMOSPHERE_1976_integrals(object):
+    r'''Tables for evaluating integrals over the US Standard Atmosphere 1976
+    with a temperature offset `dT`, used by
+    :obj:`ATMOSPHERE_1976.pressure_integral` and :obj:`ATMOSPHERE_1976.airmass`.
+    Tables are created with :obj:`get`, which keeps the `max_tables` most
+    recently used ones.
+
+    The atmosphere is split into segments of at most `segment` m which end
+    at each layer boundary, so the properties are smooth in every segment.
+    For the pressure integral, `g*rho` is fit by a Chebyshev series of degree
+    `degree` in each segment and integrated analytically. For the airmass,
+    the density is evaluated at Gauss-Legendre points in `sqrt(Z)`,
+    which removes the singularity of the integrand at the horizon. Both
+    agree with adaptive quadrature to about 1E-13 relative.
+
+    Parameters
+    ----------
+    dT : float
+        Temperature difference from standard conditions used in determining
+        the properties of the atmosphere, [K]
+    '''
+    Z_min = -5000.0
+    Z_max = 150000.0
+    segment = 2000.0
+    degree = 16
+    airmass_Z_max = 86400.0
+    airmass_points = 16
+    max_tables = 16
+    tables = {}
+
+    @classmethod
+    def get(cls, dT):
+        tables = cls.tables
+        table = tables.pop(dT, None)
+        if table is None:
+            table = cls(dT)
+            while len(tables) >= cls.max_tables:
+                del tables[next(iter(tables))]
+        # Most recently used last
+        tables[dT] = table
+        return table
+
+    def __init__(self, dT):
+        self.dT = dT
+        self.dP_coeffs = None
+        self.airmass_rho = None
 
+    @staticmethod
+    def layer_edges(Z_low, Z_high, step):
+        Z_layers = [r0*H/(r0 - H) for H in H_std]
+        edges = set(np.arange(Z_low, Z_high, step).tolist())
+        edges.update(Z for Z in Z_layers if Z_low < Z < Z_high)
+        edges.add(Z_high)
+        return np.array(sorted(edges))
+
+    def build_pressure_table(self):
+        n = self.degree + 1
+        cls = type(self)
+        if 'dP_matrix' not in cls.__dict__:
+            # Values at Chebyshev nodes -> coefficients of the integral from -1
+            t = np.cos(pi*(np.arange(n) + 0.5)/n)
+            to_coeffs = np.linalg.inv(np.polynomial.chebyshev.chebvander(t, self.degree))
+            integrate = np.polynomial.chebyshev.chebint(np.eye(n), lbnd=-1, axis=0)
+            cls.dP_nodes, cls.dP_matrix = t, (integrate @ to_coeffs).T
+            cls.dP_edges = edges = self.layer_edges(self.Z_min, self.Z_max, self.segment)
+            cls.dP_half_widths = 0.5*(edges[1:] - edges[:-1])
+        edges, half_widths = self.dP_edges, self.dP_half_widths
+        Z = (0.5*(edges[1:] + edges[:-1]))[:, None] + half_widths[:, None]*self.dP_nodes
+        atm = ATMOSPHERE_1976.from_array(Z, self.dT)
+        self.dP_coeffs = ((atm.g*atm.rho) @ self.dP_matrix)*half_widths[:, None]
+        # At t = 1 every Chebyshev polynomial is 1
+        self.dP_segments = self.dP_coeffs.sum(axis=1)
+
+    def pressure_difference(self, Z1, Z2):
+        r'''Integral of `g*rho` from `Z1` to `Z2`, both within `Z_min` and
+        `Z_max`, [Pa].
+        '''
+        if self.dP_coeffs is None:
+            self.build_pressure_table()
+        edges = self.dP_edges
+        i = np.clip(np.searchsorted(edges, [Z1, Z2], side='right') - 1, 0, len(edges) - 2)
+        t = (2.0*np.array([Z1, Z2]) - edges[i] - edges[i+1])/(edges[i+1] - edges[i])
+        # Clenshaw recurrence for the integral within each end segment
+        c = self.dP_coeffs[i]
+        b1, b2 = np.zeros(2), np.zeros(2)
+        for k in range(self.degree + 1, 0, -1):
+            b1, b2 = c[:, k] + 2.0*t*b1 - b2, b1
+        F1, F2 = (c[:, 0] + t*b1 - b2).tolist()
+        i1, i2 = int(i[0]), int(i[1])
+        if i1 <= i2:
+            return F2 - F1 + float(self.dP_segments[i1:i2].sum())
+        return F2 - F1 - float(self.dP_segments[i2:i1].sum())
+
+    def build_airmass_table(self):
+        cls = type(self)
+        if 'airmass_u' not in cls.__dict__:
+            # Z = u^2; segments are refined geometrically towards u = 0
+            u_edges = set(np.sqrt(self.layer_edges(0.0, self.airmass_Z_max, 100.0)).tolist())
+            u_edges.update(0.1*3.0**k for k in range(3))
+            u_edges = np.array(sorted(u_edges))
+            x, w = np.polynomial.legendre.leggauss(self.airmass_points)
+            a, b = u_edges[:-1, None], u_edges[1:, None]
+            u = (0.5*(a + b) + 0.5*(b - a)*x).ravel()
+            cls.airmass_u = u
+            cls.airmass_Z = u*u
+            # dZ = 2u du
+            cls.airmass_weights = (0.5*(b - a)*w).ravel()*2.0*u
+        self.airmass_rho = ATMOSPHERE_1976.from_array(self.airmass_Z, self.dT).rho
+        self.airmass_rho0 = ATMOSPHERE_1976(0.0, self.dT).rho
+
+    def airmass(self, angle, R_planet=6.371229E6, RI=1.000276):
+        r'''Mass of air per square meter from sea level to `airmass_Z_max`
+        at `angle` degrees above the horizon, [kg/m^2].
+        '''
+        if self.airmass_rho is None:
+            self.build_airmass_table()
+        rho, z = self.airmass_rho, self.airmass_Z/R_planet
+        angle = np.asarray(angle, dtype=float)
+        cos_angle = np.cos(np.radians(angle))[..., None]
+        sin_angle = np.sin(np.radians(angle))[..., None]
+        # Same integrand as to_int_airmass, with 1 - x0^2 expanded so it
+        # does not cancel at the horizon
+        x0 = cos_angle/(1.0 + z)
+        term = ((sin_angle*sin_angle + z*(2.0 + z))/((1.0 + z)*(1.0 + z))
+                - 2.0*(RI - 1.0)*(self.airmass_rho0 - rho)/self.airmass_rho0*x0*x0)
+        m = (rho/np.sqrt(term)) @ self.airmass_weights
+        return float(m) if m.ndim == 0 else m
 
 
 class ATMOSPHERE_NRLMSISE00(object):
@@ -502,27 +746,118 @@ class ATMOSPHERE_NRLMSISE00(object):
         input_obj.f107 = f107
         gtd7(input_obj, flags, output_obj)
 
-        self.He_density = output_obj.d[0]*1E6 # 1/cm^3 to 1/m^3
-        self.O_density = output_obj.d[1]*1E6 # 1/cm^3 to 1/m^3
-        self.N2_density = output_obj.d[2]*1E6 # 1/cm^3 to 1/m^3
-        self.O2_density = output_obj.d[3]*1E6 # 1/cm^3 to 1/m^3
-        self.Ar_density = output_obj.d[4]*1E6 # 1/cm^3 to 1/m^3
-        self.rho = output_obj.d[5]*1000 # gram/cm^3 to kg/m^3
-        self.H_density = output_obj.d[6]*1E6 # 1/cm^3 to 1/m^3
-        self.N_density = output_obj.d[7]*1E6 # 1/cm^3 to 1/m^3
-        self.O_anomalous_density = output_obj.d[8]*1E6 # 1/cm^3 to 1/m^3
-        self.T_exospheric = output_obj.t[0]
-        self.T = output_obj.t[1]
-
+        self._set_output(output_obj.d, output_obj.t)
+
+    def _set_output(self, d, t):
+        # d and t are the gtd7 densities and temperatures, either as lists of
+        # floats or as lists of arrays holding the values of many points
+        self.He_density = d[0]*1E6 # 1/cm^3 to 1/m^3
+        self.O_density = d[1]*1E6 # 1/cm^3 to 1/m^3
+        self.N2_density = N2 = d[2]*1E6 # 1/cm^3 to 1/m^3
+        self.O2_density = O2 = d[3]*1E6 # 1/cm^3 to 1/m^3
+        self.Ar_density = Ar = d[4]*1E6 # 1/cm^3 to 1/m^3
+        self.rho = d[5]*1000 # gram/cm^3 to kg/m^3
+        self.H_density = d[6]*1E6 # 1/cm^3 to 1/m^3
+        self.N_density = d[7]*1E6 # 1/cm^3 to 1/m^3
+        self.O_anomalous_density = d[8]*1E6 # 1/cm^3 to 1/m^3
+        self.T_exospheric = t[0]
+        self.T = t[1]
+        He, O, H, N = self.He_density, self.O_density, self.H_density, self.N_density
+
+        # Summed in the order of `atrrs`
+        self.particle_density = particle_density = N2 + O2 + Ar + He + O + H + N
         # Calculate pressure with the ideal gas law PV = nRT with V = 1 m^3
-        self.P = sum([getattr(self, a) for a in self.atrrs])*self.T*R/N_A
+        self.P = particle_density*self.T*R/N_A
         # Calculate mass density with known MWs
-        self.rho_calculated = sum([getattr(self, a)*MW for c, a, MW in
-                                   zip(self.components, self.atrrs, self.MWs)])/(1000.*N_A)
+        MWs = self.MWs
+        self.rho_calculated = (N2*MWs[0] + O2*MWs[1] + Ar*MWs[2] + He*MWs[3]
+                               + O*MWs[4] + H*MWs[5] + N*MWs[6])/(1000.*N_A)
+        self.zs = [N2/particle_density, O2/particle_density,
+                   Ar/particle_density, He/particle_density,
+                   O/particle_density, H/particle_density, N/particle_density]
+
+    @staticmethod
+    def from_array(Z, latitude=0.0, longitude=0.0, day=0, seconds=0.0,
+                   f107=150., f107_avg=150., geomagnetic_disturbance_indices=None):
+        r'''Create an :obj:`ATMOSPHERE_NRLMSISE00` object holding the
+        properties of the atmosphere at many points at once. The inputs are
+        broadcast together, and every attribute of the result is a NumPy
+        array of the broadcast shape (`zs` is a list of such arrays).
+
+        All of the points are evaluated in one call to `gtd7_array`, which
+        selects the model switches once, shares the spline setup of each
+        point between all of its species, and computes the harmonic terms
+        of points differing only in altitude once; no
+        :obj:`ATMOSPHERE_NRLMSISE00` object is created per point.
+
+        Parameters
+        ----------
+        Z : array-like
+            Elevations, [m]
+        latitude : float or array-like, optional
+            Latitudes, between -90 and 90 [degrees]
+        longitude : float or array-like, optional
+            Longitudes, between -180 and 180 or 0 and 360, [degrees]
+        day : float or array-like, optional
+            Days of year, 0-366 [day]
+        seconds : float or array-like, optional
+            Seconds since start of day, in UT1 time [s]
+        f107 : float or array-like, optional
+            Daily average 10.7 cm solar flux measurement [10^-22 W/m^2/Hz]
+        f107_avg : float or array-like, optional
+            81-day sfu average [10^-22 W/m^2/Hz]
+        geomagnetic_disturbance_indices : list of float, optional
+            List of the 7 `Ap` indexes, shared by all points; see
+            :obj:`ATMOSPHERE_NRLMSISE00`, [-]
 
-        self.particle_density = sum(getattr(self, a) for a in self.atrrs)
-        self.zs = [getattr(self, a)/self.particle_density for a in self.atrrs]
+        Returns
+        -------
+        atmosphere : ATMOSPHERE_NRLMSISE00
+            Object with array attributes, [-]
+
+        Examples
+        --------
+        >>> atm = ATMOSPHERE_NRLMSISE00.from_array([1E3, 1E5], 45, 45, 150)
+        >>> atm.T.tolist()
+        [285.54408606237405, 187.1714469236433]
+        '''
+        from fluids.nrlmsise00 import gtd7_array, nrlmsise_flags, ap_array
+        Z, latitude, longitude, day, seconds, f107, f107_avg = np.broadcast_arrays(
+            np.asarray(Z, dtype=float), latitude, longitude, day, seconds,
+            f107, f107_avg)
+        shape = Z.shape
 
+        flags = nrlmsise_flags()
+        flags.switches = [0] + [1]*23
+        aph = ap = None
+        if geomagnetic_disturbance_indices:
+            aph = ap_array()
+            aph.a = geomagnetic_disturbance_indices
+            flags.switches[9] = -1
+            ap = [geomagnetic_disturbance_indices[0]]*Z.size
+
+        seconds_flat = seconds.ravel().tolist()
+        longitude_flat = longitude.ravel().tolist()
+        lst = [sec/3600. + lon/15. for sec, lon in zip(seconds_flat, longitude_flat)]
+        outputs = gtd7_array([z*1e-3 for z in Z.ravel().tolist()],
+                             latitude.ravel().tolist(), longitude_flat,
+                             day.ravel().tolist(), seconds_flat, lst,
+                             f107_avg.ravel().tolist(), f107.ravel().tolist(),
+                             flags, ap=ap, ap_a=aph)
+
+        self = ATMOSPHERE_NRLMSISE00.__new__(ATMOSPHERE_NRLMSISE00)
+        self.Z = Z
+        self.latitude = latitude
+        self.longitude = longitude
+        self.day = day
+        self.seconds = seconds
+        self.f107 = f107
+        self.f107_avg = f107_avg
+        self.geomagnetic_disturbance_indices = geomagnetic_disturbance_indices
+        d = np.array([o.d for o in outputs], dtype=float).reshape(shape + (9,))
+        t = np.array([o.t for o in outputs], dtype=float).reshape(shape + (2,))
+        self._set_output([d[..., i] for i in range(9)], [t[..., 0], t[..., 1]])
+        return self
 
 def hwm93(Z, latitude=0, longitude=0, day=0, seconds=0, f107=150.,
           f107_avg=150., geomagnetic_disturbance_index=4):
@@ -847,6 +1182,27 @@ def earthsun_distance(moment):
     return spa.earthsun_distance(unixtime, delta_t=delta_t)*au
 
 
+def _unixtime_array(moment):
+    # Unix times and UTC datetime64 values of an array of datetime64 values
+    # or of unix times
+    moment = np.asarray(moment)
+    if moment.dtype.kind == 'M':
+        unixtime = moment.astype('datetime64[us]').astype(np.int64)/1E6
+    else:
+        unixtime = moment.astype(np.float64)
+        moment = np.floor(unixtime*1E6).astype(np.int64).astype('datetime64[us]')
+    return unixtime, moment
+
+
+def _year_month_array(moment):
+    months = moment.astype('datetime64[M]').astype(np.int64)
+    return months//12 + 1970, months % 12 + 1
+
+
+def _day_of_year_array(moment):
+    return (moment.astype('datetime64[D]') - moment.astype('datetime64[Y]')).astype(np.int64) + 1
+
+
 def solar_position(moment, latitude, longitude, Z=0.0, T=298.15, P=101325.0,
                    atmos_refract=0.5667):
     r'''Calculate the position of the sun in the sky. It is defined in terms of
@@ -865,10 +1221,12 @@ def solar_position(moment, latitude, longitude, Z=0.0, T=298.15, P=101325.0,
 
     Parameters
     ----------
-    moment : datetime, optionally with pytz info
+    moment : datetime, optionally with pytz info, or array-like
         Time and date for the calculation, in UTC time OR in the time zone
         of the latitude/longitude specified BUT WITH A TZINFO ATTACHED!
-        Please be careful with this argument, time zones are confusing. [-]
+        Please be careful with this argument, time zones are confusing.
+        An array of `datetime64` values (in UTC) or of unix times may be given
+        instead, in which case every result is an array, [-]
     latitude : float
         Latitude, between -90 and 90 [degrees]
     longitude : float
@@ -932,6 +1290,12 @@ def solar_position(moment, latitude, longitude, Z=0.0, T=298.15, P=101325.0,
     >>> solar_position(pytz.timezone('America/Edmonton').localize(datetime(2018, 4, 15, 20, 30, 28)), 51.0486, -114.07)
     [89.999569566, 90.5410381216, 0.000430433876, -0.541038121618, 286.831378190, 6.63142952587]
 
+A whole time series can be evaluated at once; here, Calgary every six hours:
+
+    >>> moments = np.arange('2018-04-15T00', '2018-04-16T00', 6, dtype='datetime64[h]')
+    >>> [round(v, 6) for v in solar_position(moments, 51.0486, -114.07)[1].tolist()]
+    [67.436111, 115.710399, 96.878396, 45.606856]
+
     Notes
     -----
     If you were standing at the same longitude of the sun such that it was no
@@ -961,6 +1325,16 @@ def solar_position(moment, latitude, longitude, Z=0.0, T=298.15, P=101325.0,
        https://astronomy.stackexchange.com/questions/237/what-azimuth-description-systems-are-in-use?rq=1.
     '''
     from fluids.optional import spa
+    if not hasattr(moment, 'utctimetuple'):
+        unixtime, moment = _unixtime_array(moment)
+        # delta_t is evaluated once per distinct month, not per time
+        delta_t = spa.calculate_deltat_array(*_year_month_array(moment))
+        result = spa.solar_position_array(unixtime, lat=latitude, lon=longitude,
+                                          elev=Z, pressure=P*1E-2,
+                                          temp=T-273.15, delta_t=delta_t,
+                                          atmos_refract=atmos_refract)
+        result[-1] = result[-1]*60.0
+        return result
     import calendar
     tt = moment.utctimetuple()
     delta_t = spa.calculate_deltat(tt.tm_year, tt.tm_mon)
@@ -1076,6 +1450,10 @@ true_zenith_airmass_models = set(['youngirvine1967', 'young1994'])
 def _get_extra_radiation_shim(datetime_or_doy, solar_constant=1366.1,
     method='spencer', epoch_year=2014, **kwargs):
     if method == 'spencer':
+        if isinstance(datetime_or_doy, np.ndarray):
+            B = (2.*pi/365.)*(datetime_or_doy - 1)
+            return solar_constant*(1.00011 + 0.034221*np.cos(B) + 0.00128*np.sin(B)
+                                   + 0.000719*np.cos(2.0*B) + 7.7e-05*np.sin(2.0*B))
         if not isinstance(datetime_or_doy, (float, int)):
             dayofyear = datetime_or_doy.timetuple().tm_yday
         else:
@@ -1094,6 +1472,102 @@ def _get_extra_radiation_shim(datetime_or_doy, solar_constant=1366.1,
                               **kwargs)
 
 
+def _solar_irradiation_array(latitude, longitude, Z, moment, surface_tilt,
+                             surface_azimuth, T=None, P=None, solar_constant=1366.1,
+                             atmos_refract=0.5667, albedo=0.25, linke_turbidity=None,
+                             extraradiation_method='spencer',
+                             airmass_model='kastenyoung1989', cache=None):
+    # Array version of solar_irradiation, for a series of times at one site
+    apparent = _airmass_model_apparent(airmass_model)
+
+    unixtime, moment = _unixtime_array(moment)
+    day_of_year = _day_of_year_array(moment)
+    years = _year_month_array(moment)[0]
+    dni_extra = _get_extra_radiation_shim(day_of_year if extraradiation_method == 'spencer' else moment,
+                                          solar_constant=solar_constant,
+                                          method=extraradiation_method,
+                                          epoch_year=int(years.flat[0]) if years.size else 2014)
+
+    if T is None or P is None:
+        # Only the day of year varies between times; evaluate each day once
+        days, inverse = np.unique(day_of_year, return_inverse=True)
+        atmosphere = ATMOSPHERE_NRLMSISE00.from_array(Z, latitude, longitude, day=days)
+        inverse = inverse.reshape(day_of_year.shape)
+        if T is None:
+            T = atmosphere.T[inverse]
+        if P is None:
+            P = atmosphere.P[inverse]
+
+    if cache is not None and 'zenith' in cache:
+        zenith = cache['zenith']
+        apparent_zenith = cache['apparent_zenith']
+        azimuth = cache['azimuth']
+    else:
+        apparent_zenith, zenith, _, _, azimuth, _ = solar_position(moment=unixtime,
+                                                                   latitude=latitude,
+                                                                   longitude=longitude,
+                                                                   Z=Z, T=T, P=P,
+                                                                   atmos_refract=atmos_refract)
+        if cache is not None:
+            cache['zenith'] = zenith
+            cache['apparent_zenith'] = apparent_zenith
+            cache['azimuth'] = azimuth
+
+    if linke_turbidity is None:
+        linke_turbidity = _lookup_linke_turbidity_array(moment, latitude, longitude)
+
+    return _clear_sky_poa_array(apparent_zenith, zenith, azimuth, Z, P, dni_extra,
+                                linke_turbidity, surface_tilt, surface_azimuth,
+                                solar_constant=solar_constant, albedo=albedo,
+                                apparent=apparent, airmass_model=airmass_model)
+
+
+def _airmass_model_apparent(airmass_model):
+    if airmass_model in apparent_zenith_airmass_models:
+        return True
+    elif airmass_model in true_zenith_airmass_models:
+        return False
+    raise ValueError('Unrecognized airmass model')
+
+
+def _lookup_linke_turbidity_array(moment, latitude, longitude):
+    # Historical Linke turbidity for an array of UTC datetime64 values at one site
+    try:
+        import pvlib
+    except:
+        raise ImportError(PVLIB_MISSING_MSG)
+    from pvlib.clearsky import lookup_linke_turbidity
+    import pandas as pd
+    return np.asarray(lookup_linke_turbidity(
+        pd.DatetimeIndex(moment.ravel()), latitude, longitude).values).reshape(moment.shape)
+
+
+def _clear_sky_poa_array(apparent_zenith, zenith, azimuth, Z, P, dni_extra,
+                         linke_turbidity, surface_tilt, surface_azimuth,
+                         solar_constant=1366.1, albedo=0.25, apparent=True,
+                         airmass_model='kastenyoung1989'):
+    # Clear sky irradiance on a tilted surface from the solar position; every
+    # argument broadcasts against the others
+    from fluids.optional.irradiance import (get_relative_airmass_array,
+                                            ineichen_array,
+                                            get_total_irradiance_array)
+    relative_airmass = get_relative_airmass_array(apparent_zenith if apparent else zenith,
+                                                  model=airmass_model)
+    airmass_absolute = relative_airmass*P/101325.
+    ans = ineichen_array(apparent_zenith=apparent_zenith,
+                         airmass_absolute=airmass_absolute,
+                         linke_turbidity=linke_turbidity,
+                         altitude=Z, dni_extra=solar_constant, perez_enhancement=True)
+    ans = get_total_irradiance_array(surface_tilt=surface_tilt,
+                                     surface_azimuth=surface_azimuth,
+                                     solar_zenith=apparent_zenith, solar_azimuth=azimuth,
+                                     dni=ans['dni'], ghi=ans['ghi'], dhi=ans['dhi'],
+                                     dni_extra=dni_extra, airmass=airmass_absolute,
+                                     albedo=albedo)
+    return (ans['poa_global'], ans['poa_direct'], ans['poa_diffuse'],
+            ans['poa_sky_diffuse'], ans['poa_ground_diffuse'])
+
+
 def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
                       surface_azimuth, T=None, P=None, solar_constant=1366.1,
                       atmos_refract=0.5667, albedo=0.25, linke_turbidity=None,
@@ -1116,10 +1590,12 @@ def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
         Longitude, between -180 and 180, [degrees]
     Z : float, optional
         Elevation above sea level for the position, [m]
-    moment : datetime, optionally with pytz info
+    moment : datetime, optionally with pytz info, or array-like
         Time and date for the calculation, in UTC time OR in the time zone
         of the latitude/longitude specified BUT WITH A TZINFO ATTACHED!
-        Please be careful with this argument, time zones are confusing. [-]
+        Please be careful with this argument, time zones are confusing.
+        An array of `datetime64` values (in UTC) or of unix times may be given
+        instead, in which case every result is an array, [-]
     surface_tilt : float
         The angle above the horizontal of the object being hit by radiation,
         [degrees]
@@ -1159,7 +1635,10 @@ def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
         available in the `pvlib` library, [-]
     cache : dict, optional
         Dictionary to to check for values to use to skip some calculations;
-        `apparent_zenith`, `zenith`, `azimuth` supported, [-]
+        `apparent_zenith`, `zenith`, `azimuth` supported. For an array of
+        `moment`, the values must be arrays of the same shape, and if they
+        are not present the computed ones are stored in it, so the solar
+        position is not recomputed for another surface at the same times, [-]
 
     Returns
     -------
@@ -1197,6 +1676,15 @@ def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
     ... surface_azimuth=180.0)
     (0.0, -0.0, 0.0, 0.0, 0.0)
 
+An array of times is evaluated at once; the solar positions are computed
+together, and the atmosphere only once per distinct day:
+
+    >>> moments = np.array(['2018-04-15T19:43:05', '2018-04-15T08:43:05'], dtype='datetime64[s]')
+    >>> [v.round(6).tolist() for v in solar_irradiation(Z=1100.0, latitude=51.0486,
+    ... longitude=-114.07, linke_turbidity=3, moment=moments, surface_tilt=41.0,
+    ... surface_azimuth=180.0)]
+    [[1065.76219, 0.0], [945.265656, 0.0], [120.496533, 0.0], [95.315353, 0.0], [25.18118, 0.0]]
+
 
     Notes
     -----
@@ -1223,6 +1711,13 @@ def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
        DaCoEx, mayudong, et al. Pvlib/Pvlib-Python: 0.5.1. Zenodo, 2017.
        https://doi.org/10.5281/zenodo.1016425.
     '''
+    if not hasattr(moment, 'utctimetuple'):
+        return _solar_irradiation_array(latitude, longitude, Z, moment, surface_tilt,
+                                        surface_azimuth, T=T, P=P, solar_constant=solar_constant,
+                                        atmos_refract=atmos_refract, albedo=albedo,
+                                        linke_turbidity=linke_turbidity,
+                                        extraradiation_method=extraradiation_method,
+                                        airmass_model=airmass_model, cache=cache)
     # Atmospheric refraction at sunrise/sunset (0.5667 deg is an often used value)
     import calendar
     from fluids.optional import spa
@@ -1302,3 +1797,188 @@ def solar_irradiation(latitude, longitude, Z, moment, surface_tilt,
     poa_ground_diffuse = float(ans['poa_ground_diffuse'])
     return (poa_global, poa_direct, poa_diffuse, poa_sky_diffuse,
             poa_ground_diffuse)
+
+
+def _moment_chunks(moments, chunk_size):
+    # Yield successive pieces of an array of times, or of the evenly spaced
+    # times described by a (start, stop, step) tuple, generating only the
+    # piece being yielded
+    if isinstance(moments, tuple):
+        start, stop, step = moments
+        if isinstance(start, str):
+            start, stop = np.datetime64(start), np.datetime64(stop)
+        count = int(np.ceil((stop - start)/step))
+        for i in range(0, count, chunk_size):
+            yield start + np.arange(i, min(i + chunk_size, count))*step
+    else:
+        moments = np.asarray(moments).ravel()
+        for i in range(0, moments.size, chunk_size):
+            yield moments[i:i + chunk_size]
+
+
+def solar_irradiation_sites(latitudes, longitudes, Z, moments, surface_tilt,
+                            surface_azimuth, T=None, P=None,
+                            solar_constant=1366.1, atmos_refract=0.5667,
+                            albedo=0.25, linke_turbidity=None,
+                            extraradiation_method='spencer',
+                            airmass_model='kastenyoung1989', chunk_size=1440):
+    r'''Calculates the clear sky solar radiation which hits a surface at a
+    specified tilt and azimuth for many sites over a long series of times,
+    as :obj:`solar_irradiation` does for one site.
+
+    The terms of the solar position which depend only on time (heliocentric
+    position, nutation, sidereal time, and the earth-sun distance) are
+    calculated once per time and shared by every site; only the topocentric
+    corrections and the irradiance model are evaluated per site. The times
+    are processed in chunks of `chunk_size` and the results are yielded chunk
+    by chunk, so arbitrarily long series can be evaluated without holding
+    every result in memory at once.
+
+    Parameters
+    ----------
+    latitudes : float or array-like
+        Latitudes of each site, between -90 and 90 [degrees]
+    longitudes : float or array-like
+        Longitudes of each site, between -180 and 180, [degrees]
+    Z : float or array-like
+        Elevation above sea level of each site, [m]
+    moments : array-like or tuple
+        Times for the calculation, as `datetime64` values in UTC or as unix
+        times; alternatively a tuple (`start`, `stop`, `step`) as for
+        :obj:`numpy.arange`, in which case only the times of the current
+        chunk are ever generated, [-]
+    surface_tilt : float or array-like
+        The angle above the horizontal of the object being hit by radiation
+        at each site, [degrees]
+    surface_azimuth : float or array-like
+        The angle the object at each site is facing (positive, North
+        eastwards 0° to 360°), [degrees]
+    T : float or array-like, optional
+        Temperature of atmosphere at ground level at each site; if not
+        specified, it is calculated with :obj:`ATMOSPHERE_NRLMSISE00`, once per
+        site and day of year, [K]
+    P : float or array-like, optional
+        Pressure of atmosphere at ground level at each site; if not
+        specified, it is calculated with :obj:`ATMOSPHERE_NRLMSISE00`, once per
+        site and day of year, [Pa]
+    solar_constant : float, optional
+        The amount of solar radiation which reaches earth's disk (at a
+        standardized distance of 1 AU), [W/m^2]
+    atmos_refract : float, optional
+        Atmospheric refractivity at sunrise/sunset, [degrees]
+    albedo : float or array-like, optional
+        The average amount of reflection of the terrain surrounding the object
+        at each site, [-]
+    linke_turbidity : float or array-like, optional
+        The amount of pollution/water in the sky versus a perfect clear sky at
+        each site; if not specified, this will be retrieved from a historical
+        grid, [-]
+    extraradiation_method : str, optional
+        The specified method to calculate the effect of earth's position on the
+        amount of radiation which reaches earth, [-]
+    airmass_model : str, optional
+        The specified method to calculate the amount of air the sunlight
+        needs to travel through to reach the earth, [-]
+    chunk_size : int, optional
+        Number of times evaluated together; the size of each yielded result
+        is the number of sites times this, [-]
+
+    Yields
+    ------
+    moments : ndarray
+        The times of the chunk, [-]
+    poa_global : ndarray
+        The total irradiance in the plane of the surface, with one row per
+        site and one column per time, [W/m^2]
+    poa_direct : ndarray
+        The total beam irradiance in the plane of the surface, [W/m^2]
+    poa_diffuse : ndarray
+        The total diffuse irradiance in the plane of the surface, [W/m^2]
+    poa_sky_diffuse : ndarray
+        The sky component of the diffuse irradiance, excluding the impact
+        from the ground, [W/m^2]
+    poa_ground_diffuse : ndarray
+        The ground-sky diffuse irradiance component, [W/m^2]
+
+    Examples
+    --------
+    Irradiation in Calgary and Houston at 19:00 UTC every day for a week,
+    evaluated two days at a time:
+
+    >>> chunks = solar_irradiation_sites([51.0486, 29.7604], [-114.07, -95.3698],
+    ... [1100.0, 15.0], (np.datetime64('2018-04-15T19:00'), np.datetime64('2018-04-22T19:00'),
+    ... np.timedelta64(1, 'D')), surface_tilt=41.0, surface_azimuth=180.0,
+    ... linke_turbidity=3, chunk_size=2)
+    >>> [poa_global.round(1).tolist() for _, poa_global, _, _, _, _ in chunks][0]
+    [[1051.8, 1053.5], [987.5, 985.8]]
+
+    Notes
+    -----
+    The results are those of :obj:`solar_irradiation` evaluated for every
+    site and time, to within floating point rounding.
+    '''
+    from fluids.optional import spa
+    apparent = _airmass_model_apparent(airmass_model)
+    latitudes, longitudes, Z = np.broadcast_arrays(np.atleast_1d(np.asarray(latitudes, dtype=np.float64)),
+                                                   np.atleast_1d(np.asarray(longitudes, dtype=np.float64)),
+                                                   np.atleast_1d(np.asarray(Z, dtype=np.float64)))
+    n_sites = latitudes.size
+    lat, lon, elev = latitudes.reshape(-1, 1), longitudes.reshape(-1, 1), Z.reshape(-1, 1)
+
+    def per_site(value):
+        if value is None:
+            return None
+        return np.broadcast_to(np.asarray(value, dtype=np.float64).reshape(-1, 1), (n_sites, 1))
+
+    T, P, turbidity = per_site(T), per_site(P), per_site(linke_turbidity)
+    surface_tilt, surface_azimuth, albedo = (per_site(surface_tilt), per_site(surface_azimuth),
+                                             per_site(albedo))
+
+    if T is None or P is None:
+        # The atmosphere depends only on the day of year; fill in a table of
+        # each site's conditions as new days are reached
+        T_days = np.full((n_sites, 367), np.nan)
+        P_days = np.full((n_sites, 367), np.nan)
+        known_days = np.zeros(367, dtype=bool)
+
+    for moment in _moment_chunks(moments, chunk_size):
+        unixtime, moment = _unixtime_array(moment)
+        day_of_year = _day_of_year_array(moment)
+        years, months = _year_month_array(moment)
+
+        # Time-only terms, shared by every site
+        delta_t = spa.calculate_deltat_array(years, months)
+        v, alpha, delta, _, xi = spa.solar_ephemeris_array(unixtime, delta_t)
+        dni_extra = _get_extra_radiation_shim(day_of_year if extraradiation_method == 'spencer' else moment,
+                                              solar_constant=solar_constant,
+                                              method=extraradiation_method,
+                                              epoch_year=int(years.flat[0]) if years.size else 2014)
+
+        T_chunk, P_chunk = T, P
+        if T is None or P is None:
+            new_days = np.unique(day_of_year[~known_days[day_of_year]])
+            if new_days.size:
+                atmosphere = ATMOSPHERE_NRLMSISE00.from_array(elev, lat, lon, day=new_days)
+                T_days[:, new_days] = atmosphere.T
+                P_days[:, new_days] = atmosphere.P
+                known_days[new_days] = True
+            if T is None:
+                T_chunk = T_days[:, day_of_year]
+            if P is None:
+                P_chunk = P_days[:, day_of_year]
+
+        apparent_zenith, zenith, _, _, azimuth = spa.topocentric_solar_position_array(
+            v, alpha, delta, xi, lat, lon, elev, pressure=P_chunk*1E-2,
+            temp=T_chunk - 273.15, atmos_refract=atmos_refract)
+
+        if turbidity is None:
+            linke_turbidity = np.array([_lookup_linke_turbidity_array(moment, latitudes[i], longitudes[i])
+                                        for i in range(n_sites)]).reshape(n_sites, -1)
+        else:
+            linke_turbidity = turbidity
+
+        ans = _clear_sky_poa_array(apparent_zenith, zenith, azimuth, elev, P_chunk, dni_extra,
+                                   linke_turbidity, surface_tilt, surface_azimuth,
+                                   solar_constant=solar_constant, albedo=albedo,
+                                   apparent=apparent, airmass_model=airmass_model)
+        yield (moment,) + ans
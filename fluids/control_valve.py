@@ -33,6 +33,8 @@ Sizing Functions
 ----------------
 .. autofunction:: size_control_valve_l
 .. autofunction:: size_control_valve_g
+.. autofunction:: size_control_valve_l_batch
+.. autofunction:: size_control_valve_g_batch
 
 Intermediary Sizing Calculations
 --------------------------------
@@ -63,10 +65,12 @@ Noise Generated by Control Valves
 from __future__ import division
 from math import sqrt, log10, exp, pi, log
 from fluids.constants import R, psi, gallon, minute
-from fluids.numerics import interp, implementation_optimize_tck, splev
+from fluids.numerics import interp, implementation_optimize_tck, splev, numpy as np
 from fluids.fittings import Cv_to_Kv, Kv_to_Cv
 
-__all__ = ['size_control_valve_l', 'size_control_valve_g', 'cavitation_index',
+__all__ = ['size_control_valve_l', 'size_control_valve_g',
+           'size_control_valve_l_batch', 'size_control_valve_g_batch',
+           'cavitation_index',
            'FF_critical_pressure_ratio_l', 'is_choked_turbulent_l',
            'is_choked_turbulent_g', 'Reynolds_valve',
            'loss_coefficient_piping', 'Reynolds_factor',
@@ -972,6 +976,385 @@ def size_control_valve_g(T, MW, mu, gamma, Z, P1, P2, Q, D1=None, D2=None,
     return C
 
 
+def _Reynolds_valve_array(nu, Q, D1, FL, Fd, C):
+    return N4*Fd*Q/nu*1.0/np.sqrt(C*FL)*np.sqrt(np.sqrt(FL*FL*C*C/N2*D1**-4.0 + 1.0))
+
+
+def _loss_coefficient_piping_array(d, D1, D2=None):
+    dr = d/D1
+    dr2 = dr*dr
+    loss = (1. - dr2*dr2) + 0.5*(1. - dr2)*(1.0 - dr2)
+    if D2 is not None:
+        dr = d/D2
+        dr2 = dr*dr
+        loss = loss + 1.0*(1. - dr2)*(1.0 - dr2) - (1. - dr2*dr2)
+    return loss
+
+
+def _Reynolds_factor_array(FL, C, d, Rev):
+    # Reynolds_factor, with reduced trim where C/d^2 > 0.016*N18
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n1 = N2/(np.minimum(C/(d*d), 0.04))**2
+        FR_1a = 1.0 + (0.33*np.sqrt(FL))/np.sqrt(np.sqrt(n1))*np.log10(Rev/10000.)
+        FR_2 = 0.026/FL*np.sqrt(n1*Rev)
+        FR_full = np.where(Rev < 10.0, FR_2, np.minimum(FR_2, FR_1a))
+        n2 = 1 + N32*(C/d**2)**(2/3.)
+        FR_3a = 1 + (0.33*np.sqrt(FL))/np.sqrt(np.sqrt(n2))*np.log10(Rev/10000.)
+        FR_4 = np.minimum(0.026/FL*np.sqrt(n2*Rev), 1)
+        FR_reduced = np.where(Rev < 10, FR_4, np.minimum(FR_3a, FR_4))
+    return np.where(C/d**2 > 0.016*N18, FR_reduced, FR_full)
+
+
+def _iterate_piping_laminar_array(C, active, nu, Q, D1, FL, Fd, d, iterations,
+                                  maxiter=1000):
+    # Increase C by 30% until the Reynolds number factor is large enough, for
+    # each case in `active`; as `iterate_piping_laminar_l` does recursively
+    Rev = np.full(C.shape, np.nan)
+    FR = np.full(C.shape, np.nan)
+    for _ in range(maxiter):
+        if not active.any():
+            break
+        Ci = 1.3*C
+        Rev_i = _Reynolds_valve_array(nu, Q, D1, FL, Fd, Ci)
+        FR_i = _Reynolds_factor_array(FL, Ci, d, Rev_i)
+        Rev = np.where(active, Rev_i, Rev)
+        FR = np.where(active, FR_i, FR)
+        iterations += active
+        again = active & (C/FR_i >= Ci)
+        C = np.where(active, Ci, C)
+        active = again
+    return C, Rev, FR, ~active
+
+
+def _batch_arrays(*values):
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+    return [np.array(a) for a in arrays]
+
+
+def size_control_valve_l_batch(rho, Psat, Pc, mu, P1, P2, Q, D1=None, D2=None,
+                               d=None, FL=0.9, Fd=1, allow_choked=True,
+                               allow_laminar=True, full_output=False,
+                               maxiter=20):
+    r'''Calculates flow coefficients of many control valves passing liquids
+    according to IEC 60534, as :obj:`size_control_valve_l` does for one. All
+    of the inputs may be arrays, which are broadcast together. The iterations
+    for the piping geometry factors and for the Reynolds number factor are
+    performed for every case at once, with each case stopping when it has
+    converged.
+
+    Parameters
+    ----------
+    rho : float or array-like
+        Density of the liquid at the inlet [kg/m^3]
+    Psat : float or array-like
+        Saturation pressure of the fluid at inlet temperature [Pa]
+    Pc : float or array-like
+        Critical pressure of the fluid [Pa]
+    mu : float or array-like
+        Viscosity of the fluid [Pa*s]
+    P1 : float or array-like
+        Inlet pressure of the fluid before valves and reducers [Pa]
+    P2 : float or array-like
+        Outlet pressure of the fluid after valves and reducers [Pa]
+    Q : float or array-like
+        Volumetric flow rate of the fluid [m^3/s]
+    D1 : float or array-like, optional
+        Diameter of the pipe before the valve [m]
+    D2 : float or array-like, optional
+        Diameter of the pipe after the valve [m]
+    d : float or array-like, optional
+        Diameter of the valve [m]
+    FL : float or array-like, optional
+        Liquid pressure recovery factor of a control valve without attached
+        fittings []
+    Fd : float or array-like, optional
+        Valve style modifier []
+    allow_choked : bool, optional
+        Overrides the automatic transition into the choked regime if this is
+        False and returns as if choked flow does not exist
+    allow_laminar : bool, optional
+        Overrides the automatic transition into the laminar regime if this is
+        False and returns as if laminar flow does not exist
+    full_output : bool, optional
+        If True, returns intermediate calculation values as
+        well as Kv in the form of a dictionary of arrays containing 'Kv',
+        'Rev', 'choked', 'FF', 'FLP', 'FR', 'FP', 'laminar', 'iterations',
+        and 'converged'; values which are not used in the calculation of a
+        case are NaN.
+    maxiter : int, optional
+        Maximum number of iterations for the piping geometry factors, [-]
+
+    Returns
+    -------
+    Kv : ndarray
+        Metric Kv valve flow coefficient (flow rate of water at a pressure drop
+        of 1 bar) [m^3/hr]
+
+    Notes
+    -----
+    `iterations` is the number of evaluations of the piping geometry factors
+    or of the Reynolds number factor for each case, and `converged` is False
+    for cases whose iterations stopped without converging. Cases without a
+    solution, for which the equations involve the square root of a negative
+    number, have a `Kv` of NaN.
+    Unlike :obj:`size_control_valve_l`, which reports the factors of the first
+    iteration, 'FP', 'FLP', 'FR', and 'choked' are those of the last
+    iteration of each case.
+
+    Examples
+    --------
+    Examples 1 and 2 of [1]_ at once:
+
+    >>> size_control_valve_l_batch(rho=965.4, Psat=70.1E3, Pc=22120E3,
+    ... mu=3.1472E-4, P1=680E3, P2=220E3, Q=0.1, D1=[0.15, 0.1],
+    ... D2=[0.15, 0.1], d=[0.15, 0.1], FL=[0.9, 0.6], Fd=[0.46, 0.98])
+    array([164.99547637, 238.05817217])
+
+    References
+    ----------
+    .. [1] IEC 60534-2-1 / ISA-75.01.01-2007
+    '''
+    no_diameters = D1 is None and D2 is None and d is None
+    if no_diameters:
+        D1 = D2 = d = 1.0
+    rho, Psat, Pc, mu, P1, P2, Q, D1, D2, d, FL, Fd = _batch_arrays(
+            rho, Psat, Pc, mu, P1, P2, Q, D1, D2, d, FL, Fd)
+    nan = np.full(rho.shape, np.nan)
+    iterations = np.zeros(rho.shape, dtype=int)
+    converged = np.ones(rho.shape, dtype=bool)
+    FP, FLP, FR = nan.copy(), nan.copy(), nan.copy()
+    # Pa to kPa, according to constants in standard
+    P1, P2, Psat, Pc = P1/1000., P2/1000., Psat/1000., Pc/1000.
+    Q = Q*3600. # m^3/s to m^3/hr, according to constants in standard
+    nu = mu/rho # kinematic viscosity used in standard
+    MAX_C_POSSIBLE = 1E40 # Quit iterations if C reaches this high
+
+    dP = P1 - P2
+    FF = 0.96 - 0.28*np.sqrt(Psat/Pc)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        choked = dP >= FL*FL*(P1-FF*Psat)
+        if allow_choked:
+            # Choked flow, equation 3; non-choked flow, eq 1
+            C = np.where(choked, Q/N1/FL*np.sqrt(rho/rho0/(P1 - FF*Psat)),
+                         Q/N1*np.sqrt(rho/rho0/dP))
+        else:
+            C = Q/N1*np.sqrt(rho/rho0/dP)
+        if no_diameters:
+            # Assume turbulent if no diameters are provided, no other calculations
+            Rev = Rev_out = np.full(rho.shape, 1e5)
+        else:
+            # m to mm, according to constants in standard
+            D1, D2, d = D1*1000., D2*1000., d*1000.
+            Rev = _Reynolds_valve_array(nu=nu, Q=Q, D1=D1, FL=FL, Fd=Fd, C=C)
+            turbulent = (Rev > 10000) | (not allow_laminar)
+            active = turbulent & ((D1 != d) | (D2 != d))
+            # liquid, using Fp and FLP
+            loss = _loss_coefficient_piping_array(d, D1, D2)
+            loss_upstream = np.where(d > D1, 0.0, _loss_coefficient_piping_array(d, D1))
+            Ci = C
+            for i in range(maxiter + 1):
+                if not active.any():
+                    break
+                FP_i = 1.0/np.sqrt(1 + loss/N2*(Ci/d**2)**2)
+                FLP_i = FL*1.0/np.sqrt(1 + FL**2/N2*loss_upstream*(Ci/d**2)**2)
+                choked_i = dP >= FLP_i*FLP_i/(FP_i*FP_i)*(P1-FF*Psat)
+                # Choked flow with piping, equation 4; non-choked, equation 5
+                C_i = np.where(choked_i, Q/N1/FLP_i*np.sqrt(rho/rho0/(P1-FF*Psat)),
+                               Q/N1/FP_i*np.sqrt(rho/rho0/dP))
+                C = np.where(active, C_i, C)
+                FP = np.where(active, FP_i, FP)
+                FLP = np.where(active, FLP_i, FLP)
+                choked = np.where(active, choked_i, choked)
+                iterations += active
+                stopped = (i == maxiter) | (Ci >= MAX_C_POSSIBLE)
+                converged &= ~(active & stopped)
+                active = active & (Ci/C_i < 0.99) & ~stopped
+                Ci = C_i
+
+            laminar = (Rev <= 10000) & allow_laminar
+            C, Rev_laminar, FR_laminar, converged_laminar = _iterate_piping_laminar_array(
+                    C, laminar, nu, Q, D1, FL, Fd, d, iterations)
+            FR = np.where(laminar, FR_laminar, FR)
+            converged &= converged_laminar
+            Rev_out = np.where(laminar, Rev_laminar, Rev)
+    converged &= ~np.isnan(C)
+    if full_output:
+        return {'Kv': C, 'Rev': Rev_out,
+                'choked': choked, 'FF': FF, 'FLP': FLP, 'FP': FP, 'FR': FR,
+                'laminar': Rev <= 10000, 'iterations': iterations,
+                'converged': converged}
+    return C
+
+
+def size_control_valve_g_batch(T, MW, mu, gamma, Z, P1, P2, Q, D1=None, D2=None,
+                               d=None, FL=0.9, Fd=1, xT=0.7, allow_choked=True,
+                               allow_laminar=True, full_output=False,
+                               maxiter=20):
+    r'''Calculates flow coefficients of many control valves passing gases
+    according to IEC 60534, as :obj:`size_control_valve_g` does for one. All
+    of the inputs may be arrays, which are broadcast together. The iterations
+    for the piping geometry factors and for the Reynolds number factor are
+    performed for every case at once, with each case stopping when it has
+    converged.
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the gas at the inlet [K]
+    MW : float or array-like
+        Molecular weight of the gas [g/mol]
+    mu : float or array-like
+        Viscosity of the fluid at inlet conditions [Pa*s]
+    gamma : float or array-like
+        Specific heat capacity ratio [-]
+    Z : float or array-like
+        Compressibility factor at inlet conditions, [-]
+    P1 : float or array-like
+        Inlet pressure of the gas before valves and reducers [Pa]
+    P2 : float or array-like
+        Outlet pressure of the gas after valves and reducers [Pa]
+    Q : float or array-like
+        Volumetric flow rate of the gas at *273.15 K* and 1 atm specifically
+        [m^3/s]
+    D1 : float or array-like, optional
+        Diameter of the pipe before the valve [m]
+    D2 : float or array-like, optional
+        Diameter of the pipe after the valve [m]
+    d : float or array-like, optional
+        Diameter of the valve [m]
+    FL : float or array-like, optional
+        Liquid pressure recovery factor of a control valve without attached
+        fittings []
+    Fd : float or array-like, optional
+        Valve style modifier []
+    xT : float or array-like, optional
+        Pressure difference ratio factor of a valve without fittings at choked
+        flow [-]
+    allow_choked : bool, optional
+        Overrides the automatic transition into the choked regime if this is
+        False and returns as if choked flow does not exist
+    allow_laminar : bool, optional
+        Overrides the automatic transition into the laminar regime if this is
+        False and returns as if laminar flow does not exist
+    full_output : bool, optional
+        If True, returns intermediate calculation values as
+        well as Kv in the form of a dictionary of arrays containing 'Kv',
+        'Rev', 'choked', 'Y', 'FR', 'FP', 'xTP', 'laminar', 'iterations', and
+        'converged'; values which are not used in the calculation of a case
+        are NaN.
+    maxiter : int, optional
+        Maximum number of iterations for the piping geometry factors, [-]
+
+    Returns
+    -------
+    Kv : ndarray
+        Metric Kv valve flow coefficient (flow rate of water at a pressure drop
+        of 1 bar) [m^3/hr]
+
+    Notes
+    -----
+    `iterations` is the number of evaluations of the piping geometry factors
+    or of the Reynolds number factor for each case, and `converged` is False
+    for cases whose iterations stopped without converging. Cases without a
+    solution, for which the equations involve the square root of a negative
+    number, have a `Kv` of NaN.
+    Unlike :obj:`size_control_valve_g`, which reports the factors of the first
+    iteration, 'FP', 'xTP', and 'FR' are those of the last iteration of each
+    case.
+
+    Examples
+    --------
+    Examples 3 and 4 of [1]_ at once:
+
+    >>> size_control_valve_g_batch(T=[433., 320.], MW=[44.01, 39.95],
+    ... mu=[1.4665E-4, 5.625E-5], gamma=[1.30, 1.67], Z=[0.988, 1.0],
+    ... P1=[680E3, 2.8E5], P2=[310E3, 1.3E5], Q=[38/36., 0.46/3600.],
+    ... D1=[0.08, 0.015], D2=[0.1, 0.015], d=[0.05, 0.015], FL=[0.85, 0.98],
+    ... Fd=[0.42, 0.07], xT=[0.60, 0.8])
+    array([7.25866455e+01, 1.64987653e-02])
+
+    References
+    ----------
+    .. [1] IEC 60534-2-1 / ISA-75.01.01-2007
+    '''
+    no_diameters = D1 is None and D2 is None and d is None
+    if no_diameters:
+        D1 = D2 = d = 1.0
+    T, MW, mu, gamma, Z, P1, P2, Q, D1, D2, d, FL, Fd, xT = _batch_arrays(
+            T, MW, mu, gamma, Z, P1, P2, Q, D1, D2, d, FL, Fd, xT)
+    nan = np.full(T.shape, np.nan)
+    iterations = np.zeros(T.shape, dtype=int)
+    converged = np.ones(T.shape, dtype=bool)
+    FP, xTP, FR = nan.copy(), nan.copy(), nan.copy()
+    MAX_C_POSSIBLE = 1E40 # Quit iterations if C reaches this high
+    # Pa to kPa, according to constants in standard
+    P1, P2 = P1*1e-3, P2*1e-3
+    Q = Q*3600. # m^3/s to m^3/hr, according to constants in standard
+    # Convert dynamic viscosity to kinematic viscosity
+    Vm = Z*R*T/(P1*1000)
+    rho = MW*1e-3/Vm
+    nu = mu/rho # kinematic viscosity used in standard
+
+    dP = P1 - P2
+    Fgamma = gamma/1.40
+    x = dP/P1
+    Y = np.maximum(1 - x/(3*Fgamma*xT), 2/3.)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        choked = x >= Fgamma*xT
+        if allow_choked:
+            # Choked, and flow coefficient from eq 14a; non-choked from eq 8a
+            C = np.where(choked, Q/(N9*P1*Y)*np.sqrt(MW*T*Z/xT/Fgamma),
+                         Q/(N9*P1*Y)*np.sqrt(MW*T*Z/x))
+        else:
+            C = Q/(N9*P1*Y)*np.sqrt(MW*T*Z/x)
+        if no_diameters:
+            # Assume turbulent if no diameters are provided, no other calculations
+            Rev = np.full(T.shape, 1e5)
+            Rev_out = nan
+        else:
+            # m to mm, according to constants in standard
+            D1, D2, d = D1*1000., D2*1000., d*1000.
+            Rev = _Reynolds_valve_array(nu=nu, Q=Q, D1=D1, FL=FL, Fd=Fd, C=C)
+            turbulent = (Rev > 10000) | (not allow_laminar)
+            active = turbulent & ((D1 != d) | (D2 != d))
+            # gas, using xTP and FLP
+            loss = _loss_coefficient_piping_array(d, D1, D2)
+            loss_upstream = _loss_coefficient_piping_array(d, D1)
+            Ci = C
+            for i in range(maxiter + 1):
+                if not active.any():
+                    break
+                FP_i = 1.0/np.sqrt(1. + loss/N2*(Ci/d**2)**2)
+                xTP_i = xT/FP_i**2/(1 + xT*loss_upstream/N5*(Ci/d**2)**2)
+                choked_i = x >= Fgamma*xTP_i
+                # Choked flow with piping, equation 17a; non-choked, equation 11a
+                C_i = np.where(choked_i, Q/(N9*FP_i*P1*Y)*np.sqrt(MW*T*Z/xTP_i/Fgamma),
+                               Q/(N9*FP_i*P1*Y)*np.sqrt(MW*T*Z/x))
+                C = np.where(active, C_i, C)
+                FP = np.where(active, FP_i, FP)
+                xTP = np.where(active, xTP_i, xTP)
+                choked = np.where(active, choked_i, choked)
+                iterations += active
+                stopped = (i == maxiter) | (Ci >= MAX_C_POSSIBLE)
+                converged &= ~(active & stopped)
+                active = active & (Ci/C_i < 0.99) & ~stopped
+                Ci = C_i
+
+            laminar = (Rev <= 10000) & allow_laminar
+            C, Rev_laminar, FR_laminar, converged_laminar = _iterate_piping_laminar_array(
+                    C, laminar, nu, Q, D1, FL, Fd, d, iterations)
+            FR = np.where(laminar, FR_laminar, FR)
+            converged &= converged_laminar
+            Rev_out = np.where(laminar, Rev_laminar, Rev)
+    converged &= ~np.isnan(C)
+    if full_output:
+        return {'Kv': C, 'Rev': Rev_out, 'choked': choked, 'Y': Y, 'FP': FP,
+                'xTP': xTP, 'FR': FR, 'laminar': Rev <= 10000,
+                'iterations': iterations, 'converged': converged}
+    return C
+
+
 # Valve data from Emerson Valve Handbook 5E
 # Quick opening valve data, spline fit, and interpolating function
 opening_quick = [0.0, 0.0136, 0.02184, 0.03256, 0.04575, 0.06221, 0.07459, 0.0878, 0.10757, 0.12654, 0.14301, 0.16032,
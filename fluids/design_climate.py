@@ -24,8 +24,11 @@ SOFTWARE.
 from __future__ import division
 
 __all__ = ['get_clean_isd_history', 'IntegratedSurfaceDatabaseStation',
-           'get_closest_station', 'get_station_year_text', 'gsod_day_parser',
+           'get_closest_station', 'get_closest_stations', 'get_station_year_text', 'gsod_day_parser',
+           'gsod_year_parser', 'get_station_year_columns', 'GSODCache',
            'StationDataGSOD', 'heating_degree_days', 'cooling_degree_days', 'stations',
+           'IntegratedSurfaceDatabaseStations', 'read_isd_history',
+           'build_isd_history_table', 'load_isd_history_table',
 #           'geopy_geolocator', 'geopy_cache', 'SimpleGeolocatorCache',
            'geocode']
 
@@ -36,6 +39,7 @@ except: # pragma: no cover
 from io import open
 import os
 import gzip
+import time
 import datetime
 from calendar import isleap
 from collections import namedtuple
@@ -43,8 +47,7 @@ from collections import namedtuple
 import numpy as np
 from fluids.core import F2K
 from fluids.constants import mile, knot, inch
-from scipy.spatial import cKDTree
-from scipy.stats import scoreatpercentile
+from fluids.numerics import PY37
 
 
 try: # pragma: no cover
@@ -333,6 +336,8 @@ def get_clean_isd_history(dest=os.path.join(folder, 'isd-history-cleaned.tsv'),
     import pandas as pd
     df = pd.read_csv(url, dtype={'USAF': str, 'WBAN': str})
     df.to_csv(dest, sep='\t', index=False, header=False)
+    build_isd_history_table(src=dest,
+                            dest=os.path.join(os.path.dirname(dest), 'isd-history-cleaned.npy'))
 
 
 class IntegratedSurfaceDatabaseStation(object):
@@ -406,8 +411,9 @@ class IntegratedSurfaceDatabaseStation(object):
 
 class StationDataGSOD(object):
     # Holds data, caches and retrieves data
-    def __init__(self, station, data_dir_override=None):
+    def __init__(self, station, data_dir_override=None, cache=None):
         self.data_dir_override = data_dir_override
+        self.cache = cache
         self.station = station
 
         self.begin = datetime.datetime.strptime(str(self.station.BEGIN), '%Y%m%d')
@@ -418,7 +424,8 @@ class StationDataGSOD(object):
 #         Would be nice to create these later, when using a download_data method
         self.raw_text = {}
         self.raw_data = {}
-        self.parsed_data = {}
+        self.columns = {}
+        self._parsed_data = None
         self.load_empty_vectors()
         self.download_data()
         self.parse_data()
@@ -427,11 +434,21 @@ class StationDataGSOD(object):
         for year in self.year_range:
             days_in_year = 366 if isleap(year) else 365
             self.raw_data[year] = [None]*days_in_year
-            self.parsed_data[year] = [None]*days_in_year
             self.raw_text[year] = None
 #        days = [None]*days_in_year(y)
 
     def download_data(self):
+        if self.cache is not None:
+            # Parsed station-years are kept in the cache, not as text
+            for year in self.year_range:
+                if year not in self.columns:
+                    try:
+                        self.columns[year] = get_station_year_columns(self.station.USAF, self.station.WBAN, year,
+                                                                      data_dir_override=self.data_dir_override,
+                                                                      cache=self.cache)
+                    except:
+                        pass
+            return
         for year in self.year_range:
             if self.raw_text[year] is None:
                 try:
@@ -441,13 +458,27 @@ class StationDataGSOD(object):
                     pass
 
     def parse_data(self):
+        # Each year is parsed into columns; the per-day namedtuples of
+        # `parsed_data` are only created if they are asked for
         for year, data in self.raw_text.items():
-            if data is not None:
-                days = self.parsed_data[year]
-                for line in data.split('\n')[1:-1]:
-                    parsed = gsod_day_parser(line)
-                    doy = parsed.DATE.timetuple().tm_yday-1
-                    days[doy] = parsed
+            if data is not None and year not in self.columns:
+                self.columns[year] = gsod_year_parser(data)
+        self._parsed_data = None
+
+    @property
+    def parsed_data(self):
+        if self._parsed_data is None:
+            parsed_data = {}
+            for year in self.year_range:
+                days_in_year = 366 if isleap(year) else 365
+                days = parsed_data[year] = [None]*days_in_year
+                if year in self.columns:
+                    for record in self.columns[year]:
+                        parsed = _gsod_day_from_record(record)
+                        doy = parsed.DATE.timetuple().tm_yday-1
+                        days[doy] = parsed
+            self._parsed_data = parsed_data
+        return self._parsed_data
 
     def coldest_month(self, older_year=None, newer_year=None, minimum_days=23):
         # Tested
@@ -463,64 +494,46 @@ class StationDataGSOD(object):
                                                     minimum_days=minimum_days)
         return month_data.index(max(month_data))
 
-    def month_average_temperature(self, older_year=None, newer_year=None,
-                                  include_yearly=False, minimum_days=23):
-        '''
-        >> station = get_closest_station(38.8572, -77.0369)
-        >> station_data = StationDataGSOD(station)
-        >> station_data.month_average_temperature(1990, 2000, include_yearly=False)
-        [276.1599380905833, 277.5375516246206, 281.1881231671554, 286.7367003367004, 291.8689638318671, 296.79545454545456, 299.51868686868687, 298.2097914630174, 294.4116161616162, 288.25883023786247, 282.3188552188553, 277.8282339524275]
+    def year_columns(self, older_year, newer_year, attr):
+        '''Concatenate the values of one field over the years with data in
+        the inclusive range `older_year` to `newer_year`.
         '''
+        values = [days[attr] for year, days in self.columns.items()
+                  if older_year <= year <= newer_year]
+        if not values:
+            return np.zeros(0, dtype=gsod_year_dtype[attr])
+        return np.concatenate(values)
+
+    def month_average(self, attr, older_year=None, newer_year=None,
+                      include_yearly=False, minimum_days=23):
         # Take years, make them inclusive; add minimum valid days.
         year_month_averages = {}
-        year_month_counts = {}
-
-        for year, data in self.parsed_data.items():
+        for year in self.year_range:
             if not (older_year <= year <= newer_year):
                 continue # Ignore out-of-range years easily
-            year_month_averages[year] = [0.0]*12
-            year_month_counts[year] = [0]*12
-
-            for i, day in enumerate(data):
-                if day is None:
-                    continue
-                # Don't do these comparisons to make it fast
-                if day.DATE.year < older_year or day.DATE.year > newer_year:
-                    continue # Ignore out-of-range days as possible
-
-                T = day.TEMP
-                if T is None:
-                    continue
-                # Cache these lookups
-                year_month_averages[year][day.DATE.month-1] += T
-                year_month_counts[year][day.DATE.month-1] += 1
-
+            averages = year_month_averages[year] = [None]*12
+            days = self.columns.get(year)
+            if days is None:
+                continue
+            values = days[attr]
+            valid = ~np.isnan(values)
+            months = days['DATE'][valid].astype('M8[M]').astype(np.int64) % 12
+            # bincount adds in day order, so the sums match a simple loop
+            sums = np.bincount(months, weights=values[valid], minlength=12)
+            counts = np.bincount(months, minlength=12)
             for month in range(12):
-                count = year_month_counts[year][month]
-                if count < minimum_days:
-                    ans = None
-                else:
-                    ans = year_month_averages[year][month]/count
-                year_month_averages[year][month] = ans
+                count = int(counts[month])
+                if count >= minimum_days:
+                    averages[month] = float(sums[month])/count
 
         # Compute the average of the month
         actual_averages = [0.0]*12
         actual_averages_counts = [0]*12
         for year, average in year_month_averages.items():
             for month in range(12):
-                if average is not None and average[month] is not None:
-                    count = actual_averages_counts[month]
-                    if count is None:
-                        count = 1
-                    else:
-                        count += 1
-                    actual_averages_counts[month] = count
-                    month_average_sum = actual_averages[month]
-                    if month_average_sum is None:
-                        month_average_sum = average[month]
-                    else:
-                        month_average_sum += average[month]
-                    actual_averages[month] = month_average_sum
+                if average[month] is not None:
+                    actual_averages_counts[month] += 1
+                    actual_averages[month] += average[month]
 
         for month in range(12):
             actual_averages[month] = actual_averages[month]/actual_averages_counts[month]
@@ -532,116 +545,273 @@ class StationDataGSOD(object):
         else:
             return actual_averages
 
-    # Copy and paste
+    def month_average_temperature(self, older_year=None, newer_year=None,
+                                  include_yearly=False, minimum_days=23):
+        '''
+        >> station = get_closest_station(38.8572, -77.0369)
+        >> station_data = StationDataGSOD(station)
+        >> station_data.month_average_temperature(1990, 2000, include_yearly=False)
+        [276.1599380905833, 277.5375516246206, 281.1881231671554, 286.7367003367004, 291.8689638318671, 296.79545454545456, 299.51868686868687, 298.2097914630174, 294.4116161616162, 288.25883023786247, 282.3188552188553, 277.8282339524275]
+        '''
+        return self.month_average('TEMP', older_year=older_year,
+                                  newer_year=newer_year,
+                                  include_yearly=include_yearly,
+                                  minimum_days=minimum_days)
+
     def month_average_windspeed(self, older_year=None, newer_year=None,
                                   include_yearly=False, minimum_days=23):
-        # Take years, make them inclusive; add minimum valid days.
-        year_month_averages = {}
-        year_month_counts = {}
+        return self.month_average('WDSP', older_year=older_year,
+                                  newer_year=newer_year,
+                                  include_yearly=include_yearly,
+                                  minimum_days=minimum_days)
+
+    def percentile_condition(self, percentile, older_year=None, newer_year=None,
+                             attr='TEMP'):
+        '''Percentile of the daily values of a field over the days with data
+        in the inclusive range `older_year` to `newer_year`; for example the
+        99th percentile of `MAX` or 1st percentile of `MIN` for design
+        temperatures.
+        '''
+        values = self.year_columns(older_year, newer_year, attr)
+        return float(np.percentile(values[~np.isnan(values)], percentile))
+
+    def degree_days(self, older_year=None, newer_year=None, T_base=None,
+                    heating=True):
+        '''Total heating (or cooling) degree days of each year in the
+        inclusive range `older_year` to `newer_year`, from the daily mean
+        temperatures; days without data are skipped. See
+        :obj:`heating_degree_days` and :obj:`cooling_degree_days`.
+        '''
+        if T_base is None:
+            T_base = 291.4833333333333 if heating else 283.15
+        totals = {}
+        for year, days in self.columns.items():
+            if older_year <= year <= newer_year:
+                T = days['TEMP'][~np.isnan(days['TEMP'])]
+                dd = T - T_base if heating else T_base - T
+                totals[year] = float(np.maximum(dd, 0.0).sum())
+        return totals
 
+    def percentile_extreme_condition(self, older_year=None, newer_year=None,
+                                  include_yearly=False, minimum_days=23, attr='WDSP'):
+        # Really need to normalize data with interpolation etc here.
+        # Need to get the data, and process it and score interpolation regimes.
+        # Or could just randomly drop data and try to fill it in.
+        accepted_values = []
         for year, data in self.parsed_data.items():
             if not (older_year <= year <= newer_year):
                 continue # Ignore out-of-range years easily
-            year_month_averages[year] = [0.0]*12
-            year_month_counts[year] = [0]*12
 
-            for i, day in enumerate(data):
-                if day is None:
-                    continue
-                # Don't do these comparisons to make it fast
-                if day.DATE.year < older_year or day.DATE.year > newer_year:
-                    continue # Ignore out-of-range days as possible
 
-                wind_speed = day.WDSP
-                if wind_speed is None:
-                    continue
-                # Cache these lookups
-                year_month_averages[year][day.DATE.month-1] += wind_speed
-                year_month_counts[year][day.DATE.month-1] += 1
 
-            for month in range(12):
-                count = year_month_counts[year][month]
-                if count < minimum_days:
-                    ans = None
-                else:
-                    ans = year_month_averages[year][month]/count
-                year_month_averages[year][month] = ans
+isd_history_fields = ('USAF', 'WBAN', 'NAME', 'CTRY', 'ST', 'ICAO', 'LAT',
+                      'LON', 'ELEV', 'BEGIN', 'END')
+isd_history_text_fields = isd_history_fields[0:6]
+isd_history_float_fields = isd_history_fields[6:9]
+isd_history_date_fields = isd_history_fields[9:11]
+isd_history_tsv_path = os.path.join(folder, 'isd-history-cleaned.tsv')
+isd_history_table_path = os.path.join(folder, 'isd-history-cleaned.npy')
 
-        # Compute the average of the month
-        actual_averages = [0.0]*12
-        actual_averages_counts = [0]*12
-        for year, average in year_month_averages.items():
-            for month in range(12):
-                if average is not None and average[month] is not None:
-                    count = actual_averages_counts[month]
-                    if count is None:
-                        count = 1
-                    else:
-                        count += 1
-                    actual_averages_counts[month] = count
-                    month_average_sum = actual_averages[month]
-                    if month_average_sum is None:
-                        month_average_sum = average[month]
-                    else:
-                        month_average_sum += average[month]
-                    actual_averages[month] = month_average_sum
 
-        for month in range(12):
-            actual_averages[month] = actual_averages[month]/actual_averages_counts[month]
+def _isd_history_value(i, v):
+    # Identifiers keep their text; everything after the name is numeric if
+    # possible. 99999 marks a missing value in any column.
+    if v == '':
+        return None
+    value = v
+    try:
+        if i > 2:
+            value = float(v)
+        if int(v) == 99999:
+            value = None
+    except ValueError:
+        pass
+    return value
 
-        # Don't set anything as properties - too many variables used in calculating thems
-        # Speed is not that important.
-        if include_yearly:
-            return actual_averages, year_month_averages
-        else:
-            return actual_averages
 
-    def percentile_extreme_condition(self, older_year=None, newer_year=None,
-                                  include_yearly=False, minimum_days=23, attr='WDSP'):
-        # Really need to normalize data with interpolation etc here.
-        # Need to get the data, and process it and score interpolation regimes.
-        # Or could just randomly drop data and try to fill it in.
-        accepted_values = []
-        for year, data in self.parsed_data.items():
-            if not (older_year <= year <= newer_year):
-                continue # Ignore out-of-range years easily
+def read_isd_history(path=isd_history_tsv_path):
+    r'''Read the cleaned isd-history file written by
+    :obj:`get_clean_isd_history` into a list of the text fields of each
+    weather station which has a location. Stations are returned in the order of
+    the file.
 
+    Parameters
+    ----------
+    path : str, optional
+        Path of the tab-separated isd-history file, [-]
 
+    Returns
+    -------
+    rows : list[list[str]]
+        The eleven text fields of each station with a known latitude and
+        longitude, [-]
+    '''
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            values = line.rstrip('\n').split('\t')[0:11]
+            lat = _isd_history_value(6, values[6])
+            lon = _isd_history_value(7, values[7])
+            if lat and lon:
+                # Some stations have no lat-long; this isn't useful
+                rows.append(values)
+    return rows
+
+
+def build_isd_history_table(src=isd_history_tsv_path,
+                            dest=isd_history_table_path):
+    r'''Convert the cleaned isd-history file into the fixed-width binary
+    table used by fluids to look up weather stations. The table is a NumPy
+    structured array with one record per station; identifiers are stored as
+    UTF-8 bytes (empty when missing), the coordinates and elevation as floats
+    (NaN when missing), and the record dates as integers.
 
-stations = []
-_latlongs = []
-'''Read in the parsed data into
-1) a list of latitudes and longitudes, temporary, which will get converted to
-a numpy array for use in KDTree
-2) a list of IntegratedSurfaceDatabaseStation objects; the query will return
-the index of the nearest weather stations.
-'''
-with open(os.path.join(folder, 'isd-history-cleaned.tsv'), encoding='utf-8') as f:
-    for line in f:
-        values = line.split('\t')
-        for i in range(0, 11):
-            # First two are not values
-            v = values[i]
-            if v == '':
-                values[i] = None # '' case
-            else:
-                try:
-                    if i > 2:
-                        values[i] = float(v)
-                    if int(v) == 99999:
-                        values[i] = None
-                except:
-                    continue
-        lat, lon = values[6], values[7]
-        if lat and lon:
-            # Some stations have no lat-long; this isn't useful
-            stations.append(IntegratedSurfaceDatabaseStation(*values))
-            _latlongs.append((lat, lon))
-_latlongs = np.array(_latlongs)
+    Parameters
+    ----------
+    src : str, optional
+        Path of the tab-separated isd-history file, [-]
+    dest : str or None, optional
+        Path to write the table to in NumPy's `.npy` format; None to only
+        return it, [-]
+
+    Returns
+    -------
+    table : ndarray
+        Structured array of the stations, [-]
+
+    Notes
+    -----
+    The table is opened as a memory map, so only the pages of stations
+    which are accessed are ever read from disk. It must be rebuilt whenever
+    the isd-history file is updated.
+    '''
+    rows = read_isd_history(src)
+    text_columns = []
+    for i, name in enumerate(isd_history_text_fields):
+        column = [(row[i] if _isd_history_value(i, row[i]) is not None else '').encode('utf-8')
+                  for row in rows]
+        text_columns.append(column)
+    dtype = [(name, 'S%d' %(max(1, max(len(v) for v in column))))
+             for name, column in zip(isd_history_text_fields, text_columns)]
+    dtype += [(name, '<f8') for name in isd_history_float_fields]
+    dtype += [(name, '<i4') for name in isd_history_date_fields]
+
+    table = np.zeros(len(rows), dtype=dtype)
+    for name, column in zip(isd_history_text_fields, text_columns):
+        table[name] = column
+    for i, name in enumerate(isd_history_float_fields, 6):
+        values = [_isd_history_value(i, row[i]) for row in rows]
+        table[name] = [np.nan if v is None else v for v in values]
+    for i, name in enumerate(isd_history_date_fields, 9):
+        table[name] = [int(_isd_history_value(i, row[i])) for row in rows]
+    if dest is not None:
+        np.save(dest, table)
+    return table
+
+
+def load_isd_history_table(path=isd_history_table_path):
+    r'''Open the binary table of weather stations as a read-only memory
+    map. If the table cannot be read, it is rebuilt in memory from the
+    isd-history text file.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the table written by :obj:`build_isd_history_table`, [-]
+
+    Returns
+    -------
+    table : ndarray
+        Structured array of the stations, [-]
+    '''
+    try:
+        return np.load(path, mmap_mode='r')
+    except (IOError, OSError, ValueError):  # pragma: no cover
+        return build_isd_history_table(dest=None)
+
+
+def _station_from_record(record):
+    values = [_isd_history_value(i, record[name].decode('utf-8'))
+              for i, name in enumerate(isd_history_text_fields)]
+    for name in isd_history_float_fields:
+        v = float(record[name])
+        values.append(None if v != v else v)
+    for name in isd_history_date_fields:
+        values.append(int(record[name]))
+    return IntegratedSurfaceDatabaseStation(*values)
+
+
+class IntegratedSurfaceDatabaseStations(object):
+    '''Read-only sequence of the weather stations in a binary isd-history
+    table. A :obj:`IntegratedSurfaceDatabaseStation` object is only created
+    when a station is first accessed, and is then kept so the same object is
+    returned every time.
+    '''
+    __slots__ = ['table', 'cache']
+
+    def __init__(self, table):
+        self.table = table
+        self.cache = [None]*len(table)
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self.cache)))]
+        station = self.cache[i]
+        if station is None:
+            station = self.cache[i] = _station_from_record(self.table[i])
+        return station
+
+    def __iter__(self):
+        for i in range(len(self.cache)):
+            yield self[i]
+
+
+isd_history_table = load_isd_history_table()
+stations = IntegratedSurfaceDatabaseStations(isd_history_table)
 station_count = len(stations)
 
 
-kd_tree = cKDTree(_latlongs) # _latlongs must be unchanged as data is not copied
+earth_radius = 6371008.8 # IUGG mean radius of the earth, [m]
+
+
+def _unit_sphere_points(latitudes, longitudes):
+    # Stations are indexed by their position on the unit sphere so the
+    # Euclidean chord distance in the KDTree orders them by great-circle
+    # distance, with no distortion near the poles or the antimeridian
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat*np.cos(lon), cos_lat*np.sin(lon), np.sin(lat)))
+
+
+def _chord_to_great_circle(chord):
+    return 2.0*earth_radius*np.arcsin(np.minimum(0.5*chord, 1.0))
+
+
+def _load_station_index():
+    '''Build the array of station latitudes and longitudes and the KDTree
+    used to search it, on the first station query.
+    '''
+    global _latlongs, _station_points, kd_tree
+    from scipy.spatial import cKDTree
+    _latlongs = np.column_stack((isd_history_table['LAT'],
+                                 isd_history_table['LON']))
+    _station_points = _unit_sphere_points(_latlongs[:, 0], _latlongs[:, 1])
+    kd_tree = cKDTree(_station_points) # _station_points must be unchanged as data is not copied
+    return _latlongs, kd_tree
+
+
+if PY37:
+    def __getattr__(name):
+        if name == '_latlongs':
+            return _load_station_index()[0]
+        elif name == 'kd_tree':
+            return _load_station_index()[1]
+        raise AttributeError("module %s has no attribute %s" %(__name__, name))
+else:  # pragma: no cover
+    _load_station_index()
 
 
 def get_closest_station(latitude, longitude, minumum_recent_data=20140000,
@@ -679,6 +849,9 @@ def get_closest_station(latitude, longitude, minumum_recent_data=20140000,
     slower as more points are requested. Bad data is returned from a KDTree
     search if more points are requested than are available.
 
+    Distances are great-circle distances on a spherical earth, so searches
+    near the poles and across the antimeridian are not distorted.
+
     Examples
     --------
     >>> get_closest_station(51.02532675, -114.049868485806, 20150000)
@@ -688,10 +861,12 @@ def get_closest_station(latitude, longitude, minumum_recent_data=20140000,
     # Searching for 100 stations is fine, 70 microseconds vs 50 microsecond for 1
     # but there's little point for more points, it gets slower.
     # bad data is returned if k > station_count
-    distances, indexes = kd_tree.query([latitude, longitude], k=min(match_max, station_count))
+    if 'kd_tree' not in globals():
+        _load_station_index()
+    distances, indexes = kd_tree.query(_unit_sphere_points(latitude, longitude)[0],
+                                       k=min(match_max, station_count))
     #
     for i in indexes:
-        latlon = _latlongs[i]
         enddate = stations[i].END
         # Iterate for all indexes until one is found whose date is current
         if enddate > minumum_recent_data:
@@ -702,6 +877,79 @@ def get_closest_station(latitude, longitude, minumum_recent_data=20140000,
                     'specified near the specified coordinates.')
 
 
+def get_closest_stations(latitudes, longitudes, minumum_recent_data=20140000,
+                         match_max=100):
+    """Query function to find the nearest weather station to each of many
+    coordinates at once, optionally requiring each station to have data more
+    recent than a specified date. This is the batch version of
+    :obj:`get_closest_station`; the KDTree is queried once for all points,
+    and only the points without a sufficiently recent station among their
+    candidates are searched again with more candidates. Stations are found
+    by great-circle distance on a spherical earth.
+
+    Parameters
+    ----------
+    latitudes : array-like
+        Latitudes to search for nearby weather stations at, [degrees]
+    longitudes : array-like
+        Longitudes to search for nearby weather stations at, [degrees]
+    minumum_recent_data : int, optional
+        Date that the weather stations are required to have more recent
+        weather data than; format YYYYMMDD; set this to 0 to not restrict data
+        by date.
+    match_max : int, optional
+        The number of results in the KDTree to search for before
+        applying the filtering criteria; increased automatically for the
+        points where it is insufficient [-]
+
+    Returns
+    -------
+    indexes : ndarray[int]
+        Index of the nearest station with sufficiently recent data in
+        `stations` for each point, in the broadcast shape of the inputs [-]
+    distances : ndarray[float]
+        Great-circle distance to each of those stations, [m]
+
+    Examples
+    --------
+    >>> indexes, distances = get_closest_stations([51.02532675, 40.0], [-114.049868485806, -100.0], 20150000)
+    >>> [stations[i].NAME for i in indexes]
+    ['CALGARY INTL CS', 'NORTON MUNI']
+    >>> distances.round(-1).tolist()
+    [9000.0, 18930.0]
+    """
+    if 'kd_tree' not in globals():
+        _load_station_index()
+    latitudes, longitudes = np.broadcast_arrays(np.asarray(latitudes, dtype=float),
+                                                np.asarray(longitudes, dtype=float))
+    shape = latitudes.shape
+    points = _unit_sphere_points(latitudes.ravel(), longitudes.ravel())
+    N = points.shape[0]
+    indexes = np.zeros(N, dtype=int)
+    distances = np.zeros(N)
+    ends = isd_history_table['END']
+
+    todo = np.arange(N)
+    k = match_max
+    while todo.size:
+        k = min(k, station_count)
+        d, i = kd_tree.query(points[todo], k=k)
+        if k == 1:
+            d, i = d[:, np.newaxis], i[:, np.newaxis]
+        recent = ends[i] > minumum_recent_data
+        # The first match in each row is the nearest recent station
+        found = recent.any(axis=1)
+        first = recent.argmax(axis=1)[found]
+        indexes[todo[found]] = i[found, first]
+        distances[todo[found]] = _chord_to_great_circle(d[found, first])
+        todo = todo[~found]
+        if todo.size and k == station_count:
+            raise ValueError('Could not find a station with more recent data than '
+                            'specified near the specified coordinates.')
+        k *= 10
+    return indexes.reshape(shape), distances.reshape(shape)
+
+
 # This should be aggressively cached
 def get_station_year_text(WMO, WBAN, year, data_dir_override=None):
     """Basic method to download data from the GSOD database, given a station
@@ -724,16 +972,7 @@ def get_station_year_text(WMO, WBAN, year, data_dir_override=None):
     data : str
         Downloaded data file
     """
-    if WMO is None:
-        WMO = 999999
-    if WBAN is None:
-        WBAN = 99999
-    station = str(int(WMO)) + '-' + str(WBAN)
-    if data_dir_override is None:
-        gsod_year_dir = os.path.join(data_dir, 'gsod', str(year))
-    else:
-        gsod_year_dir = os.path.join(data_dir_override, str(year))
-    path = os.path.join(gsod_year_dir, station + '.op')
+    path = _gsod_year_text_path(WMO, WBAN, year, data_dir_override)
     if os.path.exists(path):
         with open(path, 'r') as f:
             data = f.read()
@@ -742,15 +981,40 @@ def get_station_year_text(WMO, WBAN, year, data_dir_override=None):
             else:
                 raise ValueError(data)
 
-    toget = ('ftp://ftp.ncdc.noaa.gov/pub/data/gsod/' + str(year) + '/'
-             + station + '-' + str(year) +'.op.gz')
+    gsod_year_dir = os.path.dirname(path)
     try:
-        data = urlopen(toget, timeout=5)
-    except Exception as e:
+        year_station_data = _download_station_year_text(WMO, WBAN, year)
+    except ValueError:
         if not os.path.exists(gsod_year_dir):
             os.makedirs(gsod_year_dir)
         with open(path, 'w') as f:
             f.write('Exception')
+        raise
+
+    # Cache the data for future use
+    if not os.path.exists(gsod_year_dir):
+        os.makedirs(gsod_year_dir)
+    open(path, 'w').write(year_station_data)
+
+
+    return year_station_data
+
+
+def _gsod_year_text_path(WMO, WBAN, year, data_dir_override=None):
+    station = _gsod_station_id(WMO, WBAN)
+    if data_dir_override is None:
+        gsod_year_dir = os.path.join(data_dir, 'gsod', str(year))
+    else:
+        gsod_year_dir = os.path.join(data_dir_override, str(year))
+    return os.path.join(gsod_year_dir, station + '.op')
+
+
+def _download_station_year_text(WMO, WBAN, year):
+    toget = ('ftp://ftp.ncdc.noaa.gov/pub/data/gsod/' + str(year) + '/'
+             + _gsod_station_id(WMO, WBAN) + '-' + str(year) +'.op.gz')
+    try:
+        data = urlopen(toget, timeout=5)
+    except Exception as e:
         raise ValueError('Could not obtain desired data; check '
                         'if the year has data published for the '
                         'specified station and the station was specified '
@@ -765,13 +1029,6 @@ def get_station_year_text(WMO, WBAN, year, data_dir_override=None):
         year_station_data = year_station_data.decode('utf-8')
     except:
         pass
-
-    # Cache the data for future use
-    if not os.path.exists(gsod_year_dir):
-        os.makedirs(gsod_year_dir)
-    open(path, 'w').write(year_station_data)
-
-
     return year_station_data
 
 
@@ -929,3 +1186,355 @@ def gsod_day_parser(line, SI=True, to_datetime=True):
     indicator_values = [flag == '1' for flag in obj['FRSHTT']]
     obj.update(zip(gsod_indicator_names, indicator_values))
     return gsod_day(**obj)
+
+
+# Character positions of each field in a GSOD line; see `gsod_fields`
+gsod_field_positions = {'DATE': (14, 22), 'TEMP': (24, 30), 'TEMP_COUNT': (31, 33),
+                        'DEWP': (35, 41), 'DEWP_COUNT': (42, 44), 'SLP': (46, 52),
+                        'SLP_COUNT': (53, 55), 'STP': (57, 63), 'STP_COUNT': (64, 66),
+                        'VISIB': (68, 73), 'VISIB_COUNT': (74, 76), 'WDSP': (78, 83),
+                        'WDSP_COUNT': (84, 86), 'MXSPD': (88, 93), 'GUST': (95, 100),
+                        'MAX': (102, 108), 'MIN': (110, 116), 'PRCP': (118, 123),
+                        'SNDP': (125, 130), 'FRSHTT': (132, 138)}
+gsod_line_length = 138
+gsod_bad_floats = np.array([float(v) for v in gsod_bad_values])
+gsod_temperature_fields = ('TEMP', 'DEWP', 'MAX', 'MIN')
+gsod_SI_factors = {'VISIB': mile, 'PRCP': inch, 'SNDP': inch, 'WDSP': knot,
+                   'MXSPD': knot, 'GUST': knot, 'SLP': 100.0, 'STP': 100.0}
+
+gsod_year_dtype = np.dtype([('DATE', 'M8[D]')]
+                           + [(field, 'f8') if field in gsod_float_fields else (field, 'i4')
+                              for field in gsod_fields[1:-1]]
+                           + [('FRSHTT', 'S6')]
+                           + [(name, '?') for name in gsod_indicator_names])
+
+
+def gsod_year_parser(text, SI=True):
+    """Whole-file parser of data in the format of the GSOD database, as
+    returned by :obj:`get_station_year_text`. Each field is read at once for
+    every day in the file from its fixed character positions, and the results
+    are returned as a NumPy structured array with one record per line.
+
+    The names of the columns in the GSOD database are retained as the field
+    names of the results, as in :obj:`gsod_day_parser`; missing values are NaN
+    instead of None, and the dates are `datetime64[D]` values.
+
+    Parameters
+    ----------
+    text : str or bytes
+        Contents of a GSOD file including its header line, [-]
+    SI : bool
+        Whether or not the results get converted to base SI units, [-]
+
+    Returns
+    -------
+    days : ndarray
+        Structured array with the fields `gsod_fields` plus the boolean
+        indicators `gsod_indicator_names` (all values in SI units, if `SI` is
+        True, i.e. meters, m/s, Kelvin, Pascal; otherwise the original unit set
+        is used), [-]
+
+    Examples
+    --------
+    >>> text = ('STN--- WBAN   YEARMODA    TEMP       DEWP      SLP        STP       VISIB      WDSP     MXSPD   GUST    MAX     MIN   PRCP   SNDP   FRSHTT\\n'
+    ... '722324 03071  20190103    36.8 24    26.2 24  9999.9  0   919.2 24    9.8 24    6.6 24   15.0   20.0    55.8    28.0   0.00G 999.9  001000\\n')
+    >>> days = gsod_year_parser(text)
+    >>> days['DATE'].tolist(), days['TEMP'].tolist(), days['SLP'].tolist(), days['snow_ice'].tolist()
+    ([datetime.date(2019, 1, 3)], [275.8166666666667], [nan], [True])
+    """
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    lines = [line for line in text.split(b'\n')[1:] if line.strip()]
+    days = np.zeros(len(lines), dtype=gsod_year_dtype)
+    if not lines:
+        return days
+    chars = np.array(lines, dtype='S%d' %gsod_line_length).view(np.uint8)
+    chars = chars.reshape(len(lines), gsod_line_length).copy()
+    chars[chars == 0] = ord(' ') # Short lines are padded with nulls
+
+    def column(field):
+        start, end = gsod_field_positions[field]
+        return np.ascontiguousarray(chars[:, start:end]).view('S%d' %(end - start)).ravel()
+
+    dates = column('DATE').astype(np.int64)
+    years, month_days = np.divmod(dates, 10000)
+    months, month_days = np.divmod(month_days, 100)
+    months = (years - 1970).astype('M8[Y]').astype('M8[M]') + (months - 1)
+    days['DATE'] = months.astype('M8[D]') + (month_days - 1)
+
+    for field in gsod_float_fields:
+        values = column(field).astype(np.float64)
+        values[np.isin(values, gsod_bad_floats)] = np.nan
+        if SI:
+            if field in gsod_temperature_fields:
+                values = (values + 459.67)*five_ninths
+            elif field in gsod_SI_factors:
+                values = values*gsod_SI_factors[field]
+        days[field] = values
+
+    for field in gsod_int_fields:
+        days[field] = column(field).astype(np.int32)
+
+    days['FRSHTT'] = column('FRSHTT')
+    start = gsod_field_positions['FRSHTT'][0]
+    for i, name in enumerate(gsod_indicator_names):
+        days[name] = chars[:, start + i] == ord('1')
+    return days
+
+
+def _gsod_station_id(WMO, WBAN):
+    if WMO is None:
+        WMO = 999999
+    if WBAN is None:
+        WBAN = 99999
+    return str(int(WMO)) + '-' + str(WBAN)
+
+
+def _gsod_day_from_record(record):
+    # Inverse of `gsod_year_parser` for one record, matching `gsod_day_parser`
+    obj = {}
+    for field in gsod_year_dtype.names:
+        value = record[field]
+        if field == 'DATE':
+            value = datetime.datetime.combine(value.astype(datetime.date), datetime.time())
+        elif field == 'FRSHTT':
+            value = value.decode('utf-8')
+        elif field in gsod_float_fields:
+            value = None if value != value else float(value)
+        elif field in gsod_int_fields:
+            value = int(value)
+        else:
+            value = bool(value)
+        obj[field] = value
+    return gsod_day(**obj)
+
+
+class GSODCache(object):
+    r'''Size-bounded on-disk cache of parsed GSOD station-years. Each
+    station-year is stored as the structured array of
+    :obj:`gsod_year_parser` in a compressed `.npz` file, so later analyses
+    skip both the decompression and the parsing of the original text. An
+    index of the files, their sizes, and when each was last used is kept
+    in `index.json` in the cache directory; when the files exceed `max_size`
+    the least recently used ones are deleted.
+
+    Station-years which could not be retrieved are recorded in the index
+    as missing, so they are not requested again.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory to store the cache in; defaults to `gsod_cache` in the
+        fluids configuration directory, [-]
+    max_size : int, optional
+        Maximum total size of the cached files, [bytes]
+
+    Notes
+    -----
+    The access times of cache hits are kept in memory and written with the
+    index on the next store, or by calling :obj:`flush`.
+    '''
+    index_name = 'index.json'
+
+    def __init__(self, directory=None, max_size=2**30):
+        if directory is None:
+            directory = os.path.join(data_dir, 'gsod_cache')
+        self.directory = directory
+        self.max_size = max_size
+        self.index = {}
+        index_path = os.path.join(directory, self.index_name)
+        if os.path.exists(index_path):
+            import json
+            with open(index_path, 'r') as f:
+                self.index = json.load(f)
+
+    def key(self, WMO, WBAN, year):
+        return str(year) + '/' + _gsod_station_id(WMO, WBAN)
+
+    def path(self, key):
+        return os.path.join(self.directory, *(key + '.npz').split('/'))
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def size(self):
+        return sum(entry['size'] for entry in self.index.values())
+
+    def get(self, WMO, WBAN, year):
+        r'''Load a cached station-year.
+
+        Returns
+        -------
+        days : ndarray or None
+            Structured array of the station-year; None if it is not in the
+            cache, [-]
+
+        Raises
+        ------
+        ValueError
+            If the station-year is recorded as missing.
+        '''
+        key = self.key(WMO, WBAN, year)
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        if entry['missing']:
+            raise ValueError('Station-year %s is recorded as missing in the cache' %(key))
+        try:
+            with np.load(self.path(key)) as data:
+                days = data['days']
+        except (IOError, OSError, KeyError, ValueError):
+            # Removed or damaged outside the cache
+            del self.index[key]
+            return None
+        entry['used'] = time.time()
+        return days
+
+    def put(self, WMO, WBAN, year, days):
+        r'''Store the parsed data of a station-year, or record it as missing
+        if `days` is None, and evict the least recently used station-years if
+        the cache is over its size limit.
+        '''
+        self._store(self.key(WMO, WBAN, year), days)
+        self.evict()
+        self.flush()
+
+    def _store(self, key, days):
+        size = 0
+        if days is not None:
+            path = self.path(key)
+            folder = os.path.dirname(path)
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+            np.savez_compressed(path, days=days)
+            size = os.path.getsize(path)
+        self.index[key] = {'size': size, 'missing': days is None,
+                           'used': time.time()}
+
+    def evict(self, max_size=None):
+        r'''Delete the least recently used station-years until the cached
+        files total no more than `max_size` (by default the size limit of the
+        cache).
+        '''
+        if max_size is None:
+            max_size = self.max_size
+        size = self.size
+        if size <= max_size:
+            return
+        for key in sorted(self.index, key=lambda key: self.index[key]['used']):
+            entry = self.index[key]
+            if entry['missing']:
+                continue
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+            del self.index[key]
+            size -= entry['size']
+            if size <= max_size:
+                break
+
+    def flush(self):
+        r'''Write the index to disk.'''
+        import json
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        with open(os.path.join(self.directory, self.index_name), 'w') as f:
+            f.write(json.dumps(self.index))
+
+    def preload(self, directory, overwrite=False):
+        r'''Parse and store every station-year in a local directory of
+        GSOD files named as on the NOAA server, `<USAF>-<WBAN>-<year>.op.gz`;
+        for example an extracted yearly `gsod_<year>.tar` archive. Files are
+        searched for recursively.
+
+        Parameters
+        ----------
+        directory : str
+            Directory with the `.op.gz` files, [-]
+        overwrite : bool, optional
+            Whether to parse station-years which are already cached, [-]
+
+        Returns
+        -------
+        count : int
+            Number of station-years stored, [-]
+        '''
+        count = 0
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if not name.endswith('.op.gz'):
+                    continue
+                try:
+                    WMO, WBAN, year = name[:-6].split('-')
+                    year = int(year)
+                except ValueError:
+                    continue
+                key = self.key(WMO, WBAN, year)
+                if not overwrite and key in self.index:
+                    continue
+                with gzip.open(os.path.join(root, name), 'rb') as f:
+                    self._store(key, gsod_year_parser(f.read()))
+                count += 1
+        self.evict()
+        self.flush()
+        return count
+
+
+def get_station_year_columns(WMO, WBAN, year, data_dir_override=None,
+                             cache=None):
+    """Retrieve the data of a station for one year from the GSOD database,
+    parsed by :obj:`gsod_year_parser` into SI units. If a :obj:`GSODCache` is
+    provided, it is checked first, and data which has to be downloaded (or
+    which cannot be) is recorded in it, and only in it; no text files or
+    failure markers are written.
+
+    Parameters
+    ----------
+    WMO : int or None
+         World Meteorological Organization (WMO) identifiers, [-]
+    WBAN : int or None
+        Weather Bureau Army Navy (WBAN) weather station identifier, [-]
+    year : int
+        Year data should be retrieved from, [year]
+    data_dir_override : str, optional
+        Directory to store the downloaded text data (instead of the
+         configuration directory); with a `cache`, a directory of text data
+         which is read if present but never written to; failures recorded
+         in it by :obj:`get_station_year_text` are recorded in the cache, [-]
+    cache : GSODCache, optional
+        Cache of parsed station-years, [-]
+
+    Returns
+    -------
+    days : ndarray
+        Structured array of the daily data of the station, [-]
+    """
+    if cache is None:
+        return gsod_year_parser(get_station_year_text(WMO, WBAN, year, data_dir_override=data_dir_override))
+    days = cache.get(WMO, WBAN, year)
+    if days is not None:
+        return days
+    data = None
+    if data_dir_override is not None:
+        path = _gsod_year_text_path(WMO, WBAN, year, data_dir_override)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                data = f.read()
+            if not data or data == 'Exception':
+                # A failure recorded by get_station_year_text
+                cache.put(WMO, WBAN, year, None)
+                raise ValueError(data)
+    if data is None:
+        try:
+            data = _download_station_year_text(WMO, WBAN, year)
+        except ValueError:
+            cache.put(WMO, WBAN, year, None)
+            raise
+    days = gsod_year_parser(data)
+    cache.put(WMO, WBAN, year, days)
+    return days
@@ -34,9 +34,13 @@ or contact the author at Caleb.Andrew.Bell@gmail.com.
 Flow Meter Solvers
 ------------------
 .. autofunction:: differential_pressure_meter_solver
+.. autofunction:: differential_pressure_meter_solver_batch
+.. autodata:: batch_meters
 
 Flow Meter Interfaces
 ---------------------
+.. autoclass:: FlowMeter
+    :members: C_epsilon, m_from_dP, dP_from_m, dP_nonrecoverable
 .. autofunction:: differential_pressure_meter_dP
 .. autofunction:: differential_pressure_meter_C_epsilon
 .. autofunction:: differential_pressure_meter_beta
@@ -97,11 +101,12 @@ from __future__ import division
 from math import sqrt, cos, sin, tan, atan, pi, radians, exp, acos, log10, log
 from fluids.friction import friction_factor
 from fluids.core import Froude_densimetric
-from fluids.numerics import interp, secant, brenth, NotBoundedError, implementation_optimize_tck, bisplev
+from fluids.numerics import interp, secant, brenth, NotBoundedError, UnconvergedError, implementation_optimize_tck, bisplev, numpy as np
 from fluids.constants import g, inch, inch_inv, pi_inv
 
 __all__ = ['C_Reader_Harris_Gallagher',
            'differential_pressure_meter_solver',
+           'differential_pressure_meter_solver_batch',
            'differential_pressure_meter_dP',
            'flow_meter_discharge', 'orifice_expansibility',
            'discharge_coefficient_to_K', 'K_to_discharge_coefficient',
@@ -120,7 +125,7 @@ __all__ = ['C_Reader_Harris_Gallagher',
            'C_eccentric_orifice_ISO_15377_1998',
            'C_quarter_circle_orifice_ISO_15377_1998',
            'C_Miller_1996',
-           'all_meters',
+           'all_meters', 'batch_meters', 'FlowMeter',
            ]
 
 
@@ -2770,6 +2775,330 @@ def differential_pressure_meter_solver(D, rho, mu, k=None, D2=None, P1=None, P2=
     else:
         raise ValueError('Solver is capable of solving for one of P1, P2, D2, or m only.')
 
+
+def _C_Reader_Harris_Gallagher_array(D, beta, Re_D, taps):
+    # Array form of `C_Reader_Harris_Gallagher`, also returning the
+    # derivative of `C` with respect to the Reynolds number
+    Re_D_inv = 1.0/Re_D
+    if taps == 'corner':
+        L1, L2_prime = 0.0, 0.0
+    elif taps == 'flange':
+        L1 = L2_prime = 0.0254/D
+    elif taps == 'D' or taps == 'D/2' or taps == ORIFICE_D_AND_D_2_TAPS:
+        L1 = 1.0
+        L2_prime = 0.47
+    else:
+        raise ValueError('Unsupported tap location')
+
+    beta2 = beta*beta
+    beta4 = beta2*beta2
+    beta8 = beta4*beta4
+
+    A = 2648.5177066967326*(beta*Re_D_inv)**0.8
+    dA = -0.8*A*Re_D_inv
+    M2_prime = 2.0*L2_prime/(1.0 - beta)
+
+    expnL1 = np.exp(-L1)
+    expnL2 = expnL1*expnL1
+    expnL3 = expnL1*expnL2
+    upstream = (0.043 + expnL3*expnL2*expnL2*(0.080*expnL3 - 0.123))*beta4/(1.0 - beta4)
+    delta_C_upstream = upstream*(1.0 - 0.11*A)
+    d_upstream = -0.11*upstream*dA
+
+    t1 = np.log10(3700.*Re_D_inv)
+    positive = t1 > 0.0
+    t1 = np.where(positive, t1, 0.0)
+    dt1 = np.where(positive, -Re_D_inv/log(10.0), 0.0)
+    downstream = -0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
+    delta_C_downstream = downstream*(1.0 + 8.0*t1)
+    d_downstream = 8.0*downstream*dt1
+
+    x1 = 63.095734448019314*(Re_D_inv)**0.3
+    x2 = 22.7 - 0.0047*Re_D
+    t2 = np.where(x1 > x2, x1, x2)
+    dt2 = np.where(x1 > x2, -0.3*x1*Re_D_inv, -0.0047)
+    slope = 0.000521*(1E6*beta*Re_D_inv)**0.7
+    beta35 = beta2*beta*np.sqrt(beta)
+    C_inf_C_s = (0.5961 + 0.0261*beta2 - 0.216*beta8 + slope
+                 + (0.0188 + 0.0063*A)*beta35*t2)
+    dC_inf_C_s = -0.7*slope*Re_D_inv + beta35*(0.0063*dA*t2 + (0.0188 + 0.0063*A)*dt2)
+
+    C = C_inf_C_s + delta_C_upstream + delta_C_downstream
+    C = C + np.where(D < 0.07112, 0.011*(0.75 - beta)*(2.8 - D*inch_inv), 0.0)
+    return C, dC_inf_C_s + d_upstream + d_downstream
+
+
+def _orifice_expansibility_array(beta, tau, k):
+    # `orifice_expansibility` and its derivative with respect to P2/P1
+    beta4 = beta**4
+    a = 0.351 + beta4*(0.93*beta4 + 0.256)
+    tau_k = tau**(1.0/k)
+    return 1.0 - a*(1.0 - tau_k), a*tau_k/(k*tau)
+
+
+def _nozzle_expansibility_array(beta, tau, k):
+    # `nozzle_expansibility` and its derivative with respect to P2/P1, from
+    # the derivative of the logarithm of its square
+    beta4 = beta**4
+    tau_2k = tau**(2.0/k)
+    term1 = k*tau_2k/(k - 1.0)
+    term2 = (1.0 - beta4)/(1.0 - beta4*tau_2k)
+    tau_k = tau**((k - 1.0)/k)
+    term3 = (1.0 - tau_k)/(1.0 - tau)
+    dln = (2.0/(k*tau) + 2.0*beta4*tau_2k/(k*tau*(1.0 - beta4*tau_2k))
+           - (k - 1.0)/k*tau_k/(tau*(1.0 - tau_k)) + 1.0/(1.0 - tau))
+    # Limit for k = 1
+    ln_tau = np.log(tau)
+    limit = tau*tau*(1.0 - beta4)*-ln_tau/((1.0 - tau)*(1.0 - beta4*tau*tau))
+    dln_limit = (2.0/tau + 1.0/(tau*ln_tau) + 1.0/(1.0 - tau)
+                 + 2.0*beta4*tau/(1.0 - beta4*tau*tau))
+    isothermal = k == 1.0
+    epsilon = np.sqrt(np.where(isothermal, limit, term1*term2*term3))
+    return epsilon, 0.5*epsilon*np.where(isothermal, dln_limit, dln)
+
+
+def _cone_meter_expansibility_array(beta, tau, k):
+    # `cone_meter_expansibility_Stewart` and its derivative with respect to
+    # P2/P1; `beta` is that of the cone
+    beta4 = beta**4
+    a = 0.649 + 0.696*beta4
+    return 1.0 - a*(1.0 - tau)/k, a/k
+
+
+def _differential_pressure_meter_C_array(D, D2, m, rho, mu, meter_type, taps):
+    # Discharge coefficient of `meter_type`, and its derivative with respect
+    # to the mass flow rate
+    beta = D2/D
+    zero = np.zeros(np.broadcast(D, D2, m, rho, mu).shape)
+    if meter_type in _C_Re_meters:
+        Re_D = rho*(m/((0.25*pi*D*D)*rho))*D/mu
+        if meter_type == ISO_5167_ORIFICE:
+            C, dC = _C_Reader_Harris_Gallagher_array(D, beta, Re_D, taps)
+        elif meter_type == LONG_RADIUS_NOZZLE:
+            t = 0.00653*np.sqrt(beta)*np.sqrt(1E6/Re_D)
+            C, dC = 0.9965 - t, 0.5*t/Re_D
+        else:
+            t = (0.00175*beta**2 - 0.0033*beta**4.15)*(1E6/Re_D)**1.15
+            C, dC = 0.9900 - 0.2262*beta**4.1 - t, 1.15*t/Re_D
+        return C + zero, dC*Re_D/m + zero
+    if meter_type == ISO_15377_ECCENTRIC_ORIFICE:
+        C = C_eccentric_orifice_ISO_15377_1998(D, D2)
+    elif meter_type == ISO_15377_QUARTER_CIRCLE_ORIFICE:
+        C = C_quarter_circle_orifice_ISO_15377_1998(D, D2)
+    elif meter_type == VENTURI_NOZZLE:
+        C = C_venturi_nozzle(D, D2)
+    elif meter_type == WEDGE_METER:
+        Ds, D2s = np.broadcast_arrays(D, D2)
+        C = np.array([C_wedge_meter_ISO_5167_6_2017(float(a), float(b))
+                      for a, b in zip(Ds.ravel(), D2s.ravel())]).reshape(Ds.shape)
+    elif meter_type == UNSPECIFIED_METER:
+        C = np.nan
+    else:
+        C = _C_constant_meters[meter_type]
+    return C + zero, zero
+
+
+def _differential_pressure_meter_epsilon_array(D, D2, tau, k, meter_type):
+    # Expansibility of `meter_type` and its derivative with respect to P2/P1
+    beta = D2/D
+    if meter_type in _orifice_expansibility_meters:
+        return _orifice_expansibility_array(beta, tau, k)
+    elif meter_type == CONE_METER:
+        return _cone_meter_expansibility_array(np.sqrt(1.0 - beta*beta), tau, k)
+    elif meter_type == WEDGE_METER:
+        # The expansibility of a wedge meter is evaluated at P2 = P1, so is 1
+        return 1.0 + 0.0*tau, 0.0*tau
+    epsilon, depsilon = _nozzle_expansibility_array(beta, tau, k)
+    if meter_type == ISO_15377_CONICAL_ORIFICE:
+        epsilon_orifice, depsilon_orifice = _orifice_expansibility_array(beta, tau, k)
+        epsilon = 0.5*(epsilon + epsilon_orifice)
+        depsilon = 0.5*(depsilon + depsilon_orifice)
+    return epsilon, depsilon
+
+
+_C_Re_meters = frozenset([ISO_5167_ORIFICE, LONG_RADIUS_NOZZLE, ISA_1932_NOZZLE])
+_C_constant_meters = {ISO_15377_CONICAL_ORIFICE: ISO_15377_CONICAL_ORIFICE_C,
+                      AS_CAST_VENTURI_TUBE: AS_CAST_VENTURI_TUBE_C,
+                      MACHINED_CONVERGENT_VENTURI_TUBE: MACHINED_CONVERGENT_VENTURI_TUBE_C,
+                      ROUGH_WELDED_CONVERGENT_VENTURI_TUBE: ROUGH_WELDED_CONVERGENT_VENTURI_TUBE_C,
+                      CONE_METER: CONE_METER_C}
+_orifice_expansibility_meters = frozenset([ISO_5167_ORIFICE, ISO_15377_ECCENTRIC_ORIFICE,
+                                           ISO_15377_QUARTER_CIRCLE_ORIFICE, UNSPECIFIED_METER])
+batch_meters = frozenset(list(_C_Re_meters) + list(_C_constant_meters)
+                         + list(_orifice_expansibility_meters)
+                         + [VENTURI_NOZZLE, WEDGE_METER])
+'''Set of the meter types supported by
+:obj:`differential_pressure_meter_solver_batch`.
+'''
+
+
+def differential_pressure_meter_solver_batch(D, rho, mu, k=None, D2=None, P1=None,
+                                             P2=None, m=None,
+                                             meter_type=ISO_5167_ORIFICE,
+                                             taps=None, C_specified=None,
+                                             epsilon_specified=None,
+                                             xtol=1e-13, maxiter=50):
+    r'''Calculates either the mass flow rate, the upstream pressure, or the
+    second pressure value of many differential pressure flow meters of one
+    type at once, as :obj:`differential_pressure_meter_solver` does for one.
+    All of the inputs may be arrays, which are broadcast together. The meters
+    are solved together by Newton's method, with analytical derivatives of
+    the discharge coefficient with respect to the mass flow rate and of the
+    expansibility with respect to the pressures.
+
+    Parameters
+    ----------
+    D : float or array-like
+        Upstream internal pipe diameter, [m]
+    rho : float or array-like
+        Density of fluid at `P1`, [kg/m^3]
+    mu : float or array-like
+        Viscosity of fluid at `P1`, [Pa*s]
+    k : float or array-like, optional
+        Isentropic exponent of fluid; required unless `epsilon_specified` is
+        specified, [-]
+    D2 : float or array-like
+        Diameter of orifice, or venturi meter orifice, or flow tube orifice,
+        or cone meter end diameter, or wedge meter fluid flow height, [m]
+    P1 : float or array-like, optional
+        Static pressure of fluid upstream of differential pressure meter at the
+        cross-section of the pressure tap, [Pa]
+    P2 : float or array-like, optional
+        Static pressure of fluid downstream of differential pressure meter or
+        at the prescribed location (varies by type of meter) [Pa]
+    m : float or array-like, optional
+        Mass flow rate of fluid through the flow meter, [kg/s]
+    meter_type : str
+        One of the types in :obj:`batch_meters`, [-]
+    taps : str, optional
+        The orientation of the taps; one of 'corner', 'flange', 'D', or 'D/2';
+        applies for orifice meters only, [-]
+    C_specified : float or array-like, optional
+        If specified, the correlation for the meter type is not used - this
+        value is used for `C`
+    epsilon_specified : float or array-like, optional
+        If specified, the correlation for the fluid expansibility is not used -
+        this value is used for :math:`\epsilon`, [-]
+    xtol : float, optional
+        Relative change in the solved variable at which every meter is
+        considered converged, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+
+    Returns
+    -------
+    ans : ndarray
+        One of `m`, the mass flow rate of the fluid; `P1`, the pressure
+        upstream of the flow meter; or `P2`, the second pressure
+        tap's value; units of respectively, kg/s, Pa, or Pa
+
+    Notes
+    -----
+    Solving for `D2` is not supported; use
+    :obj:`differential_pressure_meter_solver` for that, and for the meter
+    types of Miller and Hollingshead.
+
+    Only the discharge coefficient depends on the mass flow rate, and only the
+    expansibility depends on the pressures, so the other is evaluated once.
+    Meters with NaN inputs give NaN results; an
+    :obj:`fluids.numerics.UnconvergedError` is raised if any other meter has
+    not converged within `maxiter` iterations.
+
+    Examples
+    --------
+    >>> differential_pressure_meter_solver_batch(D=0.07366, D2=[0.05, 0.04],
+    ... P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33,
+    ... meter_type='ISO 5167 orifice', taps='D')
+    array([7.70233804, 4.55702153])
+
+    >>> differential_pressure_meter_solver_batch(D=0.07366, D2=0.05,
+    ... m=[7.702338, 5.0], P1=200000.0, rho=999.1, mu=0.0011, k=1.33,
+    ... meter_type='ISO 5167 orifice', taps='D')
+    array([183000.00016902, 193131.76408653])
+    '''
+    meter_type = _meter_type_to_corr_default.get(meter_type, meter_type)
+    if meter_type not in batch_meters:
+        raise ValueError("Supported meter types are %s" %(batch_meters))
+    if meter_type == UNSPECIFIED_METER and C_specified is None:
+        raise ValueError("For unspecified meter type, C_specified is required")
+    if k is None and epsilon_specified is not None:
+        k = 1.4
+    if D2 is None:
+        raise ValueError('Solver is capable of solving for one of P1, P2, or m only.')
+    D, D2, rho, mu, k = (np.asarray(v, dtype=float) for v in (D, D2, rho, mu, k))
+    beta = D2/D
+    beta4 = beta**4
+    # Mass flow rate divided by C*epsilon*sqrt(P1 - P2)
+    K = (0.25*pi*D2*D2)*np.sqrt(2.0*rho/(1.0 - beta4))
+
+    def C_of(m):
+        if C_specified is not None:
+            C = np.asarray(C_specified, dtype=float)
+            return C, 0.0*C
+        return _differential_pressure_meter_C_array(D, D2, m, rho, mu, meter_type, taps)
+
+    def epsilon_of(tau):
+        if epsilon_specified is not None:
+            epsilon = np.asarray(epsilon_specified, dtype=float)
+            return epsilon, 0.0*epsilon
+        return _differential_pressure_meter_epsilon_array(D, D2, tau, k, meter_type)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if m is None and P1 is not None and P2 is not None:
+            P1, P2 = np.asarray(P1, dtype=float), np.asarray(P2, dtype=float)
+            epsilon = epsilon_of(P2/P1)[0]
+            Q = K*epsilon*np.sqrt(P1 - P2)
+            x = 0.6*Q
+            low, high = 0.0, np.inf
+
+            def step(x):
+                C, dC = C_of(x)
+                return (x - C*Q)/(1.0 - dC*Q)
+        elif P2 is None and m is not None and P1 is not None:
+            m, P1 = np.asarray(m, dtype=float), np.asarray(P1, dtype=float)
+            C = C_of(m)[0]
+            x = P1 - (m/(C*K))**2
+            x = np.where(x > 0.0, x, 0.5*P1)
+            low, high = 0.0, P1
+
+            def step(x):
+                epsilon, depsilon = epsilon_of(x/P1)
+                dP = P1 - x
+                root = np.sqrt(dP)
+                err = m - C*K*epsilon*root
+                derr = -C*K*(depsilon*root/P1 - 0.5*epsilon/root)
+                return err/derr
+        elif P1 is None and m is not None and P2 is not None:
+            m, P2 = np.asarray(m, dtype=float), np.asarray(P2, dtype=float)
+            C = C_of(m)[0]
+            x = P2 + (m/(C*K))**2
+            low, high = P2, np.inf
+
+            def step(x):
+                epsilon, depsilon = epsilon_of(P2/x)
+                dP = x - P2
+                root = np.sqrt(dP)
+                err = m - C*K*epsilon*root
+                derr = -C*K*(-depsilon*root*P2/(x*x) + 0.5*epsilon/root)
+                return err/derr
+        else:
+            raise ValueError('Solver is capable of solving for one of P1, P2, or m only.')
+
+        x = x + np.zeros(np.broadcast(x, K, C_specified, epsilon_specified).shape)
+        for _ in range(maxiter):
+            delta = step(x)
+            x_new = x - delta
+            # Keep the iterates in the domain by halving the distance to its
+            # bounds
+            x_new = np.where(x_new <= low, 0.5*(x + low), x_new)
+            x_new = np.where(x_new >= high, 0.5*(x + high), x_new)
+            done = (np.abs(x_new - x) <= xtol*np.abs(x)) | np.isnan(x_new)
+            x = x_new
+            if np.all(done):
+                return x
+    raise UnconvergedError("Failed to converge after %d iterations" %maxiter)
+
+
 # Set of orifice types that get their dP calculated with `dP_orifice`.
 _dP_orifice_set = set([ISO_5167_ORIFICE, ISO_15377_ECCENTRIC_ORIFICE,
                   ISO_15377_CONICAL_ORIFICE, ISO_15377_QUARTER_CIRCLE_ORIFICE,
@@ -2865,3 +3194,422 @@ def differential_pressure_meter_dP(D, D2, P1, P2, C=None,
     else:
         raise ValueError(_unsupported_meter_msg)
     return dP
+
+
+class FlowMeter(object):
+    r'''Class representing one differential pressure flow meter, of a fixed
+    type, geometry, and tap arrangement. The correlations for the discharge
+    coefficient, expansibility, and non-recoverable pressure drop of the
+    meter are selected once when it is created, and the terms depending only
+    on its geometry are calculated then; repeated calculations with the
+    meter, as in solvers or for many readings of one meter, do not repeat the
+    selection by `meter_type` and `taps` which
+    :obj:`differential_pressure_meter_C_epsilon` and
+    :obj:`differential_pressure_meter_dP` perform on every call.
+
+    Parameters
+    ----------
+    D : float
+        Upstream internal pipe diameter, [m]
+    D2 : float
+        Diameter of orifice, or venturi meter orifice, or flow tube orifice,
+        or cone meter end diameter, or wedge meter fluid flow height, [m]
+    meter_type : str
+        One of the types in :obj:`all_meters`, [-]
+    taps : str, optional
+        The orientation of the taps; one of 'corner', 'flange', 'D', or 'D/2';
+        applies for orifice meters only, [-]
+    tap_position : str, optional
+        The rotation of the taps, used **only for the eccentric orifice case**
+        where the pressure profile is are not symmetric; '180 degree' for the
+        normal case where the taps are opposite the orifice bore, and
+        '90 degree' for the case where, normally for operational reasons, the
+        taps are near the bore [-]
+    C_specified : float, optional
+        If specified, the correlation for the meter type is not used - this
+        value is used for `C`, [-]
+    epsilon_specified : float, optional
+        If specified, the correlation for the fluid expansibility is not used -
+        this value is used for :math:`\epsilon`, [-]
+
+    Attributes
+    ----------
+    meter_type : str
+        Type of the meter, with the generic orifice types replaced by the
+        correlation used for them as in
+        :obj:`differential_pressure_meter_C_epsilon`, [-]
+    beta : float
+        Differential pressure meter diameter ratio, as calculated by
+        :obj:`differential_pressure_meter_beta`, [-]
+    velocity_of_approach : float
+        Velocity of approach factor of `D2` and `D`, as calculated by
+        :obj:`velocity_of_approach_factor`, [-]
+    C : float
+        Coefficient of discharge of the meter if it does not depend on the
+        flow rate; otherwise None, [-]
+
+    Notes
+    -----
+    The methods accept floats only; see
+    :obj:`differential_pressure_meter_solver_batch` for arrays of meters.
+
+    Examples
+    --------
+    >>> meter = FlowMeter(D=0.07366, D2=0.05, meter_type='ISO 5167 orifice', taps='D')
+    >>> meter.m_from_dP(dP=17000.0, P1=200000.0, rho=999.1, mu=0.0011, k=1.33)
+    7.70233803573
+    >>> meter.dP_from_m(m=7.702338035732167, P1=200000.0, rho=999.1, mu=0.0011, k=1.33)
+    17000.0
+    '''
+    def __repr__(self):
+        return '<FlowMeter, %s, D=%g m, D2=%g m>' %(self.meter_type, self.D, self.D2)
+
+    def __init__(self, D, D2, meter_type=ISO_5167_ORIFICE, taps=None,
+                 tap_position=None, C_specified=None, epsilon_specified=None):
+        meter_type = _meter_type_to_corr_default.get(meter_type, meter_type)
+        if meter_type not in all_meters:
+            raise ValueError(_unsupported_meter_msg)
+        self.D = D
+        self.D2 = D2
+        self.meter_type = meter_type
+        self.taps = taps
+        self.tap_position = tap_position
+        self.C_specified = C_specified
+        self.epsilon_specified = epsilon_specified
+
+        self.beta = differential_pressure_meter_beta(D, D2, meter_type)
+        self.velocity_of_approach = velocity_of_approach_factor(D, D2)
+        beta_D2 = D2/D
+        beta4 = beta_D2**4
+        # Mass flow rate divided by C*epsilon*sqrt(rho*(P1 - P2))
+        self._m_factor = (0.25*pi*D2*D2)*sqrt(2.0/(1.0 - beta4))
+        self._beta_D2 = beta_D2
+        self._orifice_epsilon_factor = 0.351 + beta4*(0.93*beta4 + 0.256)
+
+        # Discharge coefficient
+        C = None
+        if C_specified is not None:
+            C = C_specified
+        elif meter_type == ISO_5167_ORIFICE:
+            self._setup_Reader_Harris_Gallagher()
+            self._C = self._C_Reader_Harris_Gallagher
+        elif meter_type in (MILLER_ORIFICE, MILLER_ECCENTRIC_ORIFICE,
+                            MILLER_SEGMENTAL_ORIFICE, MILLER_QUARTER_CIRCLE_ORIFICE,
+                            MILLER_CONICAL_ORIFICE):
+            self._C = self._C_Miller_1996
+        elif meter_type == LONG_RADIUS_NOZZLE:
+            self._C = self._C_long_radius_nozzle
+        elif meter_type == ISA_1932_NOZZLE:
+            self._C = self._C_ISA_1932_nozzle
+        elif meter_type == HOLLINGSHEAD_ORIFICE:
+            self._C_tck, self._C_tck_beta = orifice_std_Hollingshead_tck, beta_D2
+            self._C = self._C_Hollingshead_tck
+        elif meter_type == HOLLINGSHEAD_CONE:
+            self._C_tck, self._C_tck_beta = cone_Hollingshead_tck, self.beta
+            self._C = self._C_Hollingshead_tck
+        elif meter_type == HOLLINGSHEAD_WEDGE:
+            self._C_tck, self._C_tck_beta = wedge_Hollingshead_tck, self.beta
+            self._C = self._C_Hollingshead_tck
+        elif meter_type == HOLLINGSHEAD_VENTURI_SMOOTH:
+            self._C_Cs = venturi_smooth_Cs_Hollingshead
+            self._C = self._C_Hollingshead_venturi
+        elif meter_type == HOLLINGSHEAD_VENTURI_SHARP:
+            self._C_Cs = venturi_sharp_Cs_Hollingshead
+            self._C = self._C_Hollingshead_venturi
+        elif meter_type == ISO_15377_ECCENTRIC_ORIFICE:
+            C = C_eccentric_orifice_ISO_15377_1998(D, D2)
+        elif meter_type == ISO_15377_QUARTER_CIRCLE_ORIFICE:
+            C = C_quarter_circle_orifice_ISO_15377_1998(D, D2)
+        elif meter_type == ISO_15377_CONICAL_ORIFICE:
+            C = ISO_15377_CONICAL_ORIFICE_C
+        elif meter_type == VENTURI_NOZZLE:
+            C = C_venturi_nozzle(D=D, Do=D2)
+        elif meter_type == AS_CAST_VENTURI_TUBE:
+            C = AS_CAST_VENTURI_TUBE_C
+        elif meter_type == MACHINED_CONVERGENT_VENTURI_TUBE:
+            C = MACHINED_CONVERGENT_VENTURI_TUBE_C
+        elif meter_type == ROUGH_WELDED_CONVERGENT_VENTURI_TUBE:
+            C = ROUGH_WELDED_CONVERGENT_VENTURI_TUBE_C
+        elif meter_type == CONE_METER:
+            C = CONE_METER_C
+        elif meter_type == WEDGE_METER:
+            C = C_wedge_meter_ISO_5167_6_2017(D=D, H=D2)
+        else:
+            raise ValueError("For unspecified meter type, C_specified is required")
+        self.C = C
+        if C is not None:
+            self._C = self._C_constant
+
+        # Expansibility; that of wedge meters does not depend on pressure
+        self._epsilon_constant = (epsilon_specified is not None
+                                  or meter_type in (WEDGE_METER, HOLLINGSHEAD_WEDGE))
+        if epsilon_specified is not None:
+            self._epsilon = self._epsilon_specified
+        elif meter_type in (ISO_15377_CONICAL_ORIFICE, MILLER_CONICAL_ORIFICE):
+            self._epsilon = self._epsilon_conical_orifice
+        elif meter_type in (LONG_RADIUS_NOZZLE, ISA_1932_NOZZLE, VENTURI_NOZZLE,
+                            AS_CAST_VENTURI_TUBE, MACHINED_CONVERGENT_VENTURI_TUBE,
+                            ROUGH_WELDED_CONVERGENT_VENTURI_TUBE,
+                            HOLLINGSHEAD_VENTURI_SMOOTH, HOLLINGSHEAD_VENTURI_SHARP):
+            self._epsilon = self._epsilon_nozzle
+        elif meter_type in (CONE_METER, HOLLINGSHEAD_CONE):
+            self._cone_epsilon_factor = 0.649 + 0.696*self.beta**4
+            self._epsilon = self._epsilon_cone_meter
+        elif meter_type in (WEDGE_METER, HOLLINGSHEAD_WEDGE):
+            self._epsilon = self._epsilon_wedge_meter
+        else:
+            self._epsilon = self._epsilon_orifice
+
+        # Non-recoverable pressure drop
+        if meter_type in _dP_orifice_set or meter_type in (LONG_RADIUS_NOZZLE, ISA_1932_NOZZLE):
+            self._dP = self._dP_orifice
+        elif meter_type in (AS_CAST_VENTURI_TUBE, MACHINED_CONVERGENT_VENTURI_TUBE,
+                            ROUGH_WELDED_CONVERGENT_VENTURI_TUBE,
+                            HOLLINGSHEAD_VENTURI_SMOOTH, HOLLINGSHEAD_VENTURI_SHARP):
+            self._dP_venturi_tube_factor = dP_venturi_tube(D=D, Do=D2, P1=1.0, P2=0.0)
+            self._dP = self._dP_venturi_tube
+        elif meter_type in (CONE_METER, HOLLINGSHEAD_CONE):
+            self._dP = self._dP_cone_meter
+        elif meter_type in (WEDGE_METER, HOLLINGSHEAD_WEDGE):
+            self._dP = self._dP_wedge_meter
+        else:
+            self._dP = self._dP_unavailable
+
+    def _C_constant(self, m, rho, mu):
+        return self.C
+
+    def _setup_Reader_Harris_Gallagher(self):
+        # The terms of `C_Reader_Harris_Gallagher` depending only on geometry
+        D, beta, taps = self.D, self._beta_D2, self.taps
+        if taps == 'corner':
+            L1, L2_prime = 0.0, 0.0
+        elif taps == 'flange':
+            L1 = L2_prime = 0.0254/D
+        elif taps == 'D' or taps == 'D/2' or taps == ORIFICE_D_AND_D_2_TAPS:
+            L1 = 1.0
+            L2_prime = 0.47
+        else:
+            raise ValueError('Unsupported tap location')
+        beta2 = beta*beta
+        beta4 = beta2*beta2
+        beta8 = beta4*beta4
+        M2_prime = 2.0*L2_prime/(1.0 - beta)
+        expnL1 = exp(-L1)
+        expnL2 = expnL1*expnL1
+        expnL3 = expnL1*expnL2
+        self._RHG_A = 2648.5177066967326*beta**0.8
+        self._RHG_upstream = (0.043 + expnL3*expnL2*expnL2*(0.080*expnL3 - 0.123))*beta4/(1.0 - beta4)
+        self._RHG_downstream = -0.031*(M2_prime - 0.8*M2_prime**1.1)*beta**1.3
+        self._RHG_slope = 0.000521*(1E6*beta)**0.7
+        self._RHG_beta35 = beta2*beta*sqrt(beta)
+        C_const = 0.5961 + 0.0261*beta2 - 0.216*beta8
+        if D < 0.07112:
+            C_const += 0.011*(0.75 - beta)*(2.8 - D*inch_inv)
+        self._RHG_C = C_const
+
+    def _C_Reader_Harris_Gallagher(self, m, rho, mu):
+        D = self.D
+        Re_D_inv = mu/(rho*(m/((0.25*pi*D*D)*rho))*D)
+        A = self._RHG_A*Re_D_inv**0.8
+        t1 = log10(3700.*Re_D_inv)
+        if t1 < 0.0:
+            t1 = 0.0
+        x1 = 63.095734448019314*Re_D_inv**0.3
+        x2 = 22.7 - 0.0047/Re_D_inv
+        t2 = x1 if x1 > x2 else x2
+        return (self._RHG_C + self._RHG_slope*Re_D_inv**0.7
+                + (0.0188 + 0.0063*A)*self._RHG_beta35*t2
+                + self._RHG_upstream*(1.0 - 0.11*A)
+                + self._RHG_downstream*(1.0 + 8.0*t1))
+
+    def _C_Miller_1996(self, m, rho, mu):
+        return C_Miller_1996(self.D, self.D2, rho, mu, m, subtype=self.meter_type,
+                             taps=self.taps, tap_position=self.tap_position)
+
+    def _C_long_radius_nozzle(self, m, rho, mu):
+        return C_long_radius_nozzle(D=self.D, Do=self.D2, rho=rho, mu=mu, m=m)
+
+    def _C_ISA_1932_nozzle(self, m, rho, mu):
+        return C_ISA_1932_nozzle(D=self.D, Do=self.D2, rho=rho, mu=mu, m=m)
+
+    def _Re_D(self, m, rho, mu):
+        D = self.D
+        v = m/((0.25*pi*D*D)*rho)
+        return rho*v*D/mu
+
+    def _C_Hollingshead_tck(self, m, rho, mu):
+        return float(bisplev(self._C_tck_beta, log(self._Re_D(m, rho, mu)), self._C_tck))
+
+    def _C_Hollingshead_venturi(self, m, rho, mu):
+        return interp(log(self._Re_D(m, rho, mu)), venturi_logRes_Hollingshead,
+                      self._C_Cs, extrapolate=True)
+
+    def _epsilon_specified(self, P1, P2, k):
+        return self.epsilon_specified
+
+    def _epsilon_orifice(self, P1, P2, k):
+        return 1.0 - self._orifice_epsilon_factor*(1.0 - (P2/P1)**(1./k))
+
+    def _epsilon_nozzle(self, P1, P2, k):
+        return nozzle_expansibility(D=self.D, Do=self.D2, P1=P1, P2=P2, k=k,
+                                    beta=self._beta_D2)
+
+    def _epsilon_conical_orifice(self, P1, P2, k):
+        return 0.5*(self._epsilon_orifice(P1, P2, k) + self._epsilon_nozzle(P1, P2, k))
+
+    def _epsilon_cone_meter(self, P1, P2, k):
+        return 1.0 - self._cone_epsilon_factor*(P1 - P2)/(k*P1)
+
+    def _epsilon_wedge_meter(self, P1, P2, k):
+        # Evaluated at P2 = P1 as in `differential_pressure_meter_C_epsilon`
+        return nozzle_expansibility(D=self.D, Do=self.D2, P1=P1, P2=P1, k=k, beta=self.beta)
+
+    def _dP_orifice(self, P1, P2, C):
+        if C is None:
+            raise ValueError(_missing_C_msg)
+        return dP_orifice(D=self.D, Do=self.D2, P1=P1, P2=P2, C=C)
+
+    def _dP_venturi_tube(self, P1, P2, C):
+        return self._dP_venturi_tube_factor*(P1 - P2)
+
+    def _dP_cone_meter(self, P1, P2, C):
+        return dP_cone_meter(D=self.D, Dc=self.D2, P1=P1, P2=P2)
+
+    def _dP_wedge_meter(self, P1, P2, C):
+        return dP_wedge_meter(D=self.D, H=self.D2, P1=P1, P2=P2)
+
+    def _dP_unavailable(self, P1, P2, C):
+        if self.meter_type == VENTURI_NOZZLE:
+            raise NotImplementedError("Venturi meter does not have an implemented pressure drop correlation")
+        raise ValueError(_unsupported_meter_msg)
+
+    def C_epsilon(self, m, P1, P2, rho, mu, k):
+        r'''Calculates the discharge coefficient and expansibility of the
+        meter, as :obj:`differential_pressure_meter_C_epsilon` does.
+
+        Parameters
+        ----------
+        m : float
+            Mass flow rate of fluid through the flow meter, [kg/s]
+        P1 : float
+            Static pressure of fluid upstream of differential pressure meter
+            at the cross-section of the pressure tap, [Pa]
+        P2 : float
+            Static pressure of fluid downstream of differential pressure meter
+            or at the prescribed location (varies by type of meter) [Pa]
+        rho : float
+            Density of fluid at `P1`, [kg/m^3]
+        mu : float
+            Viscosity of fluid at `P1`, [Pa*s]
+        k : float
+            Isentropic exponent of fluid, [-]
+
+        Returns
+        -------
+        C : float
+            Coefficient of discharge of the meter, [-]
+        expansibility : float
+            Expansibility factor (1 for incompressible fluids, less than 1 for
+            real fluids), [-]
+        '''
+        return self._C(m, rho, mu), self._epsilon(P1, P2, k)
+
+    def m_from_dP(self, dP, P1, rho, mu, k=None):
+        r'''Calculates the mass flow rate through the meter from its measured
+        pressure difference.
+
+        Parameters
+        ----------
+        dP : float
+            Measured pressure difference `P1` - `P2` of the meter, [Pa]
+        P1 : float
+            Static pressure of fluid upstream of differential pressure meter
+            at the cross-section of the pressure tap, [Pa]
+        rho : float
+            Density of fluid at `P1`, [kg/m^3]
+        mu : float
+            Viscosity of fluid at `P1`, [Pa*s]
+        k : float, optional
+            Isentropic exponent of fluid; required unless `epsilon_specified`
+            was specified, [-]
+
+        Returns
+        -------
+        m : float
+            Mass flow rate of fluid through the flow meter, [kg/s]
+        '''
+        epsilon = self._epsilon(P1, P1 - dP, k)
+        # Only the discharge coefficient depends on the flow rate
+        Q = self._m_factor*epsilon*sqrt(rho*dP)
+        if self.C is not None:
+            return self.C*Q
+        return secant(self._err_m, 0.6*Q, args=(Q, rho, mu), xtol=1e-13)
+
+    def _err_m(self, m, Q, rho, mu):
+        return m - self._C(m, rho, mu)*Q
+
+    def dP_from_m(self, m, P1, rho, mu, k=None):
+        r'''Calculates the pressure difference the meter measures at a mass
+        flow rate.
+
+        Parameters
+        ----------
+        m : float
+            Mass flow rate of fluid through the flow meter, [kg/s]
+        P1 : float
+            Static pressure of fluid upstream of differential pressure meter
+            at the cross-section of the pressure tap, [Pa]
+        rho : float
+            Density of fluid at `P1`, [kg/m^3]
+        mu : float
+            Viscosity of fluid at `P1`, [Pa*s]
+        k : float, optional
+            Isentropic exponent of fluid; required unless `epsilon_specified`
+            was specified, [-]
+
+        Returns
+        -------
+        dP : float
+            Measured pressure difference `P1` - `P2` of the meter, [Pa]
+        '''
+        # Only the expansibility depends on the pressure difference
+        mC = m/(self._m_factor*self._C(m, rho, mu))
+        if self._epsilon_constant:
+            epsilon = self._epsilon(P1, P1, k)
+            return mC*mC/(epsilon*epsilon*rho)
+        args = (mC, P1, rho, k)
+        try:
+            P2 = brenth(self._err_P2, P1*(1-1E-9), P1*0.5, args=args)
+        except:
+            P2 = secant(self._err_P2, P1*0.5, low=P1*1e-10, args=args, high=P1, bisection=True)
+        return P1 - P2
+
+    def _err_P2(self, P2, mC, P1, rho, k):
+        return mC - self._epsilon(P1, P2, k)*sqrt(rho*(P1 - P2))
+
+    def dP_nonrecoverable(self, P1, P2, C=None):
+        r'''Calculates the non-recoverable pressure drop of the meter, as
+        :obj:`differential_pressure_meter_dP` does.
+
+        Parameters
+        ----------
+        P1 : float
+            Static pressure of fluid upstream of differential pressure meter
+            at the cross-section of the pressure tap, [Pa]
+        P2 : float
+            Static pressure of fluid downstream of differential pressure meter
+            or at the prescribed location (varies by type of meter) [Pa]
+        C : float, optional
+            Coefficient of discharge (used only in orifice plates and
+            nozzles); defaults to that of the meter if it does not depend on
+            the flow rate, [-]
+
+        Returns
+        -------
+        dP : float
+            Non-recoverable pressure drop of the differential pressure flow
+            meter, [Pa]
+        '''
+        if C is None:
+            C = self.C
+        return self._dP(P1, P2, C)
@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+This module estimates the uncertainty of the mass flow rate measured by a
+differential pressure flow meter, from the uncertainties of the pipe and
+meter diameters, the pressures, and the fluid properties, and of the
+discharge coefficient and expansibility correlations themselves. Both the
+linearized propagation of the GUM [1]_ (as in ISO 5167-1 [3]_) and the Monte
+Carlo method of its Supplement 1 [2]_ are implemented; the Monte Carlo method
+solves every draw at once with
+:obj:`fluids.flow_meter.differential_pressure_meter_solver_batch`. NumPy is
+required.
+
+For reporting bugs, adding feature requests, or submitting pull requests,
+please use the `GitHub issue tracker <https://github.com/CalebBell/fluids/>`_
+or contact the author at Caleb.Andrew.Bell@gmail.com.
+
+.. contents:: :local:
+
+Uncertainty Propagation
+-----------------------
+.. autofunction:: flow_meter_uncertainty_GUM
+.. autofunction:: flow_meter_uncertainty_Monte_Carlo
+.. autoclass:: FlowMeterUncertainty
+
+Correlation Uncertainties
+-------------------------
+.. autofunction:: C_Reader_Harris_Gallagher_uncertainty
+.. autofunction:: orifice_expansibility_uncertainty
+
+References
+----------
+.. [1] JCGM 100:2008. Evaluation of Measurement Data - Guide to the
+   Expression of Uncertainty in Measurement.
+.. [2] JCGM 101:2008. Evaluation of Measurement Data - Supplement 1 to the
+   "Guide to the Expression of Uncertainty in Measurement" - Propagation of
+   Distributions Using a Monte Carlo Method.
+.. [3] ISO 5167-1:2003 - Measurement of Fluid Flow by Means of Pressure
+   Differential Devices Inserted in Circular Cross-Section Conduits Running
+   Full -- Part 1: General Principles and Requirements.
+.. [4] ISO 5167-2:2003 - Measurement of Fluid Flow by Means of Pressure
+   Differential Devices Inserted in Circular Cross-Section Conduits Running
+   Full -- Part 2: Orifice Plates.
+"""
+
+from __future__ import division
+from math import erf, pi, sqrt
+from fluids.numerics import numpy as np
+from fluids.flow_meter import (ISO_5167_ORIFICE, batch_meters,
+                               _meter_type_to_corr_default,
+                               _differential_pressure_meter_C_array,
+                               _differential_pressure_meter_epsilon_array,
+                               differential_pressure_meter_solver_batch)
+
+__all__ = ['flow_meter_uncertainty_GUM', 'flow_meter_uncertainty_Monte_Carlo',
+           'FlowMeterUncertainty', 'C_Reader_Harris_Gallagher_uncertainty',
+           'orifice_expansibility_uncertainty']
+
+
+def C_Reader_Harris_Gallagher_uncertainty(D, Do, Re_D):
+    r'''Calculates the relative expanded uncertainty, at a 95% level of
+    confidence, of the discharge coefficient of an orifice plate given by
+    :obj:`fluids.flow_meter.C_Reader_Harris_Gallagher`, as stated in
+    ISO 5167-2 [1]_.
+
+    .. math::
+        \frac{U(C)}{C} = \left\{ \begin{array}{ll}
+        0.7 - \beta & \mbox{if }0.1 \le \beta < 0.2 \\
+        0.5 & \mbox{if }0.2 \le \beta \le 0.6 \\
+        1.667\beta - 0.5 & \mbox{if }0.6 < \beta \le 0.75 \\
+        \end{array} \right. \%
+
+    If D < 71.12 mm (2.8 in.), :math:`0.9(0.75-\beta)(2.8-D/0.0254)` % is
+    added, and if :math:`\beta > 0.5` and :math:`Re_D < 10000`, 0.2 % is
+    added.
+
+    Parameters
+    ----------
+    D : float
+        Upstream internal pipe diameter, [m]
+    Do : float
+        Diameter of orifice at flow conditions, [m]
+    Re_D : float
+        Reynolds number of the flow in the pipe, [-]
+
+    Returns
+    -------
+    U_C : float
+        Relative expanded uncertainty of the discharge coefficient, [-]
+
+    Notes
+    -----
+    The standard uncertainty is half of this value.
+
+    Examples
+    --------
+    >>> C_Reader_Harris_Gallagher_uncertainty(D=0.07366, Do=0.05, Re_D=1E5)
+    0.0063155036
+
+    References
+    ----------
+    .. [1] ISO 5167-2:2003 - Measurement of Fluid Flow by Means of Pressure
+       Differential Devices Inserted in Circular Cross-Section Conduits Running
+       Full -- Part 2: Orifice Plates.
+    '''
+    beta = Do/D
+    if beta < 0.2:
+        U = 0.7 - beta
+    elif beta <= 0.6:
+        U = 0.5
+    else:
+        U = 1.667*beta - 0.5
+    if D < 0.07112:
+        U += 0.9*(0.75 - beta)*(2.8 - D/0.0254)
+    if beta > 0.5 and Re_D < 10000.0:
+        U += 0.2
+    return 0.01*U
+
+
+def orifice_expansibility_uncertainty(P1, P2, k):
+    r'''Calculates the relative expanded uncertainty, at a 95% level of
+    confidence, of the expansibility of an orifice plate given by
+    :obj:`fluids.flow_meter.orifice_expansibility`, as stated in
+    ISO 5167-2 [1]_.
+
+    .. math::
+        \frac{U(\epsilon)}{\epsilon} = \frac{3.5\Delta P}{\kappa P_1} \%
+
+    Parameters
+    ----------
+    P1 : float
+        Static pressure of fluid upstream of orifice at the cross-section of
+        the pressure tap, [Pa]
+    P2 : float
+        Static pressure of fluid downstream of orifice at the cross-section of
+        the pressure tap, [Pa]
+    k : float
+        Isentropic exponent of fluid, [-]
+
+    Returns
+    -------
+    U_epsilon : float
+        Relative expanded uncertainty of the expansibility, [-]
+
+    Notes
+    -----
+    The standard uncertainty is half of this value.
+
+    Examples
+    --------
+    >>> orifice_expansibility_uncertainty(P1=200000.0, P2=183000.0, k=1.4)
+    0.002125
+
+    References
+    ----------
+    .. [1] ISO 5167-2:2003 - Measurement of Fluid Flow by Means of Pressure
+       Differential Devices Inserted in Circular Cross-Section Conduits Running
+       Full -- Part 2: Orifice Plates.
+    '''
+    return 0.035*(P1 - P2)/(k*P1)
+
+
+class FlowMeterUncertainty(object):
+    r'''Results of :obj:`flow_meter_uncertainty_GUM` and
+    :obj:`flow_meter_uncertainty_Monte_Carlo`.
+
+    Attributes
+    ----------
+    method : str
+        'GUM' or 'Monte Carlo', [-]
+    m : float
+        Estimate of the mass flow rate; for the Monte Carlo method, the mean
+        of the draws, [kg/s]
+    u_m : float
+        Standard uncertainty of the mass flow rate, [kg/s]
+    coverage_interval : tuple(float, float)
+        Lower and upper ends of the coverage interval of the mass flow rate,
+        [kg/s]
+    coverage_probability : float
+        Probability that the mass flow rate is in `coverage_interval`; for
+        the GUM method, the probability for a normal distribution of the
+        coverage factor, [-]
+    sensitivities : dict[str, float]
+        Partial derivative of the mass flow rate with respect to each input
+        ('D', 'D2', 'P1', 'P2', 'rho', 'mu', 'C', 'epsilon'); GUM method
+        only, otherwise None, [various]
+    contributions : dict[str, float]
+        Each sensitivity multiplied by the standard uncertainty of its input;
+        GUM method only, otherwise None, [kg/s]
+    draws : int
+        Number of draws which were solved; Monte Carlo method only, otherwise
+        None, [-]
+    failures : int
+        Number of draws without a solution (e.g. with `P2` above `P1`), which
+        are excluded from the statistics; Monte Carlo method only, otherwise
+        None, [-]
+    '''
+    def __init__(self, method, m, u_m, coverage_interval, coverage_probability,
+                 sensitivities=None, contributions=None, draws=None,
+                 failures=None):
+        self.method = method
+        self.m = m
+        self.u_m = u_m
+        self.coverage_interval = coverage_interval
+        self.coverage_probability = coverage_probability
+        self.sensitivities = sensitivities
+        self.contributions = contributions
+        self.draws = draws
+        self.failures = failures
+
+    def __repr__(self):
+        return '<FlowMeterUncertainty (%s), m=%g kg/s, u_m=%g kg/s>' %(self.method, self.m, self.u_m)
+
+
+def _correlation_uncertainties(D, D2, P1, P2, mu, k, m, meter_type, u_C, u_epsilon):
+    # Relative standard uncertainties of C and epsilon; the ISO 5167-2 values
+    # are used for orifice plates when they are not specified
+    if meter_type == ISO_5167_ORIFICE:
+        if u_C is None:
+            u_C = 0.5*C_Reader_Harris_Gallagher_uncertainty(D, D2, 4.0*m/(pi*D*mu))
+        if u_epsilon is None:
+            u_epsilon = 0.5*orifice_expansibility_uncertainty(P1, P2, k)
+    if u_C is None:
+        raise ValueError("u_C is required for meter type %s" %(meter_type))
+    if u_epsilon is None:
+        raise ValueError("u_epsilon is required for meter type %s" %(meter_type))
+    return u_C, u_epsilon
+
+
+def _check_meter_type(meter_type):
+    meter_type = _meter_type_to_corr_default.get(meter_type, meter_type)
+    if meter_type not in batch_meters:
+        raise ValueError("Supported meter types are %s" %(batch_meters))
+    return meter_type
+
+
+def flow_meter_uncertainty_GUM(D, D2, P1, P2, rho, mu, k, u_D=0.0, u_D2=0.0,
+                               u_P1=0.0, u_P2=0.0, u_rho=0.0, u_mu=0.0,
+                               u_C=None, u_epsilon=None,
+                               meter_type=ISO_5167_ORIFICE, taps=None,
+                               coverage_factor=2.0):
+    r'''Calculates the uncertainty of the mass flow rate through a
+    differential pressure flow meter by the linearized propagation of the
+    GUM [1]_, from the uncertainties of its inputs, which are taken as
+    independent.
+
+    .. math::
+        u(m) = \sqrt{\sum_i \left(\frac{\partial m}{\partial x_i}
+        u(x_i)\right)^2}
+
+    The sensitivities are the derivatives of the discharge equation,
+    :math:`m = C\epsilon\frac{\pi}{4}D_2^2\sqrt{2\rho(P_1 - P_2)
+    /(1-\beta^4)}`, including the dependence of the expansibility on the
+    pressures and of the discharge coefficient on the Reynolds number, which
+    depends on `m`:
+
+    .. math::
+        \frac{\partial m}{\partial x_i} = \frac{m}{1 - a}\left(
+        \frac{\partial \ln(C \epsilon K)}{\partial x_i}\right)_m
+
+    .. math::
+        a = \frac{\partial \ln C}{\partial \ln m}
+
+    Parameters
+    ----------
+    D : float
+        Upstream internal pipe diameter, [m]
+    D2 : float
+        Diameter of orifice, or venturi meter orifice, or flow tube orifice,
+        or cone meter end diameter, or wedge meter fluid flow height, [m]
+    P1 : float
+        Static pressure of fluid upstream of differential pressure meter at the
+        cross-section of the pressure tap, [Pa]
+    P2 : float
+        Static pressure of fluid downstream of differential pressure meter or
+        at the prescribed location (varies by type of meter) [Pa]
+    rho : float
+        Density of fluid at `P1`, [kg/m^3]
+    mu : float
+        Viscosity of fluid at `P1`, [Pa*s]
+    k : float
+        Isentropic exponent of fluid, [-]
+    u_D : float, optional
+        Standard uncertainty of `D`, [m]
+    u_D2 : float, optional
+        Standard uncertainty of `D2`, [m]
+    u_P1 : float, optional
+        Standard uncertainty of `P1`, [Pa]
+    u_P2 : float, optional
+        Standard uncertainty of `P2`, [Pa]
+    u_rho : float, optional
+        Standard uncertainty of `rho`, [kg/m^3]
+    u_mu : float, optional
+        Standard uncertainty of `mu`, [Pa*s]
+    u_C : float, optional
+        Relative standard uncertainty of the discharge coefficient correlation;
+        for ISO 5167 orifices, half of
+        :obj:`C_Reader_Harris_Gallagher_uncertainty` if not specified, and
+        required for other meters, [-]
+    u_epsilon : float, optional
+        Relative standard uncertainty of the expansibility correlation; for
+        ISO 5167 orifices, half of :obj:`orifice_expansibility_uncertainty` if
+        not specified, and required for other meters, [-]
+    meter_type : str, optional
+        One of the types in :obj:`fluids.flow_meter.batch_meters`, [-]
+    taps : str, optional
+        The orientation of the taps; one of 'corner', 'flange', 'D', or 'D/2';
+        applies for orifice meters only, [-]
+    coverage_factor : float, optional
+        Multiple of `u_m` which is the half-width of the coverage interval;
+        2 gives a coverage probability of about 95%, [-]
+
+    Returns
+    -------
+    uncertainty : FlowMeterUncertainty
+        Mass flow rate, its standard uncertainty, coverage interval, and the
+        sensitivity to and contribution of each input, [-]
+
+    Notes
+    -----
+    The derivatives with respect to the pressures, density, and viscosity are
+    analytical; those of the discharge coefficient and expansibility with
+    respect to the diameters are by central finite differences. ISO 5167-1
+    [2]_ neglects the dependence of the discharge coefficient and the
+    expansibility on the diameter ratio, which can be a large part of the
+    sensitivity to the diameters.
+
+    Examples
+    --------
+    >>> res = flow_meter_uncertainty_GUM(D=0.07366, D2=0.05, P1=200000.0,
+    ... P2=183000.0, rho=999.1, mu=0.0011, k=1.33, u_D=1E-5, u_D2=5E-6,
+    ... u_P1=100.0, u_P2=100.0, u_rho=0.5, taps='D')
+    >>> round(res.m, 6), round(res.u_m, 6)
+    (7.702338, 0.039535)
+
+    References
+    ----------
+    .. [1] JCGM 100:2008. Evaluation of Measurement Data - Guide to the
+       Expression of Uncertainty in Measurement.
+    .. [2] ISO 5167-1:2003 - Measurement of Fluid Flow by Means of Pressure
+       Differential Devices Inserted in Circular Cross-Section Conduits
+       Running Full -- Part 1: General Principles and Requirements.
+    '''
+    meter_type = _check_meter_type(meter_type)
+    m = float(differential_pressure_meter_solver_batch(D=D, D2=D2, P1=P1, P2=P2,
+                                                       rho=rho, mu=mu, k=k,
+                                                       meter_type=meter_type,
+                                                       taps=taps))
+    u_C, u_epsilon = _correlation_uncertainties(D, D2, P1, P2, mu, k, m, meter_type,
+                                                u_C, u_epsilon)
+    # The derivatives with respect to the diameters by central differences,
+    # at D*(1 + h), D*(1 - h), D2*(1 + h), D2*(1 - h), and the point itself
+    h = 1e-6
+    Ds = D*np.array([1.0 + h, 1.0 - h, 1.0, 1.0, 1.0])
+    D2s = D2*np.array([1.0, 1.0, 1.0 + h, 1.0 - h, 1.0])
+    C, dC = _differential_pressure_meter_C_array(Ds, D2s, np.asarray(m), np.asarray(rho, dtype=float),
+                                                 np.asarray(mu, dtype=float), meter_type, taps)
+    epsilon, depsilon = _differential_pressure_meter_epsilon_array(Ds, D2s, np.asarray(P2/P1),
+                                                                   np.asarray(k, dtype=float),
+                                                                   meter_type)
+    ln_C_epsilon = np.log(C*epsilon)
+    dln_D = float(ln_C_epsilon[0] - ln_C_epsilon[1])/(2.0*h*D)
+    dln_D2 = float(ln_C_epsilon[2] - ln_C_epsilon[3])/(2.0*h*D2)
+    C, dC, epsilon, depsilon = float(C[4]), float(dC[4]), float(epsilon[4]), float(depsilon[4])
+    # C depends on m through the Reynolds number, which is proportional to
+    # m/(D*mu); solving m = C*epsilon*K for m scales each partial derivative
+    a = dC*m/C
+    scale = m/(1.0 - a)
+    beta4 = (D2/D)**4
+    dP = P1 - P2
+    sensitivities = {'D': scale*(-2.0*beta4/((1.0 - beta4)*D) + dln_D),
+                     'D2': scale*(2.0/((1.0 - beta4)*D2) + dln_D2),
+                     'P1': scale*(0.5/dP - depsilon*P2/(epsilon*P1*P1)),
+                     'P2': scale*(-0.5/dP + depsilon/(epsilon*P1)),
+                     'rho': scale*0.5/rho,
+                     'mu': -scale*a/mu,
+                     'C': scale/C,
+                     'epsilon': scale/epsilon}
+    uncertainties = {'D': u_D, 'D2': u_D2, 'P1': u_P1, 'P2': u_P2, 'rho': u_rho,
+                     'mu': u_mu, 'C': u_C*C, 'epsilon': u_epsilon*epsilon}
+    contributions = {name: sensitivities[name]*uncertainties[name] for name in sensitivities}
+    u_m = sqrt(sum(c*c for c in contributions.values()))
+    U_m = coverage_factor*u_m
+    # Probability of a normal distribution within coverage_factor deviations
+    coverage_probability = erf(coverage_factor/sqrt(2.0))
+    return FlowMeterUncertainty('GUM', m, u_m, (m - U_m, m + U_m),
+                                coverage_probability, sensitivities=sensitivities,
+                                contributions=contributions)
+
+
+def flow_meter_uncertainty_Monte_Carlo(D, D2, P1, P2, rho, mu, k, u_D=0.0,
+                                       u_D2=0.0, u_P1=0.0, u_P2=0.0,
+                                       u_rho=0.0, u_mu=0.0, u_C=None,
+                                       u_epsilon=None,
+                                       meter_type=ISO_5167_ORIFICE, taps=None,
+                                       coverage_probability=0.95,
+                                       draws=1000000, chunk_size=100000,
+                                       seed=None):
+    r'''Calculates the uncertainty of the mass flow rate through a
+    differential pressure flow meter by the Monte Carlo method of the GUM
+    Supplement 1 [1]_. Each input is drawn from a normal distribution with
+    its standard uncertainty, independently of the others; the discharge
+    coefficient and the expansibility are multiplied by normally distributed
+    factors with their relative uncertainties.
+
+    The draws are made and solved in chunks of `chunk_size` with
+    :obj:`fluids.flow_meter.differential_pressure_meter_solver_batch`, so the
+    memory used does not depend on `draws`. The mean and variance are
+    accumulated over the chunks by the pairwise method of Chan, Golub, and
+    LeVeque [2]_; the coverage interval is the average, weighted by the number
+    of draws, of the probabilistically symmetric coverage interval of each
+    chunk, as in the adaptive procedure of [1]_.
+
+    Parameters
+    ----------
+    D : float
+        Upstream internal pipe diameter, [m]
+    D2 : float
+        Diameter of orifice, or venturi meter orifice, or flow tube orifice,
+        or cone meter end diameter, or wedge meter fluid flow height, [m]
+    P1 : float
+        Static pressure of fluid upstream of differential pressure meter at the
+        cross-section of the pressure tap, [Pa]
+    P2 : float
+        Static pressure of fluid downstream of differential pressure meter or
+        at the prescribed location (varies by type of meter) [Pa]
+    rho : float
+        Density of fluid at `P1`, [kg/m^3]
+    mu : float
+        Viscosity of fluid at `P1`, [Pa*s]
+    k : float
+        Isentropic exponent of fluid, [-]
+    u_D : float, optional
+        Standard uncertainty of `D`, [m]
+    u_D2 : float, optional
+        Standard uncertainty of `D2`, [m]
+    u_P1 : float, optional
+        Standard uncertainty of `P1`, [Pa]
+    u_P2 : float, optional
+        Standard uncertainty of `P2`, [Pa]
+    u_rho : float, optional
+        Standard uncertainty of `rho`, [kg/m^3]
+    u_mu : float, optional
+        Standard uncertainty of `mu`, [Pa*s]
+    u_C : float, optional
+        Relative standard uncertainty of the discharge coefficient correlation;
+        for ISO 5167 orifices, half of
+        :obj:`C_Reader_Harris_Gallagher_uncertainty` if not specified, and
+        required for other meters, [-]
+    u_epsilon : float, optional
+        Relative standard uncertainty of the expansibility correlation; for
+        ISO 5167 orifices, half of :obj:`orifice_expansibility_uncertainty` if
+        not specified, and required for other meters, [-]
+    meter_type : str, optional
+        One of the types in :obj:`fluids.flow_meter.batch_meters`, [-]
+    taps : str, optional
+        The orientation of the taps; one of 'corner', 'flange', 'D', or 'D/2';
+        applies for orifice meters only, [-]
+    coverage_probability : float, optional
+        Probability that the mass flow rate is within the coverage interval,
+        [-]
+    draws : int, optional
+        Number of draws, [-]
+    chunk_size : int, optional
+        Number of draws solved together; each chunk should be large enough
+        to estimate the coverage interval, e.g. at least
+        :math:`10^4/(1-p)` [1]_, [-]
+    seed : int or numpy.random.Generator, optional
+        Seed of, or, the random number generator, [-]
+
+    Returns
+    -------
+    uncertainty : FlowMeterUncertainty
+        Mean and standard deviation of the mass flow rate, its coverage
+        interval, and the number of draws, [-]
+
+    Notes
+    -----
+    Unlike :obj:`flow_meter_uncertainty_GUM`, the model is not linearized, so
+    the two methods differ when the uncertainties are large or the discharge
+    equation is strongly nonlinear, as when `P2` is close to `P1`.
+
+    Examples
+    --------
+    >>> res = flow_meter_uncertainty_Monte_Carlo(D=0.07366, D2=0.05,
+    ... P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, k=1.33, u_D=1E-5,
+    ... u_D2=5E-6, u_P1=100.0, u_P2=100.0, u_rho=0.5, taps='D',
+    ... draws=100000, seed=0)
+    >>> round(res.m, 2), round(res.u_m, 3)
+    (7.7, 0.039)
+
+    References
+    ----------
+    .. [1] JCGM 101:2008. Evaluation of Measurement Data - Supplement 1 to the
+       "Guide to the Expression of Uncertainty in Measurement" - Propagation of
+       Distributions Using a Monte Carlo Method.
+    .. [2] Chan, Tony F., Gene H. Golub, and Randall J. LeVeque. "Algorithms
+       for Computing the Sample Variance: Analysis and Recommendations." The
+       American Statistician 37, no. 3 (1983): 242-47.
+    '''
+    meter_type = _check_meter_type(meter_type)
+    if u_C is None or u_epsilon is None:
+        m = float(differential_pressure_meter_solver_batch(D=D, D2=D2, P1=P1, P2=P2,
+                                                           rho=rho, mu=mu, k=k,
+                                                           meter_type=meter_type,
+                                                           taps=taps))
+        u_C, u_epsilon = _correlation_uncertainties(D, D2, P1, P2, mu, k, m, meter_type,
+                                                    u_C, u_epsilon)
+    rng = np.random.default_rng(seed)
+    tail = 0.5*(1.0 - coverage_probability)
+    inputs = ((D, u_D), (D2, u_D2), (P1, u_P1), (P2, u_P2), (rho, u_rho), (mu, u_mu),
+              (1.0, u_C), (1.0, u_epsilon))
+
+    count, mean, M2 = 0, 0.0, 0.0
+    low, high = 0.0, 0.0
+    failures = 0
+    for start in range(0, draws, chunk_size):
+        n = min(chunk_size, draws - start)
+        Ds, D2s, P1s, P2s, rhos, mus, C_factors, epsilon_factors = (
+            value + u*rng.standard_normal(n) if u else value for value, u in inputs)
+        # The factor of the discharge coefficient is applied to the
+        # expansibility; only their product enters the discharge equation
+        epsilon = _differential_pressure_meter_epsilon_array(np.asarray(Ds, dtype=float),
+                                                             np.asarray(D2s, dtype=float),
+                                                             np.asarray(P2s/P1s, dtype=float),
+                                                             np.asarray(k, dtype=float),
+                                                             meter_type)[0]
+        epsilon = epsilon*C_factors*epsilon_factors + np.zeros(n)
+        with np.errstate(invalid='ignore'):
+            ms = differential_pressure_meter_solver_batch(D=Ds, D2=D2s, P1=P1s, P2=P2s,
+                                                          rho=rhos, mu=mus, k=k,
+                                                          meter_type=meter_type, taps=taps,
+                                                          epsilon_specified=epsilon)
+        ms = ms[np.isfinite(ms)]
+        failures += n - ms.size
+        if ms.size == 0:
+            continue
+        chunk_mean = float(ms.mean())
+        chunk_M2 = float(((ms - chunk_mean)**2).sum())
+        total = count + ms.size
+        delta = chunk_mean - mean
+        mean += delta*ms.size/total
+        M2 += chunk_M2 + delta*delta*count*ms.size/total
+        chunk_low, chunk_high = np.quantile(ms, [tail, 1.0 - tail])
+        low += (float(chunk_low) - low)*ms.size/total
+        high += (float(chunk_high) - high)*ms.size/total
+        count = total
+    u_m = sqrt(M2/(count - 1)) if count > 1 else float('nan')
+    if not count:
+        mean = low = high = float('nan')
+    return FlowMeterUncertainty('Monte Carlo', mean, u_m, (low, high),
+                                coverage_probability, draws=count,
+                                failures=failures)
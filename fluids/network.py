@@ -0,0 +1,526 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+This module contains a solver for the flows and pressures in networks of
+pipes, which may contain loops, for a single-phase incompressible fluid.
+NumPy and SciPy are required.
+
+For reporting bugs, adding feature requests, or submitting pull requests,
+please use the `GitHub issue tracker <https://github.com/CalebBell/fluids/>`_
+or contact the author at Caleb.Andrew.Bell@gmail.com.
+
+.. contents:: :local:
+
+Pipe Networks
+-------------
+.. autoclass:: PipeNetwork
+    :members: add_node, add_pipe, set_demand, set_pressure, solve
+"""
+
+from __future__ import division
+from math import pi
+from fluids.constants import g
+from fluids.numerics import numpy as np, UnconvergedError
+from fluids.friction import fmethods, LAMINAR_TRANSITION_PIPE
+
+__all__ = ['PipeNetwork']
+
+TURBULENT_TRANSITION_NETWORK = 4000.0
+
+
+def _turbulent_friction_factor_and_derivative(Re, eD, Method):
+    import fluids.vectorized
+    if Method in ('Clamond', 'Colebrook'):
+        fd = fluids.vectorized.Clamond(Re, eD, False)
+        x = 1.0/np.sqrt(fd)
+        # 0.8685889638065036 = 2/ln(10)
+        c = 0.8685889638065036*2.51/(eD*0.27027027027027023 + 2.51*x/Re)
+        dx_dRe = c*x/(Re*(Re + c))
+        return fd, -2.0*dx_dRe*fd/x
+    correlation = getattr(fluids.vectorized, Method)
+    fd = correlation(Re, eD)
+    h = 1e-20*Re
+    try:
+        dfd_dRe = correlation(Re + 1j*h, eD.astype(np.complex128)).imag/h
+    except TypeError:
+        h = 1e-6*Re
+        dfd_dRe = (correlation(Re + h, eD) - correlation(Re - h, eD))/(2.0*h)
+    return fd, dfd_dRe
+
+
+def friction_factor_and_derivative(Re, eD, Method='Clamond'):
+    r'''Calculates the Darcy friction factor and its derivative with respect
+    to Reynolds number for arrays of Reynolds numbers and relative roughnesses.
+    The laminar solution is used below the transition Reynolds number of
+    2040, and the specified correlation above a Reynolds number of 4000;
+    between them, the friction factor is interpolated linearly in Reynolds
+    number, so the pressure drop of a pipe is a continuous, increasing
+    function of its flow rate as the network solver requires [1]_.
+
+    For the `Clamond` and `Colebrook` methods, the derivative comes from
+    implicit differentiation of the Colebrook equation:
+
+    .. math::
+        \frac{\partial f_d}{\partial Re} = -\frac{2}{x^3}\frac{c x}
+        {Re(Re + c)};\; x = \frac{1}{\sqrt{f_d}};\; c = \frac{2\cdot 2.51}
+        {\ln(10)(\epsilon/(3.7D) + 2.51x/Re)}
+
+    For the other explicit correlations, the complex-step derivative of
+    their NumPy implementation is used, which is exact to machine precision.
+
+    Parameters
+    ----------
+    Re : ndarray
+        Reynolds numbers, [-]
+    eD : ndarray
+        Relative roughnesses of the walls, [-]
+    Method : str, optional
+        Name of the friction factor correlation, [-]
+
+    Returns
+    -------
+    fd : ndarray
+        Darcy friction factors [-]
+    dfd_dRe : ndarray
+        Derivatives of the Darcy friction factors with respect to Reynolds
+        number, [-]
+
+    References
+    ----------
+    .. [1] Rossman, Lewis A. "EPANET 2 Users Manual." U.S. Environmental
+       Protection Agency, 2000.
+    '''
+    fd = np.empty(Re.shape)
+    dfd_dRe = np.empty(Re.shape)
+    laminar = Re < LAMINAR_TRANSITION_PIPE
+    Re_lam = Re[laminar]
+    fd[laminar] = 64.0/Re_lam
+    dfd_dRe[laminar] = -64.0/(Re_lam*Re_lam)
+
+    turbulent = ~laminar
+    transition = turbulent & (Re < TURBULENT_TRANSITION_NETWORK)
+    if transition.any():
+        # Straight line from the laminar friction factor to the turbulent one
+        eD_tr = eD[transition]
+        f_lam = 64.0/LAMINAR_TRANSITION_PIPE
+        f_turb, _ = _turbulent_friction_factor_and_derivative(
+                np.full(eD_tr.shape, TURBULENT_TRANSITION_NETWORK), eD_tr, Method)
+        slope = (f_turb - f_lam)/(TURBULENT_TRANSITION_NETWORK - LAMINAR_TRANSITION_PIPE)
+        fd[transition] = f_lam + slope*(Re[transition] - LAMINAR_TRANSITION_PIPE)
+        dfd_dRe[transition] = slope
+        turbulent &= ~transition
+
+    fd[turbulent], dfd_dRe[turbulent] = _turbulent_friction_factor_and_derivative(
+            Re[turbulent], eD[turbulent], Method)
+    return fd, dfd_dRe
+
+
+class PipeNetwork(object):
+    r'''Class representing a network of pipes, which may contain loops,
+    carrying a single-phase incompressible fluid. Nodes either have a
+    specified pressure (supplies, reservoirs, discharges to atmosphere) or a
+    specified demand (mass flow leaving the network at that node). Each pipe
+    connects two nodes and has a loss coefficient for its fittings in addition
+    to its straight-pipe friction.
+
+    The network is solved for the mass flow in every pipe and the pressure at
+    every node with unspecified pressure using the global gradient algorithm
+    of Todini and Pilati [1]_. Newton's method is applied to the combined pipe
+    energy and node continuity equations; each iteration only requires the
+    solution of a sparse, symmetric positive definite system whose size is the
+    number of nodes with unknown pressure:
+
+    .. math::
+        \left(A_1^T G^{-1} A_1\right) \Delta P = A_1^T G^{-1} r_1 - r_2
+
+    .. math::
+        \Delta m = G^{-1}\left(A_1 \Delta P - r_1\right)
+
+    Here :math:`A_1` is the pipe-node incidence matrix of the unknown nodes,
+    :math:`G` is the diagonal matrix of derivatives of each pipe's pressure
+    drop with respect to its mass flow, :math:`r_1` is the residual of each
+    pipe's pressure drop equation, and :math:`r_2` is the residual of each
+    node's mass balance. :math:`G` is calculated analytically from the
+    friction factor correlation, the loss coefficient, and the dynamic
+    pressure.
+
+    The pressure drop of each pipe is:
+
+    .. math::
+        P_{start} + \rho g z_{start} - P_{end} - \rho g z_{end}
+        = \left(f_d\frac{L}{D} + K\right)\frac{\rho V|V|}{2}
+
+    The sparsity pattern of the linear system is computed once for a given
+    topology and reused for every iteration and every later solve.
+
+    Parameters
+    ----------
+    None
+
+    Attributes
+    ----------
+    m : ndarray
+        Mass flow in each pipe, in the order they were added; positive from
+        `start` to `end`, [kg/s]
+    P : ndarray
+        Pressure at each node, in the order they were added, [Pa]
+    V : ndarray
+        Velocity in each pipe, [m/s]
+    Re : ndarray
+        Reynolds number in each pipe, [-]
+    fd : ndarray
+        Darcy friction factor in each pipe, [-]
+    dP : ndarray
+        Pressure drop of friction and fittings across each pipe; does not
+        include the change in elevation, [Pa]
+    iterations : int
+        Number of Newton iterations taken by the last solve, [-]
+
+    Notes
+    -----
+    Every node must be connected to a node with a specified pressure, or the
+    pressures are indeterminate.
+
+    The friction factor is calculated by
+    :obj:`friction_factor_and_derivative`, which bridges the gap between
+    the laminar and turbulent friction factors with a straight line from a
+    Reynolds number of 2040 to 4000. Without this, a pipe whose pressure drop
+    falls inside the gap has no solution and Newton's method cycles.
+
+    The derivative of the pressure drop of a laminar pipe, including a pipe
+    with no flow, is the analytical one of the Hagen-Poiseuille equation. A
+    pipe with no length and no flow has no resistance; a small minimum
+    derivative is used in that case to keep the linear system well defined.
+
+    The previous solution is used as the initial guess when `solve` is called
+    again, so what-if studies which change demands or specified pressures
+    converge in a few iterations.
+
+    Examples
+    --------
+    Two reservoirs feeding a demand through three pipes in a loop:
+
+    >>> net = PipeNetwork()
+    >>> net.add_node('tank 1', P=4E5)
+    >>> net.add_node('tank 2', P=3.5E5)
+    >>> net.add_node('junction', demand=20.0)
+    >>> net.add_node('consumer', demand=15.0, z=5.0)
+    >>> net.add_pipe('1', 'tank 1', 'junction', D=0.15, L=500.0, roughness=5E-5, K=1.5)
+    >>> net.add_pipe('2', 'tank 2', 'junction', D=0.1, L=300.0, roughness=5E-5)
+    >>> net.add_pipe('3', 'junction', 'consumer', D=0.1, L=200.0, roughness=5E-5)
+    >>> net.add_pipe('4', 'tank 1', 'consumer', D=0.08, L=800.0, roughness=5E-5)
+    >>> net.solve(rho=1000.0, mu=1E-3)
+    >>> net.m.round(4).tolist()
+    [25.3748, 4.8808, 10.2556, 4.7444]
+    >>> net.P.round(1).tolist()
+    [400000.0, 350000.0, 337386.6, 254815.6]
+
+    References
+    ----------
+    .. [1] Todini, E., and S. Pilati. "A Gradient Algorithm for the Analysis
+       of Pipe Networks." In Computer Applications in Water Supply: Vol. 1
+       --- Systems Analysis and Simulation, 1-20. Research Studies Press,
+       1988.
+    .. [2] Rossman, Lewis A. "EPANET 2 Users Manual." U.S. Environmental
+       Protection Agency, 2000.
+    '''
+    def __repr__(self): # pragma : no cover
+        return '<PipeNetwork, %d nodes, %d pipes>' %(len(self.node_names), len(self.pipe_names))
+
+    def __init__(self):
+        self.node_names = []
+        self.node_indices = {}
+        self.node_P = []
+        self.node_demand = []
+        self.node_z = []
+
+        self.pipe_names = []
+        self.pipe_indices = {}
+        self.pipe_start = []
+        self.pipe_end = []
+        self.pipe_D = []
+        self.pipe_L = []
+        self.pipe_roughness = []
+        self.pipe_K = []
+
+        self.m = None
+        self.P = None
+        self._structure = None
+
+    def add_node(self, name, P=None, demand=0.0, z=0.0):
+        r'''Add a node to the network.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the node, [-]
+        P : float, optional
+            Specified pressure at the node; if None, the pressure is solved
+            for, [Pa]
+        demand : float, optional
+            Mass flow leaving the network at the node; negative for a flow
+            entering the network; ignored if `P` is specified, [kg/s]
+        z : float, optional
+            Elevation of the node, [m]
+        '''
+        if name in self.node_indices:
+            raise ValueError("Node %s already exists" %(name))
+        self.node_indices[name] = len(self.node_names)
+        self.node_names.append(name)
+        self.node_P.append(P)
+        self.node_demand.append(demand)
+        self.node_z.append(z)
+        self._structure = None
+        self.m = self.P = None
+
+    def add_pipe(self, name, start, end, D, L, roughness=0.0, K=0.0):
+        r'''Add a pipe between two existing nodes of the network. Positive flow
+        is from `start` to `end`.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the pipe, [-]
+        start : str
+            Name of the node the pipe starts at, [-]
+        end : str
+            Name of the node the pipe ends at, [-]
+        D : float
+            Inner diameter of the pipe, [m]
+        L : float
+            Length of the pipe, [m]
+        roughness : float, optional
+            Roughness of the pipe wall, [m]
+        K : float, optional
+            Sum of the loss coefficients of the fittings, entrances and exits
+            in the pipe, based on the pipe's diameter, as calculated with the
+            functions in :obj:`fluids.fittings`, [-]
+        '''
+        if name in self.pipe_indices:
+            raise ValueError("Pipe %s already exists" %(name))
+        try:
+            start, end = self.node_indices[start], self.node_indices[end]
+        except KeyError:
+            raise ValueError("Pipes must connect existing nodes")
+        if start == end:
+            raise ValueError("A pipe cannot connect a node to itself")
+        self.pipe_indices[name] = len(self.pipe_names)
+        self.pipe_names.append(name)
+        self.pipe_start.append(start)
+        self.pipe_end.append(end)
+        self.pipe_D.append(D)
+        self.pipe_L.append(L)
+        self.pipe_roughness.append(roughness)
+        self.pipe_K.append(K)
+        self._structure = None
+        self.m = self.P = None
+
+    def set_demand(self, name, demand):
+        r'''Change the demand at a node with unspecified pressure. The
+        structure of the network and the last solution are kept, so the next
+        solve is warm-started.
+
+        Parameters
+        ----------
+        name : str
+            Name of the node, [-]
+        demand : float
+            Mass flow leaving the network at the node, [kg/s]
+        '''
+        i = self.node_indices[name]
+        if self.node_P[i] is not None:
+            raise ValueError("Node %s has a specified pressure" %(name))
+        self.node_demand[i] = demand
+
+    def set_pressure(self, name, P):
+        r'''Change the specified pressure at a node with specified pressure.
+        The structure of the network and the last solution are kept, so the
+        next solve is warm-started.
+
+        Parameters
+        ----------
+        name : str
+            Name of the node, [-]
+        P : float
+            Pressure at the node, [Pa]
+        '''
+        i = self.node_indices[name]
+        if self.node_P[i] is None:
+            raise ValueError("Node %s does not have a specified pressure" %(name))
+        self.node_P[i] = P
+
+    def _build_structure(self):
+        N_nodes, N_pipes = len(self.node_names), len(self.pipe_names)
+        fixed = np.array([P is not None for P in self.node_P], dtype=bool)
+        if not fixed.any():
+            raise ValueError("At least one node must have a specified pressure")
+        unknown_nodes = np.where(~fixed)[0]
+        unknown_index = np.full(N_nodes, -1, dtype=np.int64)
+        unknown_index[unknown_nodes] = np.arange(len(unknown_nodes))
+        N = len(unknown_nodes)
+
+        start = np.array(self.pipe_start, dtype=np.int64)
+        end = np.array(self.pipe_end, dtype=np.int64)
+        us, ue = unknown_index[start], unknown_index[end]
+        pipes = np.arange(N_pipes)
+
+        # Pipe-node incidence of the unknown nodes; +1 at start, -1 at end
+        from scipy.sparse import csr_matrix
+        has_s, has_e = us >= 0, ue >= 0
+        rows = np.concatenate([pipes[has_s], pipes[has_e]])
+        cols = np.concatenate([us[has_s], ue[has_e]])
+        vals = np.concatenate([np.ones(has_s.sum()), -np.ones(has_e.sum())])
+        A1 = csr_matrix((vals, (rows, cols)), shape=(N_pipes, N))
+
+        # Entries of A1^T diag(w) A1 contributed by each pipe; their positions
+        # in the CSC data array are found once here and reused every iteration
+        both = has_s & has_e
+        S_rows = np.concatenate([us[has_s], ue[has_e], us[both], ue[both]])
+        S_cols = np.concatenate([us[has_s], ue[has_e], ue[both], us[both]])
+        S_pipes = np.concatenate([pipes[has_s], pipes[has_e], pipes[both], pipes[both]])
+        S_signs = np.concatenate([np.ones(has_s.sum() + has_e.sum()), -np.ones(2*both.sum())])
+        keys, S_positions = np.unique(S_cols*N + S_rows, return_inverse=True)
+        S_indices = keys % N
+        S_indptr = np.concatenate([[0], np.cumsum(np.bincount(keys//N, minlength=N))])
+        if N and len(keys) and np.any(np.bincount(S_rows, minlength=N) == 0):
+            raise ValueError("Every node must be connected to a pipe")
+
+        D = np.array(self.pipe_D, dtype=np.float64)
+        A = 0.25*pi*D*D
+        self._structure = {'fixed': fixed, 'unknown_nodes': unknown_nodes,
+                           'start': start, 'end': end, 'A1': A1, 'A1T': A1.T.tocsr(),
+                           'S_pipes': S_pipes, 'S_signs': S_signs,
+                           'S_positions': S_positions.ravel(),
+                           'S_indices': S_indices, 'S_indptr': S_indptr,
+                           'D': D, 'A': A, 'L': np.array(self.pipe_L, dtype=np.float64),
+                           'eD': np.array(self.pipe_roughness, dtype=np.float64)/D,
+                           'K': np.array(self.pipe_K, dtype=np.float64)}
+        return self._structure
+
+    def _dP_and_derivative(self, m, rho, mu, Method, s):
+        D, A, L, K = s['D'], s['A'], s['L'], s['K']
+        m_abs = np.abs(m)
+        V = m_abs/(rho*A)
+        Re = np.maximum(rho*V*D/mu, 1e-300)
+        with np.errstate(divide='ignore', over='ignore'):
+            # dfd_dRe of a laminar pipe without flow is infinite; it is unused
+            fd, dfd_dRe = friction_factor_and_derivative(Re, s['eD'], Method)
+        L_D = L/D
+        coeff = fd*L_D + K
+        q = 0.5*rho*V*V
+        dP = np.copysign(coeff*q, m)
+        # d(dP)/dm; dV/dm = 1/(rho*A), dRe/dm = D/(A*mu)
+        G = coeff*V/A
+        # The friction pressure drop of laminar flow is linear in m, so its
+        # derivative is evaluated directly; this also holds at no flow, where
+        # dfd_dRe is infinite and q is zero
+        laminar = Re < LAMINAR_TRANSITION_PIPE
+        G[laminar] = 32.0*mu*L[laminar]/(rho*D[laminar]**2*A[laminar]) + K[laminar]*V[laminar]/A[laminar]
+        t = ~laminar
+        G[t] += q[t]*L_D[t]*dfd_dRe[t]*D[t]/(A[t]*mu)
+        return dP, G, V, Re, fd
+
+    def solve(self, rho, mu, Method='Clamond', m0=None, xtol=1e-10, maxiter=100):
+        r'''Solve the network for the mass flow in every pipe and the pressure
+        at every node, storing them as the attributes `m` and `P`.
+
+        Parameters
+        ----------
+        rho : float
+            Density of the fluid, [kg/m^3]
+        mu : float
+            Viscosity of the fluid, [Pa*s]
+        Method : str, optional
+            Friction factor correlation to use; any of the methods accepted by
+            :obj:`fluids.friction.friction_factor`, [-]
+        m0 : ndarray, optional
+            Initial guess for the mass flow in every pipe; if not provided,
+            the previous solution is used if there is one, otherwise a
+            velocity of 1 m/s in every pipe, [kg/s]
+        xtol : float, optional
+            Relative tolerance on the change in mass flows, [-]
+        maxiter : int, optional
+            Maximum number of Newton iterations, [-]
+        '''
+        if Method is None:
+            Method = 'Clamond'
+        if Method not in fmethods:
+            raise ValueError("Method not recognized")
+        from scipy.sparse import csc_matrix
+        from scipy.sparse.linalg import splu
+        s = self._structure
+        if s is None:
+            s = self._build_structure()
+        A1, A1T = s['A1'], s['A1T']
+        start, end, fixed = s['start'], s['end'], s['fixed']
+        N = len(s['unknown_nodes'])
+
+        z = np.array(self.node_z, dtype=np.float64)
+        # Piezometric pressures of the specified nodes
+        P_fixed = np.zeros(len(z))
+        P_fixed[fixed] = [P for P in self.node_P if P is not None]
+        P_fixed[fixed] += rho*g*z[fixed]
+        P_known_drop = P_fixed[start]*fixed[start] - P_fixed[end]*fixed[end]
+        demand = np.array(self.node_demand, dtype=np.float64)[s['unknown_nodes']]
+
+        if m0 is not None:
+            m = np.array(m0, dtype=np.float64)
+        elif self.m is not None:
+            m = self.m.copy()
+        else:
+            m = rho*s['A']
+        if self.P is not None:
+            P = self.P[s['unknown_nodes']] + rho*g*z[s['unknown_nodes']]
+        else:
+            P = np.zeros(N)
+
+        G_min = 1e-12*rho/np.min(s['A'])
+        converged = False
+        for iteration in range(1, maxiter+1):
+            dP, G, V, Re, fd = self._dP_and_derivative(m, rho, mu, Method, s)
+            G = np.maximum(G, G_min)
+            r1 = dP - A1.dot(P) - P_known_drop
+            r2 = A1T.dot(m) + demand
+            G_inv = 1.0/G
+            data = np.bincount(s['S_positions'], weights=(s['S_signs']*G_inv[s['S_pipes']]),
+                               minlength=len(s['S_indices']))
+            if N:
+                S = csc_matrix((data, s['S_indices'], s['S_indptr']), shape=(N, N))
+                dPs = splu(S).solve(A1T.dot(G_inv*r1) - r2)
+            else:
+                dPs = np.zeros(0)
+            dm = G_inv*(A1.dot(dPs) - r1)
+            m += dm
+            P += dPs
+            if np.max(np.abs(dm)) <= xtol*max(np.max(np.abs(m)), 1e-300):
+                converged = True
+                break
+        self.iterations = iteration
+        if not converged:
+            raise UnconvergedError("Network did not converge in %d iterations" %(maxiter))
+
+        dP, G, V, Re, fd = self._dP_and_derivative(m, rho, mu, Method, s)
+        P_all = P_fixed.copy()
+        P_all[s['unknown_nodes']] = P
+        P_all -= rho*g*z
+        self.m, self.P = m, P_all
+        self.V, self.Re, self.fd, self.dP = np.copysign(V, m), Re, fd, dP
@@ -27,7 +27,7 @@ from . import nrlmsise_00
 from . import nrlmsise_00_header
 from . import nrlmsise_00_data
 
-from .nrlmsise_00 import gtd7
+from .nrlmsise_00 import gtd7, gtd7_array, nrlmsise_context
 from .nrlmsise_00_header import nrlmsise_output, nrlmsise_input, nrlmsise_flags, ap_array
 
 
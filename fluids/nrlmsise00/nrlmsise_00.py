@@ -43,7 +43,7 @@ from __future__ import division
 from .nrlmsise_00_header import *
 from .nrlmsise_00_data import *
 from math import sin, cos, pow, exp, log, sqrt
-__all__ = ['gtd7']
+__all__ = ['gtd7', 'gtd7_array', 'nrlmsise_context']
 
 """
 /* ------------------------------------------------------------------- */
@@ -365,16 +365,44 @@ def spline(x, y, n, yp1, ypn, y2):
 def zeta(zz, zl):
     return ((zz-zl)*(re_nrlmsise_00[0]+zl)/(re_nrlmsise_00[0]+zz))    #re is the global variable
 
-def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
+def densm_spline(mn, zn, tn, tgn):
     '''
-/*      Calculate Temperature and Density Profiles for lower atmos.  */
-'''
+/*      Calculate the spline nodes of one lower atmosphere temperature
+ *      profile used by DENSM; shared by every DENSM call of a point.
+ */
+ '''
     xs = [0.0]*10
     ys = [0.0]*10
     y2out = [0.0]*10
+    z1=zn[0];
+    z2=zn[mn-1];
+    t1=tn[0];
+    t2=tn[mn-1];
+    zgdif = zeta(z2, z1);
+
+    #/* set up spline nodes */
+    for k in range(mn):
+        xs[k]=zeta(zn[k],z1)/zgdif;
+        ys[k]=1.0 / tn[k];
+    yd1=-tgn[0] / (t1*t1) * zgdif;
+    yd2=-tgn[1] / (t2*t2) * zgdif * (pow(((re_nrlmsise_00[0]+z2)/(re_nrlmsise_00[0]+z1)),2.0));
+
+    #/* calculate spline coefficients */
+    spline (xs, ys, mn, yd1, yd2, y2out);
+    return (xs, ys, y2out, z1, t1, zgdif)
+
+
+def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2, nodes=None):
+    '''
+/*      Calculate Temperature and Density Profiles for lower atmos.  */
+ nodes is an optional two-element list caching the densm_spline results of
+ the stratosphere/mesosphere and troposphere/stratosphere profiles
+'''
     rgas = 831.4
     #rgas = 831.44621    #maybe make this a global constant?
     densm_tmp=d0
+    if nodes is None:
+        nodes = [None, None]
     if (alt>zn2[0]): # pragma: no cover
         if(xm==0.0):
             return tz[0]
@@ -387,22 +415,10 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
     else:
         z=zn2[mn2-1];
     mn=mn2;
-    z1=zn2[0];
-    z2=zn2[mn-1];
-    t1=tn2[0];
-    t2=tn2[mn-1];
+    if nodes[0] is None:
+        nodes[0] = densm_spline(mn2, zn2, tn2, tgn2)
+    xs, ys, y2out, z1, t1, zgdif = nodes[0]
     zg = zeta(z, z1);
-    zgdif = zeta(z2, z1);
-
-    #/* set up spline nodes */
-    for k in range(mn):
-        xs[k]=zeta(zn2[k],z1)/zgdif;
-        ys[k]=1.0 / tn2[k];
-    yd1=-tgn2[0] / (t1*t1) * zgdif;
-    yd2=-tgn2[1] / (t2*t2) * zgdif * (pow(((re_nrlmsise_00[0]+z2)/(re_nrlmsise_00[0]+z1)),2.0));
-
-    #/* calculate spline coefficients */
-    spline (xs, ys, mn, yd1, yd2, y2out);   #No need to change this
     x = zg/zgdif;
     y = [0.0]
     splint (xs, ys, y2out, mn, x, y);
@@ -433,25 +449,10 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
     #/* troposhere / stratosphere temperature */
     z = alt;
     mn = mn3;
-    z1=zn3[0];
-    z2=zn3[mn-1];
-    t1=tn3[0];
-    t2=tn3[mn-1];
+    if nodes[1] is None:
+        nodes[1] = densm_spline(mn3, zn3, tn3, tgn3)
+    xs, ys, y2out, z1, t1, zgdif = nodes[1]
     zg=zeta(z,z1);
-    zgdif=zeta(z2,z1);
-
-
-
-    #/* set up spline nodes */
-    for k in range(mn):
-        xs[k] = zeta(zn3[k],z1) / zgdif;
-        ys[k] = 1.0 / tn3[k];
-    
-    yd1=-tgn3[0] / (t1*t1) * zgdif;
-    yd2=-tgn3[1] / (t2*t2) * zgdif * (pow(((re_nrlmsise_00[0]+z2)/(re_nrlmsise_00[0]+z1)),2.0));
-
-    #/* calculate spline coefficients */
-    spline (xs, ys, mn, yd1, yd2, y2out);
     x = zg/zgdif;
     y = [0.0]
     splint (xs, ys, y2out, mn, x, y);
@@ -484,21 +485,59 @@ def densm(alt, d0, xm, tz, mn3, zn3, tn3, tgn3, mn2, zn2, tn2, tgn2):
 /* ------------------------------- DENSU ----------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
+def densu_spline(tinf, tlb, s2, zlb, mn1, zn1, tn1, tgn1):
+    '''
+/*      Calculate the spline nodes of the lower thermosphere temperature
+ *      profile used by DENSU below ZA. They depend only on the Bates
+ *      profile parameters, so GTS7 computes them once and shares them
+ *      between all of its DENSU calls.
+ */
+ tn1 and tgn1 are simulated pointers
+ '''
+    xs = [0.0]*5
+    ys = [0.0]*5
+    y2out = [0.0]*5
+
+    #/* Bates temperature at ZA */
+    za = zn1[0];
+    ta = tinf - (tinf - tlb) * exp(-s2*zeta(za, zlb));
+
+    #/* temperature gradient at ZA from Bates profile */
+    dta = (tinf - ta) * s2 * pow(((re_nrlmsise_00[0]+zlb)/(re_nrlmsise_00[0]+za)),2.0);
+    tgn1[0]=dta;
+    tn1[0]=ta;
+    mn=mn1;
+    z1=zn1[0];
+    z2=zn1[mn-1];
+    t1=tn1[0];
+    t2=tn1[mn-1];
+    zgdif = zeta(z2, z1);
+    #/* set up spline nodes */
+    for k in range(mn):
+        xs[k] = zeta(zn1[k], z1) / zgdif;
+        ys[k] = 1.0 / tn1[k];
+
+    #/* end node derivatives */
+    yd1 = -tgn1[0] / (t1*t1) * zgdif;
+    yd2 = -tgn1[1] / (t2*t2) * zgdif * pow(((re_nrlmsise_00[0]+z2)/(re_nrlmsise_00[0]+z1)),2.0);
+    #/* calculate spline coefficients */
+    spline (xs, ys, mn, yd1, yd2, y2out);
+    return (xs, ys, y2out, z1, t1, zgdif)
+
+
+def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1,
+          nodes=None):
     '''
 /*      Calculate Temperature and Density Profiles for MSIS models
  *      New lower thermo polynomial
  */
- tz, zn1, tn1, and tgn1 are simulated pointers
+ tz, zn1, tn1, and tgn1 are simulated pointers; nodes is the result of
+ densu_spline for the same tinf, tlb, s2 and zlb, computed here if not given
  '''
     rgas = 831.4
     #rgas = 831.44621    #maybe make this a global constant?
     densu_temp = 1.0
 
-    xs = [0.0]*5
-    ys = [0.0]*5
-    y2out = [0.0]*5
-
     #/* joining altitudes of Bates and spline */
     za=zn1[0];
     if (alt>za):
@@ -511,38 +550,21 @@ def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
     
     #/* Bates temperature */
     tt = tinf - (tinf - tlb) * exp(-s2*zg2);
-    ta = tt;
     tz[0] = tt
     densu_temp = tz[0]
 
     if (alt<za):
-        #/* calculate temperature below ZA
-        # * temperature gradient at ZA from Bates profile */
-        dta = (tinf - ta) * s2 * pow(((re_nrlmsise_00[0]+zlb)/(re_nrlmsise_00[0]+za)),2.0);
-        tgn1[0]=dta;
-        tn1[0]=ta;
+        #/* calculate temperature below ZA */
+        if nodes is None:
+            nodes = densu_spline(tinf, tlb, s2, zlb, mn1, zn1, tn1, tgn1)
+        xs, ys, y2out, z1, t1, zgdif = nodes
+        mn=mn1;
         if (alt>zn1[mn1-1]):
             z=alt;
         else:
             z=zn1[mn1-1];
-        mn=mn1;
-        z1=zn1[0];
-        z2=zn1[mn-1];
-        t1=tn1[0];
-        t2=tn1[mn-1];
         #/* geopotental difference from z1 */
         zg = zeta (z, z1);
-        zgdif = zeta(z2, z1);
-        #/* set up spline nodes */
-        for k in range(mn):
-            xs[k] = zeta(zn1[k], z1) / zgdif;
-            ys[k] = 1.0 / tn1[k];
-        
-        #/* end node derivatives */
-        yd1 = -tgn1[0] / (t1*t1) * zgdif;
-        yd2 = -tgn1[1] / (t2*t2) * zgdif * pow(((re_nrlmsise_00[0]+z2)/(re_nrlmsise_00[0]+z1)),2.0);
-        #/* calculate spline coefficients */
-        spline (xs, ys, mn, yd1, yd2, y2out);
         x = zg / zgdif;
         y = [0.0]
         splint (xs, ys, y2out, mn, x, y);
@@ -586,6 +608,62 @@ def densu(alt, dlb, tinf, tlb, xm, alpha, tz, zlb, s2, mn1, zn1, tn1, tgn1):
     return densu_temp;
 
 
+'''
+/* ------------------------------------------------------------------- */
+/* ----------------------------- CONTEXT ----------------------------- */
+/* ------------------------------------------------------------------- */
+'''
+class nrlmsise_context(object):
+    '''Cache of the GLOBE7 and GLOB7S terms of one epoch and position.
+
+    GLOBE7 and GLOB7S do not depend on the altitude; their Legendre
+    polynomials, local time harmonics and results only change with the day,
+    time, position, solar flux, magnetic activity and switches of the input.
+    Passing the same context to `gtd7` for points which differ only in
+    altitude computes those terms once; `gtd7` calls `select` for every
+    point, which clears the cache whenever any of them change.
+
+    Attributes
+    ----------
+    key : tuple
+        Epoch, position and switches the cached terms were computed for
+    harmonics : tuple
+        Legendre polynomials, local time harmonics and `dfa` set by GLOBE7
+    globe7 : dict
+        GLOBE7 results and the magnetic activity terms they leave, by
+        parameter set
+    glob7s : dict
+        GLOB7S results, by parameter set and magnetic activity terms
+    '''
+    def __init__(self):
+        self.key = None
+        self.clear()
+
+    def clear(self):
+        self.harmonics = None
+        self.globe7 = {}
+        self.glob7s = {}
+
+    def select(self, Input, flags):
+        ap_a = None if Input.ap_a is None else tuple(Input.ap_a.a)
+        key = (Input.doy, Input.sec, Input.g_lat, Input.g_long, Input.lst,
+               Input.f107A, Input.f107, Input.ap, ap_a, tuple(flags.sw),
+               tuple(flags.swc))
+        if key != self.key:
+            self.key = key
+            self.clear()
+
+    def save(self):
+        self.harmonics = ([row[:] for row in plg], stloc, ctloc, s2tloc,
+                          c2tloc, s3tloc, c3tloc, dfa)
+
+    def restore(self):
+        global stloc, ctloc, s2tloc, c2tloc, s3tloc, c3tloc, dfa
+        rows, stloc, ctloc, s2tloc, c2tloc, s3tloc, c3tloc, dfa = self.harmonics
+        for row, saved in zip(plg, rows):
+            row[:] = saved
+
+
 '''
 /* ------------------------------------------------------------------- */
 /* ------------------------------- GLOBE7 ---------------------------- */
@@ -610,11 +688,20 @@ def sg0(ex, p, ap):
                                                                                g0_nrlmsise00(ap[6], p)*pow(ex, 12.0))*(1.0 - pow(ex, 8.0))/(1.0 - ex)))/sumex(ex);
 
 
-def globe7(p, Input, flags):
+def globe7(p, Input, flags, context=None):
     '''
 /*       CALCULATE G(L) FUNCTION 
  *       Upper Thermosphere Parameters */
+ context is an optional nrlmsise_context for the epoch and position of Input
 '''
+    global dfa, apdf, stloc, ctloc, s2tloc, c2tloc, s3tloc, c3tloc
+    if context is not None:
+        cached = context.globe7.get(id(p))
+        if cached is not None:
+            #/* restore the state GLOB7S reads, as if computed again */
+            context.restore()
+            tinf, apdf, apt[0] = cached
+            return tinf
     t = [0]*15  #modified this, there was a for loop that did this
     sw9 = 1
     sr = 7.2722E-5;
@@ -631,52 +718,54 @@ def globe7(p, Input, flags):
         sw9 = -1
     xlong = Input.g_long
 
-    #/* calculate legendre polynomials */
-    c = sin(Input.g_lat * dgtr);
-    s = cos(Input.g_lat * dgtr);
-    c2 = c*c;
-    c4 = c2*c2;
-    s2 = s*s;
-
-    plg[0][1] = c;
-    plg[0][2] = 0.5*(3.0*c2 -1.0);
-    plg[0][3] = 0.5*(5.0*c*c2-3.0*c);
-    plg[0][4] = (35.0*c4 - 30.0*c2 + 3.0)/8.0;
-    plg[0][5] = (63.0*c2*c2*c - 70.0*c2*c + 15.0*c)/8.0;
-    plg[0][6] = (11.0*c*plg[0][5] - 5.0*plg[0][4])/6.0;
-#/*      plg[0][7] = (13.0*c*plg[0][6] - 6.0*plg[0][5])/7.0; */
-    plg[1][1] = s;
-    plg[1][2] = 3.0*c*s;
-    plg[1][3] = 1.5*(5.0*c2-1.0)*s;
-    plg[1][4] = 2.5*(7.0*c2*c-3.0*c)*s;
-    plg[1][5] = 1.875*(21.0*c4 - 14.0*c2 +1.0)*s;
-    plg[1][6] = (11.0*c*plg[1][5]-6.0*plg[1][4])/5.0;
-#/*      plg[1][7] = (13.0*c*plg[1][6]-7.0*plg[1][5])/6.0; */
-#/*      plg[1][8] = (15.0*c*plg[1][7]-8.0*plg[1][6])/7.0; */
-    plg[2][2] = 3.0*s2;
-    plg[2][3] = 15.0*s2*c;
-    plg[2][4] = 7.5*(7.0*c2 -1.0)*s2;
-    plg[2][5] = 3.0*c*plg[2][4]-2.0*plg[2][3];
-    plg[2][6] =(11.0*c*plg[2][5]-7.0*plg[2][4])/4.0;
-    plg[2][7] =(13.0*c*plg[2][6]-8.0*plg[2][5])/5.0;
-    plg[3][3] = 15.0*s2*s;
-    plg[3][4] = 105.0*s2*s*c; 
-    plg[3][5] =(9.0*c*plg[3][4]-7.*plg[3][3])/2.0;
-    plg[3][6] =(11.0*c*plg[3][5]-8.*plg[3][4])/3.0;
-
-    if( not (((flags.sw[7]==0) and (flags.sw[8]==0)) and (flags.sw[14] == 0))):
-        global stloc
-        stloc = sin(hr*tloc);
-        global ctloc
-        ctloc = cos(hr*tloc);
-        global s2tloc
-        s2tloc = sin(2.0*hr*tloc);
-        global c2tloc
-        c2tloc = cos(2.0*hr*tloc);
-        global s3tloc
-        s3tloc = sin(3.0*hr*tloc);
-        global c3tloc
-        c3tloc = cos(3.0*hr*tloc);
+    if context is not None and context.harmonics is not None:
+        context.restore()
+    else:
+        #/* calculate legendre polynomials */
+        c = sin(Input.g_lat * dgtr);
+        s = cos(Input.g_lat * dgtr);
+        c2 = c*c;
+        c4 = c2*c2;
+        s2 = s*s;
+
+        plg[0][1] = c;
+        plg[0][2] = 0.5*(3.0*c2 -1.0);
+        plg[0][3] = 0.5*(5.0*c*c2-3.0*c);
+        plg[0][4] = (35.0*c4 - 30.0*c2 + 3.0)/8.0;
+        plg[0][5] = (63.0*c2*c2*c - 70.0*c2*c + 15.0*c)/8.0;
+        plg[0][6] = (11.0*c*plg[0][5] - 5.0*plg[0][4])/6.0;
+    #/*      plg[0][7] = (13.0*c*plg[0][6] - 6.0*plg[0][5])/7.0; */
+        plg[1][1] = s;
+        plg[1][2] = 3.0*c*s;
+        plg[1][3] = 1.5*(5.0*c2-1.0)*s;
+        plg[1][4] = 2.5*(7.0*c2*c-3.0*c)*s;
+        plg[1][5] = 1.875*(21.0*c4 - 14.0*c2 +1.0)*s;
+        plg[1][6] = (11.0*c*plg[1][5]-6.0*plg[1][4])/5.0;
+    #/*      plg[1][7] = (13.0*c*plg[1][6]-7.0*plg[1][5])/6.0; */
+    #/*      plg[1][8] = (15.0*c*plg[1][7]-8.0*plg[1][6])/7.0; */
+        plg[2][2] = 3.0*s2;
+        plg[2][3] = 15.0*s2*c;
+        plg[2][4] = 7.5*(7.0*c2 -1.0)*s2;
+        plg[2][5] = 3.0*c*plg[2][4]-2.0*plg[2][3];
+        plg[2][6] =(11.0*c*plg[2][5]-7.0*plg[2][4])/4.0;
+        plg[2][7] =(13.0*c*plg[2][6]-8.0*plg[2][5])/5.0;
+        plg[3][3] = 15.0*s2*s;
+        plg[3][4] = 105.0*s2*s*c; 
+        plg[3][5] =(9.0*c*plg[3][4]-7.*plg[3][3])/2.0;
+        plg[3][6] =(11.0*c*plg[3][5]-8.*plg[3][4])/3.0;
+
+        if( not (((flags.sw[7]==0) and (flags.sw[8]==0)) and (flags.sw[14] == 0))):
+            stloc = sin(hr*tloc);
+            ctloc = cos(hr*tloc);
+            s2tloc = sin(2.0*hr*tloc);
+            c2tloc = cos(2.0*hr*tloc);
+            s3tloc = sin(3.0*hr*tloc);
+            c3tloc = cos(3.0*hr*tloc);
+
+        #/* F10.7 EFFECT */
+        dfa = Input.f107A - 150.0;
+        if context is not None:
+            context.save()
 
     cd32 = cos(dr*(Input.doy-p[31]));
     cd18 = cos(2.0*dr*(Input.doy-p[17]));
@@ -689,8 +778,6 @@ def globe7(p, Input, flags):
 
     #/* F10.7 EFFECT */
     df = Input.f107 - Input.f107A;
-    global dfa
-    dfa = Input.f107A - 150.0;
     t[0] =  p[19]*df*(1.0+p[59]*dfa) + p[20]*df*df + p[21]*dfa + p[29]*pow(dfa,2.0);
     f1 = 1.0 + (p[47]*dfa +p[19]*df+p[20]*df*df)*flags.swc[1];
     f2 = 1.0 + (p[49]*dfa+p[19]*df+p[20]*df*df)*flags.swc[1];
@@ -759,7 +846,6 @@ def globe7(p, Input, flags):
         p45=p[44];
         if (p44<0): # pragma: no cover
             p44 = 1.0E-5;
-        global apdf
         apdf = apd + (p45-1.0)*(apd + (exp(-p44 * apd) - 1.0)/p44);
         if (flags.sw[9]):
             t[8]=apdf*(p[32]+p[45]*plg[0][2]+p[34]*plg[0][4]+ \
@@ -827,6 +913,8 @@ def globe7(p, Input, flags):
     tinf = p[30];
     for i in range(14):
         tinf = tinf + abs(flags.sw[i+1])*t[i];
+    if context is not None:
+        context.globe7[id(p)] = (tinf, apdf, apt[0])
     return tinf;
 
 
@@ -835,11 +923,21 @@ def globe7(p, Input, flags):
 /* ------------------------------- GLOB7S ---------------------------- */
 /* ------------------------------------------------------------------- */
 '''
-def glob7s(p, Input, flags):
+def glob7s(p, Input, flags, context=None):
     '''
 /*    VERSION OF GLOBE FOR LOWER ATMOSPHERE 10/26/99 
  */
+ context is an optional nrlmsise_context for the epoch and position of Input;
+ the result also depends on the magnetic activity left by the last GLOBE7
  '''
+    if context is not None:
+        key = (id(p), apdf, apt[0])
+        cached = context.glob7s.get(key)
+        if cached is not None:
+            return cached
+        tt = glob7s(p, Input, flags)
+        context.glob7s[key] = tt
+        return tt
     pset = 2.0
     t = [0.0]*14
     dr=1.72142E-2;
@@ -929,11 +1027,16 @@ def glob7s(p, Input, flags):
 /* ------------------------------- GTD7 ------------------------------ */
 /* ------------------------------------------------------------------- */
 '''
-def gtd7(Input, flags, output):
+def gtd7(Input, flags, output, select=True, context=None):
     """The standard model subroutine (GTD7) always computes the.
 
     ‘‘thermospheric’’ mass density by explicitly summing the masses of the
     species in equilibrium at the thermospheric temperature T(z).
+
+    `select` may be set to False when `flags` has already been processed by
+    `tselec`, as `gtd7_array` does once for all of its points. `context` is
+    an optional `nrlmsise_context` reused between calls which differ only in
+    altitude.
     """
     mn3 = 5
     zn3 = [32.5,20.0,15.0,10.0,0.0]
@@ -942,7 +1045,10 @@ def gtd7(Input, flags, output):
     zmix = 62.5
     soutput = nrlmsise_output()
 
-    tselec(flags);
+    if select:
+        tselec(flags);
+    if context is not None:
+        context.select(Input, flags)
 
     #/* Latitude variation of gravity (none for sw[2]=0) */
     xlat=Input.g_lat;
@@ -961,7 +1067,7 @@ def gtd7(Input, flags, output):
     tmp=Input.alt;
     Input.alt=altt;
 
-    gts7(Input, flags, soutput);
+    gts7(Input, flags, soutput, context);
     altt=Input.alt;
     Input.alt=tmp;
     if (flags.sw[0]): # pragma: no cover  #/* metric adjustment */
@@ -982,10 +1088,10 @@ def gtd7(Input, flags, output):
 #*/
     meso_tgn2[0]=meso_tgn1[1];
     meso_tn2[0]=meso_tn1[4];
-    meso_tn2[1]=pma[0][0]*pavgm[0]/(1.0-flags.sw[20]*glob7s(pma[0], Input, flags));
-    meso_tn2[2]=pma[1][0]*pavgm[1]/(1.0-flags.sw[20]*glob7s(pma[1], Input, flags));
-    meso_tn2[3]=pma[2][0]*pavgm[2]/(1.0-flags.sw[20]*flags.sw[22]*glob7s(pma[2], Input, flags));
-    meso_tgn2[1]=pavgm[8]*pma[9][0]*(1.0+flags.sw[20]*flags.sw[22]*glob7s(pma[9], Input, flags))*meso_tn2[3]*meso_tn2[3]/(pow((pma[2][0]*pavgm[2]),2.0));
+    meso_tn2[1]=pma[0][0]*pavgm[0]/(1.0-flags.sw[20]*glob7s(pma[0], Input, flags, context));
+    meso_tn2[2]=pma[1][0]*pavgm[1]/(1.0-flags.sw[20]*glob7s(pma[1], Input, flags, context));
+    meso_tn2[3]=pma[2][0]*pavgm[2]/(1.0-flags.sw[20]*flags.sw[22]*glob7s(pma[2], Input, flags, context));
+    meso_tgn2[1]=pavgm[8]*pma[9][0]*(1.0+flags.sw[20]*flags.sw[22]*glob7s(pma[9], Input, flags, context))*meso_tn2[3]*meso_tn2[3]/(pow((pma[2][0]*pavgm[2]),2.0));
     meso_tn3[0]=meso_tn2[3];
 
     if (Input.alt<zn3[0]):
@@ -994,11 +1100,11 @@ def gtd7(Input, flags, output):
 #*         Inverse temperature a linear function of spherical harmonics
 #*/
         meso_tgn3[0]=meso_tgn2[1];
-        meso_tn3[1]=pma[3][0]*pavgm[3]/(1.0-flags.sw[22]*glob7s(pma[3], Input, flags));
-        meso_tn3[2]=pma[4][0]*pavgm[4]/(1.0-flags.sw[22]*glob7s(pma[4], Input, flags));
-        meso_tn3[3]=pma[5][0]*pavgm[5]/(1.0-flags.sw[22]*glob7s(pma[5], Input, flags));
-        meso_tn3[4]=pma[6][0]*pavgm[6]/(1.0-flags.sw[22]*glob7s(pma[6], Input, flags));
-        meso_tgn3[1]=pma[7][0]*pavgm[7]*(1.0+flags.sw[22]*glob7s(pma[7], Input, flags)) *meso_tn3[4]*meso_tn3[4]/(pow((pma[6][0]*pavgm[6]),2.0));
+        meso_tn3[1]=pma[3][0]*pavgm[3]/(1.0-flags.sw[22]*glob7s(pma[3], Input, flags, context));
+        meso_tn3[2]=pma[4][0]*pavgm[4]/(1.0-flags.sw[22]*glob7s(pma[4], Input, flags, context));
+        meso_tn3[3]=pma[5][0]*pavgm[5]/(1.0-flags.sw[22]*glob7s(pma[5], Input, flags, context));
+        meso_tn3[4]=pma[6][0]*pavgm[6]/(1.0-flags.sw[22]*glob7s(pma[6], Input, flags, context));
+        meso_tgn3[1]=pma[7][0]*pavgm[7]*(1.0+flags.sw[22]*glob7s(pma[7], Input, flags, context)) *meso_tn3[4]*meso_tn3[4]/(pow((pma[6][0]*pavgm[6]),2.0));
     
 
     #/* LINEAR TRANSITION TO FULL MIXING BELOW zn2[0] */
@@ -1011,7 +1117,8 @@ def gtd7(Input, flags, output):
     #/**** N2 density ****/
     dmr=soutput.d[2] / dm28m - 1.0;
     tz = [0.0]
-    output.d[2]=densm(Input.alt,dm28m,xmm, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2);
+    nodes = [None, None]
+    output.d[2]=densm(Input.alt,dm28m,xmm, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2, nodes);
     output.d[2]=output.d[2] * (1.0 + dmr*dmc);
 
     #/**** HE density ****/
@@ -1044,11 +1151,58 @@ def gtd7(Input, flags, output):
 
     #/**** temperature at altitude ****/
     global dd
-    dd = densm(Input.alt, 1.0, 0, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2);
+    dd = densm(Input.alt, 1.0, 0, tz, mn3, zn3, meso_tn3, meso_tgn3, mn2, zn2, meso_tn2, meso_tgn2, nodes);
     output.t[1]=tz[0];
     return
 
 
+def gtd7_array(alt, g_lat, g_long, doy, sec, lst, f107A, f107, flags,
+               ap=None, ap_a=None):
+    """Evaluate GTD7 at a sequence of points sharing one set of flags.
+
+    All of `alt`, `g_lat`, `g_long`, `doy`, `sec`, `lst`, `f107A` and `f107`
+    are sequences of the same length, with the meaning and units of the
+    fields of `nrlmsise_input`; `ap` is an optional sequence of daily
+    magnetic indexes and `ap_a` an optional `ap_array` shared by all points.
+    The switches are selected once, and one input object is reused for every
+    point. Points which differ only in altitude are evaluated together with
+    one `nrlmsise_context`, so the GLOBE7 and GLOB7S terms of each epoch and
+    position are computed once. A list of `nrlmsise_output` objects is
+    returned, one per point.
+    """
+    tselec(flags)
+    Input = nrlmsise_input()
+    Input.ap_a = ap_a
+    profiles = {}
+    for i in range(len(alt)):
+        key = (doy[i], sec[i], g_lat[i], g_long[i], lst[i], f107A[i], f107[i],
+               None if ap is None else ap[i])
+        try:
+            profiles[key].append(i)
+        except KeyError:
+            profiles[key] = [i]
+
+    outputs = [None]*len(alt)
+    context = nrlmsise_context()
+    for indexes in profiles.values():
+        i = indexes[0]
+        Input.doy = doy[i]
+        Input.sec = sec[i]
+        Input.g_lat = g_lat[i]
+        Input.g_long = g_long[i]
+        Input.lst = lst[i]
+        Input.f107A = f107A[i]
+        Input.f107 = f107[i]
+        if ap is not None:
+            Input.ap = ap[i]
+        for i in indexes:
+            Input.alt = alt[i]
+            output = nrlmsise_output()
+            gtd7(Input, flags, output, select=False, context=context)
+            outputs[i] = output
+    return outputs
+
+
 '''
 /* ------------------------------------------------------------------- */
 /* ------------------------------- GTD7D ----------------------------- */
@@ -1147,7 +1301,7 @@ def ghp7(Input, flags, output, press): # pragma: no cover
 /* ------------------------------- GTS7 ------------------------------ */
 /* ------------------------------------------------------------------- */
 '''
-def gts7(Input, flags, output):
+def gts7(Input, flags, output, context=None):
     '''
 /*     Thermospheric portion of NRLMSISE-00
  *     See GTD7 for more extensive comments
@@ -1169,7 +1323,7 @@ def gts7(Input, flags, output):
     #/* TINF VARIATIONS NOT IMPORTANT BELOW ZA OR ZN1(1) */
     if (Input.alt>zn1[0]):
         tinf = ptm[0]*pt[0] * \
-                    (1.0+flags.sw[16]*globe7(pt,Input,flags));
+                    (1.0+flags.sw[16]*globe7(pt, Input, flags, context));
     else:
         tinf = ptm[0]*pt[0];
     output.t[0]=tinf;
@@ -1177,20 +1331,20 @@ def gts7(Input, flags, output):
     #/*  GRADIENT VARIATIONS NOT IMPORTANT BELOW ZN1(5) */
     if (Input.alt>zn1[4]):
         g0 = ptm[3]*ps[0] * \
-            (1.0+flags.sw[19]*globe7(ps,Input,flags));
+            (1.0+flags.sw[19]*globe7(ps, Input, flags, context));
     else:
         g0 = ptm[3]*ps[0];
-    tlb = ptm[1] * (1.0 + flags.sw[17]*globe7(pd[3],Input,flags))*pd[3][0];
+    tlb = ptm[1] * (1.0 + flags.sw[17]*globe7(pd[3], Input, flags, context))*pd[3][0];
     s = g0 / (tinf - tlb);
 
 #/*      Lower thermosphere temp variations not significant for
 # *       density above 300 km */
     if (Input.alt<300.0):
-        meso_tn1[1]=ptm[6]*ptl[0][0]/(1.0-flags.sw[18]*glob7s(ptl[0], Input, flags));
-        meso_tn1[2]=ptm[2]*ptl[1][0]/(1.0-flags.sw[18]*glob7s(ptl[1], Input, flags));
-        meso_tn1[3]=ptm[7]*ptl[2][0]/(1.0-flags.sw[18]*glob7s(ptl[2], Input, flags));
-        meso_tn1[4]=ptm[4]*ptl[3][0]/(1.0-flags.sw[18]*flags.sw[20]*glob7s(ptl[3], Input, flags));
-        meso_tgn1[1]=ptm[8]*pma[8][0]*(1.0+flags.sw[18]*flags.sw[20]*glob7s(pma[8], Input, flags))*meso_tn1[4]*meso_tn1[4]/(pow((ptm[4]*ptl[3][0]),2.0));
+        meso_tn1[1]=ptm[6]*ptl[0][0]/(1.0-flags.sw[18]*glob7s(ptl[0], Input, flags, context));
+        meso_tn1[2]=ptm[2]*ptl[1][0]/(1.0-flags.sw[18]*glob7s(ptl[1], Input, flags, context));
+        meso_tn1[3]=ptm[7]*ptl[2][0]/(1.0-flags.sw[18]*glob7s(ptl[2], Input, flags, context));
+        meso_tn1[4]=ptm[4]*ptl[3][0]/(1.0-flags.sw[18]*flags.sw[20]*glob7s(ptl[3], Input, flags, context));
+        meso_tgn1[1]=ptm[8]*pma[8][0]*(1.0+flags.sw[18]*flags.sw[20]*glob7s(pma[8], Input, flags, context))*meso_tn1[4]*meso_tn1[4]/(pow((ptm[4]*ptl[3][0]),2.0));
     else:
         meso_tn1[1]=ptm[6]*ptl[0][0];
         meso_tn1[2]=ptm[2]*ptl[1][0];
@@ -1199,12 +1353,15 @@ def gts7(Input, flags, output):
         meso_tgn1[1]=ptm[8]*pma[8][0]*meso_tn1[4]*meso_tn1[4]/(pow((ptm[4]*ptl[3][0]),2.0));
 	
 
+    #/* spline nodes below ZA, shared by all the DENSU calls below */
+    nodes = densu_spline(tinf, tlb, s, ptm[5], mn1, zn1, meso_tn1, meso_tgn1)
+
     z0 = zn1[3];
     t0 = meso_tn1[3];
     tr12 = 1.0;
 
     #/* N2 variation factor at Zlb */
-    g28=flags.sw[21]*globe7(pd[2], Input, flags);
+    g28=flags.sw[21]*globe7(pd[2], Input, flags, context);
 
     #/* VARIATION OF TURBOPAUSE HEIGHT */
     zhf=pdl[1][24]*(1.0+flags.sw[5]*pdl[0][24]*sin(dgtr*Input.g_lat)*cos(dr*(Input.doy-pt[13])));
@@ -1219,7 +1376,7 @@ def gts7(Input, flags, output):
     db28 = pdm[2][0]*exp(g28)*pd[2][0];
     #/* Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[2]=densu(z,db28,tinf,tlb,28.0,alpha[2],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[2]=densu(z,db28,tinf,tlb,28.0,alpha[2],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[2];
     #/* Turbopause */
@@ -1228,11 +1385,11 @@ def gts7(Input, flags, output):
     xmd=28.0-xmm;
     #/* Mixed density at Zlb */
     tz = [0]
-    b28=densu(zh28,db28,tinf,tlb,xmd,(alpha[2]-1.0),tz,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    b28=densu(zh28,db28,tinf,tlb,xmd,(alpha[2]-1.0),tz,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1,nodes);
     if ((flags.sw[15]) and (z<=altl[2])):
         #/*  Mixed density at Alt */
         global dm28
-        dm28=densu(z,b28,tinf,tlb,xmm,alpha[2],tz,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm28=densu(z,b28,tinf,tlb,xmm,alpha[2],tz,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         #/*  Net density at Alt */
         output.d[2]=dnet(output.d[2],dm28,zhm28,xmm,28.0);
     
@@ -1241,12 +1398,12 @@ def gts7(Input, flags, output):
     #/**** HE DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g4 = flags.sw[21]*globe7(pd[0], Input, flags);
+    g4 = flags.sw[21]*globe7(pd[0], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db04 = pdm[0][0]*exp(g4)*pd[0][0];
     #/*  Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[0]=densu(z,db04,tinf,tlb, 4.,alpha[0],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[0]=densu(z,db04,tinf,tlb, 4.,alpha[0],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[0];
     if ((flags.sw[15]) and (z<altl[0])):
@@ -1254,12 +1411,12 @@ def gts7(Input, flags, output):
         zh04=pdm[0][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b04=densu(zh04,db04,tinf,tlb,4.-xmm,alpha[0]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b04=densu(zh04,db04,tinf,tlb,4.-xmm,alpha[0]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
         global dm04
-        dm04=densu(z,b04,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm04=densu(z,b04,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         zhm04=zhm28;
         #/*  Net density at Alt */
@@ -1276,12 +1433,12 @@ def gts7(Input, flags, output):
     #/**** O DENSITY ****/
 
     #/*  Density variation factor at Zlb */
-    g16= flags.sw[21]*globe7(pd[1],Input,flags);
+    g16= flags.sw[21]*globe7(pd[1], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db16 =  pdm[1][0]*exp(g16)*pd[1][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[1]=densu(z,db16,tinf,tlb, 16.,alpha[1],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    output.d[1]=densu(z,db16,tinf,tlb, 16.,alpha[1],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[1];
     if ((flags.sw[15]) and (z<=altl[1])):
@@ -1289,12 +1446,12 @@ def gts7(Input, flags, output):
         zh16=pdm[1][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b16=densu(zh16,db16,tinf,tlb,16.0-xmm,(alpha[1]-1.0), RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b16=densu(zh16,db16,tinf,tlb,16.0-xmm,(alpha[1]-1.0), RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
         global dm16
-        dm16=densu(z,b16,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm16=densu(z,b16,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         zhm16=zhm28;
         #/*  Net density at Alt */
@@ -1316,12 +1473,12 @@ def gts7(Input, flags, output):
     #/**** O2 DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g32= flags.sw[21]*globe7(pd[4], Input, flags);
+    g32= flags.sw[21]*globe7(pd[4], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db32 = pdm[3][0]*exp(g32)*pd[4][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[3]=densu(z,db32,tinf,tlb, 32.,alpha[3],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1);
+    output.d[3]=densu(z,db32,tinf,tlb, 32.,alpha[3],RandomVariable,ptm[5],s,mn1, zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[3];
     if (flags.sw[15]):
@@ -1330,12 +1487,12 @@ def gts7(Input, flags, output):
             zh32=pdm[3][2];
             #/*  Mixed density at Zlb */
             RandomVariable = [output.t[1]]
-            b32=densu(zh32,db32,tinf,tlb,32.-xmm,alpha[3]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+            b32=densu(zh32,db32,tinf,tlb,32.-xmm,alpha[3]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
             output.t[1] = RandomVariable[0]
             #/*  Mixed density at Alt */
             RandomVariable = [output.t[1]]
             global dm32
-            dm32=densu(z,b32,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+            dm32=densu(z,b32,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
             output.t[1] = RandomVariable[0]
             zhm32=zhm28;
             #/*  Net density at Alt */
@@ -1359,12 +1516,12 @@ def gts7(Input, flags, output):
     #/**** AR DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g40= flags.sw[21]*globe7(pd[5],Input,flags);
+    g40= flags.sw[21]*globe7(pd[5], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db40 = pdm[4][0]*exp(g40)*pd[5][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[4]=densu(z,db40,tinf,tlb, 40.,alpha[4],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[4]=densu(z,db40,tinf,tlb, 40.,alpha[4],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[4];
     if ((flags.sw[15]) and (z<=altl[4])):
@@ -1372,12 +1529,12 @@ def gts7(Input, flags, output):
         zh40=pdm[4][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b40=densu(zh40,db40,tinf,tlb,40.-xmm,alpha[4]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b40=densu(zh40,db40,tinf,tlb,40.-xmm,alpha[4]-1.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
         global dm40
-        dm40=densu(z,b40,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm40=densu(z,b40,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         zhm40=zhm28;
         #/*  Net density at Alt */
@@ -1394,12 +1551,12 @@ def gts7(Input, flags, output):
     #/**** HYDROGEN DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g1 = flags.sw[21]*globe7(pd[6], Input, flags);
+    g1 = flags.sw[21]*globe7(pd[6], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db01 = pdm[5][0]*exp(g1)*pd[6][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[6]=densu(z,db01,tinf,tlb,1.,alpha[6],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[6]=densu(z,db01,tinf,tlb,1.,alpha[6],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[6];
     if ((flags.sw[15]) and (z<=altl[6])):
@@ -1407,12 +1564,12 @@ def gts7(Input, flags, output):
         zh01=pdm[5][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b01=densu(zh01,db01,tinf,tlb,1.-xmm,alpha[6]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b01=densu(zh01,db01,tinf,tlb,1.-xmm,alpha[6]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
         global dm01
-        dm01=densu(z,b01,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm01=densu(z,b01,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         zhm01=zhm28;
         #/*  Net density at Alt */
@@ -1434,12 +1591,12 @@ def gts7(Input, flags, output):
     #/**** ATOMIC NITROGEN DENSITY ****/
 
     #/*   Density variation factor at Zlb */
-    g14 = flags.sw[21]*globe7(pd[7],Input,flags);
+    g14 = flags.sw[21]*globe7(pd[7], Input, flags, context);
     #/*  Diffusive density at Zlb */
     db14 = pdm[6][0]*exp(g14)*pd[7][0];
     #/*   Diffusive density at Alt */
     RandomVariable = [output.t[1]]
-    output.d[7]=densu(z,db14,tinf,tlb,14.,alpha[7],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+    output.d[7]=densu(z,db14,tinf,tlb,14.,alpha[7],RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     dd=output.d[7];
     if ((flags.sw[15]) and (z<=altl[7])): 
@@ -1447,12 +1604,12 @@ def gts7(Input, flags, output):
         zh14=pdm[6][2];
         #/*  Mixed density at Zlb */
         RandomVariable = [output.t[1]]
-        b14=densu(zh14,db14,tinf,tlb,14.-xmm,alpha[7]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        b14=densu(zh14,db14,tinf,tlb,14.-xmm,alpha[7]-1., RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         #/*  Mixed density at Alt */
         RandomVariable = [output.t[1]]
         global dm14
-        dm14=densu(z,b14,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1);
+        dm14=densu(z,b14,tinf,tlb,xmm,0.,RandomVariable,ptm[5],s,mn1,zn1,meso_tn1,meso_tgn1,nodes);
         output.t[1] = RandomVariable[0]
         zhm14=zhm28;
         #/*  Net density at Alt */
@@ -1473,7 +1630,7 @@ def gts7(Input, flags, output):
 
     #/**** Anomalous OXYGEN DENSITY ****/
 
-    g16h = flags.sw[21]*globe7(pd[8],Input,flags);
+    g16h = flags.sw[21]*globe7(pd[8], Input, flags, context);
     db16h = pdm[7][0]*exp(g16h)*pd[8][0];
     tho = pdm[7][9]*pdl[0][6];
     RandomVariable = [output.t[1]]
@@ -1494,7 +1651,7 @@ def gts7(Input, flags, output):
     #/* temperature */
     z = sqrt(Input.alt*Input.alt);
     RandomVariable = [output.t[1]]
-    ddum = densu(z,1.0, tinf, tlb, 0.0, 0.0, RandomVariable, ptm[5], s, mn1, zn1, meso_tn1, meso_tgn1);
+    ddum = densu(z,1.0, tinf, tlb, 0.0, 0.0, RandomVariable, ptm[5], s, mn1, zn1, meso_tn1, meso_tgn1,nodes);
     output.t[1] = RandomVariable[0]
     if (flags.sw[0]): # pragma: no cover
         for i in range(9):
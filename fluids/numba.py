@@ -22,11 +22,14 @@ SOFTWARE.
 """
 
 from __future__ import division
+import os
 import sys
+import hashlib
 import importlib.util
 import re
 import types
 import inspect
+import warnings
 import string
 import numpy as np
 import fluids as normal_fluids
@@ -284,6 +287,60 @@ numpy_not_list_expr = r'np.full((\4,), \1)'
 match_prange = r'range\( *([a-zA-Z0-9_]+) *\) *: *# * (numba|NUMBA) *: *(prange|PRANGE)'
 sub_prange = r'prange(\1):'
 
+try:
+    from appdirs import user_cache_dir
+    source_cache_dir = os.path.join(user_cache_dir('fluids'), 'numba_source')
+except ImportError:
+    source_cache_dir = None
+
+
+def cached_transformed_source(name, source, transform):
+    # Return `transform(source)`; the result is saved in `source_cache_dir`,
+    # keyed by the fluids version and a hash of the source and the transform,
+    # and read from there by later imports
+    if source_cache_dir is None:
+        return transform(source)
+    key = source + repr(transform.__code__.co_consts) + repr(transform.__code__.co_names)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    path = os.path.join(source_cache_dir, normal_fluids.__version__, '%s-%s.py' %(name, digest))
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except (IOError, OSError):
+        pass
+    transformed = transform(source)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = '%s.%d.tmp' %(path, os.getpid())
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(transformed)
+        os.replace(tmp, path)
+    except (IOError, OSError):
+        pass
+    return transformed
+
+
+def rewrite_lists_to_arrays(source):
+    source = remove_for_numba(source)  # do before anything else
+    source = return_value_numpy(source)
+    source = re.sub(list_mult_expr, numpy_not_list_expr, source)
+    source = re.sub(match_prange, sub_prange, source)
+    return source
+
+
+def rewrite_solver(source):
+    source = source.replace(', kwargs={}', '').replace(', **kwargs', '').replace(', kwargs=kwargs', '')
+    source = source.replace('iterations=i, point=p, err=q1', '')
+    source = source.replace(', q1=q1, p1=p1, q0=q0, p0=p0', '')
+    source = source.replace('%d iterations" %maxiter', '"')
+    source = source.replace('ytol=None', 'ytol=1e100')
+    source = source.replace(', value=%s" %(maxiter, x)', '"')
+    source = re.sub(r'''UnconvergedError\(.*''', '''UnconvergedError("Failed to converge")''', source) # Gotta keep errors all one one line
+    source = remove_for_numba(source)
+    source = re.sub(list_mult_expr, numpy_not_list_expr, source)
+    return source
+
+
 def transform_lists_to_arrays(module, to_change, __funcs, vec=False, cache_blacklist=set([])):
     if vec:
         conv_fun = numba.vectorize
@@ -305,12 +362,11 @@ def transform_lists_to_arrays(module, to_change, __funcs, vec=False, cache_black
 
         orig_func = getattr(real_mod, func)
         source = inspect.getsource(orig_func)
-        source = remove_for_numba(source)  # do before anything else
         if type(orig_func) is not type:
-            source = return_value_numpy(source)
-            source = re.sub(list_mult_expr, numpy_not_list_expr, source)
+            source = cached_transformed_source(func, source, rewrite_lists_to_arrays)
             parallel = 'prange' in source
-            source = re.sub(match_prange, sub_prange, source)
+        else:
+            source = cached_transformed_source(func, source, remove_for_numba)
 #        if 'roughness_Farshad' in source:
 #            print(source)
 #            print(parallel, 'hi', extra_args)
@@ -433,15 +489,7 @@ def create_numerics(replaced, vec=False):
     solvers = ['secant', 'brenth', 'newton', 'halley', 'ridder', 'newton_system', 'solve_2_direct', 'solve_3_direct', 'solve_4_direct', 'basic_damping', 'bisect'] #
     for s in solvers:
         source = inspect.getsource(getattr(NUMERICS_SUBMOD, s))
-        source = source.replace(', kwargs={}', '').replace(', **kwargs', '').replace(', kwargs=kwargs', '')
-        source = source.replace('iterations=i, point=p, err=q1', '')
-        source = source.replace(', q1=q1, p1=p1, q0=q0, p0=p0', '')
-        source = source.replace('%d iterations" %maxiter', '"')
-        source = source.replace('ytol=None', 'ytol=1e100')
-        source = source.replace(', value=%s" %(maxiter, x)', '"')
-        source = re.sub(r'''UnconvergedError\(.*''', '''UnconvergedError("Failed to converge")''', source) # Gotta keep errors all one one line
-        source = remove_for_numba(source)
-        source = re.sub(list_mult_expr, numpy_not_list_expr, source)
+        source = cached_transformed_source(s, source, rewrite_solver)
 
 #        if any(i in s for i in ('bisect', 'solve_2_direct', 'basic_damping')):
 #            print(source)
@@ -489,118 +537,122 @@ numerics = NUMERICS_SUBMOD
 normal = normal_fluids
 
 
-def transform_module(normal, __funcs, replaced, vec=False, blacklist=frozenset([]),
-                     cache_blacklist=set([])):
-    new_mods = []
+def transform_submodule(mod, __funcs, replaced, vec=False, blacklist=frozenset([]),
+                        cache_blacklist=set([])):
     if vec:
         conv_fun = numba.vectorize
         extra_args = extra_args_vec
     else:
         conv_fun = numba.njit
         extra_args = extra_args_std
-    # Run module-by-module. Expensive, as we need to create module copies
-    try:
-        all_submodules = normal.all_submodules()
-    except:
-        all_submodules = normal.submodules
     numtypes = {float, int, complex}
     settypes = {set, frozenset}
-    for mod in all_submodules:
-        #print(all_submodules, mod)
-        SUBMOD_COPY = importlib.util.find_spec(mod.__name__)
-        SUBMOD = importlib.util.module_from_spec(SUBMOD_COPY)
-        SUBMOD.IS_NUMBA = True
-        SUBMOD.numba = numba
-        SUBMOD.jitclass = jitclass
-        SUBMOD.njit = numba.njit
-        SUBMOD.jit = numba.jit
-        SUBMOD.prange = numba.prange
-
-        if vec:
-            SUBMOD.IS_NUMBA_VEC = True
-        SUBMOD_COPY.loader.exec_module(SUBMOD)
-        SUBMOD.np = np
-        SUBMOD.sum = np.sum
-
-        SUBMOD.__dict__.update(replaced)
-        new_mods.append(SUBMOD)
-        mod_split_names = mod.__name__.split('.')
-        __funcs[mod_split_names[-1]] = SUBMOD # fluids.numba.optional.spa
-        __funcs['.'.join(mod_split_names[:-1])] = SUBMOD # set fluids.optional.spa fluids.numba.spa
-        __funcs['.'.join(mod_split_names[-2:])] = SUBMOD # set 'optional.spa' in the dict too
+    SUBMOD_COPY = importlib.util.find_spec(mod.__name__)
+    SUBMOD = importlib.util.module_from_spec(SUBMOD_COPY)
+    SUBMOD.IS_NUMBA = True
+    SUBMOD.numba = numba
+    SUBMOD.jitclass = jitclass
+    SUBMOD.njit = numba.njit
+    SUBMOD.jit = numba.jit
+    SUBMOD.prange = numba.prange
 
-        try:
-            names = set(SUBMOD.__all__)
-        except:
-            names = set()
-        for mod_obj_name in dir(SUBMOD):
-            obj = getattr(SUBMOD, mod_obj_name)
-            if (isinstance(obj, types.FunctionType)
-                and mod_obj_name != '__getattr__'
-                and not mod_obj_name.startswith('_load')
-                and obj.__module__ == SUBMOD.__name__):
-                names.add(mod_obj_name)
-
-        # try:
-        #     names += SUBMOD.__numba_additional_funcs__
-        # except:
-        #     pass
-
-        numba_funcs = []
-        funcs = []
-        for name in names:
-            obj = getattr(SUBMOD, name)
-            if isinstance(obj, types.FunctionType):
-                if name not in total_skip and name not in blacklist:
-                    SUBMOD.__dict__[name] = obj = conv_fun(cache=(caching and name not in cache_blacklist), **extra_args)(obj)
-                    numba_funcs.append(obj)
-                else:
-                    funcs.append(obj)
-            __funcs[name] = obj
-
-        module_constants_changed_type = {}
-        for arr_name in SUBMOD.__dict__:
-            if arr_name in no_conv_data_names: continue
-            obj = getattr(SUBMOD, arr_name)
-            obj_type = type(obj)
-            if obj_type is list and obj:
-                # Assume all elements have the same general type
-                r = obj[0]
-                r_type = type(r)
-                if r_type in numtypes:
+    if vec:
+        SUBMOD.IS_NUMBA_VEC = True
+    SUBMOD_COPY.loader.exec_module(SUBMOD)
+    SUBMOD.np = np
+    SUBMOD.sum = np.sum
+
+    SUBMOD.__dict__.update(replaced)
+    mod_split_names = mod.__name__.split('.')
+    __funcs[mod_split_names[-1]] = SUBMOD # fluids.numba.optional.spa
+    __funcs['.'.join(mod_split_names[:-1])] = SUBMOD # set fluids.optional.spa fluids.numba.spa
+    __funcs['.'.join(mod_split_names[-2:])] = SUBMOD # set 'optional.spa' in the dict too
+
+    try:
+        names = set(SUBMOD.__all__)
+    except:
+        names = set()
+    for mod_obj_name in dir(SUBMOD):
+        obj = getattr(SUBMOD, mod_obj_name)
+        if (isinstance(obj, types.FunctionType)
+            and mod_obj_name != '__getattr__'
+            and not mod_obj_name.startswith('_load')
+            and obj.__module__ == SUBMOD.__name__):
+            names.add(mod_obj_name)
+
+    # try:
+    #     names += SUBMOD.__numba_additional_funcs__
+    # except:
+    #     pass
+
+    numba_funcs = []
+    funcs = []
+    for name in names:
+        obj = getattr(SUBMOD, name)
+        if isinstance(obj, types.FunctionType):
+            if name not in total_skip and name not in blacklist:
+                SUBMOD.__dict__[name] = obj = conv_fun(cache=(caching and name not in cache_blacklist), **extra_args)(obj)
+                numba_funcs.append(obj)
+            else:
+                funcs.append(obj)
+        __funcs[name] = obj
+
+    module_constants_changed_type = {}
+    for arr_name in SUBMOD.__dict__:
+        if arr_name in no_conv_data_names: continue
+        obj = getattr(SUBMOD, arr_name)
+        obj_type = type(obj)
+        if obj_type is list and obj:
+            # Assume all elements have the same general type
+            r = obj[0]
+            r_type = type(r)
+            if r_type in numtypes:
+                arr = np.array(obj)
+                if arr.dtype.char != 'O': module_constants_changed_type[arr_name] = arr
+            elif r_type is list and r and type(r[0]) in numtypes:
+                if len(set([len(r) for r in obj])) == 1:
+                    # All same size - nice numpy array
                     arr = np.array(obj)
                     if arr.dtype.char != 'O': module_constants_changed_type[arr_name] = arr
-                elif r_type is list and r and type(r[0]) in numtypes:
-                    if len(set([len(r) for r in obj])) == 1:
-                        # All same size - nice numpy array
-                        arr = np.array(obj)
-                        if arr.dtype.char != 'O': module_constants_changed_type[arr_name] = arr
-                    else:
-                        # Tuple of different size numpy arrays
-                        module_constants_changed_type[arr_name] = tuple([np.array(v) for v in obj])
-            elif obj_type in settypes:
-                module_constants_changed_type[arr_name] = tuple(obj)
-            # elif obj_type is dict:
-            #     try:
-            #         print('starting', arr_name)
-            #         infer_dictionary_types(obj)
-            #         module_constants_changed_type[arr_name] = numba_dict(obj)
-            #     except:
-            #         print(arr_name, 'failed')
-            #         pass
-
-        SUBMOD.__dict__.update(module_constants_changed_type)
-        __funcs.update(module_constants_changed_type)
-
-        # if not vec:
-            # for t in numba_funcs:
-            #     #if normal.__name__ == 'chemicals':
-            #     #    if 'iapws' not in all_submodules[-1].__name__:
-            #     #        print(new_objs, t)
-            #     #        1/0
-            #     t.py_func.__globals__.update(SUBMOD.__dict__)
-            # for t in funcs:
-            #     t.__globals__.update(SUBMOD.__dict__)
+                else:
+                    # Tuple of different size numpy arrays
+                    module_constants_changed_type[arr_name] = tuple([np.array(v) for v in obj])
+        elif obj_type in settypes:
+            module_constants_changed_type[arr_name] = tuple(obj)
+        # elif obj_type is dict:
+        #     try:
+        #         print('starting', arr_name)
+        #         infer_dictionary_types(obj)
+        #         module_constants_changed_type[arr_name] = numba_dict(obj)
+        #     except:
+        #         print(arr_name, 'failed')
+        #         pass
+
+    SUBMOD.__dict__.update(module_constants_changed_type)
+    __funcs.update(module_constants_changed_type)
+
+    # if not vec:
+        # for t in numba_funcs:
+        #     #if normal.__name__ == 'chemicals':
+        #     #    if 'iapws' not in all_submodules[-1].__name__:
+        #     #        print(new_objs, t)
+        #     #        1/0
+        #     t.py_func.__globals__.update(SUBMOD.__dict__)
+        # for t in funcs:
+        #     t.__globals__.update(SUBMOD.__dict__)
+    return SUBMOD
+
+
+def transform_module(normal, __funcs, replaced, vec=False, blacklist=frozenset([]),
+                     cache_blacklist=set([])):
+    # Run module-by-module. Expensive, as we need to create module copies
+    try:
+        all_submodules = normal.all_submodules()
+    except:
+        all_submodules = normal.submodules
+    new_mods = [transform_submodule(mod, __funcs, replaced, vec=vec, blacklist=blacklist,
+                                    cache_blacklist=cache_blacklist)
+                for mod in all_submodules]
 
     # Do our best to allow functions to be found
     if '__file__' in __funcs:
@@ -612,8 +664,10 @@ def transform_module(normal, __funcs, replaced, vec=False, blacklist=frozenset([
     return new_mods
 
 
-def transform_complete(replaced, __funcs, __all__, normal, vec=False):
-    cache_blacklist = set(['Stichlmair_flood', 'airmass',
+# Functions compiled without an on-disk cache, as numba cannot reliably reload
+# their cached machine code; mostly those passing functions to a solver or an
+# integrator, or calling SciPy's compiled special functions
+cache_blacklist = set(['Stichlmair_flood', 'airmass',
    'Spitzglass_high', '_to_solve_Spitzglass_high',
    '_to_solve_Spitzglass_low', 'Spitzglass_low',
    'Oliphant', '_to_solve_Oliphant',
@@ -626,7 +680,59 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
    '_SA_partial_horiz_ellipsoidal_head_to_int', '_SA_partial_horiz_ellipsoidal_head_limits', 'SA_partial_horiz_ellipsoidal_head',
    '_SA_partial_horiz_guppy_head_to_int', 'SA_partial_horiz_guppy_head', 'SA_partial_horiz_torispherical_head',
    'SA_from_h', 'V_tank'])
-#    cache_blacklist = set([])
+
+
+# Functions whose source is rewritten to replace lists with arrays
+lists_to_arrays_functions = ['packed_tower._Stichlmair_flood_f_and_jac',
+             'packed_tower.Stichlmair_flood', 'compressible.isothermal_gas',
+             'fittings.Darby3K', 'fittings.Hooper2K', 'geometry.SA_partial_horiz_torispherical_head',
+             'optional.spa.solar_position', 'optional.spa.longitude_obliquity_nutation',
+             'optional.spa.transit_sunrise_sunset',
+             'fittings.bend_rounded_Crane', 'geometry.tank_from_two_specs_err',
+             'friction.roughness_Farshad',
+             ]
+
+
+def transform_fixups(key, __funcs, vec=False):
+    # Changes made by hand to the transformed submodule `key`, such as
+    # 'friction' or 'optional.spa', after transform_submodule
+    to_change = [s for s in lists_to_arrays_functions if s.rsplit('.', 1)[0] == key]
+    transform_lists_to_arrays(normal_fluids, to_change, __funcs, vec=vec, cache_blacklist=cache_blacklist)
+
+    # Do some classes by hand
+    if key == 'geometry':
+        PlateExchanger_spec = [(k, float64) for k in ('pitch', 'beta', 'gamma', 'a', 'amplitude', 'wavelength',
+                               'b', 'chevron_angle', 'inclination_angle', 'plate_corrugation_aspect_ratio',
+                               'plate_enlargement_factor', 'D_eq', 'D_hydraulic', 'width', 'length', 'thickness',
+                               'd_port', 'plates', 'length_port', 'A_plate_surface', 'A_heat_transfer',
+                               'A_channel_flow', 'channels', 'channels_per_fluid')]
+        PlateExchanger_spec.append(('chevron_angles', numba.types.UniTuple(float64, 2)))
+
+        HelicalCoil_spec = [(k, float64) for k in
+                            ('Do', 'Dt', 'Di', 'Do_total', 'N', 'pitch', 'H', 'H_total',
+                             'tube_circumference', 'tube_length', 'surface_area', 'helix_angle',
+                             'curvature', 'total_inlet_area', 'total_volume', 'inner_surface_area',
+                             'inlet_area', 'inner_volume', 'annulus_area', 'annulus_volume')]
+
+#        # No string support
+#        PlateExchanger = jitclass(PlateExchanger_spec)(getattr(__funcs['geometry'], 'PlateExchanger'))
+#        __funcs['PlateExchanger'] = __funcs['geometry'].PlateExchanger = PlateExchanger
+
+        HelicalCoil = jitclass(HelicalCoil_spec)(getattr(__funcs['geometry'], 'HelicalCoil'))
+        __funcs['HelicalCoil'] = __funcs['geometry'].HelicalCoil = HelicalCoil
+    elif key == 'atmosphere':
+        ATMOSPHERE_1976_spec = [(k, float64) for k in
+                            ('Z', 'dT', 'H', 'T_layer', 'T_increase', 'P_layer', 'H_layer', 'H_above_layer',
+                             'T', 'P', 'rho', 'v_sonic',
+                             'mu', 'k', 'g', 'R')]
+        ATMOSPHERE_1976 = jitclass(ATMOSPHERE_1976_spec)(getattr(__funcs['atmosphere'], 'ATMOSPHERE_1976'))
+        __funcs['ATMOSPHERE_1976'] = __funcs['atmosphere'].ATMOSPHERE_1976 = ATMOSPHERE_1976
+    elif key == 'friction':
+        # Not needed
+        __funcs['friction'].Colebrook = __funcs['Colebrook'] = __funcs['Clamond']
+
+
+def transform_complete(replaced, __funcs, __all__, normal, vec=False):
     if vec:
         conv_fun = numba.vectorize
         extra_args = extra_args_vec
@@ -635,16 +741,8 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
         extra_args = extra_args_std
     new_mods = transform_module(normal, __funcs, replaced, vec=vec, cache_blacklist=cache_blacklist)
 
-
-    to_change = ['packed_tower._Stichlmair_flood_f_and_jac',
-                 'packed_tower.Stichlmair_flood', 'compressible.isothermal_gas',
-                 'fittings.Darby3K', 'fittings.Hooper2K', 'geometry.SA_partial_horiz_torispherical_head',
-                 'optional.spa.solar_position', 'optional.spa.longitude_obliquity_nutation',
-                 'optional.spa.transit_sunrise_sunset',
-                 'fittings.bend_rounded_Crane', 'geometry.tank_from_two_specs_err',
-                 'friction.roughness_Farshad',
-                 ]
-    transform_lists_to_arrays(normal_fluids, to_change, __funcs, vec=vec, cache_blacklist=cache_blacklist)
+    for mod in new_mods:
+        transform_fixups(mod.__name__.split('.', 1)[1], __funcs, vec=vec)
 
 
     # AvailableMethods  will be removed in the future in favor of non-numba only
@@ -665,40 +763,6 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
         __funcs[func] = obj
         obj.__doc__ = ''
 
-
-    # Do some classes by hand
-    PlateExchanger_spec = [(k, float64) for k in ('pitch', 'beta', 'gamma', 'a', 'amplitude', 'wavelength',
-                           'b', 'chevron_angle', 'inclination_angle', 'plate_corrugation_aspect_ratio',
-                           'plate_enlargement_factor', 'D_eq', 'D_hydraulic', 'width', 'length', 'thickness',
-                           'd_port', 'plates', 'length_port', 'A_plate_surface', 'A_heat_transfer',
-                           'A_channel_flow', 'channels', 'channels_per_fluid')]
-    PlateExchanger_spec.append(('chevron_angles', numba.types.UniTuple(float64, 2)))
-
-    HelicalCoil_spec = [(k, float64) for k in
-                        ('Do', 'Dt', 'Di', 'Do_total', 'N', 'pitch', 'H', 'H_total',
-                         'tube_circumference', 'tube_length', 'surface_area', 'helix_angle',
-                         'curvature', 'total_inlet_area', 'total_volume', 'inner_surface_area',
-                         'inlet_area', 'inner_volume', 'annulus_area', 'annulus_volume')]
-
-    ATMOSPHERE_1976_spec = [(k, float64) for k in
-                        ('Z', 'dT', 'H', 'T_layer', 'T_increase', 'P_layer', 'H_layer', 'H_above_layer',
-                         'T', 'P', 'rho', 'v_sonic',
-                         'mu', 'k', 'g', 'R')]
-
-#    # No string support
-#    PlateExchanger = jitclass(PlateExchanger_spec)(getattr(__funcs['geometry'], 'PlateExchanger'))
-#    __funcs['PlateExchanger'] = __funcs['geometry'].PlateExchanger = PlateExchanger
-
-    HelicalCoil = jitclass(HelicalCoil_spec)(getattr(__funcs['geometry'], 'HelicalCoil'))
-    __funcs['HelicalCoil'] = __funcs['geometry'].HelicalCoil = HelicalCoil
-
-    ATMOSPHERE_1976 = jitclass(ATMOSPHERE_1976_spec)(getattr(__funcs['atmosphere'], 'ATMOSPHERE_1976'))
-    __funcs['ATMOSPHERE_1976'] = __funcs['atmosphere'].ATMOSPHERE_1976 = ATMOSPHERE_1976
-
-
-    # Not needed
-    __funcs['friction'].Colebrook = __funcs['Colebrook'] = __funcs['Clamond']
-
     # Works but 50% slower
     #__funcs['geometry']._V_horiz_spherical_toint = __funcs['_V_horiz_spherical_toint'] = cfunc("float64(float64, float64, float64, float64)")(normal_fluids.geometry._V_horiz_spherical_toint)
 
@@ -709,12 +773,217 @@ def transform_complete(replaced, __funcs, __all__, normal, vec=False):
         except AttributeError:
             pass
 
-transform_complete(replaced, __funcs, __all__, normal, vec=False)
+# Submodules of fluids transformed so far, by name without the fluids prefix
+transformed_submodules = {}
+_normal_submodules = {}
+_name_to_submodule = {}
+
+
+def _index_submodules():
+    # Find, without transforming anything, which submodule of fluids each
+    # name of this namespace comes from; a name in several submodules is taken
+    # from the last one, as when every submodule is transformed
+    for module in normal_fluids.all_submodules():
+        key = module.__name__.split('.', 1)[1]
+        _normal_submodules[key] = module
+        _name_to_submodule[module.__name__.split('.')[-1]] = key
+        _name_to_submodule[key] = key
+    for key, module in _normal_submodules.items():
+        names = list(getattr(module, '__all__', []))
+        for name, obj in module.__dict__.items():
+            if (isinstance(obj, types.FunctionType) and name != '__getattr__'
+                    and not name.startswith('_load') and obj.__module__ == module.__name__):
+                names.append(name)
+        for name in names:
+            _name_to_submodule[name] = key
+        __all__.extend(getattr(module, '__all__', []))
+    for name in lists_to_arrays_functions:
+        _name_to_submodule[name.split('.')[-1]] = name.rsplit('.', 1)[0]
+    _name_to_submodule['Colebrook'] = 'friction'
+
+
+def _submodule_dependencies(key):
+    # The other submodules of fluids whose functions or data `key` uses
+    module = _normal_submodules[key]
+    by_name = {m.__name__: k for k, m in _normal_submodules.items()}
+    dependencies = set()
+    for name, obj in module.__dict__.items():
+        if name.startswith('__'):
+            continue
+        if isinstance(obj, (types.FunctionType, type)):
+            origin = by_name.get(obj.__module__)
+            if origin is not None:
+                dependencies.add(origin)
+        elif isinstance(obj, types.ModuleType):
+            if obj.__name__ in by_name:
+                dependencies.add(by_name[obj.__name__])
+        elif isinstance(obj, (list, tuple, dict, set, frozenset, np.ndarray)):
+            for other, other_module in _normal_submodules.items():
+                if other_module.__dict__.get(name) is obj:
+                    dependencies.add(other)
+        if isinstance(obj, types.FunctionType) and obj.__module__ == module.__name__:
+            # Names imported inside functions
+            codes = [obj.__code__]
+            while codes:
+                code = codes.pop()
+                codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+                for used in code.co_names:
+                    if used not in module.__dict__ and used in _name_to_submodule:
+                        dependencies.add(_name_to_submodule[used])
+    dependencies.discard(key)
+    return dependencies
+
+
+def transform_submodule_lazy(key):
+    r'''Transform the submodule `key` of fluids (e.g. 'friction' or
+    'optional.spa') for numba, and the submodules it uses, if they have not
+    been transformed already, and return it. This is done automatically when
+    a name of this namespace is first accessed.
+    '''
+    try:
+        return transformed_submodules[key]
+    except KeyError:
+        pass
+    SUBMOD = transform_submodule(_normal_submodules[key], __funcs, replaced,
+                                 cache_blacklist=cache_blacklist)
+    # Registered before its dependencies are transformed, for import cycles
+    transformed_submodules[key] = SUBMOD
+    for dependency in sorted(_submodule_dependencies(key)):
+        transform_submodule_lazy(dependency)
+    transform_fixups(key, __funcs)
+    __funcs.pop('__file__', None)
+    replaced.pop('__file__', None)
+    for mod in transformed_submodules.values():
+        mod.__dict__.update(__funcs)
+    globals().update(__funcs)
+    return SUBMOD
+
+
+def transform_all():
+    r'''Transform every submodule of fluids for numba, as is otherwise done
+    on demand one submodule at a time.
+    '''
+    for key in _normal_submodules:
+        transform_submodule_lazy(key)
+
 
+def _load_name(name):
+    key = _name_to_submodule.get(name)
+    if key is None:
+        transform_all()
+    else:
+        transform_submodule_lazy(key)
+    try:
+        return __funcs[name]
+    except KeyError:
+        raise AttributeError("module %s has no attribute %s" %(__name__, name))
+
+
+_index_submodules()
 numbafied_fluids_functions = __funcs
-globals().update(__funcs)
 globals().update(replaced)
 
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name.startswith('__'):
+            raise AttributeError("module %s has no attribute %s" %(__name__, name))
+        return _load_name(name)
+else:
+    transform_all()
+
+
+def _docstring_calls(name, doc):
+    # Sources of the calls of `name` in the examples of a docstring
+    import doctest
+    calls = []
+    try:
+        examples = doctest.DocTestParser().get_examples(doc or '')
+    except ValueError:
+        return calls
+    for example in examples:
+        source = example.source.strip()
+        if source.startswith(name + '('):
+            calls.append(source)
+    return calls
+
+
+def precompile(names=None):
+    r'''Compile the functions of the `fluids.numba` namespace, and write their
+    machine code to numba's on-disk cache, so later processes load them in
+    milliseconds instead of compiling them on their first call. Run this once
+    after installing fluids, e.g. while building a container image; set the
+    `NUMBA_CACHE_DIR` environment variable if the installation is read-only.
+
+    Numba compiles a function for the types of the arguments it is called
+    with, so each function is called with the arguments of the examples in
+    the docstring of its `fluids` counterpart.
+
+    Parameters
+    ----------
+    names : list[str], optional
+        Names of the functions to compile; all of them if not specified, [-]
+
+    Returns
+    -------
+    report : dict[str, tuple(str, str)]
+        For each function, a status and a detail; the status is 'cached' when
+        the compiled code was written to the on-disk cache (the detail lists
+        the compiled signatures), 'compiled' when the function was compiled
+        but cannot be cached, 'failed' when an example did not compile or
+        run (the detail is the error), and 'no example' when the docstring
+        has no example to compile from, [-]
+
+    Examples
+    --------
+    >>> report = precompile(['Clamond', 'Stichlmair_flood']) # doctest: +SKIP
+    >>> report['Stichlmair_flood'][0] # doctest: +SKIP
+    'compiled'
+    '''
+    from numba.core.registry import CPUDispatcher
+    if names is None:
+        transform_all()
+        names = sorted(set(n for n in __all__ if isinstance(__funcs.get(n), CPUDispatcher)))
+    report = {}
+    for name in names:
+        dispatcher = _load_name(name)
+        calls = _docstring_calls(name, getattr(getattr(normal_fluids, name, None), '__doc__', None))
+        if not calls:
+            report[name] = ('no example', 'the docstring has no example calling %s' %(name))
+            continue
+        error = not_cached = None
+        for call in calls:
+            # The other functions an example uses must be transformed too
+            try:
+                used_names = compile(call, '<example>', 'eval').co_names
+            except SyntaxError:
+                used_names = ()
+            for used in used_names:
+                if used in _name_to_submodule:
+                    transform_submodule_lazy(_name_to_submodule[used])
+            namespace = {'np': np, 'pi': pi}
+            namespace.update(__funcs)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                try:
+                    eval(call, namespace)
+                except Exception as e:
+                    error = '%s: %s' %(type(e).__name__, str(e).strip().split('\n')[0])
+            for w in caught:
+                # Numba warns when a function compiled with cache=True cannot be cached
+                if 'cannot cache' in str(w.message).lower():
+                    not_cached = str(w.message).strip().split('\n')[0]
+        signatures = ', '.join(str(sig) for sig in dispatcher.signatures)
+        if not dispatcher.signatures:
+            report[name] = ('failed', error)
+        elif not caching or name in cache_blacklist:
+            report[name] = ('compiled', 'on-disk caching is disabled for this function '
+                            'as numba cannot reliably reload it; compiled %s' %(signatures))
+        elif not_cached is not None:
+            report[name] = ('compiled', not_cached)
+        else:
+            report[name] = ('cached', signatures)
+    return report
+
 #sys.modules['fluids.numerics'] = old_numerics
 
 
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import division
+import ast
+import inspect
+import textwrap
+import numpy as np
+import numba
+import fluids.numba
+
+__all__ = []
+
+__funcs = {}
+__kernels = {}
+
+_kernel_template = '''def kernel(%s):
+    for i in prange(out0.shape[0]):
+%s
+'''
+
+
+def _kernel(func, mask, n_out):
+    # Compile, once per function, pattern of array arguments and number of
+    # outputs, a loop calling `func` at each point with numba's prange
+    key = (func, mask, n_out)
+    try:
+        return __kernels[key]
+    except KeyError:
+        pass
+    args = ['x%d' %(i) for i in range(len(mask))]
+    call = 'f(%s)' %(', '.join(a + '[i]' if m else a for a, m in zip(args, mask)))
+    outs = ['out%d' %(i) for i in range(n_out)]
+    if n_out == 1:
+        body = '        out0[i] = %s' %(call)
+    else:
+        body = '        r = %s\n' %(call)
+        body += '\n'.join('        out%d[i] = r[%d]' %(i, i) for i in range(n_out))
+    source = _kernel_template %(', '.join(args + outs), body)
+    lcs, _ = fluids.numba.numba_exec_cacheable(source, {}, {'f': func, 'prange': numba.prange},
+                                               cache_name='parallel-%s' %(func.__name__))
+    kernel = numba.njit(parallel=True, nogil=True)(lcs['kernel'])
+    __kernels[key] = kernel
+    return kernel
+
+
+def _output_count(func):
+    # Number of values `func` returns, from the `return` statements of its
+    # source; 1 unless every one of them returns a tuple of the same length
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func.py_func)))
+    except (IOError, OSError, TypeError, SyntaxError):
+        return 1
+    counts = set()
+    nodes = list(ast.iter_child_nodes(tree.body[0]))
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, (ast.FunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Return) and node.value is not None:
+            counts.add(len(node.value.elts) if isinstance(node.value, ast.Tuple) else 1)
+        nodes.extend(ast.iter_child_nodes(node))
+    return counts.pop() if len(counts) == 1 else 1
+
+
+def _batch_function(name, func):
+    signature = inspect.signature(func.py_func)
+
+    def batch(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        values = list(bound.arguments.values())
+        mask = tuple(np.ndim(v) > 0 and not isinstance(v, str) for v in values)
+        arrays = np.broadcast_arrays(*[np.asarray(v) for v, m in zip(values, mask) if m])
+        shape = arrays[0].shape if arrays else ()
+        arrays = iter([np.ascontiguousarray(a).ravel() for a in arrays])
+        values = [next(arrays) if m else v for v, m in zip(values, mask)]
+        size = int(np.prod(shape))
+        if size == 0:
+            # Nothing to evaluate; the number of outputs comes from the source
+            n_out = _output_count(func)
+            if n_out == 1:
+                return np.empty(shape)
+            return tuple([np.empty(shape) for _ in range(n_out)])
+        # Evaluate the first point to find the number and types of outputs
+        first = func(*[v[0] if m else v for v, m in zip(values, mask)])
+        results = first if type(first) is tuple else (first,)
+        outs = [np.empty(size, dtype=np.asarray(r).dtype) for r in results]
+        _kernel(func, mask, len(outs))(*(values + outs))
+        outs = [o.reshape(shape) for o in outs]
+        return tuple(outs) if type(first) is tuple else outs[0]
+
+    batch.__name__ = name
+    batch.__doc__ = func.__doc__
+    return batch
+
+
+# The names of fluids.numba; its functions are only transformed when first
+# used, so whether a name is a function is only known then
+__all__.extend(sorted(set(fluids.numba.__all__)))
+
+
+def __getattr__(name):
+    try:
+        return __funcs[name]
+    except KeyError:
+        pass
+    if name.startswith('__'):
+        raise AttributeError("module %s has no attribute %s" %(__name__, name))
+    func = getattr(fluids.numba, name)
+    if isinstance(func, numba.core.registry.CPUDispatcher):
+        func = _batch_function(name, func)
+    # Classes and data are the same as in fluids.numba
+    __funcs[name] = func
+    return func
@@ -40,6 +40,7 @@ __all__ = ['isclose', 'horner', 'horner_and_der', 'horner_and_der2',
            'linspace', 'logspace', 'cumsum', 'diff', 'basic_damping',
            'is_poly_negative', 'is_poly_positive',
            'implementation_optimize_tck', 'tck_interp2d_linear',
+           'TableRegistry', 'LazyTable',
            'bisect', 'ridder', 'brenth', 'newton', 'secant', 'halley',
            'splev', 'bisplev', 'derivative', 'jacobian', 'hessian',
            'normalize', 'oscillation_checker',
@@ -2452,6 +2453,130 @@ def tck_interp2d_linear(x, y, z, kx=1, ky=1):
     return implementation_optimize_tck(tck)
 
 
+class LazyTable(object):
+    """Stand-in for a table of data, such as the `tck` of a spline, which is
+    held by a :obj:`TableRegistry` and only built when it is first used.
+
+    It can be unpacked, indexed, and iterated like the table itself. On first
+    use the table is built and replaces this object in the namespace of the
+    module that registered it, so later lookups cost nothing extra.
+    """
+    __slots__ = ('registry', 'name')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __repr__(self):
+        return '<LazyTable %s>' %(self.name)
+
+    def materialize(self):
+        return self.registry[self.name]
+
+    def __iter__(self):
+        return iter(self.registry[self.name])
+
+    def __len__(self):
+        return len(self.registry[self.name])
+
+    def __getitem__(self, i):
+        return self.registry[self.name][i]
+
+
+class TableRegistry(object):
+    """Registry of tables of data for a module which are built on first use.
+    Tables are registered by decorating a function which builds them with
+    :obj:`TableRegistry.lazy`; the name of the function is bound to a
+    :obj:`LazyTable` instead, until the table is needed.
+
+    When NumPy is available and `blob` is the path of an existing `.npz` file
+    written by :obj:`TableRegistry.save`, tables are read from it instead of
+    being built, so the cost of using a table does not depend on how much
+    source code defines it.
+
+    Parameters
+    ----------
+    namespace : dict
+        Global namespace of the module the tables belong to, [-]
+    blob : str, optional
+        Path of a `.npz` file of precomputed tables, [-]
+    """
+    def __init__(self, namespace, blob=None):
+        self.namespace = namespace
+        self.blob = blob
+        self.builders = {}
+        self.tables = {}
+        self._blob_data = None
+
+    def __repr__(self):
+        return '<TableRegistry, %d tables, %d built>' %(len(self.builders), len(self.tables))
+
+    def lazy(self, builder):
+        name = builder.__name__
+        self.builders[name] = builder
+        return LazyTable(self, name)
+
+    def __contains__(self, name):
+        return name in self.builders
+
+    def __iter__(self):
+        return iter(self.builders)
+
+    def __getitem__(self, name):
+        try:
+            return self.tables[name]
+        except KeyError:
+            pass
+        table = self._read_blob(name)
+        if table is None:
+            table = self.builders[name]()
+        self.tables[name] = table
+        if isinstance(self.namespace.get(name, None), LazyTable):
+            self.namespace[name] = table
+        return table
+
+    def load_all(self):
+        """Build every table in the registry, replacing all of the
+        :obj:`LazyTable` stand-ins in the module's namespace.
+        """
+        for name in self.builders:
+            self[name]
+        return self.tables
+
+    def _read_blob(self, name):
+        if self.blob is None or IS_PYPY_OR_SKIP_DEPENDENCIES:
+            return None
+        data = self._blob_data
+        if data is None:
+            try:
+                with np.load(self.blob) as blob:
+                    data = {k: blob[k] for k in blob.files}
+            except (IOError, OSError):
+                data = {}
+            self._blob_data = data
+        if name + ':0' not in data:
+            return None
+        table, i = [], 0
+        while '%s:%d' %(name, i) in data:
+            v = data['%s:%d' %(name, i)]
+            table.append(int(v) if v.ndim == 0 else v)
+            i += 1
+        return tuple(table)
+
+    def save(self, path=None):
+        """Build every table from its source and write the ones which are
+        tuples of arrays and integers, such as spline `tck` tuples, to a
+        `.npz` file; by default the registry's `blob`.
+        """
+        arrays = {}
+        for name, builder in self.builders.items():
+            table = builder()
+            if all(isinstance(v, (int, list, np.ndarray)) for v in table):
+                for i, v in enumerate(table):
+                    arrays['%s:%d' %(name, i)] = np.array(v)
+        np.savez(self.blob if path is None else path, **arrays)
+
+
 
 def caching_decorator(f, full=False):
     from functools import wraps
@@ -211,3 +211,77 @@ def ineichen(apparent_zenith, airmass_absolute, linke_turbidity,
 
 
 
+
+
+def get_relative_airmass_array(zenith, model='kastenyoung1989'):
+    # NumPy version of get_relative_airmass; NaN below the horizon
+    import numpy as np
+    if 'kastenyoung1989' != model:
+        raise ValueError('%s is not a valid model for relativeairmass', model)
+    z = np.asarray(zenith, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        am = 1.0/(np.cos(np.radians(z)) + 0.50572*((6.07995 + (90.0 - z))**-1.6364))
+    return am
+
+
+def ineichen_array(apparent_zenith, airmass_absolute, linke_turbidity,
+                   altitude=0, dni_extra=1364., perez_enhancement=False):
+    # NumPy version of ineichen, with the same handling of night time
+    import numpy as np
+    apparent_zenith, airmass_absolute = np.broadcast_arrays(
+        np.asarray(apparent_zenith, dtype=np.float64),
+        np.asarray(airmass_absolute, dtype=np.float64))
+    night = np.isnan(airmass_absolute) | np.isnan(apparent_zenith)
+    cos_zenith = np.maximum(np.cos(np.radians(apparent_zenith)), 0.0)
+
+    tl = linke_turbidity
+    fh1 = np.exp(-altitude/8000.)
+    fh2 = np.exp(-altitude/1250.)
+    cg1 = 5.09e-5*altitude + 0.868
+    cg2 = 3.92e-5*altitude + 0.0387
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ghi = np.exp(-cg2*airmass_absolute*(fh1 + fh2*(tl - 1.0)))
+        if perez_enhancement:
+            ghi *= np.exp(0.01*airmass_absolute**1.8)
+        ghi = np.where(ghi > 0.0, cg1*dni_extra*cos_zenith*tl/tl*ghi, 0.0)
+
+        b = 0.664 + 0.163/fh1
+        bnci = b*np.exp(-0.09*airmass_absolute*(tl - 1))
+        bnci = np.where(bnci > 0.0, dni_extra*bnci, 0.0)
+
+        # "empirical correction" SE 73, 157 & SE 73, 312; 1e20 for a zero
+        # cos_zenith as in the scalar version
+        bnci_2 = ((1.0 - (0.1 - 0.2*np.exp(-tl))/(0.1 + 0.882/fh1))/cos_zenith)
+    bnci_2 = ghi*np.minimum(bnci_2, 1e20)
+    dni = np.minimum(bnci, bnci_2)
+    dhi = ghi - dni*cos_zenith
+    return {'ghi': np.where(night, 0.0, ghi), 'dni': np.where(night, 0.0, dni),
+            'dhi': np.where(night, 0.0, dhi)}
+
+
+def get_total_irradiance_array(surface_tilt, surface_azimuth,
+                               solar_zenith, solar_azimuth,
+                               dni, ghi, dhi, dni_extra=None, airmass=None,
+                               albedo=.25, surface_type=None,
+                               model='isotropic',
+                               model_perez='allsitescomposite1990', **kwargs):
+    # NumPy version of get_total_irradiance
+    import numpy as np
+    if model == 'isotropic':
+        poa_sky_diffuse = dhi*(1 + np.cos(np.radians(surface_tilt)))*0.5
+    else:
+        from pvlib.irradiance import get_sky_diffuse
+        poa_sky_diffuse = get_sky_diffuse(surface_tilt, surface_azimuth,
+                    solar_zenith, solar_azimuth,
+                    dni, ghi, dhi, dni_extra=dni_extra, airmass=airmass,
+                    model=model, model_perez=model_perez)
+    poa_ground_diffuse = ghi*albedo*(1.0 - np.cos(np.radians(surface_tilt)))*0.5
+    projection = (np.cos(np.radians(surface_tilt))*np.cos(np.radians(solar_zenith))
+                  + np.sin(np.radians(surface_tilt))*np.sin(np.radians(solar_zenith))
+                  *np.cos(np.radians(solar_azimuth - surface_azimuth)))
+    aoi_ = np.degrees(np.arccos(np.clip(projection, -1.0, 1.0)))
+    poa_direct = np.maximum(dni*np.cos(np.radians(aoi_)), 0.0)
+    poa_diffuse = poa_sky_diffuse + poa_ground_diffuse
+    return {'poa_global': poa_direct + poa_diffuse, 'poa_direct': poa_direct,
+            'poa_diffuse': poa_diffuse, 'poa_sky_diffuse': poa_sky_diffuse,
+            'poa_ground_diffuse': poa_ground_diffuse}
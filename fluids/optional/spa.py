@@ -72,7 +72,8 @@ __all__ = ['julian_day_dt', 'julian_day', 'julian_ephemeris_day', 'julian_centur
            'atmospheric_refraction_correction', 'topocentric_elevation_angle', 'topocentric_zenith_angle',
            'topocentric_astronomers_azimuth', 'topocentric_azimuth_angle', 'sun_mean_longitude',
            'equation_of_time', 'calculate_deltat', 'longitude_obliquity_nutation',
-           'transit_sunrise_sunset',
+           'transit_sunrise_sunset', 'calculate_deltat_array', 'solar_position_array',
+           'solar_ephemeris_array', 'topocentric_solar_position_array',
            ]
 nan = float("nan")
 
@@ -990,6 +991,182 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
     return [theta, theta0, e, e0, phi, eot]
 
 
+def _periodic_terms_array(table, jme, np):
+    # Sum of A*cos(B + C*jme) over the rows of a table, in the same order as
+    # the scalar functions; looping over rows keeps memory at one array
+    total = np.zeros_like(jme)
+    for A, B, C in table:
+        total += A*np.cos(B + C*jme)
+    return total
+
+
+def calculate_deltat_array(year, month):
+    """Calculate `delta_t` for arrays of years and months. Time series only
+    span a few distinct months, so :obj:`calculate_deltat` is evaluated once
+    per distinct year and month and the results are broadcast back.
+    """
+    import numpy as np
+    year, month = np.broadcast_arrays(np.asarray(year, dtype=np.int64),
+                                      np.asarray(month, dtype=np.int64))
+    months, inverse = np.unique(year*12 + (month - 1), return_inverse=True)
+    values = np.array([calculate_deltat(int(k//12), int(k % 12 + 1)) for k in months])
+    return values[inverse.ravel()].reshape(year.shape)
+
+
+def solar_ephemeris_array(unixtime, delta_t):
+    """Calculate the terms of the NREL SPA algorithm which depend only on
+    time, for an array of times. They are the same for every observer, so
+    one ephemeris can be shared by any number of sites with
+    :obj:`topocentric_solar_position_array`.
+
+    Returns
+    -------
+    tuple with elements (arrays):
+        apparent sidereal time,
+        geocentric sun right ascension,
+        geocentric sun declination,
+        equation_of_time,
+        equatorial horizontal parallax
+    """
+    import numpy as np
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+    jd = julian_day(unixtime)
+    jde = julian_ephemeris_day(jd, delta_t)
+    jc = julian_century(jd)
+    jce = julian_ephemeris_century(jde)
+    jme = julian_ephemeris_millennium(jce)
+
+    R = (jme*(jme*(jme*(jme*(4.0*np.cos(2.56 + 6283.08*jme))
+         + _periodic_terms_array(HELIO_RADIUS_TABLE_LIST_3, jme, np))
+         + _periodic_terms_array(HELIO_RADIUS_TABLE_LIST_2, jme, np))
+         + _periodic_terms_array(HELIO_RADIUS_TABLE_LIST_1, jme, np))
+         + _periodic_terms_array(HELIO_RADIUS_TABLE_LIST_0, jme, np))*1E-8
+    l0 = _periodic_terms_array(HELIO_LONG_TABLE_LIST_0, jme, np)
+    l1 = _periodic_terms_array(HELIO_LONG_TABLE_LIST_1, jme, np)
+    l2 = _periodic_terms_array(HELIO_LONG_TABLE_LIST_2, jme, np)
+    l3 = _periodic_terms_array(HELIO_LONG_TABLE_LIST_3, jme, np)
+    l4 = _periodic_terms_array(HELIO_LONG_TABLE_LIST_4, jme, np)
+    l5 = -0.9999987317275395
+    L = (rad2deg*(jme*(jme*(jme*(jme*(jme*l5 + l4) + l3) + l2) + l1) + l0)*1E-8) % 360
+    b0 = _periodic_terms_array(HELIO_LAT_TABLE_LIST_0, jme, np)
+    b1 = _periodic_terms_array(HELIO_LAT_TABLE_LIST_1, jme, np)
+    B = rad2deg*((b0 + b1*jme)*1E-8)
+
+    Theta = geocentric_longitude(L)
+    beta = geocentric_latitude(B)
+    x0 = deg2rad*mean_elongation(jce)
+    x1 = deg2rad*mean_anomaly_sun(jce)
+    x2 = deg2rad*mean_anomaly_moon(jce)
+    x3 = deg2rad*moon_argument_latitude(jce)
+    x4 = deg2rad*moon_ascending_longitude(jce)
+    delta_psi_sum = np.zeros_like(jce)
+    delta_eps_sum = np.zeros_like(jce)
+    for row in range(63):
+        arg = (NUTATION_YTERM_LIST_0[row]*x0 + NUTATION_YTERM_LIST_1[row]*x1
+               + NUTATION_YTERM_LIST_2[row]*x2 + NUTATION_YTERM_LIST_3[row]*x3
+               + NUTATION_YTERM_LIST_4[row]*x4)
+        arr = NUTATION_ABCD_LIST[row]
+        delta_psi_sum += (arr[0] + jce*arr[1])*np.sin(arg)
+        delta_eps_sum += (arr[2] + jce*arr[3])*np.cos(arg)
+    delta_psi = delta_psi_sum/36000000.0
+    delta_epsilon = delta_eps_sum/36000000.0
+
+    epsilon0 = mean_ecliptic_obliquity(jme)
+    epsilon = true_ecliptic_obliquity(epsilon0, delta_epsilon)
+    delta_tau = aberration_correction(R)
+    lamd = apparent_sun_longitude(Theta, delta_psi, delta_tau)
+    v0 = mean_sidereal_time(jd, jc)
+    cos_epsilon = np.cos(deg2rad*epsilon)
+    sin_epsilon = np.sin(deg2rad*epsilon)
+    v = v0 + delta_psi*cos_epsilon
+    sin_lamd = np.sin(deg2rad*lamd)
+    alpha = np.degrees(np.arctan2(sin_lamd*cos_epsilon
+                                  - np.tan(deg2rad*beta)*sin_epsilon,
+                                  np.cos(deg2rad*lamd))) % 360
+    delta = np.degrees(np.arcsin(np.sin(deg2rad*beta)*cos_epsilon
+                                 + np.cos(deg2rad*beta)*sin_epsilon*sin_lamd))
+
+    m = sun_mean_longitude(jme)
+    E = ((m - 0.0057183 - alpha + delta_psi*cos_epsilon) % 360)*4.0
+    eot = np.where(E > 20.0, E - 1440.0, np.where(E < -20.0, E + 1440.0, E))
+    xi = equatorial_horizontal_parallax(R)
+    return v, alpha, delta, eot, xi
+
+
+def topocentric_solar_position_array(v, alpha, delta, xi, lat, lon, elev,
+                                     pressure, temp, atmos_refract):
+    """Apply the observer corrections of the NREL SPA algorithm to an
+    ephemeris from :obj:`solar_ephemeris_array`. All arguments broadcast
+    together; giving the observer arguments a trailing axis of length one
+    evaluates many sites against one time series.
+
+    Returns
+    -------
+    list with elements (arrays):
+        apparent zenith,
+        zenith,
+        elevation,
+        apparent_elevation,
+        azimuth
+    """
+    import numpy as np
+    H = (v + lon - alpha) % 360
+    lat_rad = deg2rad*lat
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    u = np.arctan(0.99664719*np.tan(lat_rad))
+    x = np.cos(u) + elev*1.5678552054360676e-07*cos_lat
+    y = 0.99664719*np.sin(u) + elev*1.5678552054360676e-07*sin_lat
+
+    x0 = np.sin(deg2rad*xi)
+    H_rad = deg2rad*H
+    cos_delta = np.cos(deg2rad*delta)
+    denom = cos_delta - x*x0*np.cos(H_rad)
+    delta_alpha = np.degrees(np.arctan2(-x*x0*np.sin(H_rad), denom))
+    delta_prime = np.degrees(np.arctan2((np.sin(deg2rad*delta) - y*x0)
+                                        *np.cos(deg2rad*delta_alpha), denom))
+    H_prime = H - delta_alpha
+    H_prime_rad = deg2rad*H_prime
+    delta_prime_rad = deg2rad*delta_prime
+    e0 = np.degrees(np.arcsin(sin_lat*np.sin(delta_prime_rad)
+                              + cos_lat*np.cos(delta_prime_rad)*np.cos(H_prime_rad)))
+    switch = e0 >= -1.0*(0.26667 + atmos_refract)
+    delta_e = ((pressure/1010.0)*(283.0/(273.0 + temp))
+               *1.02/(60.0*np.tan(deg2rad*(e0 + 10.3/(e0 + 5.11)))))*switch
+    e = e0 + delta_e
+    gamma = np.degrees(np.arctan2(np.sin(H_prime_rad),
+                                  np.cos(H_prime_rad)*sin_lat
+                                  - np.tan(delta_prime_rad)*cos_lat)) % 360.0
+    phi = (gamma + 180.0) % 360.0
+    return [90.0 - e, 90.0 - e0, e, e0, phi]
+
+
+def solar_position_array(unixtime, lat, lon, elev, pressure, temp, delta_t,
+                         atmos_refract):
+    """Calculate the solar position with the NREL SPA algorithm for an array
+    of times using NumPy; the heliocentric and nutation series are summed
+    over every time at once, row by row. Accepts the same arguments as
+    :obj:`solar_position`, where `delta_t` may be an array as from
+    :obj:`calculate_deltat_array`, and the observer arguments broadcast
+    against `unixtime`.
+
+    Returns
+    -------
+    list with elements (arrays):
+        apparent zenith,
+        zenith,
+        elevation,
+        apparent_elevation,
+        azimuth,
+        equation_of_time
+    """
+    v, alpha, delta, eot, xi = solar_ephemeris_array(unixtime, delta_t)
+    result = topocentric_solar_position_array(v, alpha, delta, xi, lat, lon,
+                                              elev, pressure, temp,
+                                              atmos_refract)
+    result.append(eot)
+    return result
+
+
 try:
     if IS_NUMBA:  # type: ignore
         try:
@@ -34,6 +34,8 @@ or contact the author at Caleb.Andrew.Bell@gmail.com.
 Pipe Schedules
 --------------
 .. autofunction:: nearest_pipe
+.. autofunction:: nearest_pipes
+.. autofunction:: schedules_from_Di
 
 Wire Gauge
 ----------
@@ -45,9 +47,11 @@ Wire Gauge
 
 from __future__ import division
 from math import pi
+from bisect import bisect_left
 from fluids.constants import inch
+from fluids.numerics import numpy as np
 
-__all__ = ['nearest_pipe', 'gauge_from_t', 't_from_gauge', 'wire_schedules']
+__all__ = ['nearest_pipe', 'nearest_pipes', 'schedules_from_Di', 'gauge_from_t', 't_from_gauge', 'wire_schedules']
 
 # Schedules 5, 10, 20, 30, 40, 60, 80, 100, 120, 140, 160 from
 # ASME B36.10M - Welded and Seamless Wrought Steel Pipe
@@ -674,32 +678,6 @@ def nearest_pipe(Do=None, Di=None, NPS=None, schedule='40'):
     if NPS:
         NPS = float(NPS)
 
-    def Di_lookup(Di, NPSes, Dis, Dos, ts):
-        for i in range(len(Dis)): # Go up ascending list; once larger than specified, return
-            if Dis[-1] < Di:
-                return None
-            if Dis[i] >= Di:
-                _nps, _di, _do, _t = NPSes[i], Dis[i], Dos[i], ts[i]
-                return (_nps, _di, _do, _t)
-        raise ValueError('Di lookup failed')
-
-    def Do_lookup(Do, NPSes, Dis, Dos, ts):
-        for i in range(len(Dos)): # Go up ascending list; once larger than specified, return
-            if Dos[-1] < Do:
-                return None
-            if Dos[i] >= Do:
-                _nps, _di, _do, _t = NPSes[i], Dis[i], Dos[i], ts[i]
-                return (_nps, _di, _do, _t)
-        raise ValueError('Do lookup failed')
-
-    def NPS_lookup(NPS, NPSes, Dis, Dos, ts):
-        for i in range(len(NPSes)): # Go up ascending list; once larger than specified, return
-            if NPSes[i] == NPS:
-                _nps, _di, _do, _t = NPSes[i], Dis[i], Dos[i], ts[i]
-                return (_nps, _di, _do, _t)
-        raise ValueError('NPS not in list')
-
-
     # If accidentally given an numerical schedule, convert it to a string
     schedule_type = type(schedule)
     if schedule_type in (int, float):
@@ -710,18 +688,156 @@ def nearest_pipe(Do=None, Di=None, NPS=None, schedule='40'):
     else:
         NPSes, Dis, Dos, ts = schedule_lookup[schedule]
 
-    # Handle the three cases of different inputs
+    # Handle the three cases of different inputs; the lists are ascending, so
+    # the first pipe as large or larger than specified is found by bisection
     if Di:
-        nums = Di_lookup(Di, NPSes, Dis, Dos, ts)
+        i = bisect_left(Dis, Di)
     elif Do:
-        nums = Do_lookup(Do, NPSes, Dis, Dos, ts)
+        i = bisect_left(Dos, Do)
     elif NPS:
-        nums = NPS_lookup(NPS, NPSes, Dis, Dos, ts)
+        i = bisect_left(NPSes, NPS)
+        if i == len(NPSes) or NPSes[i] != NPS:
+            raise ValueError('NPS not in list')
 
-    if nums is None:
+    if i == len(NPSes):
         raise ValueError('Pipe input is larger than max of selected schedule')
-    _nps, _di, _do, _t = nums
-    return _nps, _di/1E3, _do/1E3, _t/1E3
+    return NPSes[i], Dis[i]/1E3, Dos[i]/1E3, ts[i]/1E3
+
+
+# Arrays of the schedules in mm, created when first needed
+schedule_arrays = {}
+Di_index = None
+
+
+def _schedule_arrays(schedule):
+    if type(schedule) in (int, float):
+        schedule = str(int(schedule))
+    try:
+        return schedule_arrays[schedule]
+    except KeyError:
+        pass
+    if schedule not in schedule_lookup:
+        raise ValueError('Schedule not recognized')
+    arrays = tuple(np.array(v, dtype=float) for v in schedule_lookup[schedule])
+    schedule_arrays[schedule] = arrays
+    return arrays
+
+
+def _Di_index():
+    # The inner diameters of every schedule in m sorted together, with the
+    # schedule and position in it of each
+    global Di_index
+    if Di_index is None:
+        names, positions, Dis = [], [], []
+        for name in schedule_lookup:
+            Di_mm = _schedule_arrays(name)[1]
+            names.extend([name]*len(Di_mm))
+            positions.append(np.arange(len(Di_mm)))
+            Dis.append(Di_mm/1E3)
+        Dis, positions = np.concatenate(Dis), np.concatenate(positions)
+        order = np.argsort(Dis, kind='stable')
+        Di_index = (Dis[order], [names[j] for j in order], positions[order])
+    return Di_index
+
+
+def nearest_pipes(Do=None, Di=None, NPS=None, schedule='40'):
+    r'''Searches for and finds the nearest standard pipe size to each of an
+    array of specifications in one schedule, as :obj:`nearest_pipe` does for
+    one. The schedule is converted to NumPy arrays once, and the pipes are
+    found by binary search; this is much faster than calling
+    :obj:`nearest_pipe` in a loop for many pipes.
+
+    Parameters
+    ----------
+    Do : array-like, optional
+        Pipe outer diameters, [m]
+    Di : array-like, optional
+        Pipe inner diameters, [m]
+    NPS : array-like, optional
+        Nominal pipe sizes, [-]
+    schedule : str
+        String representing schedule size; any accepted by
+        :obj:`nearest_pipe`
+
+    Returns
+    -------
+    NPS : ndarray
+        Nominal pipe sizes, [-]
+    Di : ndarray
+        Pipe inner diameters, [m]
+    Do : ndarray
+        Pipe outer diameters, [m]
+    t : ndarray
+        Pipe wall thicknesses, [m]
+
+    Notes
+    -----
+    Only one of `Do`, `Di`, or `NPS` should be provided; they are checked in
+    the order `Di`, `Do`, `NPS`. An exception is raised if any of the inputs
+    is larger than the largest pipe of the schedule, or if any nominal pipe
+    size is not in the schedule.
+
+    Examples
+    --------
+    >>> nearest_pipes(Di=[0.021, 0.05, 0.1])
+    (array([1., 2., 4.]), array([0.02664, 0.05248, 0.10226]), array([0.0334, 0.0603, 0.1143]), array([0.00338, 0.00391, 0.00602]))
+    '''
+    NPSes, Dis, Dos, ts = _schedule_arrays(schedule)
+    if Di is not None:
+        i = np.searchsorted(Dis, np.asarray(Di, dtype=float)*1E3, side='left')
+    elif Do is not None:
+        i = np.searchsorted(Dos, np.asarray(Do, dtype=float)*1E3, side='left')
+    elif NPS is not None:
+        NPS = np.asarray(NPS, dtype=float)
+        i = np.searchsorted(NPSes, NPS, side='left')
+        if np.any((i == len(NPSes)) | (NPSes[np.minimum(i, len(NPSes) - 1)] != NPS)):
+            raise ValueError('NPS not in list')
+    else:
+        raise ValueError('One of `Do`, `Di`, or `NPS` is required')
+    if np.any(i == len(NPSes)):
+        raise ValueError('Pipe input is larger than max of selected schedule')
+    return NPSes[i], Dis[i]/1E3, Dos[i]/1E3, ts[i]/1E3
+
+
+def schedules_from_Di(Di, atol=1E-4):
+    r'''Finds every standard pipe, of any schedule, with an inner diameter
+    within `atol` of the specified one. The inner diameters of every schedule
+    are sorted together once, so each lookup is a binary search.
+
+    Parameters
+    ----------
+    Di : float
+        Pipe inner diameter, [m]
+    atol : float, optional
+        Allowable difference in inner diameter, [m]
+
+    Returns
+    -------
+    pipes : list[tuple(str, float, float, float, float)]
+        The schedule, nominal pipe size [-], inner diameter [m], outer
+        diameter [m], and wall thickness [m] of each pipe found, the nearest
+        in inner diameter first, [-]
+
+    Notes
+    -----
+    The default tolerance of 0.1 mm covers the rounding differences between
+    the imperial and metric versions of the schedules.
+
+    Examples
+    --------
+    >>> [pipe[0] for pipe in schedules_from_Di(0.05248)]
+    ['40', 'STD', '40S', 'S40F441SI', '40D1527', 'PVCD2665', '40D1785', 'S40F441IPS']
+    '''
+    Dis, names, positions = _Di_index()
+    lo = np.searchsorted(Dis, Di - atol, side='left')
+    hi = np.searchsorted(Dis, Di + atol, side='right')
+    pipes = []
+    for j in range(lo, hi):
+        NPSes, Di_mm, Do_mm, t_mm = schedule_lookup[names[j]]
+        k = positions[j]
+        pipes.append((names[j], NPSes[k], Di_mm[k]/1E3, Do_mm[k]/1E3, t_mm[k]/1E3))
+    pipes.sort(key=lambda pipe: abs(pipe[2] - Di))
+    return pipes
 
 
 ### Wire gauge schedules
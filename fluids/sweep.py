@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+This module evaluates every correlation of a method-selecting function, such
+as :obj:`fluids.friction.friction_factor` or
+:obj:`fluids.two_phase.two_phase_dP`, over a set of input points, for
+comparing correlations against each other or against data. The points are
+split into chunks which are evaluated in parallel by a pool of processes or
+threads. NumPy is required; pandas is required only for
+:obj:`MethodSweep.to_frame`.
+
+For reporting bugs, adding feature requests, or submitting pull requests,
+please use the `GitHub issue tracker <https://github.com/CalebBell/fluids/>`_
+or contact the author at Caleb.Andrew.Bell@gmail.com.
+
+.. contents:: :local:
+
+Correlation Sweeps
+------------------
+.. autofunction:: evaluate_methods
+.. autoclass:: MethodSweep
+    :members: to_frame
+"""
+
+from __future__ import division
+import os
+import sys
+from time import perf_counter
+from fluids.numerics import numpy as np
+
+__all__ = ['evaluate_methods', 'MethodSweep']
+
+
+def _methods_function(func):
+    # The function listing the correlations of `func`, by the naming
+    # convention of the library, e.g. drag_sphere -> drag_sphere_methods
+    module = sys.modules[func.__module__]
+    methods_func = getattr(module, func.__name__ + '_methods', None)
+    if methods_func is None:
+        raise ValueError("%s has no %s_methods function; specify `methods`"
+                         % (func.__name__, func.__name__))
+    return methods_func
+
+
+def _methods_kwargs(methods_func, kwargs):
+    # The inputs which the `_methods` function accepts
+    code = methods_func.__code__
+    accepted = code.co_varnames[:code.co_argcount]
+    return {k: v for k, v in kwargs.items() if k in accepted and k != 'check_ranges'}
+
+
+def _evaluate_chunk(func, methods_func, methods, names, columns, constants,
+                    check_ranges):
+    # Evaluate every method at every point of one chunk; run in the workers
+    n_methods, n_points = len(methods), len(columns[0]) if columns else 1
+    values = [[float('nan')]*n_points for _ in range(n_methods)]
+    times = [0.0]*n_methods
+    failures = [0]*n_methods
+    kwargs = dict(constants)
+    for j in range(n_points):
+        for name, column in zip(names, columns):
+            kwargs[name] = column[j]
+        applicable = None
+        if check_ranges:
+            applicable = set(methods_func(check_ranges=True, **_methods_kwargs(methods_func, kwargs)))
+        for i, method in enumerate(methods):
+            if applicable is not None and method not in applicable:
+                failures[i] += 1
+                continue
+            t0 = perf_counter()
+            try:
+                value = func(Method=method, **kwargs)
+            except Exception:
+                value = None
+            times[i] += perf_counter() - t0
+            if value is None:
+                failures[i] += 1
+            else:
+                values[i][j] = value
+    return values, times, failures
+
+
+class MethodSweep(object):
+    r'''Results of :obj:`evaluate_methods`.
+
+    Attributes
+    ----------
+    methods : list[str]
+        Names of the evaluated correlations, [-]
+    inputs : dict[str, ndarray]
+        The varying inputs, broadcast to the shape of the points, [various]
+    values : ndarray
+        Result of each correlation at each point, with shape
+        (len(methods),) + the shape of the points; NaN where a correlation
+        raised an exception, returned None, or was not applicable, [various]
+    times : ndarray
+        Total time spent evaluating each correlation, summed over every
+        worker, [s]
+    failures : ndarray
+        Number of points at which each correlation has no value, [-]
+    '''
+    def __init__(self, methods, inputs, values, times, failures):
+        self.methods = methods
+        self.inputs = inputs
+        self.values = values
+        self.times = times
+        self.failures = failures
+
+    def __repr__(self):
+        return '<MethodSweep, %d methods at %d points>' %(len(self.methods),
+                                                         self.values[0].size if self.methods else 0)
+
+    def to_frame(self):
+        r'''Return the results as a long-format pandas DataFrame, with one row
+        for every method and point; the columns are `method`, `point` (the
+        flat index of the point), each varying input, `value`, and
+        `time_per_point` (the mean time of the method per point, [s]).
+
+        Returns
+        -------
+        frame : pandas.DataFrame
+            Table of results, [-]
+        '''
+        import pandas as pd
+        n_methods = len(self.methods)
+        n_points = self.values[0].size if n_methods else 0
+        data = {'method': np.repeat(np.array(self.methods, dtype=object), n_points),
+                'point': np.tile(np.arange(n_points), n_methods)}
+        for name, value in self.inputs.items():
+            data[name] = np.tile(value.ravel(), n_methods)
+        data['value'] = self.values.reshape(n_methods, n_points).ravel()
+        data['time_per_point'] = np.repeat(self.times/max(n_points, 1), n_points)
+        return pd.DataFrame(data)
+
+
+def evaluate_methods(func, methods=None, executor='process', max_workers=None,
+                     chunk_size=None, check_ranges=False, **inputs):
+    r'''Evaluate every correlation of a method-selecting function at each of
+    a set of points, in parallel.
+
+    The varying inputs are broadcast together as NumPy arrays to form the
+    points; use e.g. `Re=Res[:, None], eD=eDs[None, :]` for a grid. Inputs
+    which are scalars are passed unchanged to every call. The points are
+    split into chunks and each chunk is evaluated with every correlation by a
+    worker of the pool.
+
+    Parameters
+    ----------
+    func : callable
+        A function accepting a `Method` argument, such as
+        :obj:`fluids.friction.friction_factor`, :obj:`fluids.drag.drag_sphere`,
+        :obj:`fluids.packed_bed.dP_packed_bed`,
+        :obj:`fluids.two_phase.two_phase_dP` or
+        :obj:`fluids.two_phase_voidage.liquid_gas_voidage`, [-]
+    methods : list[str], optional
+        Correlations to evaluate; if not specified, those returned by the
+        function's `_methods` function (e.g.
+        :obj:`fluids.drag.drag_sphere_methods`) for the first point with
+        `check_ranges` False, [-]
+    executor : str or concurrent.futures.Executor, optional
+        'process' for a process pool, 'thread' for a thread pool, None to
+        evaluate in the calling thread, or an existing executor to submit the
+        chunks to; the correlations are pure Python and hold the GIL, so only
+        a process pool uses more than one core, [-]
+    max_workers : int, optional
+        Number of workers of a new pool; defaults to the number of CPUs, [-]
+    chunk_size : int, optional
+        Number of points per chunk; defaults to a quarter of an equal share
+        of the points per worker, so the workers stay balanced, [-]
+    check_ranges : bool, optional
+        Whether to give NaN at points outside the stated range of a
+        correlation, as determined by the `_methods` function, [-]
+    inputs : float or array-like
+        The arguments of `func`, [various]
+
+    Returns
+    -------
+    sweep : MethodSweep
+        Values and timings of every correlation, [-]
+
+    Examples
+    --------
+    >>> from fluids.drag import drag_sphere
+    >>> sweep = evaluate_methods(drag_sphere, methods=['Stokes', 'Barati'],
+    ...                          Re=[0.1, 1.0], executor=None)
+    >>> sweep.values.round(4).tolist()
+    [[240.0, 24.0], [242.658, 26.5363]]
+    '''
+    names = [k for k, v in inputs.items() if np.ndim(v) > 0]
+    constants = {k: v for k, v in inputs.items() if np.ndim(v) == 0}
+    arrays = np.broadcast_arrays(*[np.asarray(inputs[k]) for k in names]) if names else []
+    shape = arrays[0].shape if names else ()
+    n_points = int(np.prod(shape))
+    flat = [a.ravel().tolist() for a in arrays]
+
+    methods_func = None
+    if methods is None or check_ranges:
+        methods_func = _methods_function(func)
+    if methods is None:
+        first = dict(constants)
+        for name, column in zip(names, flat):
+            first[name] = column[0]
+        methods = list(methods_func(check_ranges=False, **_methods_kwargs(methods_func, first)))
+    methods = list(methods)
+
+    if executor is None:
+        workers = 1
+    elif isinstance(executor, str):
+        workers = max_workers or os.cpu_count() or 1
+    else:
+        workers = getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-n_points//(4*workers)))
+    starts = list(range(0, n_points, chunk_size)) if names else [0]
+
+    def chunk_args(start):
+        return (func, methods_func, methods, names,
+                [column[start:start + chunk_size] for column in flat],
+                constants, check_ranges)
+
+    if executor is None:
+        results = [_evaluate_chunk(*chunk_args(start)) for start in starts]
+    else:
+        own = isinstance(executor, str)
+        if own:
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            if executor == 'process':
+                pool = ProcessPoolExecutor(max_workers=workers)
+            elif executor == 'thread':
+                pool = ThreadPoolExecutor(max_workers=workers)
+            else:
+                raise ValueError("Unrecognized executor %s" %(executor))
+        else:
+            pool = executor
+        try:
+            futures = [pool.submit(_evaluate_chunk, *chunk_args(start)) for start in starts]
+            results = [future.result() for future in futures]
+        finally:
+            if own:
+                pool.shutdown()
+
+    n_methods = len(methods)
+    values = np.empty((n_methods, n_points))
+    times = np.zeros(n_methods)
+    failures = np.zeros(n_methods, dtype=int)
+    for start, (chunk_values, chunk_times, chunk_failures) in zip(starts, results):
+        if n_methods:
+            chunk_values = np.array(chunk_values, dtype=float)
+            values[:, start:start + chunk_values.shape[1]] = chunk_values
+        times += chunk_times
+        failures += chunk_failures
+    return MethodSweep(methods, {k: a for k, a in zip(names, arrays)},
+                       values.reshape((n_methods,) + shape), times, failures)
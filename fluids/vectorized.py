@@ -22,7 +22,7 @@ SOFTWARE.
 """
 
 from __future__ import division
-from fluids.numerics import numpy as np, FakePackage
+from fluids.numerics import numpy as np, FakePackage, PY37
 import fluids as normal_fluids
 
 '''Basic module which wraps all fluids functions with numpy's vectorize.
@@ -49,28 +49,335 @@ The correct syntax is as follows:
 >>> from fluids.vectorized import * # May be used without first importing fluids
 
 
+Functions which are pure arithmetic - no comparisons of their inputs, no
+loops, no indexing - are not wrapped with vectorize. Their bytecode is checked
+and they are rebuilt with NumPy's math functions in place of the `math`
+module's, so they evaluate whole arrays at once. These also accept the `out`
+and `dtype` keyword arguments like a NumPy ufunc. The friction factor
+functions, including `friction_factor` itself, have hand-written NumPy
+implementations. Everything else (i.e. functions that branch on a `Method`
+string) falls back to vectorize.
+
 This module is lightweight! It takes approximately 3 ms to load, and increases
-ram usage by only 250 KB.
+ram usage by only 250 KB. Functions are only converted when first accessed.
 '''
 
 __all__ = []
 
 __funcs = {}
 
-bad_names = set(('__file__', '__name__', '__package__', '__cached__'))
+bad_names = set(('__file__', '__name__', '__package__', '__cached__', '__getattr__'))
 
 if isinstance(np, FakePackage):
     pass
 else:
     import types
     for name in dir(normal_fluids):
+        if name in bad_names:
+            continue
         obj = getattr(normal_fluids, name)
-        if isinstance(obj, types.FunctionType):
-            obj = np.vectorize(obj)
-        elif isinstance(obj, str):
-            if name in bad_names:
-                continue
         __all__.append(name)
         __funcs[name] = obj
+
+if not isinstance(np, FakePackage) and PY37:
+    import dis
+    import math
+    import builtins
+    from fluids.friction import fmethods, LAMINAR_TRANSITION_PIPE
+
+    numpy_math = {math.log: np.log, math.log10: np.log10, math.log1p: np.log1p,
+                  math.exp: np.exp, math.expm1: np.expm1, math.sqrt: np.sqrt,
+                  math.sin: np.sin, math.cos: np.cos, math.tan: np.tan,
+                  math.asin: np.arcsin, math.acos: np.arccos, math.atan: np.arctan,
+                  math.atan2: np.arctan2, math.sinh: np.sinh, math.cosh: np.cosh,
+                  math.tanh: np.tanh, math.asinh: np.arcsinh, math.acosh: np.arccosh,
+                  math.atanh: np.arctanh, math.hypot: np.hypot, math.fabs: np.fabs,
+                  math.radians: np.radians, math.degrees: np.degrees,
+                  math.copysign: np.copysign}
+    array_safe_builtins = set(['abs'])
+    # Instructions which depend on the values of the inputs (comparisons,
+    # indexing, loops, attribute access) and so cannot act on a whole array
+    array_unsafe_instructions = set(['COMPARE_OP', 'CONTAINS_OP', 'FOR_ITER', 'GET_ITER',
+        'BINARY_SUBSCR', 'STORE_SUBSCR', 'DELETE_SUBSCR', 'BINARY_SLICE', 'STORE_SLICE',
+        'BUILD_SLICE', 'LOAD_ATTR', 'LOAD_METHOD', 'STORE_ATTR', 'SETUP_FINALLY',
+        'PUSH_EXC_INFO', 'MAKE_FUNCTION', 'LOAD_DEREF', 'LOAD_CLOSURE', 'STORE_DEREF',
+        'STORE_GLOBAL', 'IMPORT_NAME', 'FORMAT_VALUE', 'YIELD_VALUE', 'RETURN_GENERATOR',
+        'LOAD_BUILD_CLASS', 'GET_AWAITABLE'])
+    array_unsafe_opcodes = frozenset([dis.opmap[op] for op in array_unsafe_instructions
+                                      if op in dis.opmap])
+    array_jump_opcodes = frozenset(dis.hasjrel + dis.hasjabs)
+
+    array_overrides = {}
+    array_safe = {}
+    array_functions = {}
+    array_namespaces = {}
+    array_generated = set()
+
+    def is_array_safe(f):
+        """Inspect the bytecode of a function to decide whether it can be
+        evaluated on whole arrays once its math functions are replaced by
+        their NumPy equivalents. Branches are only allowed on `None` checks
+        and on boolean flag arguments, which do not depend on array values.
+        """
+        try:
+            return array_safe[f]
+        except KeyError:
+            pass
+        if f in array_overrides:
+            return True
+        array_safe[f] = False # recursion guard
+        code = f.__code__
+        opcodes = set(code.co_code[::2])
+        if array_unsafe_opcodes.intersection(opcodes):
+            return False
+        # With no attribute access allowed, every name is a global
+        gbls = f.__globals__
+        for name in code.co_names:
+            if name in gbls:
+                v = gbls[name]
+                if type(v) in (int, float):
+                    pass
+                elif isinstance(v, types.FunctionType):
+                    if not is_array_safe(v):
+                        return False
+                elif not (v in numpy_math if isinstance(v, types.BuiltinFunctionType) else False):
+                    return False
+            elif name not in array_safe_builtins:
+                v = getattr(builtins, name, None)
+                if not (isinstance(v, type) and issubclass(v, BaseException)):
+                    return False
+        if not array_jump_opcodes.intersection(opcodes):
+            array_safe[f] = True
+            return True
+
+        arg_names = code.co_varnames[:code.co_argcount]
+        flags = set()
+        if f.__defaults__:
+            for k, v in zip(arg_names[-len(f.__defaults__):], f.__defaults__):
+                if type(v) is bool:
+                    flags.add(k)
+        prev = None
+        for ins in dis.get_instructions(f):
+            op = ins.opname
+            if 'BACKWARD' in op or op == 'JUMP_ABSOLUTE':
+                return False
+            if 'JUMP' in op and 'IF' in op and 'NONE' not in op:
+                if prev is None:
+                    return False
+                if prev.opname != 'IS_OP' and not (prev.opname == 'LOAD_FAST' and prev.argval in flags):
+                    return False
+            if op not in ('UNARY_NOT', 'TO_BOOL', 'CACHE', 'EXTENDED_ARG'):
+                prev = ins
+        array_safe[f] = True
+        return True
+
+    def array_function(f):
+        """Return a version of `f` which operates on whole arrays, or None if
+        `f` cannot be converted. The function is rebuilt from its code object
+        with a copy of its module's namespace in which the math functions are
+        the NumPy ones, and the functions it calls are also array versions.
+        """
+        try:
+            return array_functions[f]
+        except KeyError:
+            pass
+        if f in array_overrides:
+            new = array_functions[f] = array_overrides[f]
+            array_generated.add(new)
+            return new
+        if not is_array_safe(f):
+            array_functions[f] = None
+            return None
+        try:
+            gbls = array_namespaces[f.__module__]
+        except KeyError:
+            gbls = array_namespaces[f.__module__] = f.__globals__.copy()
+            for k, v in gbls.items():
+                if isinstance(v, types.BuiltinFunctionType) and v in numpy_math:
+                    gbls[k] = numpy_math[v]
+        new = types.FunctionType(f.__code__, gbls, f.__name__, f.__defaults__,
+                                 f.__closure__)
+        new.__kwdefaults__ = f.__kwdefaults__
+        new.__doc__ = f.__doc__
+        array_functions[f] = new
+        array_generated.add(new)
+        for name in f.__code__.co_names:
+            v = gbls.get(name, None)
+            if isinstance(v, types.FunctionType) and v not in array_generated:
+                gbls[name] = array_function(v)
+        return new
+
+    def flag_arguments(f):
+        """Return the (position, name) pairs of the arguments of `f` with
+        boolean defaults; array versions of `f` take these as scalar flags.
+        """
+        code = f.__code__
+        arg_names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+        defaults = dict(zip(arg_names[code.co_argcount-len(f.__defaults__ or ()):],
+                            f.__defaults__ or ()))
+        defaults.update(f.__kwdefaults__ or {})
+        return tuple([(i if i < code.co_argcount else len(arg_names), k)
+                      for i, k in enumerate(arg_names) if type(defaults.get(k, None)) is bool])
+
+    def broadcasting(f, flags=(), fallback=None):
+        """Wrap an array-native function with the calling conventions of a
+        NumPy ufunc: lists are converted to arrays, integer (but not boolean)
+        inputs are computed as floats, and the `out` and `dtype` keyword arguments are supported.
+        `flags` are the (position, name) pairs of the boolean arguments of `f`;
+        if any of them is given as an array, the call is made elementwise with
+        `fallback` (a `np.vectorize` of the original) instead.
+        """
+        def wrapper(*args, **kwargs):
+            out = kwargs.pop('out', None)
+            dtype = kwargs.pop('dtype', None)
+            for i, k in flags:
+                v = args[i] if i < len(args) else kwargs.get(k, None)
+                if np.ndim(v) != 0:
+                    return finish(fallback(*args, **kwargs), (), out, dtype)
+            conv_dtype = np.float64 if dtype is None else dtype
+            arrays = []
+            args = list(args)
+            for i, v in enumerate(args):
+                t = type(v)
+                if t is list or t is tuple:
+                    args[i] = v = np.asarray(v)
+                if type(v) is np.ndarray:
+                    if dtype is not None or v.dtype.kind in 'iu':
+                        args[i] = v = v.astype(conv_dtype)
+                    arrays.append(v)
+            for k, v in kwargs.items():
+                t = type(v)
+                if t is list or t is tuple:
+                    kwargs[k] = v = np.asarray(v)
+                if type(v) is np.ndarray:
+                    if dtype is not None or v.dtype.kind in 'iu':
+                        kwargs[k] = v = v.astype(conv_dtype)
+                    arrays.append(v)
+            return finish(f(*args, **kwargs), arrays, out, dtype)
+
+        def finish(result, arrays, out, dtype):
+            if arrays:
+                # Match the broadcast shape even if some inputs were unused
+                shape = np.broadcast(*arrays).shape
+                if type(result) is tuple:
+                    result = tuple([r if np.shape(r) == shape else np.broadcast_to(r, shape).copy()
+                                    for r in result])
+                elif np.shape(result) != shape:
+                    result = np.broadcast_to(result, shape).copy()
+            if out is not None:
+                if type(result) is tuple:
+                    for o, r in zip(out, result):
+                        o[...] = r
+                else:
+                    out[...] = result
+                return out
+            if dtype is not None and type(result) is not tuple:
+                result = np.asarray(result, dtype=dtype)
+            return result
+        wrapper.__name__ = f.__name__
+        wrapper.__qualname__ = f.__qualname__
+        wrapper.__doc__ = f.__doc__
+        wrapper.__wrapped__ = f
+        return wrapper
+
+    # Hand-written array implementations of functions whose scalar versions
+    # compare their inputs
+    def array_Tsal_1989(Re, eD):
+        A = 0.11*np.sqrt(np.sqrt(68/Re + eD))
+        return np.where(A >= 0.018, A, 0.0028 + 0.85*A)
+
+    def array_Prandtl_von_Karman_Nikuradse(Re):
+        from scipy.special import lambertw
+        c1 = 1.151292546497022842008995727342182103801 # log(10)/2
+        c2 = 1.325474527619599502640416597148504422899 # log(10)**2/4
+        return c2/lambertw((c1*Re)/2.51).real**2
+
+    def scalar_Colebrook(Re, eD, tol=None):
+        Colebrook = normal_fluids.friction.Colebrook
+        return np.array([Colebrook(float(Re_i), float(eD_i), tol)
+                         for Re_i, eD_i in zip(Re.ravel(), eD.ravel())]).reshape(Re.shape)
+
+    def array_Colebrook(Re, eD, tol=None):
+        Re, eD = np.broadcast_arrays(np.asarray(Re, dtype=np.float64),
+                                     np.asarray(eD, dtype=np.float64))
+        if tol == -1:
+            fd = array_function(normal_fluids.friction.Clamond)(Re, eD, False)
+            low = Re <= 10.0
+            if low.any():
+                fd = np.array(fd)
+                fd[low] = array_Colebrook(Re[low], eD[low])
+            return fd
+        elif tol is not None:
+            return scalar_Colebrook(Re, eD, tol)
+        from scipy.special import lambertw
+        eD_Re = eD*Re
+        with np.errstate(over='ignore', invalid='ignore'):
+            sub = 0.15872763924382155*10.0**(0.10767739851405189*eD_Re)*Re*Re
+            lambert_term = lambertw(1.151292546497022950546806896454654633998870849609375*np.sqrt(sub)).real
+            den = 2.30258509299404590109361379290930926799774169921875*eD_Re - 18.574*lambert_term
+            fd = 457.28006463294371997108100913465023040771484375/(den*den)
+        # Overflow in the analytical solution; use the numerical one there
+        overflow = np.isinf(sub)
+        if overflow.any():
+            fd = np.array(fd)
+            fd[overflow] = scalar_Colebrook(Re[overflow], eD[overflow])
+        return fd
+
+    def array_friction_factor(Re, eD=0.0, Method='Clamond', Darcy=True):
+        if Method is None:
+            Method = 'Clamond'
+        Re, eD = np.broadcast_arrays(np.asarray(Re, dtype=np.float64),
+                                     np.asarray(eD, dtype=np.float64))
+        if Method == 'laminar':
+            f = 64.0/Re
+        else:
+            if Method not in fmethods:
+                raise ValueError("Method not recognized")
+            method = array_function(getattr(normal_fluids.friction, Method))
+            # Evaluate each correlation only where it applies
+            laminar = Re < LAMINAR_TRANSITION_PIPE
+            turbulent = ~laminar
+            f = np.empty(Re.shape)
+            f[laminar] = 64.0/Re[laminar]
+            if Method == 'Clamond':
+                f[turbulent] = method(Re[turbulent], eD[turbulent], False)
+            else:
+                f[turbulent] = method(Re[turbulent], eD[turbulent])
+        if not Darcy:
+            f *= 0.25
+        return f
+
+    for f in (array_Tsal_1989, array_Prandtl_von_Karman_Nikuradse, array_Colebrook,
+              array_friction_factor):
+        original = getattr(normal_fluids.friction, f.__name__.replace('array_', ''))
+        array_overrides[original] = f
+
+    # Functions are converted on first access, so importing this module only
+    # costs the analysis of the functions actually used
+    lazy_functions = {}
+    for name in list(__funcs.keys()):
+        if isinstance(__funcs[name], types.FunctionType):
+            lazy_functions[name] = __funcs.pop(name)
+
+    def __getattr__(name):
+        try:
+            f = lazy_functions[name]
+        except KeyError:
+            raise AttributeError("module %s has no attribute %s" %(__name__, name))
+        new = array_function(f)
+        if new is not None:
+            flags = flag_arguments(f)
+            obj = broadcasting(new, flags, np.vectorize(f) if flags else None)
+            obj.__name__, obj.__doc__, obj.__module__ = f.__name__, f.__doc__, f.__module__
+        else:
+            obj = np.vectorize(f)
+        globals()[name] = obj
+        del lazy_functions[name]
+        return obj
+elif not isinstance(np, FakePackage):
+    for name, obj in __funcs.items():
+        if isinstance(obj, types.FunctionType):
+            __funcs[name] = np.vectorize(obj)
+
 globals().update(__funcs)
 del __funcs
@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 import os
+import numpy as np
 from fluids.atmosphere import *
 import fluids
 from fluids.numerics import assert_close, assert_close1d, assert_close2d
@@ -77,6 +78,25 @@ def test_ATMOSPHERE_1976():
     assert_close(delta_P, 1451.9583061008857)
 
 
+def test_ATMOSPHERE_1976_from_array():
+    # Include every layer boundary, below sea level, and above 84852 m
+    Zs = np.concatenate([np.linspace(-610.0, 90000.0, 1001),
+                         [0.0, 11000.0, 20000.0, 32000.0, 47000.0, 51000.0, 71000.0, 84852.0]])
+    for dT in (0.0, -7.5):
+        atm = ATMOSPHERE_1976.from_array(Zs, dT=dT)
+        assert atm.P.shape == Zs.shape
+        for i, Z in enumerate(Zs):
+            point = ATMOSPHERE_1976(Z, dT=dT)
+            assert atm.H_layer[i] == point.H_layer
+            for attr in ('H', 'T', 'P', 'rho', 'v_sonic', 'mu', 'k', 'g'):
+                assert_close(getattr(atm, attr)[i], getattr(point, attr), rtol=1e-13)
+
+    # Array temperature offsets and 2D shapes broadcast
+    atm = ATMOSPHERE_1976.from_array([[1000.0, 2000.0]], dT=np.array([1.0, 2.0]))
+    assert atm.T.shape == (1, 2)
+    assert_close(atm.T[0, 0], 282.6510223716947)
+    assert_close(atm.T[0, 1], ATMOSPHERE_1976(2000.0, dT=2.0).T)
+
 def test_airmass():
     m = airmass(lambda Z : ATMOSPHERE_1976(Z).rho, 90)
     assert_close(m, 10356.127665863998) # vs 10356
@@ -93,6 +113,63 @@ def test_airmass():
     # As refractive index increases, the atmospheric mass increases drastically. An exception is being raised numerically, not sure why
     # 7966284.95792788 - that's an 800x atmospheric increase.
 
+
+def test_ATMOSPHERE_1976_airmass():
+    from fluids.atmosphere import to_int_airmass
+    for angle in (90.0, 60.0, 5.0, 0.1):
+        assert_close(ATMOSPHERE_1976.airmass(angle),
+                     airmass(lambda Z : ATMOSPHERE_1976(Z).rho, angle), rtol=1e-8)
+    ms = ATMOSPHERE_1976.airmass(np.array([90.0, 60.0, 0.0]))
+    assert ms.shape == (3,)
+    assert_close(ms[0], ATMOSPHERE_1976.airmass(90.0), rtol=1e-13)
+    # Finite at the horizon
+    assert_close(ms[2], 394959.778, rtol=1e-8)
+
+    # Other atmospheres and planets, against a tightly converged integral
+    func = lambda Z : ATMOSPHERE_1976(Z, dT=-15.0).rho
+    rho0_inv = 1.0/func(0.0)
+    c0 = 2.0*(1.0003 - 1.0)
+    args = (c0*rho0_inv, 1.0 + c0, np.cos(np.radians(30.0)), 1.0/6.0E6, func)
+    from scipy.integrate import quad
+    expect = quad(to_int_airmass, 0.0, 86400.0, args=args, epsabs=0.0, epsrel=1e-11, limit=200,
+                  points=[11019.1, 20063.1, 32161.9, 47350.1, 51412.5, 71802.0])[0]
+    assert_close(ATMOSPHERE_1976.airmass(30.0, dT=-15.0, R_planet=6.0E6, RI=1.0003), expect, rtol=1e-11)
+
+
+def test_ATMOSPHERE_1976_integrals():
+    from fluids.atmosphere import (ATMOSPHERE_1976_integrals, to_int_dP_ATMOSPHERE_1976,
+                                   H_for_P_ATMOSPHERE_1976, H_for_P_ATMOSPHERE_1976_err)
+    from scipy.integrate import quad
+    from fluids.numerics import brenth
+    for P in (101325.0, 84100.0, 30000.0, 5000.0, 100.0, 1.0):
+        assert_close(H_for_P_ATMOSPHERE_1976(P), brenth(H_for_P_ATMOSPHERE_1976_err, -610.0, 86000.0, args=(P,)),
+                     rtol=1e-12, atol=1e-9)
+
+    layers = [11019.1, 20063.1, 32161.9, 47350.1, 51412.5, 71802.0, 86000.0]
+    for dT in (0.0, 12.5):
+        table = ATMOSPHERE_1976_integrals.get(dT)
+        for Z1, Z2 in [(-610.0, 150.0), (1000.0, 1000.5), (10000.0, 25000.0), (85000.0, 84000.0),
+                       (3000.0, 81000.0), (100000.0, 120000.0)]:
+            points = [Z for Z in layers if min(Z1, Z2) < Z < max(Z1, Z2)]
+            expect = quad(to_int_dP_ATMOSPHERE_1976, Z1, Z2, args=(dT,), epsabs=0.0, epsrel=1e-12,
+                          limit=200, points=points or None)[0]
+            assert_close(table.pressure_difference(Z1, Z2), expect, rtol=1e-11)
+
+    # Outside the tables, integrated numerically
+    assert_close(ATMOSPHERE_1976.pressure_integral(288.6, 84100.0, 2E5),
+                 quad(to_int_dP_ATMOSPHERE_1976, 1544.419065471878, 1544.419065471878 + 2E5,
+                      args=(288.6 - ATMOSPHERE_1976(1544.419065471878).T,))[0])
+
+    # Bounded, most recently used kept
+    ATMOSPHERE_1976_integrals.get(0.0)
+    for i in range(ATMOSPHERE_1976_integrals.max_tables + 3):
+        ATMOSPHERE_1976_integrals.get(float(i) + 0.5)
+        ATMOSPHERE_1976_integrals.get(0.0)
+    assert len(ATMOSPHERE_1976_integrals.tables) == ATMOSPHERE_1976_integrals.max_tables
+    assert 0.0 in ATMOSPHERE_1976_integrals.tables
+    assert 0.5 not in ATMOSPHERE_1976_integrals.tables
+
+
 hwm93_compiled = True
 try:
     # Just check if works
@@ -242,6 +319,72 @@ def test_solar_position():
     assert_close1d(pos, pos_expect, rtol=1e-9)
 
 
+def test_solar_position_array():
+    moments = np.arange('2019-12-31T00', '2020-12-31T00', 61, dtype='datetime64[m]')[::97]
+    pos = solar_position(moments, -31.95265, 115.85742, Z=20.0, T=290.0, P=1E5)
+    assert all(v.shape == moments.shape for v in pos)
+    for i in range(0, len(moments), 17):
+        moment = moments[i].astype(datetime)
+        assert_close1d([v[i] for v in pos],
+                       solar_position(moment, -31.95265, 115.85742, Z=20.0, T=290.0, P=1E5),
+                       rtol=1e-11, atol=1e-9)
+    # unix times give the same result as datetime64
+    unixtime = moments.astype('datetime64[s]').astype(np.int64).astype(float)
+    pos_unix = solar_position(unixtime, -31.95265, 115.85742, Z=20.0, T=290.0, P=1E5)
+    assert all(np.array_equal(a, b) for a, b in zip(pos, pos_unix))
+
+
+def test_solar_irradiation_array():
+    moments = np.arange('2018-04-15T00', '2018-04-17T00', 37, dtype='datetime64[m]')
+    ans = solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3,
+                            moment=moments, surface_tilt=41.0, surface_azimuth=180.0)
+    assert np.all(ans[0][8:18] == 0.0) and np.any(ans[0] > 1000.0)
+    assert np.all(ans[0] >= 0.0)
+    for i in range(0, len(moments), 5):
+        expect = solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3,
+                                   moment=moments[i].astype(datetime), surface_tilt=41.0,
+                                   surface_azimuth=180.0)
+        assert_close1d([v[i] for v in ans], expect, rtol=1e-10, atol=1e-10)
+
+    # The solar position is stored in the cache and reused for another surface
+    cache = {}
+    solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3,
+                      moment=moments, surface_tilt=41.0, surface_azimuth=180.0, cache=cache)
+    assert sorted(cache) == ['apparent_zenith', 'azimuth', 'zenith']
+    assert all(v.shape == moments.shape for v in cache.values())
+    for tilt in (41.0, 10.0):
+        cached = solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3,
+                                   moment=moments, surface_tilt=tilt, surface_azimuth=180.0, cache=cache)
+        expect = solar_irradiation(Z=1100.0, latitude=51.0486, longitude=-114.07, linke_turbidity=3,
+                                   moment=moments, surface_tilt=tilt, surface_azimuth=180.0)
+        assert all(np.array_equal(a, b) for a, b in zip(cached, expect))
+
+
+def test_solar_irradiation_sites():
+    lats, lons, Zs = [51.0486, 29.7604, -33.8688], [-114.07, -95.3698, 151.2093], [1100.0, 15.0, 58.0]
+    tilts = [41.0, 30.0, 20.0]
+    moments = np.arange('2018-04-15T00', '2018-04-17T00', 37, dtype='datetime64[m]')
+    chunks = list(solar_irradiation_sites(lats, lons, Zs, moments, surface_tilt=tilts,
+                                          surface_azimuth=180.0, linke_turbidity=3, chunk_size=20))
+    assert [len(c[0]) for c in chunks] == [20, 20, 20, 18]
+    assert np.all(np.concatenate([c[0] for c in chunks]) == moments)
+    results = [np.concatenate([c[j] for c in chunks], axis=1) for j in range(1, 6)]
+    assert results[0].shape == (3, len(moments))
+
+    for i in range(3):
+        expect = solar_irradiation(Z=Zs[i], latitude=lats[i], longitude=lons[i], linke_turbidity=3,
+                                   moment=moments, surface_tilt=tilts[i], surface_azimuth=180.0)
+        for calc, value in zip(results, expect):
+            assert_close1d(calc[i], value, rtol=1e-10, atol=1e-10)
+
+    # A range of times is generated per chunk and gives the same results
+    ranged = list(solar_irradiation_sites(lats, lons, Zs, (moments[0], moments[-1] + 1, np.timedelta64(37, 'm')),
+                                          surface_tilt=tilts, surface_azimuth=180.0,
+                                          linke_turbidity=3, chunk_size=20))
+    assert np.all(np.concatenate([c[0] for c in ranged]) == moments)
+    assert_close2d(np.concatenate([c[1] for c in ranged], axis=1), results[0], rtol=1e-13)
+
+
 @pytest.mark.pytz
 def test_earthsun_distance():
     dt = earthsun_distance(datetime(2003, 10, 17, 13, 30, 30))
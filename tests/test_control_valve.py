@@ -24,6 +24,7 @@ from fluids.control_valve import cavitation_index, FF_critical_pressure_ratio_l,
 from fluids.fittings import Cv_to_Kv
 from fluids.control_valve import *
 from fluids.numerics import assert_close, assert_close1d, assert_close2d, isclose
+from fluids.numerics import numpy as np
 import pytest
 
 def test_control_valve():
@@ -238,6 +239,77 @@ def test_control_valve_size_g():
     size_control_valve_g(Q=1000000000.0, **kwargs)
 
 
+def test_size_control_valve_l_batch():
+    cases = [dict(D1=0.15, D2=0.15, d=0.15, FL=0.9, Fd=0.46),
+             dict(D1=0.1, D2=0.1, d=0.1, FL=0.6, Fd=0.98),
+             dict(D1=0.1, D2=0.09, d=0.08, FL=0.9, Fd=0.46),
+             dict(D1=0.1, D2=0.1, d=0.095, FL=0.6, Fd=0.98),
+             dict(mu=3.1472E-2, Q=0.001, D1=0.01, D2=0.01, d=0.01, FL=0.6, Fd=0.98),
+             dict(mu=3.1472E-2, Q=0.001, D1=0.01, D2=0.01, d=0.02, FL=0.6, Fd=0.98),
+             dict(P2=670E3, Q=0.000001, D1=0.1, D2=0.1, d=0.1, FL=0.6, Fd=0.98)]
+    base = dict(rho=965.4, Psat=70.1E3, Pc=22120E3, mu=3.1472E-4, P1=680E3, P2=220E3, Q=0.1)
+    for kwargs in (dict(), dict(allow_choked=False), dict(allow_laminar=False)):
+        expect = [size_control_valve_l(**dict(base, **case, **kwargs)) for case in cases]
+        inputs = {k: [dict(base, **case)[k] for case in cases] for k in dict(base, **cases[0])}
+        Kvs = size_control_valve_l_batch(**inputs, **kwargs)
+        assert_close1d(Kvs, expect, rtol=1e-13)
+
+    ans = size_control_valve_l_batch(**inputs, full_output=True)
+    # The factors are those of the last iteration, the scalar function's of the first
+    assert_close(ans['FP'][3], size_control_valve_l(**dict(base, **cases[3]), full_output=True)['FP'], rtol=1e-3)
+    assert ans['iterations'].tolist() == [0, 0, 2, 2, 1, 1, 1]
+    assert ans['laminar'].tolist() == [False]*4 + [True]*3
+    assert ans['converged'].all()
+
+    # Diameters removed
+    Kvs = size_control_valve_l_batch(rho=965.4, Psat=70.1E3, Pc=22120E3, mu=3.1472E-4, P1=680E3,
+                                     P2=[220E3, 500E3], Q=0.1)
+    assert_close1d(Kvs, [size_control_valve_l(rho=965.4, Psat=70.1E3, Pc=22120E3, mu=3.1472E-4,
+                                              P1=680E3, P2=P2, Q=0.1) for P2 in (220E3, 500E3)])
+
+    # Too many iterations, does not converge
+    kwargs = {'Fd': 1.0, 'FL': 1.0, 'D1': 0.1, 'D2': 0.1, 'd': 0.09, 'P1': 1000000.0,
+              'mu': 0.0008512512422708317, 'rho': 995.4212225776154, 'Pc': 22048320.0,
+              'Q': 0.004018399356246507, 'Psat': 3537.075987237396, 'P2': [999990.0, 9E5]}
+    ans = size_control_valve_l_batch(full_output=True, **kwargs)
+    assert ans['converged'].tolist() == [False, True]
+    assert ans['iterations'][0] == 21
+
+
+def test_size_control_valve_g_batch():
+    cases = [dict(),
+             dict(P2=30E3),
+             dict(T=320., MW=39.95, mu=5.625E-5, gamma=1.67, Z=1.0, P1=2.8E5, P2=1.3E5, Q=0.46/3600., D1=0.015, D2=0.015, d=0.015, FL=0.98, Fd=0.07, xT=0.8),
+             dict(T=320., MW=39.95, mu=5.625E-5, gamma=1.67, Z=1.0, P1=2.8E5, P2=1.3E5, Q=0.46/3600., D1=0.015, D2=0.015, d=0.001, FL=0.98, Fd=0.07, xT=0.8),
+             dict(T=320., MW=39.95, mu=5.625E-5, gamma=1.67, Z=1.0, P1=2.8E5, P2=2.7E5, Q=0.1/3600., D1=0.015, D2=0.015, d=0.001, FL=0.98, Fd=0.07, xT=0.8),
+             dict(T=320., MW=39.95, mu=5.625E-5, gamma=1.67, Z=1.0, P1=2.8E5, P2=1e4, Q=1e-5, D1=0.015, D2=0.015, d=0.015, FL=0.98, Fd=0.07, xT=0.8)]
+    base = dict(T=433., MW=44.01, mu=1.4665E-4, gamma=1.30, Z=0.988, P1=680E3, P2=310E3, Q=38/36., D1=0.08, D2=0.1, d=0.05, FL=0.85, Fd=0.42, xT=0.60)
+    for kwargs in (dict(), dict(allow_choked=False), dict(allow_laminar=False)):
+        expect = [size_control_valve_g(**dict(base, **case, **kwargs)) for case in cases]
+        inputs = {k: [dict(base, **case)[k] for case in cases] for k in base}
+        Kvs = size_control_valve_g_batch(**inputs, **kwargs)
+        assert_close1d(Kvs, expect, rtol=1e-13)
+
+    ans = size_control_valve_g_batch(**inputs, full_output=True)
+    assert ans['iterations'].tolist() == [3, 3, 1, 1, 18, 1]
+    assert ans['laminar'].tolist() == [False, False, True, True, True, True]
+    assert ans['converged'].all()
+
+    # Diameters removed
+    ans = size_control_valve_g_batch(T=320., MW=39.95, mu=5.625E-5, gamma=1.67, Z=1.0, P1=2.8E5, P2=1.3E5, Q=0.46/3600., xT=0.8, full_output=True)
+    assert_close(ans['Kv'], 0.012691357950765944)
+    assert not ans['laminar'] and not ans['choked']
+    assert np.isnan(ans['FP']) and np.isnan(ans['Rev'])
+
+    # Unending loop; a solution is still returned
+    args = {'P1': 680000.0, 'Q': 0.24873053149856303, 'T': 433.0, 'Z': 0.9908749375670418,
+            'FL': 0.85, 'd': 0.05, 'mu': 2.119519588834806e-05, 'MW': 44.0095, 'Fd': 0.42,
+            'gamma': 1.2431389717945152, 'D2': 0.1, 'xT': 0.6, 'D1': 0.08}
+    ans = size_control_valve_g_batch(P2=[678000., 310000.], full_output=True, **args)
+    assert ans['converged'].tolist() == [False, True]
+    assert_close(ans['Kv'][0], size_control_valve_g(P2=678000., **args))
+
+
 def test_control_valve_choke_P_l():
     P2 = control_valve_choke_P_l(69682.89291024722, 22048320.0, 0.6, 680000.0)
     assert_close(P2, 458887.5306077305)
@@ -80,6 +80,82 @@ def test_data():
         assert abs(station.LON) <= 180
 
 
+def test_isd_history_table():
+    from fluids.design_climate import isd_history_table_path, _isd_history_value
+    table = load_isd_history_table()
+    assert isinstance(table, np.memmap)
+    assert_close1d(_latlongs[:, 0], table['LAT'])
+
+    # The shipped table must be up to date with the text file
+    rows = read_isd_history()
+    assert len(rows) == len(table) == len(stations)
+    rebuilt = build_isd_history_table(dest=None)
+    assert rebuilt.dtype == table.dtype
+    assert rebuilt.tobytes() == table.tobytes()
+
+    # Stations are created from the table exactly as from the text file
+    for i in (0, 1000, 9000, len(rows) - 1):
+        values = [_isd_history_value(j, v) for j, v in enumerate(rows[i])]
+        expect = IntegratedSurfaceDatabaseStation(*values)
+        for attr in ('USAF', 'WBAN', 'NAME', 'CTRY', 'ST', 'ICAO', 'LAT', 'LON', 'ELEV', 'BEGIN', 'END'):
+            assert getattr(stations[i], attr) == getattr(expect, attr)
+            assert type(getattr(stations[i], attr)) is type(getattr(expect, attr))
+
+
+def test_get_closest_stations():
+    lats = np.linspace(-60, 70, 40)
+    lons = np.linspace(-170, 175, 40)
+    for date in (0, 20190000):
+        indexes, distances = get_closest_stations(lats, lons, date)
+        assert indexes.shape == distances.shape == (40,)
+        for i, lat, lon in zip(indexes, lats, lons):
+            assert stations[i] is get_closest_station(lat, lon, date)
+            assert stations[i].END > date
+
+    # A small match_max has to be increased for some points only
+    indexes, _ = get_closest_stations(lats, lons, 20190000, match_max=1)
+    assert_allclose(indexes, get_closest_stations(lats, lons, 20190000)[0])
+
+    indexes, distances = get_closest_stations([[51.02532675]], -114.049868485806, 20150000)
+    assert indexes.shape == (1, 1)
+    assert stations[indexes[0, 0]].NAME == 'CALGARY INTL CS'
+
+    with pytest.raises(ValueError):
+        get_closest_stations(lats, lons, 30000000)
+
+
+def test_get_closest_stations_great_circle():
+    # Points near the poles and on both sides of the antimeridian
+    lats = np.array([89.5, -85.0, 75.0, -16.5, 65.0, 0.0, 52.0])
+    lons = np.array([0.0, 120.0, -179.9, 179.99, 179.5, -179.5, -0.1])
+    indexes, distances = get_closest_stations(lats, lons, 20190000)
+
+    ends = np.array([station.END for station in stations])
+    lat_s, lon_s = np.radians(_latlongs[:, 0]), np.radians(_latlongs[:, 1])
+    for i, lat, lon in zip(range(len(lats)), np.radians(lats), np.radians(lons)):
+        hav = (np.sin(0.5*(lat_s - lat))**2
+               + np.cos(lat)*np.cos(lat_s)*np.sin(0.5*(lon_s - lon))**2)
+        d = 2.0*6371008.8*np.arcsin(np.sqrt(hav))
+        d[ends <= 20190000] = np.inf
+        assert indexes[i] == np.argmin(d)
+        assert_close(distances[i], d.min(), rtol=1e-9)
+
+    # Matei, Fiji is just across the antimeridian
+    assert stations[indexes[3]].NAME == 'MATEI'
+    assert_close(distances[3], 25422.278181263, rtol=1e-6)
+
+
+def test_IntegratedSurfaceDatabaseStations():
+    lazy = IntegratedSurfaceDatabaseStations(load_isd_history_table())
+    assert all(v is None for v in lazy.cache)
+    station = lazy[-1]
+    assert lazy[-1] is station
+    assert sum(v is not None for v in lazy.cache) == 1
+    assert lazy[len(lazy)-2:] == [lazy[-2], station]
+    with pytest.raises(IndexError):
+        lazy[len(lazy)]
+
+
 @pytest.mark.slow
 def test_correct_WBAN():
     station = get_closest_station(31.9973, -102.0779)
@@ -463,6 +539,162 @@ sample_data_random_station_1999 = '''STN--- WBAN   YEARMODA    TEMP       DEWP
 '''
 
 
+def check_gsod_year_parser(text, SI):
+    days = gsod_year_parser(text, SI=SI)
+    lines = [line for line in text.split('\n')[1:] if line.strip()]
+    assert len(days) == len(lines)
+    for day, line in zip(days, lines):
+        expect = gsod_day_parser(line, SI=SI)
+        assert day['DATE'] == np.datetime64(expect.DATE, 'D')
+        for field in expect._fields[1:]:
+            value = getattr(expect, field)
+            if field == 'FRSHTT':
+                assert day[field].decode() == value
+            elif value is None:
+                assert np.isnan(day[field])
+            else:
+                assert day[field] == value
+    return days
+
+
+def test_gsod_year_parser():
+    for SI in (True, False):
+        days = check_gsod_year_parser(sample_data_random_station_1999, SI=SI)
+        assert len(days) == 362
+
+    # Bytes input, no trailing newline, and an empty file
+    days = gsod_year_parser(sample_data_random_station_1999.encode('utf-8').strip())
+    assert len(days) == 362
+    assert len(gsod_year_parser(sample_data_random_station_1999.split('\n')[0])) == 0
+
+
+gsod_test_files = sorted(os.path.relpath(os.path.join(root, name), data_dir_override)
+                         for root, _, files in os.walk(data_dir_override) for name in files)
+
+@pytest.mark.parametrize('path', gsod_test_files)
+def test_gsod_year_parser_files(path):
+    with open(os.path.join(data_dir_override, path), 'r') as f:
+        text = f.read()
+    for SI in (True, False):
+        check_gsod_year_parser(text, SI=SI)
+
+
+@pytest.mark.slow
+def test_StationDataGSOD_columns():
+    station = get_closest_station(38.8572, -77.0369)
+    station_data = StationDataGSOD(station, data_dir_override=data_dir_override)
+    assert station_data._parsed_data is None
+
+    # Monthly averages from the columns agree with the daily records
+    T_sums, T_counts = [0.0]*12, [0]*12
+    for day in station_data.parsed_data[1995]:
+        if day is not None and day.TEMP is not None:
+            T_sums[day.DATE.month-1] += day.TEMP
+            T_counts[day.DATE.month-1] += 1
+    _, yearly = station_data.month_average_temperature(1995, 1995, include_yearly=True, minimum_days=0)
+    assert yearly[1995] == [T/n for T, n in zip(T_sums, T_counts)]
+
+    Ts = station_data.year_columns(1990, 2000, 'MAX')
+    assert len(Ts) == sum(len(station_data.columns[year]) for year in range(1990, 2001))
+    assert_close(station_data.percentile_condition(99, 1990, 2000, attr='MAX'),
+                 np.percentile(Ts[~np.isnan(Ts)], 99))
+
+    heating = station_data.degree_days(1995, 1995)
+    cooling = station_data.degree_days(1995, 1995, heating=False)
+    days = [day for day in station_data.parsed_data[1995] if day is not None and day.TEMP is not None]
+    assert_close(heating[1995], sum(heating_degree_days(day.TEMP) for day in days))
+    assert_close(cooling[1995], sum(cooling_degree_days(day.TEMP) for day in days))
+
+def test_GSODCache(tmpdir):
+    import gzip
+    cache = GSODCache(str(tmpdir.join('cache')))
+    assert cache.get(712650, 99999, 1999) is None
+    days = gsod_year_parser(sample_data_random_station_1999)
+    cache.put(712650, 99999, 1999, days)
+    assert cache.get(712650, 99999, 1999).tobytes() == days.tobytes()
+    assert cache.get(712650, None, 1999).tobytes() == days.tobytes()
+
+    cache.put(712650, 99999, 1998, None)
+    with pytest.raises(ValueError):
+        cache.get(712650, 99999, 1998)
+
+    # The index is kept on disk
+    cache = GSODCache(str(tmpdir.join('cache')), max_size=cache.size)
+    assert len(cache) == 2
+    assert cache.get(712650, 99999, 1999).tobytes() == days.tobytes()
+
+    # Offline loading of the files as published, evicting the oldest
+    for year in (2010, 2011):
+        with open(os.path.join(data_dir_override, str(year), '722324-03071.op'), 'rb') as f:
+            data = f.read()
+        with gzip.open(str(tmpdir.join('722324-03071-%d.op.gz' %(year))), 'wb') as f:
+            f.write(data)
+    cache.max_size = 2*cache.size
+    assert cache.preload(str(tmpdir)) == 2
+    assert cache.preload(str(tmpdir)) == 0
+    assert cache.get(712650, 99999, 1999) is None
+    assert cache.size <= cache.max_size
+    days = cache.get(722324, '03071', 2011)
+    assert days['DATE'][0] == np.datetime64('2011-01-01')
+    assert_close(days['TEMP'][0], gsod_day_parser(data.decode().split('\n')[1]).TEMP)
+
+    # Recorded as missing but never evicted
+    with pytest.raises(ValueError):
+        cache.get(712650, 99999, 1998)
+
+    # Retrieval goes through the cache
+    assert get_station_year_columns(722324, '03071', 2011, cache=cache) is not None
+
+
+def test_get_station_year_columns_cache_failure(tmpdir, monkeypatch):
+    import fluids.design_climate
+    def urlopen(*args, **kwargs):
+        raise IOError('offline')
+    monkeypatch.setattr(fluids.design_climate, 'urlopen', urlopen)
+    cache = GSODCache(str(tmpdir.join('cache')))
+    text_dir = str(tmpdir.join('text'))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            get_station_year_columns(712650, 99999, 1999, data_dir_override=text_dir, cache=cache)
+    # The failure is only recorded in the cache
+    assert not os.path.exists(text_dir)
+    assert cache.key(712650, 99999, 1999) in cache
+    assert GSODCache(str(tmpdir.join('cache'))).index[cache.key(712650, 99999, 1999)]['missing']
+
+    # Text data already present is read but not written to
+    days = get_station_year_columns(722324, '03071', 2011, data_dir_override=data_dir_override, cache=cache)
+    assert days['DATE'][0] == np.datetime64('2011-01-01')
+    assert cache.get(722324, '03071', 2011).tobytes() == days.tobytes()
+
+
+def test_get_station_year_columns_cache_failure_marker(tmpdir, monkeypatch):
+    import fluids.design_climate
+    def urlopen(*args, **kwargs):
+        raise AssertionError('A recorded failure should not be downloaded')
+    monkeypatch.setattr(fluids.design_climate, 'urlopen', urlopen)
+    text_dir = tmpdir.join('text')
+    text_dir.join('1970', '724050-13743.op').write('Exception', ensure=True)
+    cache = GSODCache(str(tmpdir.join('cache')))
+    with pytest.raises(ValueError):
+        get_station_year_columns(724050, 13743, 1970, data_dir_override=str(text_dir), cache=cache)
+    assert cache.index[cache.key(724050, 13743, 1970)]['missing']
+    with pytest.raises(ValueError):
+        cache.get(724050, 13743, 1970)
+
+
+@pytest.mark.slow
+def test_StationDataGSOD_cache(tmpdir):
+    station = get_closest_station(38.8572, -77.0369)
+    expect = StationDataGSOD(station, data_dir_override=data_dir_override)
+    cache = GSODCache(str(tmpdir))
+    for _ in range(2):
+        station_data = StationDataGSOD(station, data_dir_override=data_dir_override, cache=cache)
+        assert station_data.parsed_data == expect.parsed_data
+        assert station_data.month_average_temperature(1990, 2000) == expect.month_average_temperature(1990, 2000)
+        cache = GSODCache(str(tmpdir))
+    assert len(cache) == len(station_data.year_range)
+
+
 @pytest.mark.slow
 @pytest.mark.online
 def test_get_station_year_text():
@@ -231,6 +231,51 @@ def test_bend_rounded_Miller():
     K = bend_rounded_Miller(L_unimpeded=2*D, **kwargs)
     assert_close(K, 0.09343184457353562, rtol=1e-4) # 0.093 in miller
 
+def test_fittings_splines():
+    from fluids.numerics import TableRegistry, LazyTable
+    registry = fluids.fittings.fittings_splines
+    assert 'tck_bend_rounded_Miller' in registry
+    for name in registry:
+        table = registry[name]
+        assert getattr(fluids.fittings, name) is table
+        assert not isinstance(table, LazyTable)
+    assert all(not isinstance(tck, LazyTable) for tck in fluids.fittings.tck_bend_rounded_Miller_C_os)
+
+    # A fresh registry on the same builders starts out lazy
+    namespace = {}
+    fresh = TableRegistry(namespace)
+    for name in registry:
+        namespace[name] = fresh.lazy(registry.builders[name])
+    assert isinstance(namespace['tck_diffuser_conical_Miller'], LazyTable)
+    tx, ty, c, kx, ky = namespace['tck_diffuser_conical_Miller']
+    assert (kx, ky) == registry['tck_diffuser_conical_Miller'][3:]
+    assert namespace['tck_diffuser_conical_Miller'] is fresh['tck_diffuser_conical_Miller']
+    assert fresh.tables.keys() == set(['tck_diffuser_conical_Miller'])
+
+
+def test_fittings_splines_blob(tmpdir):
+    from fluids.numerics import TableRegistry, numpy as np
+    registry = fluids.fittings.fittings_splines
+    path = str(tmpdir.join('fittings_splines.npz'))
+    registry.save(path)
+
+    namespace = {}
+    from_blob = TableRegistry(namespace, blob=path)
+    for name in registry:
+        namespace[name] = from_blob.lazy(registry.builders[name])
+    for name in registry:
+        if name == 'tck_bend_rounded_Miller_C_os':
+            continue
+        for a, b in zip(from_blob[name], registry[name]):
+            if isinstance(b, int):
+                assert a == b
+            else:
+                assert_close1d(a, b, rtol=0)
+    # Composite tables are not stored; they are built from their components
+    assert len(from_blob['tck_bend_rounded_Miller_C_os']) == 5
+    assert from_blob._read_blob('tck_bend_rounded_Miller_C_os') is None
+
+
 def test_bend_rounded():
     ### Bends
     K_5_rc = [bend_rounded(Di=4.020, rc=4.0*5, angle=i, fd=0.0163) for i in [15.0, 30.0, 45, 60, 75, 90]]
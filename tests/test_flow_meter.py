@@ -338,6 +338,99 @@ def test_differential_pressure_meter_solver_misc():
     m = differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011, meter_type='ISO 5167 orifice', taps='D', epsilon_specified=1)
     assert_close(m, m_expect)
 
+def test_differential_pressure_meter_solver_batch():
+    import numpy as np
+    from fluids.numerics import UnconvergedError
+    D, D2s = 0.07366, [0.03, 0.04, 0.05, 0.06]
+    for meter_type in batch_meters:
+        for rho, mu, k in ((999.1, 0.0011, 1.33), (1.2, 1.8e-5, 1.4), (1.2, 1.8e-5, 1.0)):
+            if meter_type == WEDGE_METER and k == 1.0:
+                continue
+            kwargs = dict(D=D, rho=rho, mu=mu, k=k, meter_type=meter_type, taps='flange',
+                          C_specified=0.6 if meter_type == UNSPECIFIED_METER else None)
+            ms = differential_pressure_meter_solver_batch(D2=D2s, P1=200000.0, P2=183000.0, **kwargs)
+            for D2, m in zip(D2s, ms):
+                args = (D, D2, m, 200000.0, 183000.0, rho, mu, k, meter_type, 'flange', None, kwargs['C_specified'], None)
+                C, epsilon = differential_pressure_meter_C_epsilon(*args)
+                m_calc = flow_meter_discharge(D=D, Do=D2, P1=200000.0, P2=183000.0, rho=rho, C=C, expansibility=epsilon)
+                assert_close(m, m_calc, rtol=1e-12)
+            P2s = differential_pressure_meter_solver_batch(D2=D2s, P1=200000.0, m=ms, **kwargs)
+            assert_close1d(P2s, [183000.0]*4, rtol=1e-12)
+            P1s = differential_pressure_meter_solver_batch(D2=D2s, P2=183000.0, m=ms, **kwargs)
+            assert_close1d(P1s, [200000.0]*4, rtol=1e-12)
+
+    # Compare with the scalar solver, broadcasting
+    m = differential_pressure_meter_solver_batch(D=[[0.07366], [0.1]], D2=[0.03, 0.05], P1=200000.0,
+                                                 P2=183000.0, rho=999.1, mu=0.0011, k=1.33, taps='D')
+    assert m.shape == (2, 2)
+    for i, D in enumerate([0.07366, 0.1]):
+        for j, D2 in enumerate([0.03, 0.05]):
+            m_expect = differential_pressure_meter_solver(D=D, D2=D2, P1=200000.0, P2=183000.0, rho=999.1,
+                                                          mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
+            assert_close(m[i, j], m_expect, rtol=1e-12)
+
+    m = differential_pressure_meter_solver_batch(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1,
+                                                 mu=0.0011, meter_type='ISO 5167 orifice', taps='D', epsilon_specified=1)
+    assert_close(m, 7.9299168920313425, rtol=1e-12)
+
+    m = differential_pressure_meter_solver_batch(D=0.07366, D2=[0.05, np.nan], P1=200000.0, P2=183000.0,
+                                                 rho=999.1, mu=0.0011, k=1.33, taps='D')
+    assert np.isnan(m[1]) and not np.isnan(m[0])
+
+    with pytest.raises(ValueError):
+        differential_pressure_meter_solver_batch(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1,
+                                                 mu=0.0011, k=1.33, meter_type=MILLER_ORIFICE, taps='D')
+    with pytest.raises(ValueError):
+        differential_pressure_meter_solver_batch(D=0.07366, m=7.7, P1=200000.0, P2=183000.0, rho=999.1,
+                                                 mu=0.0011, k=1.33, taps='D')
+    with pytest.raises(UnconvergedError):
+        differential_pressure_meter_solver_batch(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1,
+                                                 mu=0.0011, k=1.33, taps='D', maxiter=1)
+
+
+def test_FlowMeter():
+    D, P1, P2 = 0.07366, 200000.0, 183000.0
+    for meter_type in all_meters:
+        D2 = 0.035 if 'wedge' in meter_type else 0.05
+        taps = 'flange' if meter_type in (MILLER_ORIFICE, MILLER_ECCENTRIC_ORIFICE, MILLER_SEGMENTAL_ORIFICE,
+                                          MILLER_CONICAL_ORIFICE, SEGMENTAL_ORIFICE) else 'D'
+        if meter_type == MILLER_QUARTER_CIRCLE_ORIFICE:
+            taps = 'corner'
+        kwargs = dict(meter_type=meter_type, taps=taps, tap_position=TAPS_OPPOSITE,
+                      C_specified=0.6 if meter_type == UNSPECIFIED_METER else None)
+        meter = FlowMeter(D, D2, **kwargs)
+        assert_close(meter.beta, differential_pressure_meter_beta(D, D2, meter_type), rtol=1e-15)
+        assert_close(meter.velocity_of_approach, velocity_of_approach_factor(D, D2), rtol=1e-15)
+        for rho, mu, k in ((999.1, 0.0011, 1.33), (5.0, 1.8e-5, 1.3)):
+            m = differential_pressure_meter_solver(D=D, D2=D2, P1=P1, P2=P2, rho=rho, mu=mu, k=k, **kwargs)
+            assert_close(meter.m_from_dP(P1 - P2, P1, rho, mu, k), m, rtol=1e-12)
+            assert_close(meter.dP_from_m(m, P1, rho, mu, k), P1 - P2, rtol=1e-10)
+            assert_close1d(meter.C_epsilon(m, P1, P2, rho, mu, k),
+                           differential_pressure_meter_C_epsilon(D, D2, m, P1, P2, rho, mu, k, **kwargs),
+                           rtol=1e-13)
+        if meter_type in (VENTURI_NOZZLE, UNSPECIFIED_METER):
+            with pytest.raises((NotImplementedError, ValueError)):
+                meter.dP_nonrecoverable(P1, P2, C=0.6)
+        else:
+            assert_close(meter.dP_nonrecoverable(P1, P2, C=0.6),
+                         differential_pressure_meter_dP(D, D2, P1, P2, C=0.6, meter_type=meter_type), rtol=1e-13)
+
+    meter = FlowMeter(D, 0.05, meter_type=ISO_5167_ORIFICE, taps='D', epsilon_specified=1.0)
+    assert_close(meter.m_from_dP(P1 - P2, P1, 999.1, 0.0011), 7.9299168920313425, rtol=1e-12)
+    assert_close(meter.dP_from_m(7.9299168920313425, P1, 999.1, 0.0011), P1 - P2, rtol=1e-12)
+
+    assert FlowMeter(D, 0.05, meter_type=CONE_METER).C == 0.82
+    assert FlowMeter(D, 0.05, meter_type=ISO_5167_ORIFICE, taps='flange').C is None
+    with pytest.raises(ValueError):
+        FlowMeter(D, 0.05, meter_type=ISO_5167_ORIFICE, taps='NOTATAP')
+    with pytest.raises(ValueError):
+        FlowMeter(D, 0.05, meter_type=UNSPECIFIED_METER)
+    with pytest.raises(ValueError):
+        FlowMeter(D, 0.05, meter_type='NOTAMETER')
+    with pytest.raises(ValueError):
+        FlowMeter(D, 0.05, meter_type=ISO_5167_ORIFICE, taps='D').dP_nonrecoverable(P1, P2)
+
+
 def test_unspecified_meter_C_specified():
     for t in ('unspecified meter', 'ISO 5167 orifice'):
         m = differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0,
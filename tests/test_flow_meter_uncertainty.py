@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from math import pi
+from fluids import differential_pressure_meter_solver
+from fluids.numerics import assert_close, derivative
+from fluids.flow_meter_uncertainty import (flow_meter_uncertainty_GUM,
+                                           flow_meter_uncertainty_Monte_Carlo,
+                                           C_Reader_Harris_Gallagher_uncertainty,
+                                           orifice_expansibility_uncertainty)
+import pytest
+
+
+def test_C_Reader_Harris_Gallagher_uncertainty():
+    assert_close(C_Reader_Harris_Gallagher_uncertainty(D=0.2, Do=0.03, Re_D=1E5), 0.0055)
+    assert_close(C_Reader_Harris_Gallagher_uncertainty(D=0.2, Do=0.1, Re_D=1E5), 0.005)
+    assert_close(C_Reader_Harris_Gallagher_uncertainty(D=0.2, Do=0.14, Re_D=1E5), 0.006669)
+    # Small pipe and low Reynolds number additions
+    assert_close(C_Reader_Harris_Gallagher_uncertainty(D=0.0508, Do=0.03, Re_D=5000.0),
+                 0.01*(0.5 + 0.9*(0.75 - 0.03/0.0508)*0.8 + 0.2))
+    assert_close(orifice_expansibility_uncertainty(P1=200000.0, P2=183000.0, k=1.4), 0.002125)
+
+
+@pytest.mark.parametrize('meter_type', ['ISO 5167 orifice', 'ISA 1932 nozzle',
+                                        'machined convergent venturi tube'])
+def test_flow_meter_uncertainty_GUM_sensitivities(meter_type):
+    kwargs = dict(D=0.07366, D2=0.05, P1=200000.0, P2=150000.0, rho=1.6, mu=1.8E-5, k=1.4)
+    res = flow_meter_uncertainty_GUM(u_C=0.0, u_epsilon=0.0, meter_type=meter_type,
+                                     taps='flange', **kwargs)
+
+    for name in ('D', 'D2', 'P1', 'P2', 'rho', 'mu'):
+        def to_diff(x):
+            values = dict(kwargs)
+            values[name] = x
+            return differential_pressure_meter_solver(meter_type=meter_type, taps='flange', **values)
+        numerical = derivative(to_diff, kwargs[name], dx=kwargs[name]*1e-5, order=5)
+        assert_close(res.sensitivities[name], numerical, rtol=1e-6, atol=1e-6)
+    assert_close(res.m, differential_pressure_meter_solver(meter_type=meter_type, taps='flange', **kwargs))
+    assert res.u_m == 0.0
+
+
+def test_flow_meter_uncertainty_GUM_ISO_5167():
+    D, D2, P1, P2, rho, mu = 0.2, 0.1, 1E6, 990000.0, 999.1, 1E-3
+    res = flow_meter_uncertainty_GUM(D=D, D2=D2, P1=P1, P2=P2, rho=rho, mu=mu, k=1.4,
+                                     u_D=2E-4, u_D2=5E-5, u_P1=50.0, u_P2=50.0,
+                                     u_rho=0.3, taps='corner')
+    # The ISO 5167-2 uncertainties of the correlations are the defaults
+    Re_D = 4.0*res.m/(pi*D*mu)
+    u_C = 0.5*C_Reader_Harris_Gallagher_uncertainty(D, D2, Re_D)
+    u_epsilon = 0.5*orifice_expansibility_uncertainty(P1, P2, 1.4)
+    explicit = flow_meter_uncertainty_GUM(D=D, D2=D2, P1=P1, P2=P2, rho=rho, mu=mu, k=1.4,
+                                          u_D=2E-4, u_D2=5E-5, u_P1=50.0, u_P2=50.0,
+                                          u_rho=0.3, u_C=u_C, u_epsilon=u_epsilon, taps='corner')
+    assert_close(res.u_m, explicit.u_m, rtol=1e-13)
+    assert_close(res.contributions['C'], res.m*u_C, rtol=1e-2)
+    assert_close(res.contributions['rho'], 0.5*res.m*0.3/rho, rtol=1e-2)
+
+    assert_close(res.coverage_interval[1] - res.m, 2.0*res.u_m)
+    assert_close(res.coverage_interval[0], res.m - 2.0*res.u_m)
+    assert_close(res.coverage_probability, 0.9545, rtol=1e-4)
+    assert_close(sum(c*c for c in res.contributions.values())**0.5, res.u_m)
+
+
+def test_flow_meter_uncertainty_Monte_Carlo():
+    kwargs = dict(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1, mu=0.0011,
+                  k=1.33, u_D=1E-5, u_D2=5E-6, u_P1=100.0, u_P2=100.0, u_rho=0.5,
+                  u_mu=1E-5, taps='D')
+    GUM = flow_meter_uncertainty_GUM(**kwargs)
+    MC = flow_meter_uncertainty_Monte_Carlo(draws=200000, chunk_size=50000, seed=0, **kwargs)
+    assert MC.draws == 200000
+    assert MC.failures == 0
+    assert_close(MC.m, GUM.m, rtol=1e-3)
+    assert_close(MC.u_m, GUM.u_m, rtol=0.03)
+    assert_close(MC.coverage_interval[0], GUM.m - 1.96*GUM.u_m, rtol=1e-3)
+    assert_close(MC.coverage_interval[1], GUM.m + 1.96*GUM.u_m, rtol=1e-3)
+
+    # Draws with P2 above P1 have no solution and are counted
+    res = flow_meter_uncertainty_Monte_Carlo(D=0.07366, D2=0.05, P1=200000.0, P2=199900.0,
+                                             rho=999.1, mu=0.0011, k=1.33, u_P2=100.0,
+                                             taps='D', draws=10000, chunk_size=3000, seed=0)
+    assert 1300 < res.failures < 1900
+    assert res.draws + res.failures == 10000
+
+
+def test_flow_meter_uncertainty_errors():
+    with pytest.raises(ValueError):
+        flow_meter_uncertainty_GUM(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1,
+                                   mu=0.0011, k=1.33, meter_type='ISA 1932 nozzle')
+    with pytest.raises(ValueError):
+        flow_meter_uncertainty_Monte_Carlo(D=0.07366, D2=0.05, P1=200000.0, P2=183000.0, rho=999.1,
+                                           mu=0.0011, k=1.33, meter_type='Miller orifice')
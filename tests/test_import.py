@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+import os
+import sys
+import subprocess
+import importlib
+import fluids
+from fluids.numerics import PY37
+import pytest
+
+
+def run_fresh(source):
+    '''Run `source` in a new interpreter, returning what it prints.'''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(fluids.__file__)))
+    return subprocess.check_output([sys.executable, '-c', source], env=env).decode().strip()
+
+
+def test_submodule_exports():
+    assert sorted(fluids.submodule_exports) == sorted(fluids.submodule_names)
+    for name, exported in fluids.submodule_exports.items():
+        module = importlib.import_module('fluids.' + name)
+        assert exported == module.__all__
+        for obj_name in exported:
+            assert getattr(fluids, obj_name) is getattr(module, obj_name)
+    assert len(set(fluids.__all__)) == len(fluids.__all__)
+    assert set(fluids.__all__) <= set(dir(fluids))
+    assert [m.__name__ for m in fluids.submodules] == ['fluids.' + n for n in fluids.submodule_names]
+
+
+@pytest.mark.skipif(not PY37, reason='Lazy loading requires Python 3.7')
+def test_import_is_lazy():
+    # The import time budget: `import fluids` loads no physics submodules
+    loaded = run_fresh("import sys, fluids; print(' '.join(sorted(m for m in sys.modules if m.startswith('fluids'))))")
+    allowed = set(['fluids', 'fluids.constants', 'fluids.constants.constants', 'fluids.numerics',
+                   'fluids.numerics.arrays', 'fluids.numerics.doubledouble', 'fluids.numerics.special'])
+    assert set(loaded.split()) <= allowed
+
+    loaded = run_fresh("import sys; from fluids import Reynolds, K_from_f; import fluids; fluids.friction; "
+                       "print(' '.join(sorted(m for m in sys.modules if m.startswith('fluids'))))")
+    assert set(loaded.split()) - allowed == set(['fluids.core', 'fluids.friction'])
+
+    # The exported names are read from the submodules without importing them
+    loaded = run_fresh("import sys, fluids; assert 'Reynolds' in fluids.__all__; dir(fluids); "
+                       "print(' '.join(sorted(m for m in sys.modules if m.startswith('fluids'))))")
+    assert set(loaded.split()) <= allowed
+
+    with pytest.raises(AttributeError):
+        fluids.not_a_fluids_function
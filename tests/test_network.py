@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from fluids import one_phase_dP, dP_from_K, Clamond, Haaland, Reynolds
+from fluids.constants import g
+from fluids.numerics import assert_close, assert_close1d
+from fluids.numerics import numpy as np
+import pytest
+
+try:
+    import scipy.sparse
+    has_scipy = True
+except:
+    has_scipy = False
+
+if has_scipy:
+    from fluids.network import PipeNetwork, friction_factor_and_derivative
+
+
+@pytest.mark.scipy
+def test_friction_factor_and_derivative():
+    Re = np.array([100.0, 1500.0, 5000.0, 1e5, 1e7, 3000.0])
+    eD = np.array([1e-4, 1e-4, 0.0, 1e-3, 1e-5, 1e-4])
+    for Method, f in [('Clamond', Clamond), ('Haaland', Haaland)]:
+        fd, dfd_dRe = friction_factor_and_derivative(Re, eD, Method)
+        h = 1e-5*Re
+        fd_p, _ = friction_factor_and_derivative(Re + h, eD, Method)
+        fd_m, _ = friction_factor_and_derivative(Re - h, eD, Method)
+        assert_close1d(dfd_dRe, (fd_p - fd_m)/(2.0*h), rtol=1e-6)
+        assert_close1d(fd[2:5], [f(Re[i], eD[i]) for i in range(2, 5)], rtol=1e-13)
+        assert_close1d(fd[:2], 64.0/Re[:2], rtol=1e-15)
+        # Transitional region joins both continuously
+        f_low = friction_factor_and_derivative(np.array([2040.0]), eD[5:], Method)[0]
+        f_high = friction_factor_and_derivative(np.array([4000.0]), eD[5:], Method)[0]
+        assert_close(f_low[0], 64.0/2040.0)
+        assert_close(f_high[0], f(4000.0, eD[5]), rtol=1e-13)
+        assert f_low[0] < fd[5] < f_high[0]
+
+
+@pytest.mark.scipy
+def test_PipeNetwork_single_pipe():
+    rho, mu, D, L, roughness, K = 998.0, 1e-3, 0.05, 100.0, 1e-5, 3.2
+    net = PipeNetwork()
+    net.add_node('supply', P=3e5, z=10.0)
+    net.add_node('discharge', P=1e5)
+    net.add_pipe('pipe', 'supply', 'discharge', D=D, L=L, roughness=roughness, K=K)
+    net.solve(rho=rho, mu=mu)
+
+    m = net.m[0]
+    dP = one_phase_dP(m, rho, mu, D, roughness, L) + dP_from_K(K, rho, net.V[0])
+    assert_close(dP, 2e5 + rho*g*10.0, rtol=1e-10)
+    assert_close(net.dP[0], dP, rtol=1e-10)
+    assert_close(net.Re[0], Reynolds(V=net.V[0], D=D, rho=rho, mu=mu))
+    assert_close1d(net.P, [3e5, 1e5])
+
+    # Flow reverses when the pressures are swapped
+    net.set_pressure('supply', 1e5 - rho*g*10.0)
+    net.set_pressure('discharge', 3e5 + rho*g*10.0)
+    net.solve(rho=rho, mu=mu)
+    assert_close(net.m[0], -m, rtol=1e-10)
+    assert net.V[0] < 0
+
+    # Laminar flow
+    net.set_pressure('supply', 1e5 - rho*g*10.0 + 1.0)
+    net.set_pressure('discharge', 1e5)
+    net.solve(rho=rho, mu=10.0)
+    assert net.Re[0] < 2040
+    dP = one_phase_dP(net.m[0], rho, 10.0, D, roughness, L) + dP_from_K(K, rho, net.V[0])
+    assert_close(dP, 1.0, rtol=1e-8)
+
+
+@pytest.mark.scipy
+def test_PipeNetwork_loop():
+    net = PipeNetwork()
+    net.add_node('tank 1', P=4E5)
+    net.add_node('tank 2', P=3.5E5)
+    net.add_node('junction', demand=20.0)
+    net.add_node('consumer', demand=15.0, z=5.0)
+    net.add_pipe('1', 'tank 1', 'junction', D=0.15, L=500.0, roughness=5E-5, K=1.5)
+    net.add_pipe('2', 'tank 2', 'junction', D=0.1, L=300.0, roughness=5E-5)
+    net.add_pipe('3', 'junction', 'consumer', D=0.1, L=200.0, roughness=5E-5)
+    net.add_pipe('4', 'tank 1', 'consumer', D=0.08, L=800.0, roughness=5E-5)
+    rho = 1000.0
+    net.solve(rho=rho, mu=1E-3)
+
+    m, P = net.m, net.P
+    assert_close(m[0] + m[1] - m[2], 20.0, rtol=1e-12)
+    assert_close(m[2] + m[3], 15.0, rtol=1e-12)
+    # Pressure drops around the loop and along each pipe are consistent
+    Pz = P + rho*g*np.array([0.0, 0.0, 0.0, 5.0])
+    for i, (s, e) in enumerate([(0, 2), (1, 2), (2, 3), (0, 3)]):
+        assert_close(Pz[s] - Pz[e], net.dP[i], rtol=1e-9)
+    assert_close1d(m, [25.374818880, 4.880779198, 10.255598078, 4.744401922], rtol=1e-8)
+
+    # Warm start after a change in demand
+    first_iterations = net.iterations
+    net.set_demand('junction', 21.0)
+    net.solve(rho=rho, mu=1E-3)
+    assert net.iterations < first_iterations
+    assert_close(m[0] + m[1] + m[3], 35.0) # old solution untouched
+    assert_close(net.m[0] + net.m[1] - net.m[2], 21.0, rtol=1e-12)
+
+    # Other friction factor correlations
+    net.solve(rho=rho, mu=1E-3, Method='Haaland')
+    assert_close(net.m[0] + net.m[1] - net.m[2], 21.0, rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        net.solve(rho=rho, mu=1E-3, Method='BADMETHOD')
+    with pytest.raises(ValueError):
+        net.set_demand('tank 1', 1.0)
+    with pytest.raises(ValueError):
+        net.set_pressure('junction', 1.0)
+    with pytest.raises(ValueError):
+        net.add_node('junction')
+    with pytest.raises(ValueError):
+        net.add_pipe('5', 'junction', 'nowhere', D=0.1, L=1.0)
+
+
+@pytest.mark.scipy
+def test_PipeNetwork_no_flow():
+    # A dead end without demand carries no flow
+    net = PipeNetwork()
+    net.add_node('tank', P=3e5)
+    net.add_node('junction', demand=5.0)
+    net.add_node('outlet', P=1e5)
+    net.add_node('dead end', demand=0.0)
+    net.add_pipe('1', 'tank', 'junction', D=0.1, L=100.0, roughness=1e-5)
+    net.add_pipe('2', 'junction', 'outlet', D=0.1, L=100.0, roughness=1e-5)
+    net.add_pipe('3', 'junction', 'dead end', D=0.05, L=50.0, roughness=1e-5, K=2.0)
+    net.solve(rho=1000.0, mu=1e-3)
+    assert abs(net.m[2]) < 1e-10
+    assert_close(net.P[3], net.P[1], rtol=1e-10)
+    m = net.m.copy()
+
+    # Warm start from the previous solution
+    net.solve(rho=1000.0, mu=1e-3)
+    assert_close1d(net.m[:2], m[:2], rtol=1e-10)
+
+    # Initial guess of exactly no flow in a pipe
+    net.solve(rho=1000.0, mu=1e-3, m0=[5.0, 5.0, 0.0])
+    assert_close1d(net.m[:2], m[:2], rtol=1e-10)
+    assert abs(net.m[2]) < 1e-10
+    assert np.all(np.isfinite(net.P))
+
+
+@pytest.mark.scipy
+def test_PipeNetwork_grid():
+    # Square grid of pipes fed from one corner, drawn off everywhere else
+    n = 30
+    net = PipeNetwork()
+    for i in range(n):
+        for j in range(n):
+            if i == j == 0:
+                net.add_node((i, j), P=6e5)
+            else:
+                net.add_node((i, j), demand=0.01)
+    for i in range(n):
+        for j in range(n):
+            if i + 1 < n:
+                net.add_pipe((i, j, 'x'), (i, j), (i+1, j), D=0.1, L=50.0, roughness=1e-4)
+            if j + 1 < n:
+                net.add_pipe((i, j, 'y'), (i, j), (i, j+1), D=0.1, L=50.0, roughness=1e-4)
+    net.solve(rho=1000.0, mu=1e-3)
+    assert_close(net.m[net.pipe_indices[(0, 0, 'x')]] + net.m[net.pipe_indices[(0, 0, 'y')]],
+                 0.01*(n*n - 1), rtol=1e-10)
+    # Symmetric about the diagonal
+    assert_close(net.P[net.node_indices[(3, 7)]], net.P[net.node_indices[(7, 3)]], rtol=1e-10)
+    assert np.all(np.diff(net.P[[net.node_indices[(i, i)] for i in range(n)]]) < 0)
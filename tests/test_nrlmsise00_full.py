@@ -82,3 +82,41 @@ def test_ATMOSPHERE_NRLMSISE00():
     atm = ATMOSPHERE_NRLMSISE00(Z=1E3, latitude=45.0, longitude=45.0, day=150.0)
     assert_close(atm.particle_density, 2.2929008167737723e+25)
     assert_close1d(atm.zs, [0.7811046347676225, 0.2095469403691101, 0.009343183088772914, 5.241774494627779e-06, 0.0, 0.0, 0.0])
+
+
+def test_ATMOSPHERE_NRLMSISE00_from_array():
+    import numpy as np
+    Zs = np.array([[0.0, 20E3, 65E3], [85E3, 150E3, 600E3]])
+    lats = np.array([-60.0, 10.0, 45.0])
+    keys = ['He_density', 'O_density', 'N2_density', 'O2_density', 'Ar_density',
+            'rho', 'H_density', 'N_density', 'O_anomalous_density',
+            'T_exospheric', 'T', 'P', 'rho_calculated', 'particle_density']
+    for indices in (None, [4.0, 10.0, 3.0, 5.0, 7.0, 4.0, 6.0]):
+        atm = ATMOSPHERE_NRLMSISE00.from_array(Zs, lats, 300.0, 172, 29000.0, 170.0, 160.0,
+                                               geomagnetic_disturbance_indices=indices)
+        for i in range(2):
+            for j in range(3):
+                point = ATMOSPHERE_NRLMSISE00(Zs[i, j], lats[j], 300.0, 172, 29000.0, 170.0, 160.0,
+                                              geomagnetic_disturbance_indices=indices)
+                for k in keys:
+                    assert getattr(atm, k).shape == (2, 3)
+                    assert getattr(atm, k)[i, j] == getattr(point, k)
+                assert [z[i, j] for z in atm.zs] == point.zs
+
+
+def test_nrlmsise_context():
+    from fluids.nrlmsise00 import gtd7, nrlmsise_context, nrlmsise_flags, nrlmsise_input, nrlmsise_output
+    flags = nrlmsise_flags()
+    flags.switches = [0] + [1]*23
+    context = nrlmsise_context()
+    for lat, lst in [(45.0, 3.0), (45.0, 3.0), (-20.0, 17.5)]:
+        for alt in [0.0, 40.0, 70.0, 95.0, 150.0, 400.0, 1000.0]:
+            Input = nrlmsise_input(doy=172, sec=29000.0, alt=alt, g_lat=lat, g_long=-70.0,
+                                   lst=lst, f107A=150.0, f107=150.0, ap=4.0)
+            expect, output = nrlmsise_output(), nrlmsise_output()
+            gtd7(Input, flags, expect)
+            gtd7(Input, flags, output, context=context)
+            assert output.d == expect.d
+            assert output.t == expect.t
+            assert context.key[2] == lat
+    assert len(context.globe7) == 11
@@ -32,6 +32,7 @@ try:
     import numba
     import fluids.numba
     import fluids.numba_vectorized
+    import fluids.numba_parallel
 except:
     numba = None
 import numpy as np
@@ -673,3 +674,79 @@ def test_numerics_solve_direct():
     assert_close1d(np.linalg.solve(A, B), ans, rtol=5e-14)
     assert type(ans) is np.ndarray
 
+
+@mark_as_numba
+def test_numba_parallel():
+    Res = np.logspace(3, 7, 50).reshape(5, 10)
+    eDs = np.logspace(-6, -2, 10)
+    fds = fluids.numba_parallel.friction_factor(Re=Res, eD=eDs)
+    assert fds.shape == (5, 10)
+    assert_close1d(fds.ravel(), [friction_factor(Re, eD) for Re, eD in zip(Res.ravel(), np.tile(eDs, 5))])
+    assert_close1d(fluids.numba_parallel.Colebrook(Res[0], 1e-4), [Colebrook(Re, 1e-4) for Re in Res[0]])
+    assert_close1d(fluids.numba_parallel.friction_factor(Res[0], 1e-4, Method='Haaland'),
+                   [friction_factor(Re, 1e-4, Method='Haaland') for Re in Res[0]])
+
+    xs = np.linspace(0.1, 0.9, 5)
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05, L=1.0)
+    assert_close1d(fluids.numba_parallel.two_phase_dP(x=xs, Method='Friedel', **kwargs),
+                   [two_phase_dP(x=x, Method='Friedel', **kwargs) for x in xs])
+
+    P2s = np.linspace(180000.0, 190000.0, 4)
+    ms = fluids.numba_parallel.differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0,
+            P2=P2s, rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D')
+    assert_close1d(ms, [differential_pressure_meter_solver(D=0.07366, D2=0.05, P1=200000.0, P2=P2,
+                        rho=999.1, mu=0.0011, k=1.33, meter_type='ISO 5167 orifice', taps='D') for P2 in P2s])
+
+    # Multiple return values give a tuple of arrays
+    C, epsilon = fluids.numba_parallel.differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
+            P2=P2s, rho=999.1, mu=0.0011, k=1.33, m=ms, meter_type='ISO 5167 orifice', taps='D')
+    for i in range(4):
+        assert_close1d([C[i], epsilon[i]], differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05,
+                       P1=200000.0, P2=P2s[i], rho=999.1, mu=0.0011, k=1.33, m=ms[i],
+                       meter_type='ISO 5167 orifice', taps='D'))
+
+    # Empty inputs keep the number of outputs
+    C, epsilon = fluids.numba_parallel.differential_pressure_meter_C_epsilon(D=0.07366, D2=0.05, P1=200000.0,
+            P2=np.array([]), rho=999.1, mu=0.0011, k=1.33, m=np.array([]), meter_type='ISO 5167 orifice', taps='D')
+    assert C.shape == epsilon.shape == (0,)
+    assert fluids.numba_parallel.friction_factor(Re=np.empty((0, 3)), eD=eDs[:3]).shape == (0, 3)
+
+
+@mark_as_numba
+def test_precompile():
+    report = fluids.numba.precompile(['Clamond', 'Stichlmair_flood', 'friction_factor', 'nearest_pipe'])
+    assert report['Clamond'][0] == 'cached'
+    assert report['friction_factor'][0] == 'cached'
+    assert report['Stichlmair_flood'][0] == 'compiled'
+    assert len(fluids.numba.Clamond.signatures) >= 1
+    assert set(report) == {'Clamond', 'Stichlmair_flood', 'friction_factor', 'nearest_pipe'}
+    for status, detail in report.values():
+        assert status in ('cached', 'compiled', 'failed', 'no example')
+        assert detail
+
+
+@mark_as_numba
+def test_lazy_transform():
+    import subprocess, sys
+    code = ('import fluids.numba; fluids.numba.friction_factor(Re=1e5, eD=1e-4); '
+            'print(sorted(fluids.numba.transformed_submodules))')
+    out = subprocess.check_output([sys.executable, '-c', code])
+    assert out.decode().strip() == "['core', 'friction']"
+
+    fluids.numba.transform_all()
+    assert set(fluids.numba.transformed_submodules) == set(fluids.numba._normal_submodules)
+    assert fluids.numba.friction_factor is fluids.numba.friction.friction_factor
+
+
+@mark_as_numba
+def test_cached_transformed_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(fluids.numba, 'source_cache_dir', str(tmp_path))
+    calls = []
+    def transform(source):
+        calls.append(source)
+        return source.upper()
+    assert fluids.numba.cached_transformed_source('f', 'def f(): pass', transform) == 'DEF F(): PASS'
+    assert fluids.numba.cached_transformed_source('f', 'def f(): pass', transform) == 'DEF F(): PASS'
+    assert len(calls) == 1
+    assert fluids.numba.cached_transformed_source('f', 'def f(): return 1', transform) == 'DEF F(): RETURN 1'
+    assert len(calls) == 2
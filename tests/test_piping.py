@@ -21,7 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from fluids.piping import nearest_pipe, gauge_from_t, t_from_gauge
+from fluids.piping import nearest_pipe, nearest_pipes, schedules_from_Di, gauge_from_t, t_from_gauge
 from fluids.numerics import assert_close, assert_close1d
 import pytest
 
@@ -153,6 +153,52 @@ def test_gauge():
     assert_close1d((0.10226, 0.1143, 0.006019999999999999), (Di, Do, t), rtol=1e-12)
 
 
+def test_nearest_pipes():
+    import numpy as np
+    from fluids.piping import schedule_lookup
+    for schedule, (NPSs, Dis, Dos, ts) in schedule_lookup.items():
+        for key, values in (('Di', Dis), ('Do', Dos)):
+            values = np.array(values[:-1])/1E3
+            values = np.concatenate([values, values*0.97, values[:1]*0.5])
+            batch = nearest_pipes(schedule=schedule, **{key: values})
+            for j, v in enumerate(values):
+                assert_close1d([b[j] for b in batch], nearest_pipe(schedule=schedule, **{key: float(v)}), rtol=0)
+        batch = nearest_pipes(NPS=NPSs, schedule=schedule)
+        assert_close1d(batch[1], np.array(Dis)/1E3, rtol=0)
+
+    NPS, Di, Do, t = nearest_pipes(Do=[[0.5, 0.3], [0.1, 0.2]], schedule=80)
+    assert NPS.shape == (2, 2)
+    assert_close1d(NPS.ravel(), [20, 12, 3.5, 8])
+
+    with pytest.raises(ValueError):
+        nearest_pipes(Di=[0.1, 2.0])
+    with pytest.raises(ValueError):
+        nearest_pipes(NPS=[2, 2.2])
+    with pytest.raises(ValueError):
+        nearest_pipes(Di=[0.1], schedule='BAD')
+    with pytest.raises(ValueError):
+        nearest_pipes()
+
+
+def test_schedules_from_Di():
+    from fluids.piping import schedule_lookup
+    pipes = schedules_from_Di(0.05248, atol=0.0)
+    assert [p[0] for p in pipes] == ['40', 'STD', '40S', 'S40F441SI']
+    assert_close1d(pipes[0][1:], nearest_pipe(NPS=2))
+
+    pipes = schedules_from_Di(0.05248)
+    assert len(pipes) == 8
+    for schedule, NPS, Di, Do, t in pipes:
+        assert abs(Di - 0.05248) <= 1e-4
+        assert_close1d((NPS, Di, Do, t), nearest_pipe(NPS=NPS, schedule=schedule), rtol=0)
+
+    # Every pipe is found from its own inner diameter
+    for schedule, (NPSs, Dis, Dos, ts) in schedule_lookup.items():
+        for Di in Dis:
+            assert schedule in [p[0] for p in schedules_from_Di(Di/1E3, atol=0.0)]
+    assert schedules_from_Di(5.0) == []
+
+
 def test_piping_schedule_basics():
     from fluids.piping import schedule_lookup
 
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2021, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+from fluids import (friction_factor, friction_factor_methods, drag_sphere, drag_sphere_methods,
+                    two_phase_dP, two_phase_dP_methods, dP_packed_bed)
+from fluids.numerics import assert_close1d
+from fluids.numerics import numpy as np
+from fluids.sweep import evaluate_methods
+import pytest
+
+
+@pytest.mark.parametrize('executor', [None, 'thread', 'process'])
+def test_evaluate_methods_friction_factor(executor):
+    Res = np.logspace(3, 7, 7)
+    eDs = np.array([1e-6, 1e-4, 1e-2])
+    sweep = evaluate_methods(friction_factor, Re=Res[:, None], eD=eDs[None, :],
+                             executor=executor, max_workers=2, chunk_size=4)
+    assert sweep.methods == friction_factor_methods(Re=Res[0], eD=eDs[0], check_ranges=False)
+    assert sweep.values.shape == (len(sweep.methods), 7, 3)
+    assert sweep.inputs['Re'].shape == (7, 3)
+    assert np.all(sweep.times > 0.0)
+    i = sweep.methods.index('Haaland')
+    for j in range(7):
+        for k in range(3):
+            assert sweep.values[i, j, k] == friction_factor(Re=Res[j], eD=eDs[k], Method='Haaland')
+
+
+def test_evaluate_methods_check_ranges():
+    Res = [1e-3, 0.1, 100.0, 1e5]
+    sweep = evaluate_methods(drag_sphere, Re=Res, check_ranges=True, executor=None)
+    for i, method in enumerate(sweep.methods):
+        for j, Re in enumerate(Res):
+            if method in drag_sphere_methods(Re, check_ranges=True):
+                assert sweep.values[i, j] == drag_sphere(Re, Method=method)
+            else:
+                assert np.isnan(sweep.values[i, j])
+        assert sweep.failures[i] == np.isnan(sweep.values[i]).sum()
+
+
+def test_evaluate_methods_constants():
+    xs = np.linspace(0.1, 0.9, 5)
+    kwargs = dict(m=0.6, rhol=915., rhog=2.67, mul=180E-6, mug=14E-6, sigma=0.0487, D=0.05)
+    sweep = evaluate_methods(two_phase_dP, x=xs, executor='thread', **kwargs)
+    assert sweep.methods == two_phase_dP_methods(x=xs[0], **kwargs)
+    assert list(sweep.inputs) == ['x']
+    i = sweep.methods.index('Lockhart_Martinelli')
+    assert_close1d(sweep.values[i], [two_phase_dP(x=x, Method='Lockhart_Martinelli', **kwargs) for x in xs],
+                   rtol=1e-15)
+
+    # A method which fails gives NaN and is counted
+    sweep = evaluate_methods(dP_packed_bed, methods=['Ergun', 'not a method'], dp=8E-4,
+                             voidage=0.4, vs=[1e-3, 1e-2], rho=1E3, mu=1E-3, executor=None)
+    assert np.all(np.isnan(sweep.values[1])) and sweep.failures.tolist() == [0, 2]
+
+
+def test_method_sweep_to_frame():
+    pytest.importorskip('pandas')
+    sweep = evaluate_methods(drag_sphere, methods=['Stokes', 'Barati'], Re=[0.1, 1.0], executor=None)
+    frame = sweep.to_frame()
+    assert frame.shape == (4, 5)
+    assert frame['method'].tolist() == ['Stokes', 'Stokes', 'Barati', 'Barati']
+    assert frame['Re'].tolist() == [0.1, 1.0, 0.1, 1.0]
+    assert frame['value'].tolist() == sweep.values.ravel().tolist()
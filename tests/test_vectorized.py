@@ -45,3 +45,100 @@ def test_Morsi_Alexander():
     assert_allclose(Cds, Cds_vect)
 
 
+
+
+def test_friction_factor_array_native():
+    from fluids.friction import fmethods
+    Res = np.logspace(1, 9, 200)
+    eDs = np.logspace(-7, -1, 200)[::-1]
+    for Method in list(fmethods.keys()) + ['laminar']:
+        fds = fluids.vectorized.friction_factor(Re=Res, eD=eDs, Method=Method)
+        expect = [friction_factor(Re=Re, eD=eD, Method=Method) for Re, eD in zip(Res, eDs)]
+        assert type(fds) is np.ndarray
+        assert_allclose(fds, expect, rtol=1e-12)
+
+    # Broadcasting, Fanning
+    fds = fluids.vectorized.friction_factor(Re=[[1e3], [1e5]], eD=[1e-5, 1e-4, 1e-3], Darcy=False)
+    assert fds.shape == (2, 3)
+    assert_allclose(fds[1, 1], friction_factor(1e5, 1e-4, Darcy=False), rtol=1e-13)
+
+    with pytest.raises(ValueError):
+        fluids.vectorized.friction_factor(Re=[1e5], Method='BADMETHOD')
+
+
+def test_Colebrook_array_native():
+    # Analytical solution overflows for the last point
+    Res = np.array([1e4, 1e5, 1e6])
+    eDs = np.array([1e-4, 1e-4, 1e-2])
+    fds = fluids.vectorized.Colebrook(Res, eDs)
+    assert_allclose(fds, [Colebrook(Re, eD) for Re, eD in zip(Res, eDs)], rtol=1e-13)
+
+    fds = fluids.vectorized.Colebrook(np.array([5.0, 1e5]), 1e-4, tol=-1)
+    assert_allclose(fds, [Colebrook(5.0, 1e-4, tol=-1), Colebrook(1e5, 1e-4, tol=-1)], rtol=1e-13)
+
+    assert_allclose(fluids.vectorized.Tsal_1989(1e5, [1e-4, 1e-2]),
+                    [Tsal_1989(1e5, 1e-4), Tsal_1989(1e5, 1e-2)], rtol=1e-13)
+    assert_allclose(fluids.vectorized.Prandtl_von_Karman_Nikuradse([1e5, 1e7]),
+                    [Prandtl_von_Karman_Nikuradse(1e5), Prandtl_von_Karman_Nikuradse(1e7)], rtol=1e-13)
+
+
+def test_Clamond_array_fast():
+    # An array of flags is evaluated elementwise
+    Res = np.array([1e5, 1e6])
+    eDs = np.array([1e-5, 1e-6])
+    fds = fluids.vectorized.Clamond(Res, eDs, fast=np.array([False, True]))
+    assert_allclose(fds, [Clamond(1e5, 1e-5, False), Clamond(1e6, 1e-6, True)], rtol=1e-14)
+    fds = fluids.vectorized.Clamond(Res, eDs, np.array([False]*2))
+    assert_allclose(fds, fluids.vectorized.Clamond(Res, eDs, False), rtol=1e-14)
+
+
+def test_generated_array_functions():
+    # Arithmetic functions are evaluated directly with NumPy, not vectorize
+    for f in (fluids.vectorized.Reynolds, fluids.vectorized.K_from_f,
+              fluids.vectorized.dP_from_K, fluids.vectorized.Clamond):
+        assert not isinstance(f, np.vectorize)
+    # String dispatch still needs vectorize
+    assert isinstance(fluids.vectorized.bend_rounded, np.vectorize)
+
+    Ds = np.array([0.25, 0.5, 0.75, 1.0])
+    Res = fluids.vectorized.Reynolds(V=2.5, D=Ds, rho=1.1613, mu=1.9E-5)
+    assert_allclose(Res, [Reynolds(V=2.5, D=D, rho=1.1613, mu=1.9E-5) for D in Ds], rtol=1e-14)
+    assert_allclose(fluids.vectorized.Reynolds(V=[1.5, 2.5], D=[[0.25], [0.5]], nu=1e-5),
+                    [[37500.0, 62500.0], [75000.0, 125000.0]], rtol=1e-14)
+    with pytest.raises(ValueError):
+        fluids.vectorized.Reynolds(V=2.5, D=Ds)
+
+    # out and dtype arguments
+    out = np.zeros(4)
+    ans = fluids.vectorized.K_from_f(fd=[0.018, 0.02, 0.022, 0.024], L=100., D=Ds, out=out)
+    assert ans is out
+    assert_allclose(out, [K_from_f(fd=fd, L=100., D=D) for fd, D in zip([0.018, 0.02, 0.022, 0.024], Ds)], rtol=1e-14)
+    assert fluids.vectorized.dP_from_K(K=[10, 20], rho=1000, V=3, dtype=np.float32).dtype == np.float32
+
+    # Integer inputs are computed as floats
+    assert_allclose(fluids.vectorized.Blasius(np.array([10000, 20000])), [Blasius(10000), Blasius(20000)], rtol=1e-14)
+
+    # Unused inputs still broadcast
+    assert fluids.vectorized.Reynolds(V=2.5, D=0.1, rho=np.ones(3), mu=1e-3, nu=1e-5).shape == (3,)
+
+
+def test_generated_array_functions_array_flags():
+    # Boolean flags given as arrays are evaluated elementwise
+    Vs = np.array([1.8, 1.8])
+    ans = fluids.vectorized.Froude(Vs, 2.0, squared=np.array([False, True]))
+    assert_allclose(ans, [Froude(1.8, 2.0), Froude(1.8, 2.0, squared=True)], rtol=1e-14)
+    ans = fluids.vectorized.Froude(Vs, 2.0, 9.80665, [False, True])
+    assert_allclose(ans, [Froude(1.8, 2.0), Froude(1.8, 2.0, squared=True)], rtol=1e-14)
+
+    ans = fluids.vectorized.Froude_densimetric(1.83, 2.0, 800.0, 1.2, heavy=np.array([True, False]))
+    assert_allclose(ans, [Froude_densimetric(1.83, 2.0, 800.0, 1.2, heavy=True),
+                          Froude_densimetric(1.83, 2.0, 800.0, 1.2, heavy=False)], rtol=1e-14)
+
+    ans = fluids.vectorized.friction_factor([1e5, 1e5], 1e-4, Darcy=np.array([True, False]))
+    assert_allclose(ans, [friction_factor(1e5, 1e-4), friction_factor(1e5, 1e-4, Darcy=False)], rtol=1e-13)
+
+    # Scalar flags, including NumPy bools, stay on the array path
+    out = np.zeros(2)
+    ans = fluids.vectorized.Froude(Vs, 2.0, squared=np.bool_(True), out=out)
+    assert ans is out
+    assert_allclose(out, [Froude(1.8, 2.0, squared=True)]*2, rtol=1e-14)